@@ -58,6 +58,14 @@ class Settings(BaseSettings):
     svg_preprocessing_precision: int = Field(default=3, description="Numeric precision for preprocessing")
     svg_preprocessing_multipass: bool = Field(default=False, description="Enable multiple preprocessing passes")
     
+    # Conversion Executor Configuration
+    conversion_workers: int = Field(default=0, description="Conversion worker processes (0 = CPU count)")
+    conversion_queue_size: int = Field(
+        default=8,
+        description="Conversions allowed to wait for a worker before returning 429"
+    )
+    conversion_timeout: float = Field(default=120.0, description="Per-request conversion timeout in seconds")
+    
     # Logging Configuration
     log_level: str = Field(default="INFO", description="Logging level")
     log_format: str = Field(
@@ -8,7 +8,9 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from typing import Optional
 
 from .config import get_settings
@@ -21,17 +23,63 @@ from .routes.analysis import router as analysis_router
 from .routes.oauth import router as oauth_router
 from .routes.export import router as export_router
 from src.svg2pptx import convert_svg_to_pptx
+from concurrent.futures.process import BrokenProcessPool
+from core.batch.conversion_executor import (
+    ConversionTimeoutError,
+    ExecutorSaturatedError,
+    configure_conversion_executor,
+    get_conversion_executor,
+)
+from core.batch.http_fetcher import get_http_fetcher
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start warm conversion workers before serving, stop them on shutdown."""
+    settings = get_settings()
+    executor = configure_conversion_executor(
+        max_workers=settings.conversion_workers or None,
+        max_queue=settings.conversion_queue_size,
+        timeout=settings.conversion_timeout,
+    )
+    await asyncio.to_thread(executor.start)
+    try:
+        yield
+    finally:
+        executor.shutdown(wait=False)
+
+
+def _executor_http_error(exc: Exception) -> HTTPException:
+    """Map conversion executor backpressure, worker failures and timeouts to HTTP errors."""
+    if isinstance(exc, ExecutorSaturatedError):
+        return HTTPException(
+            status_code=429,
+            detail="Server is busy converting other files. Please retry shortly.",
+            headers={"Retry-After": "5"}
+        )
+    if isinstance(exc, BrokenProcessPool):
+        return HTTPException(
+            status_code=503,
+            detail="Conversion worker failed. Please retry shortly.",
+            headers={"Retry-After": "5"}
+        )
+    return HTTPException(
+        status_code=504,
+        detail=f"Conversion timed out: {exc}"
+    )
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="SVG to Google Drive API",
     description="Convert SVG files to PowerPoint format with multi-slide support, Google Drive upload, Google Slides export, and visual testing",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -67,10 +115,15 @@ app.include_router(analysis_router)
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
+    executor = get_conversion_executor()
     return {
         "status": "healthy", 
         "service": "svg2pptx-api",
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "conversion_queue": {
+            "in_flight": executor.in_flight,
+            "capacity": executor.capacity
+        }
     }
 
 
@@ -89,9 +142,9 @@ async def convert_svg_to_drive(
     Args:
         url: URL of the SVG file to convert
         fileId: Optional Google Drive file ID to update instead of creating new
-        preprocessing: Optional preprocessing preset (minimal, default, aggressive)
-        precision: Optional numeric precision for preprocessing (1-10)
-        clean_slate: Optional flag to enable clean slate architecture (experimental)
+        preprocessing: Not supported by the clean slate pipeline (400 if given)
+        precision: Not supported by the clean slate pipeline (400 if given)
+        clean_slate: Clean slate architecture is always used (400 if false)
         current_user: Authenticated user info (from dependency)
 
     Returns:
@@ -150,24 +203,23 @@ async def convert_svg_to_drive(
         
         logger.info(f"Converting SVG from {url} for user {current_user.get('api_key', 'unknown')}")
         
-        # Initialize conversion service with custom preprocessing options
-        conversion_service = ConversionService()
+        # Conversions run on the clean slate pipeline, which has no preset
+        # preprocessing; refuse options it would otherwise silently ignore
+        if preprocessing is not None or precision is not None:
+            raise HTTPException(
+                status_code=400,
+                detail="preprocessing and precision are not supported by the clean slate conversion pipeline"
+            )
+        if clean_slate is False:
+            raise HTTPException(
+                status_code=400,
+                detail="The legacy conversion pipeline is no longer available; omit clean_slate or set it to true"
+            )
         
-        # Apply custom preprocessing settings if provided
-        if preprocessing and preprocessing in ['minimal', 'default', 'aggressive']:
-            conversion_service.settings.svg_preprocessing_preset = preprocessing
-        if precision and 1 <= precision <= 10:
-            conversion_service.settings.svg_preprocessing_precision = precision
-        if clean_slate is not None:
-            # Set clean slate mode if supported by conversion service
-            if hasattr(conversion_service.settings, 'use_clean_slate'):
-                conversion_service.settings.use_clean_slate = clean_slate
-            else:
-                # Log that clean slate option was requested but not supported
-                logger.info(f"Clean slate option ({clean_slate}) requested but not supported by conversion service")
+        conversion_service = await asyncio.to_thread(ConversionService)
         
-        # Perform conversion and upload
-        result = conversion_service.convert_and_upload(svg_url=url, file_id=fileId)
+        # Perform conversion and upload; CPU work runs on the conversion executor
+        result = await conversion_service.convert_and_upload_async(svg_url=url, file_id=fileId)
         
         return JSONResponse(
             content=result,
@@ -177,6 +229,8 @@ async def convert_svg_to_drive(
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
+    except (ExecutorSaturatedError, ConversionTimeoutError, BrokenProcessPool) as e:
+        raise _executor_http_error(e)
     except ConversionError as e:
         logger.error(f"Conversion error for URL {url}: {e}")
         raise HTTPException(
@@ -273,14 +327,13 @@ async def convert_svg_to_multislide(
 
         logger.info(f"Converting SVG to multi-slide from {url} for user {current_user.get('api_key', 'unknown')}")
 
-        # Download SVG content
-        import requests
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        svg_content = response.text
+        # Download SVG content off the event loop
+        fetched = await asyncio.to_thread(get_http_fetcher().fetch, url, 30)
+        svg_content = fetched.content.decode('utf-8', errors='replace')
 
-        # Convert to multi-slide PPTX
-        result = convert_svg_to_multislide_pptx_api(
+        # Convert to multi-slide PPTX on the conversion executor
+        result = await get_conversion_executor().run(
+            convert_svg_to_multislide_pptx_api,
             svg_input=svg_content,
             output_path=None,  # Creates temp file
             animation_threshold=animation_threshold or 3,
@@ -288,29 +341,23 @@ async def convert_svg_to_multislide(
         )
 
         # Upload to Google Drive using existing conversion service
-        conversion_service = ConversionService()
+        conversion_service = await asyncio.to_thread(ConversionService)
 
-        # Read PPTX file content
-        with open(result['output_path'], 'rb') as f:
-            pptx_content = f.read()
-
-        # Clean up temporary PPTX file
-        import os
-        try:
-            os.unlink(result['output_path'])
-        except OSError:
-            pass
+        # Read PPTX file content and clean up the temporary PPTX file
+        pptx_content = await asyncio.to_thread(_read_and_remove, result['output_path'])
 
         # Upload to Google Drive
         filename = f"multislide_presentation_{animation_threshold or 3}.pptx"
         if fileId:
-            upload_result = conversion_service.upload_manager.update_file_content(
+            upload_result = await asyncio.to_thread(
+                conversion_service.upload_manager.update_file_content,
                 file_id=fileId,
                 content=pptx_content,
                 filename=filename
             )
         else:
-            upload_result = conversion_service.upload_manager.upload_content_as_file(
+            upload_result = await asyncio.to_thread(
+                conversion_service.upload_manager.upload_content_as_file,
                 content=pptx_content,
                 filename=filename,
                 folder_id=conversion_service.settings.google_drive_folder_id
@@ -331,6 +378,8 @@ async def convert_svg_to_multislide(
 
     except HTTPException:
         raise
+    except (ExecutorSaturatedError, ConversionTimeoutError, BrokenProcessPool) as e:
+        raise _executor_http_error(e)
     except ConversionError as e:
         logger.error(f"Multi-slide conversion error for URL {url}: {e}")
         raise HTTPException(
@@ -345,6 +394,46 @@ async def convert_svg_to_multislide(
         )
 
 
+def _write_temp_svg(content: bytes) -> str:
+    """Write SVG content to a temporary file and return its path."""
+    import tempfile
+    with tempfile.NamedTemporaryFile(mode='wb', suffix='.svg', delete=False) as f:
+        f.write(content)
+        return f.name
+
+
+def _read_and_remove(path: str) -> bytes:
+    """Read a temporary output file and delete it."""
+    import os
+    with open(path, 'rb') as f:
+        content = f.read()
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+    return content
+
+
+_converted_output_caches: dict = {}
+
+
+def _get_converted_output_cache(fetcher):
+    """Get the store of converted presentations kept beside the HTTP response cache."""
+    if fetcher.cache is None:
+        return None
+    cache_dir = str(fetcher.cache.cache_dir / "converted")
+    cache = _converted_output_caches.get(cache_dir)
+    if cache is None:
+        from core.performance.fallback_cache import FallbackMediaCache
+        try:
+            cache = FallbackMediaCache(cache_dir, max_disk_size=256 * 1024 * 1024)
+        except OSError as e:
+            logger.warning(f"Converted output cache disabled, cannot use {cache_dir}: {e}")
+            return None
+        _converted_output_caches[cache_dir] = cache
+    return cache
+
+
 @app.post("/convert/multiple")
 async def convert_multiple_svgs_to_presentation(
     urls: list[str],
@@ -443,52 +532,71 @@ async def convert_multiple_svgs_to_presentation(
 
         logger.info(f"Converting {len(validated_urls)} SVGs to multi-slide presentation for user {current_user.get('api_key', 'unknown')}")
 
-        # Download all SVG files and create temporary files
-        import tempfile
-        import requests
+        # Download all SVG files concurrently, off the event loop. Sources
+        # cached by an earlier request are revalidated with a conditional GET.
+        import json
         import os
+        from core.performance.fallback_cache import fallback_cache_key
+
+        fetcher = get_http_fetcher()
+        fetched = await asyncio.to_thread(fetcher.fetch_all, validated_urls, 30)
+        for fetch_result in fetched:
+            if isinstance(fetch_result, Exception):
+                raise fetch_result
+        unchanged_count = sum(1 for fetch_result in fetched if fetch_result.not_modified)
+
+        # Byte-identical sources and options reuse the previous presentation
+        output_cache = _get_converted_output_cache(fetcher)
+        output_key = fallback_cache_key(
+            'pptx-multiple', animation_threshold or 3,
+            *(fetch_result.content_hash for fetch_result in fetched),
+        )
+        result_key = fallback_cache_key('pptx-multiple-result', output_key)
+        pptx_content = await asyncio.to_thread(output_cache.get, output_key) if output_cache else None
+        cached_result = await asyncio.to_thread(output_cache.get, result_key) if pptx_content is not None else None
 
         temp_svg_paths = []
         try:
-            for i, url in enumerate(validated_urls):
-                response = requests.get(url, timeout=30)
-                response.raise_for_status()
-
-                # Create temporary SVG file
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.svg', delete=False, encoding='utf-8') as f:
-                    f.write(response.text)
-                    temp_svg_paths.append(f.name)
-
-            # Convert multiple SVGs to single PPTX
-            result = convert_multiple_svgs_to_pptx_api(
-                svg_paths=temp_svg_paths,
-                output_path=None,  # Creates temp file
-                animation_threshold=animation_threshold or 3
-            )
+            if cached_result is not None:
+                result = json.loads(cached_result)
+                logger.info(f"All {len(fetched)} sources unchanged ({unchanged_count} not modified), "
+                            f"reusing converted presentation")
+            else:
+                for fetch_result in fetched:
+                    # Create temporary SVG file
+                    temp_svg_paths.append(await asyncio.to_thread(_write_temp_svg, fetch_result.content))
+
+                # Convert multiple SVGs to single PPTX on the conversion executor
+                result = await get_conversion_executor().run(
+                    convert_multiple_svgs_to_pptx_api,
+                    svg_paths=temp_svg_paths,
+                    output_path=None,  # Creates temp file
+                    animation_threshold=animation_threshold or 3
+                )
 
-            # Upload to Google Drive using existing conversion service
-            conversion_service = ConversionService()
+                # Read PPTX file content and clean up the temporary PPTX file
+                pptx_content = await asyncio.to_thread(_read_and_remove, result['output_path'])
+                result = {key: value for key, value in result.items() if key != 'output_path'}
 
-            # Read PPTX file content
-            with open(result['output_path'], 'rb') as f:
-                pptx_content = f.read()
+                if output_cache is not None:
+                    await asyncio.to_thread(output_cache.put, output_key, pptx_content)
+                    await asyncio.to_thread(output_cache.put, result_key, json.dumps(result, default=str).encode())
 
-            # Clean up temporary PPTX file
-            try:
-                os.unlink(result['output_path'])
-            except OSError:
-                pass
+            # Upload to Google Drive using existing conversion service
+            conversion_service = await asyncio.to_thread(ConversionService)
 
             # Upload to Google Drive
             filename = f"multiple_svgs_presentation_{len(validated_urls)}_files.pptx"
             if fileId:
-                upload_result = conversion_service.upload_manager.update_file_content(
+                upload_result = await asyncio.to_thread(
+                    conversion_service.upload_manager.update_file_content,
                     file_id=fileId,
                     content=pptx_content,
                     filename=filename
                 )
             else:
-                upload_result = conversion_service.upload_manager.upload_content_as_file(
+                upload_result = await asyncio.to_thread(
+                    conversion_service.upload_manager.upload_content_as_file,
                     content=pptx_content,
                     filename=filename,
                     folder_id=conversion_service.settings.google_drive_folder_id
@@ -500,6 +608,8 @@ async def convert_multiple_svgs_to_presentation(
                 **upload_result,
                 "conversion_type": "multiple_files",
                 "source_count": len(validated_urls),
+                "unchanged_source_count": unchanged_count,
+                "conversion_cached": cached_result is not None,
                 "animation_threshold": animation_threshold or 3
             }
 
@@ -518,6 +628,8 @@ async def convert_multiple_svgs_to_presentation(
 
     except HTTPException:
         raise
+    except (ExecutorSaturatedError, ConversionTimeoutError, BrokenProcessPool) as e:
+        raise _executor_http_error(e)
     except ConversionError as e:
         logger.error(f"Multiple SVG conversion error: {e}")
         raise HTTPException(
@@ -546,7 +658,8 @@ async def http_exception_handler(request, exc):
             "detail": exc.detail,  # Include detail field for consistency
             "path": str(request.url.path),
             "method": request.method
-        }
+        },
+        headers=getattr(exc, "headers", None)
     )
 
 
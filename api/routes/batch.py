@@ -6,6 +6,7 @@ Provides endpoints for creating batch jobs, monitoring status, and managing
 Drive uploads with folder organization and preview generation.
 """
 
+import asyncio
 import logging
 import sys
 from pathlib import Path
@@ -177,7 +178,9 @@ async def create_batch_job(
 
                 # Download URLs to temp files
                 logger.info(f"Downloading {len(job_request.urls)} SVG URLs for job {job_id}")
-                download_result = download_svgs_to_temp(
+                # Concurrent, pooled fetch; run off the event loop
+                download_result = await asyncio.to_thread(
+                    download_svgs_to_temp,
                     urls=job_request.urls,
                     job_id=job_id
                 )
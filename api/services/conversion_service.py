@@ -3,6 +3,7 @@
 Main conversion service that integrates SVG processing with Google Drive.
 """
 
+import asyncio
 import logging
 import time
 from typing import Dict, Optional, Any
@@ -12,9 +13,20 @@ from .google_drive import GoogleDriveService, GoogleDriveError
 from .google_slides import GoogleSlidesService, GoogleSlidesError
 from .file_processor import UploadManager, FileProcessor
 from ..config import get_settings
+from concurrent.futures.process import BrokenProcessPool
+from core.batch.conversion_executor import (
+    ConversionExecutor,
+    ConversionTimeoutError,
+    ExecutorSaturatedError,
+    get_conversion_executor,
+)
+from core.batch.http_fetcher import FetchError, get_http_fetcher
 
 logger = logging.getLogger(__name__)
 
+# Largest SVG accepted from a URL
+MAX_SVG_BYTES = 10 * 1024 * 1024
+
 
 class ConversionError(Exception):
     """Custom exception for conversion operations."""
@@ -75,53 +87,61 @@ class ConversionService:
             logger.info("Converting SVG to PPTX")
             pptx_content = self._convert_svg_to_pptx(svg_content, svg_url)
             
-            # Step 3: Generate filename
-            filename = self._generate_filename(svg_url)
-            
-            # Step 4: Upload or update in Google Drive
-            if file_id:
-                logger.info(f"Updating existing file: {file_id}")
-                result = self.upload_manager.update_file_content(
-                    file_id=file_id,
-                    content=pptx_content,
-                    filename=filename
-                )
-            else:
-                logger.info(f"Uploading new file: {filename}")
-                result = self.upload_manager.upload_content_as_file(
-                    content=pptx_content,
-                    filename=filename,
-                    folder_id=self.settings.google_drive_folder_id
-                )
+            return self._upload_and_describe(pptx_content, svg_url, file_id, start_time)
             
-            # Calculate processing time
+        except Exception as e:
             processing_time = time.time() - start_time
+            logger.error(f"Conversion failed after {processing_time:.2f}s: {e}")
+            raise ConversionError(f"Conversion failed: {e}")
+        finally:
+            # Clean up any temporary files
+            if self.upload_manager:
+                self.upload_manager.cleanup_all()
+    
+    async def convert_and_upload_async(self, svg_url: str, file_id: Optional[str] = None,
+                                       executor: Optional[ConversionExecutor] = None,
+                                       timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Convert SVG from URL to PPTX and upload to Google Drive without blocking the event loop.
+        
+        Fetch (through the shared pooled HTTP fetcher) and upload run in worker
+        threads; the conversion itself runs on a warm converter in the
+        conversion executor's process pool.
+        
+        Args:
+            svg_url: URL of the SVG file to convert
+            file_id: Optional Google Drive file ID to update
+            executor: Conversion executor (process-wide executor if None)
+            timeout: Conversion timeout in seconds (executor default if None)
             
-            # Enhance result with processing info
-            result.update({
-                'processingTime': round(processing_time, 2),
-                'sourceUrl': svg_url,
-                'conversionMethod': 'svg2pptx-api'
-            })
+        Returns:
+            Dictionary with conversion and upload results
+            
+        Raises:
+            ExecutorSaturatedError: If the conversion queue is full
+            ConversionTimeoutError: If the conversion does not finish in time
+            BrokenProcessPool: If a conversion worker died
+        """
+        start_time = time.time()
+        executor = executor or get_conversion_executor()
+        
+        try:
+            logger.info(f"Processing SVG from URL: {svg_url}")
+            svg_content = await asyncio.to_thread(self._fetch_svg_content_pooled, svg_url)
             
-            # Generate preview information if possible
+            logger.info("Converting SVG to PPTX on conversion executor")
             try:
-                logger.info("Generating presentation previews")
-                presentation_id = self._extract_presentation_id_from_drive_file(result['fileId'])
-                if presentation_id:
-                    preview_info = self.slides_service.generate_preview_summary(presentation_id)
-                    result['previews'] = preview_info['previews']
-                    result['presentationUrl'] = preview_info['urls']['presentation']
-                    logger.info(f"Generated preview info: {preview_info['previews']['available']} thumbnails")
-                else:
-                    logger.warning("Could not extract presentation ID for previews")
+                pptx_content = await executor.convert(svg_content, timeout=timeout)
+            except (ExecutorSaturatedError, ConversionTimeoutError, BrokenProcessPool):
+                raise
             except Exception as e:
-                logger.warning(f"Could not generate previews: {e}")
-                result['previews'] = {'available': 0, 'total': 0, 'error': str(e)}
+                logger.error(f"SVG to PPTX conversion failed: {e}")
+                pptx_content = self._create_error_pptx(svg_url, str(e))
             
-            logger.info(f"Conversion completed successfully in {processing_time:.2f}s")
-            return result
+            return await asyncio.to_thread(self._upload_and_describe, pptx_content, svg_url, file_id, start_time)
             
+        except (ExecutorSaturatedError, ConversionTimeoutError, BrokenProcessPool):
+            raise
         except Exception as e:
             processing_time = time.time() - start_time
             logger.error(f"Conversion failed after {processing_time:.2f}s: {e}")
@@ -131,6 +151,56 @@ class ConversionService:
             if self.upload_manager:
                 self.upload_manager.cleanup_all()
     
+    def _upload_and_describe(self, pptx_content: bytes, svg_url: str,
+                             file_id: Optional[str], start_time: float) -> Dict[str, Any]:
+        """Upload converted PPTX content and attach timing and preview information."""
+        # Generate filename
+        filename = self._generate_filename(svg_url)
+        
+        # Upload or update in Google Drive
+        if file_id:
+            logger.info(f"Updating existing file: {file_id}")
+            result = self.upload_manager.update_file_content(
+                file_id=file_id,
+                content=pptx_content,
+                filename=filename
+            )
+        else:
+            logger.info(f"Uploading new file: {filename}")
+            result = self.upload_manager.upload_content_as_file(
+                content=pptx_content,
+                filename=filename,
+                folder_id=self.settings.google_drive_folder_id
+            )
+        
+        # Calculate processing time
+        processing_time = time.time() - start_time
+        
+        # Enhance result with processing info
+        result.update({
+            'processingTime': round(processing_time, 2),
+            'sourceUrl': svg_url,
+            'conversionMethod': 'svg2pptx-api'
+        })
+        
+        # Generate preview information if possible
+        try:
+            logger.info("Generating presentation previews")
+            presentation_id = self._extract_presentation_id_from_drive_file(result['fileId'])
+            if presentation_id:
+                preview_info = self.slides_service.generate_preview_summary(presentation_id)
+                result['previews'] = preview_info['previews']
+                result['presentationUrl'] = preview_info['urls']['presentation']
+                logger.info(f"Generated preview info: {preview_info['previews']['available']} thumbnails")
+            else:
+                logger.warning("Could not extract presentation ID for previews")
+        except Exception as e:
+            logger.warning(f"Could not generate previews: {e}")
+            result['previews'] = {'available': 0, 'total': 0, 'error': str(e)}
+        
+        logger.info(f"Conversion completed successfully in {processing_time:.2f}s")
+        return result
+    
     def _fetch_svg_content(self, svg_url: str) -> bytes:
         """
         Fetch SVG content from URL.
@@ -143,16 +213,8 @@ class ConversionService:
         """
         try:
             import httpx
-            import urllib.parse
-            
-            # Validate URL format
-            parsed_url = urllib.parse.urlparse(svg_url)
-            if not parsed_url.scheme or not parsed_url.netloc:
-                raise ConversionError(f"Invalid URL format: {svg_url}")
             
-            # Only allow HTTP/HTTPS schemes for security
-            if parsed_url.scheme.lower() not in ['http', 'https']:
-                raise ConversionError(f"Unsupported URL scheme: {parsed_url.scheme}")
+            self._validate_svg_url(svg_url)
             
             logger.info(f"Fetching SVG content from: {svg_url}")
             
@@ -171,23 +233,9 @@ class ConversionService:
                 # Check response status
                 response.raise_for_status()
                 
-                # Validate content type
-                content_type = response.headers.get('content-type', '').lower()
-                if not any(ct in content_type for ct in ['svg', 'xml']):
-                    logger.warning(f"Unexpected content type: {content_type}")
-                
-                # Check content size (limit to 10MB)
-                content_length = len(response.content)
-                max_size = 10 * 1024 * 1024  # 10MB
-                if content_length > max_size:
-                    raise ConversionError(f"SVG file too large: {content_length} bytes (max: {max_size})")
+                self._validate_svg_content(response.content, response.headers.get('content-type', ''))
                 
-                # Validate that content looks like SVG
-                content_str = response.content.decode('utf-8', errors='replace')
-                if '<svg' not in content_str.lower():
-                    raise ConversionError("Downloaded content does not appear to be valid SVG")
-                
-                logger.info(f"Successfully fetched SVG content: {content_length} bytes")
+                logger.info(f"Successfully fetched SVG content: {len(response.content)} bytes")
                 return response.content
                 
         except httpx.HTTPStatusError as e:
@@ -206,6 +254,78 @@ class ConversionService:
             logger.error(f"Unexpected error fetching SVG from {svg_url}: {e}")
             raise ConversionError(f"Failed to fetch SVG content: {e}")
     
+    def _fetch_svg_content_pooled(self, svg_url: str) -> bytes:
+        """
+        Fetch SVG content from URL through the shared HTTP fetcher.
+        
+        Reuses pooled connections and revalidates cached copies; applies the
+        same scheme, size and content checks as _fetch_svg_content.
+        
+        Args:
+            svg_url: URL to fetch SVG from
+            
+        Returns:
+            SVG content as bytes
+        """
+        import requests
+        
+        self._validate_svg_url(svg_url)
+        
+        logger.info(f"Fetching SVG content from: {svg_url}")
+        try:
+            fetched = get_http_fetcher().fetch(svg_url, timeout=30, max_bytes=MAX_SVG_BYTES)
+        except FetchError:
+            raise ConversionError(f"SVG file too large (max: {MAX_SVG_BYTES} bytes)")
+        except requests.HTTPError as e:
+            logger.error(f"HTTP error fetching SVG: {e}")
+            raise ConversionError(f"Failed to fetch SVG: HTTP {e.response.status_code}")
+        except requests.Timeout as e:
+            logger.error(f"Timeout fetching SVG from {svg_url}: {e}")
+            raise ConversionError("Timeout fetching SVG from URL (30s timeout exceeded)")
+        except requests.RequestException as e:
+            logger.error(f"Request error fetching SVG from {svg_url}: {e}")
+            raise ConversionError(f"Network error fetching SVG: {e}")
+        
+        self._validate_svg_content(fetched.content, fetched.content_type)
+        
+        logger.info(f"Successfully fetched SVG content: {len(fetched.content)} bytes"
+                    f"{' (not modified)' if fetched.not_modified else ''}")
+        return fetched.content
+    
+    def _validate_svg_url(self, svg_url: str) -> None:
+        """
+        Reject malformed URLs and schemes other than HTTP/HTTPS.
+        
+        Raises:
+            ConversionError: If the URL cannot be fetched safely
+        """
+        import urllib.parse
+        
+        parsed_url = urllib.parse.urlparse(svg_url)
+        if not parsed_url.scheme or not parsed_url.netloc:
+            raise ConversionError(f"Invalid URL format: {svg_url}")
+        
+        # Only allow HTTP/HTTPS schemes for security
+        if parsed_url.scheme.lower() not in ['http', 'https']:
+            raise ConversionError(f"Unsupported URL scheme: {parsed_url.scheme}")
+    
+    def _validate_svg_content(self, content: bytes, content_type: str) -> None:
+        """
+        Check a downloaded body's size and that it looks like SVG.
+        
+        Raises:
+            ConversionError: If the body is too large or not SVG
+        """
+        content_type = content_type.lower()
+        if not any(ct in content_type for ct in ['svg', 'xml']):
+            logger.warning(f"Unexpected content type: {content_type}")
+        
+        if len(content) > MAX_SVG_BYTES:
+            raise ConversionError(f"SVG file too large: {len(content)} bytes (max: {MAX_SVG_BYTES})")
+        
+        if b'<svg' not in content.lower():
+            raise ConversionError("Downloaded content does not appear to be valid SVG")
+    
     def _convert_svg_to_pptx(self, svg_content: bytes, source_url: str) -> bytes:
         """
         Convert SVG content to PPTX format using preprocessing and modular converters.
@@ -15,6 +15,7 @@ from .svg_validator import (
     ValidationSeverity,
     create_svg_validator,
 )
+from .tree_statistics import TreeStatistics, collect_tree_statistics
 from .types import (
     CompatibilityLevel,
     CompatibilityReport,
@@ -30,6 +31,8 @@ __all__ = [
     'SVGAnalyzer',
     'AnalysisResult',
     'ComplexityCalculator',
+    'TreeStatistics',
+    'collect_tree_statistics',
     'SVGAnalyzerAPI',
     'create_api_analyzer',
     'SVGValidator',
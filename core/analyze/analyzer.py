@@ -12,9 +12,6 @@ from typing import Any, Optional
 
 from lxml import etree as ET
 
-# Import safe iteration utilities
-from ..xml.safe_iter import walk
-
 # Import OutputFormat with fallback for testing
 try:
     from ..pipeline.config import OutputFormat
@@ -26,6 +23,7 @@ except ImportError:
         SLIDE_XML = "slide_xml"
         DEBUG_JSON = "debug_json"
 from .complexity_calculator import ComplexityCalculator
+from .tree_statistics import TreeStatistics, collect_tree_statistics
 
 logger = logging.getLogger(__name__)
 
@@ -118,12 +116,17 @@ class SVGAnalyzer:
         self.complexity_calculator = ComplexityCalculator()
         self.logger = logging.getLogger(__name__)
 
-    def analyze(self, svg_root: ET.Element) -> AnalysisResult:
+    def analyze(self, svg_root: ET.Element, parse_result: Any | None = None,
+                parser: Any | None = None) -> AnalysisResult:
         """
         Analyze SVG structure and recommend conversion strategy.
 
         Args:
             svg_root: Root SVG element
+            parse_result: Optional ParseResult that produced ``svg_root``. When
+                given, the IR scene is built from that DOM directly instead of
+                serializing and re-parsing it.
+            parser: Optional SVGParser to reuse for IR conversion
 
         Returns:
             AnalysisResult with complexity score and recommendations
@@ -131,30 +134,28 @@ class SVGAnalyzer:
         start_time = time.perf_counter()
 
         try:
-            # Basic element counting
-            elements = list(walk(svg_root))
-            element_count = len(elements) - 1  # Exclude root SVG element
-
-            # Count specific element types
-            element_counts = self._count_elements_by_type(svg_root)
+            # Single pass over the tree fills every counter and accumulator
+            statistics = collect_tree_statistics(svg_root)
+            element_count = statistics.total_elements - 1  # Exclude root SVG element
+            element_counts = statistics.element_counts
 
             # Calculate complexity score
-            complexity_score = self._calculate_complexity_score(svg_root, element_counts)
+            complexity_score = self._calculate_complexity_score(svg_root, element_counts, statistics)
 
             # Analyze features
-            features = self._analyze_features(svg_root)
+            features = statistics.feature_flags()
 
             # Calculate detailed complexity metrics
-            text_complexity = self._calculate_text_complexity(svg_root)
-            path_complexity = self._calculate_path_complexity(svg_root)
-            group_nesting_depth = self._calculate_group_nesting_depth(svg_root)
+            text_complexity = statistics.text_complexity
+            path_complexity = statistics.path_complexity
+            group_nesting_depth = statistics.group_nesting_depth
 
             # Determine recommended output format
             recommended_format = self._recommend_output_format(complexity_score, features)
 
             # Generate recommendations
             strategies = self._generate_strategies(complexity_score, features, element_counts)
-            optimizations = self._generate_optimization_suggestions(svg_root, features)
+            optimizations = self._generate_optimization_suggestions(svg_root, features, statistics)
 
             # Calculate processing time
             processing_time = (time.perf_counter() - start_time) * 1000
@@ -163,7 +164,9 @@ class SVGAnalyzer:
             estimated_conversion_time = self._estimate_conversion_time(complexity_score, element_count)
 
             # Create IR scene and enhance analysis with IR data
-            scene = self._create_ir_scene_placeholder(svg_root, element_counts)
+            scene = self._create_ir_scene_placeholder(
+                svg_root, element_counts, parse_result=parse_result, parser=parser,
+            )
 
             # If we have IR data, use it to enhance complexity analysis
             if scene and len(scene) > 0:
@@ -217,19 +220,15 @@ class SVGAnalyzer:
 
     def _count_elements_by_type(self, svg_root: ET.Element) -> dict[str, int]:
         """Count elements by type"""
-        counts = {}
-
-        for element in walk(svg_root):
-            tag = self._get_local_tag(element.tag)
-            if tag != 'svg':  # Skip root
-                counts[tag] = counts.get(tag, 0) + 1
+        return collect_tree_statistics(svg_root).element_counts
 
-        return counts
-
-    def _calculate_complexity_score(self, svg_root: ET.Element, element_counts: dict[str, int]) -> float:
+    def _calculate_complexity_score(self, svg_root: ET.Element, element_counts: dict[str, int],
+                                    statistics: TreeStatistics | None = None) -> float:
         """Calculate overall complexity score (0.0 to 1.0)"""
         try:
-            return self.complexity_calculator.calculate_overall_complexity(svg_root, element_counts)
+            return self.complexity_calculator.calculate_overall_complexity(
+                svg_root, element_counts, statistics=statistics,
+            )
         except Exception as e:
             self.logger.warning(f"Complexity calculation failed, using fallback: {e}")
             # Fallback calculation
@@ -242,139 +241,19 @@ class SVGAnalyzer:
 
     def _analyze_features(self, svg_root: ET.Element) -> dict[str, bool]:
         """Analyze SVG features that affect complexity"""
-        features = {
-            'has_transforms': False,
-            'has_clipping': False,
-            'has_patterns': False,
-            'has_animations': False,
-        }
-
-        for element in walk(svg_root):
-            # Check for transforms
-            if element.get('transform'):
-                features['has_transforms'] = True
-
-            # Check for clipping
-            if element.get('clip-path') or self._get_local_tag(element.tag) == 'clipPath':
-                features['has_clipping'] = True
-
-            # Check for patterns
-            if self._get_local_tag(element.tag) == 'pattern':
-                features['has_patterns'] = True
-
-            # Check for animations
-            tag = self._get_local_tag(element.tag)
-            if tag in ['animate', 'animateTransform', 'animateMotion', 'animateColor', 'set']:
-                features['has_animations'] = True
-
-        return features
+        return collect_tree_statistics(svg_root).feature_flags()
 
     def _calculate_text_complexity(self, svg_root: ET.Element) -> float:
         """Calculate text-specific complexity"""
-        text_elements = []
-
-        for element in walk(svg_root):
-            tag = self._get_local_tag(element.tag)
-            if tag in ['text', 'tspan']:
-                text_elements.append(element)
-
-        if not text_elements:
-            return 0.0
-
-        complexity_factors = []
-
-        for text_elem in text_elements:
-            factor = 0.1  # Base complexity
-
-            # Font complexity
-            if text_elem.get('font-family'):
-                factor += 0.1
-            if text_elem.get('font-size'):
-                factor += 0.1
-            if text_elem.get('font-weight') in ['bold', 'bolder']:
-                factor += 0.1
-            if text_elem.get('font-style') == 'italic':
-                factor += 0.1
-
-            # Positioning complexity
-            if text_elem.get('x') or text_elem.get('y'):
-                factor += 0.1
-            if text_elem.get('dx') or text_elem.get('dy'):
-                factor += 0.2
-
-            # Text effects
-            if text_elem.get('text-decoration'):
-                factor += 0.1
-            if text_elem.get('text-anchor'):
-                factor += 0.1
-
-            # Path-based text
-            if text_elem.get('textPath'):
-                factor += 0.5
-
-            complexity_factors.append(min(factor, 1.0))
-
-        return sum(complexity_factors) / len(complexity_factors) if complexity_factors else 0.0
+        return collect_tree_statistics(svg_root).text_complexity
 
     def _calculate_path_complexity(self, svg_root: ET.Element) -> float:
         """Calculate path-specific complexity"""
-        path_elements = [elem for elem in walk(svg_root) if self._get_local_tag(elem.tag) == 'path']
-
-        if not path_elements:
-            return 0.0
-
-        complexity_scores = []
-
-        for path_elem in path_elements:
-            path_data = path_elem.get('d', '')
-            if not path_data:
-                complexity_scores.append(0.0)
-                continue
-
-            # Count different command types
-            commands = {
-                'M': path_data.count('M') + path_data.count('m'),
-                'L': path_data.count('L') + path_data.count('l'),
-                'C': path_data.count('C') + path_data.count('c'),
-                'Q': path_data.count('Q') + path_data.count('q'),
-                'A': path_data.count('A') + path_data.count('a'),
-                'Z': path_data.count('Z') + path_data.count('z'),
-            }
-
-            # Calculate complexity based on command types and counts
-            total_commands = sum(commands.values())
-            if total_commands == 0:
-                complexity_scores.append(0.0)
-                continue
-
-            # Weighted complexity (curves are more complex than lines)
-            weighted_complexity = (
-                commands['M'] * 0.1 +
-                commands['L'] * 0.2 +
-                commands['C'] * 0.8 +
-                commands['Q'] * 0.6 +
-                commands['A'] * 1.0 +
-                commands['Z'] * 0.1
-            )
+        return collect_tree_statistics(svg_root).path_complexity
 
-            # Normalize by total commands
-            path_complexity = min(weighted_complexity / max(total_commands, 1), 1.0)
-            complexity_scores.append(path_complexity)
-
-        return sum(complexity_scores) / len(complexity_scores) if complexity_scores else 0.0
-
-    def _calculate_group_nesting_depth(self, svg_root: ET.Element, current_depth: int = 0) -> int:
+    def _calculate_group_nesting_depth(self, svg_root: ET.Element) -> int:
         """Calculate maximum group nesting depth"""
-        from ..xml.safe_iter import children
-
-        max_depth = current_depth
-
-        for child in children(svg_root):
-            if self._get_local_tag(child.tag) == 'g':
-                child_depth = self._calculate_group_nesting_depth(child, current_depth + 1)
-                max_depth = max(max_depth, child_depth)
-
-        return max_depth
+        return collect_tree_statistics(svg_root).group_nesting_depth
 
     def _recommend_output_format(self, complexity_score: float, features: dict[str, bool]) -> OutputFormat:
         """Recommend output format based on complexity and features"""
@@ -425,31 +304,30 @@ class SVGAnalyzer:
         return strategies
 
     def _generate_optimization_suggestions(self, svg_root: ET.Element,
-                                         features: dict[str, bool]) -> list[str]:
+                                         features: dict[str, bool],
+                                         statistics: TreeStatistics | None = None) -> list[str]:
         """Generate optimization suggestions"""
+        if statistics is None:
+            statistics = collect_tree_statistics(svg_root)
+
         suggestions = []
 
         # Check for common optimization opportunities
-        if len(list(walk(svg_root))) > 100:
+        if statistics.total_elements > 100:
             suggestions.append('consider_element_reduction')
 
         if features['has_transforms']:
             suggestions.append('consolidate_transformations')
 
         # Check for unused definitions
-        defs = svg_root.find('.//{http://www.w3.org/2000/svg}defs')
-        if defs is not None and len(defs) > 0:
+        if statistics.first_defs_child_count:
             suggestions.append('remove_unused_definitions')
 
         # Check for precision issues
-        for element in walk(svg_root):
-            for attr_name, attr_value in element.attrib.items():
-                if attr_name in ['x', 'y', 'width', 'height', 'cx', 'cy', 'r'] and '.' in str(attr_value):
-                    if len(str(attr_value).split('.')[-1]) > 3:
-                        suggestions.append('reduce_coordinate_precision')
-                        break
+        if statistics.has_high_precision_coordinates:
+            suggestions.append('reduce_coordinate_precision')
 
-        return list(set(suggestions))  # Remove duplicates
+        return suggestions
 
     def _estimate_conversion_time(self, complexity_score: float, element_count: int) -> float:
         """Estimate conversion time in milliseconds"""
@@ -465,18 +343,24 @@ class SVGAnalyzer:
         return base_time + element_time + complexity_overhead
 
     def _create_ir_scene_placeholder(self, svg_root: ET.Element,
-                                   element_counts: dict[str, int]) -> list[Any]:
+                                   element_counts: dict[str, int],
+                                   parse_result: Any | None = None,
+                                   parser: Any | None = None) -> list[Any]:
         """Create IR scene using the new SVG parser - never returns None"""
         try:
             # Use the new SVG to IR parser
             from ..parse.parser import SVGParser
 
-            # Convert the SVG element back to string for the parser
-            # This is a bit inefficient but maintains clean interfaces
-            svg_string = ET.tostring(svg_root, encoding='unicode')
+            if parser is None:
+                parser = SVGParser()
 
-            parser = SVGParser()
-            scene, parse_result = parser.parse_to_ir(svg_string)
+            if parse_result is not None and parse_result.svg_root is svg_root:
+                # Single-parse mode: share the DOM the pipeline already parsed
+                scene = parser.convert_parse_result_to_ir(parse_result)
+            else:
+                # Standalone usage: serialize and run the full parse again
+                svg_string = ET.tostring(svg_root, encoding='unicode')
+                scene, parse_result = parser.parse_to_ir(svg_string)
 
             if parse_result.success and scene is not None:
                 self.logger.debug(f"Created IR scene with {len(scene)} elements")
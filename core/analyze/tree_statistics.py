@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Tree Statistics Collector
+
+Single-pass collection of every counter, feature flag and complexity
+accumulator used by SVGAnalyzer and ComplexityCalculator.
+"""
+
+from dataclasses import dataclass, field
+
+from lxml import etree as ET
+
+from .constants import SVG_NAMESPACE
+
+_SVG = f"{{{SVG_NAMESPACE}}}"
+_XLINK_HREF = '{http://www.w3.org/1999/xlink}href'
+
+ANIMATION_TAGS = frozenset({'animate', 'animateTransform', 'animateMotion', 'animateColor', 'set'})
+
+# Numeric attributes inspected for high-precision coordinates
+PRECISION_ATTRIBUTES = ('x', 'y', 'width', 'height', 'cx', 'cy', 'r', 'rx', 'ry',
+                        'x1', 'y1', 'x2', 'y2', 'offset')
+SUGGESTION_PRECISION_ATTRIBUTES = frozenset({'x', 'y', 'width', 'height', 'cx', 'cy', 'r'})
+
+
+@dataclass
+class TreeStatistics:
+    """Aggregated statistics for one SVG tree, gathered in a single walk."""
+    # Counts (total includes the root element)
+    total_elements: int = 0
+    element_counts: dict[str, int] = field(default_factory=dict)
+
+    # Feature flags (names match ComplexityCalculator.feature_multipliers)
+    features: set[str] = field(default_factory=set)
+
+    # Structure
+    max_nesting_depth: int = 0
+    group_nesting_depth: int = 0
+    defs_child_count: int = 0
+    first_defs_child_count: int | None = None
+    use_count: int = 0
+    href_count: int = 0
+    url_reference_count: int = 0
+
+    # Analyzer complexity accumulators (local tag matching)
+    text_complexity: float = 0.0
+    path_complexity: float = 0.0
+
+    # Calculator complexity accumulators (SVG namespace matching)
+    path_data_complexity: float = 0.0
+    text_content_complexity: float = 0.0
+    precision_complexity: float = 0.0
+    has_high_precision_coordinates: bool = False
+
+    def feature_flags(self) -> dict[str, bool]:
+        """Return the analyzer feature flag dictionary."""
+        return {
+            'has_transforms': 'has_transforms' in self.features,
+            'has_clipping': 'has_clipping' in self.features,
+            'has_patterns': 'has_patterns' in self.features,
+            'has_animations': 'has_animations' in self.features,
+        }
+
+
+def collect_tree_statistics(svg_root: ET.Element) -> TreeStatistics:
+    """
+    Collect TreeStatistics by visiting each element of ``svg_root`` once.
+
+    Args:
+        svg_root: Root SVG element
+
+    Returns:
+        TreeStatistics for the whole tree
+    """
+    stats = TreeStatistics()
+    counts = stats.element_counts
+    features = stats.features
+
+    text_factors: list[float] = []
+    path_scores: list[float] = []
+    path_data_scores: list[float] = []
+    text_content_factors: list[float] = []
+    numeric_attrs = 0
+    high_precision_attrs = 0
+
+    # Open <text>/<tspan> frames for descendant-dependent text factors:
+    # [element, tspan_descendants, has_text_path]
+    text_frames: list[list] = []
+    # Group chain depth per open element (None once the chain of <g> is broken)
+    group_chain: list[int | None] = []
+    depth = -1
+
+    for event, element in ET.iterwalk(svg_root, events=('start', 'end')):
+        raw_tag = element.tag
+        if not isinstance(raw_tag, str):
+            continue  # Comments and processing instructions
+        tag = raw_tag.split('}')[1] if '}' in raw_tag else raw_tag
+
+        if event == 'end':
+            if text_frames and text_frames[-1][0] is element:
+                _, tspans, has_text_path = text_frames.pop()
+                text_content_factors.append(
+                    _text_content_factor(element, tspans, has_text_path),
+                )
+            group_chain.pop()
+            depth -= 1
+            continue
+
+        depth += 1
+        stats.total_elements += 1
+        if depth > stats.max_nesting_depth:
+            stats.max_nesting_depth = depth
+
+        # Group nesting follows direct <g> chains from the root only
+        if depth == 0:
+            chain = 0
+        else:
+            parent_chain = group_chain[-1]
+            chain = parent_chain + 1 if parent_chain is not None and tag == 'g' else None
+        group_chain.append(chain)
+        if chain is not None and chain > stats.group_nesting_depth:
+            stats.group_nesting_depth = chain
+
+        if tag != 'svg':
+            counts[tag] = counts.get(tag, 0) + 1
+
+        attrib = element.attrib
+        get = attrib.get
+
+        # Feature detection
+        if get('transform'):
+            features.add('has_transforms')
+        if get('clip-path') or tag == 'clipPath':
+            features.add('has_clipping')
+        if tag == 'pattern':
+            features.add('has_patterns')
+        if tag in ('linearGradient', 'radialGradient'):
+            features.add('has_gradients')
+        if tag.startswith('fe') or tag == 'filter' or get('filter'):
+            features.add('has_filters')
+        if tag == 'mask' or get('mask'):
+            features.add('has_masks')
+        if tag in ANIMATION_TAGS:
+            features.add('has_animations')
+
+        # References
+        if get('href') or get(_XLINK_HREF):
+            stats.href_count += 1
+        for name, value in attrib.items():
+            if value.startswith('url(#'):
+                stats.url_reference_count += 1
+            if (not stats.has_high_precision_coordinates
+                    and name in SUGGESTION_PRECISION_ATTRIBUTES
+                    and '.' in value and len(value.split('.')[-1]) > 3):
+                stats.has_high_precision_coordinates = True
+
+        for name in PRECISION_ATTRIBUTES:
+            value = get(name)
+            if value and '.' in value:
+                numeric_attrs += 1
+                if len(value.split('.')[-1]) > 3:
+                    high_precision_attrs += 1
+
+        if tag in ('text', 'tspan'):
+            text_factors.append(_text_attribute_factor(element))
+        elif tag == 'path':
+            path_scores.append(_path_command_score(get('d', '')))
+
+        # Namespace-qualified descendants (mirrors findall('.//{svg}...'))
+        if depth > 0 and raw_tag.startswith(_SVG):
+            if tag == 'tspan':
+                for frame in text_frames:
+                    frame[1] += 1
+            elif tag == 'textPath':
+                for frame in text_frames:
+                    frame[2] = True
+
+            if tag == 'defs':
+                defs_len = len(element)
+                stats.defs_child_count += defs_len
+                if stats.first_defs_child_count is None:
+                    stats.first_defs_child_count = defs_len
+            elif tag == 'use':
+                stats.use_count += 1
+            elif tag == 'path':
+                path_data_scores.append(_path_data_score(get('d', '')))
+
+            if tag in ('text', 'tspan'):
+                text_frames.append([element, 0, False])
+
+    stats.text_complexity = _mean(text_factors)
+    stats.path_complexity = _mean(path_scores)
+    stats.path_data_complexity = _mean(path_data_scores)
+    stats.text_content_complexity = _mean(text_content_factors)
+    if numeric_attrs:
+        stats.precision_complexity = min(high_precision_attrs / numeric_attrs, 1.0)
+
+    return stats
+
+
+def _mean(values: list[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+def _text_attribute_factor(text_elem: ET.Element) -> float:
+    """Attribute-driven complexity of a single text or tspan element."""
+    factor = 0.1  # Base complexity
+
+    # Font complexity
+    if text_elem.get('font-family'):
+        factor += 0.1
+    if text_elem.get('font-size'):
+        factor += 0.1
+    if text_elem.get('font-weight') in ['bold', 'bolder']:
+        factor += 0.1
+    if text_elem.get('font-style') == 'italic':
+        factor += 0.1
+
+    # Positioning complexity
+    if text_elem.get('x') or text_elem.get('y'):
+        factor += 0.1
+    if text_elem.get('dx') or text_elem.get('dy'):
+        factor += 0.2
+
+    # Text effects
+    if text_elem.get('text-decoration'):
+        factor += 0.1
+    if text_elem.get('text-anchor'):
+        factor += 0.1
+
+    # Path-based text
+    if text_elem.get('textPath'):
+        factor += 0.5
+
+    return min(factor, 1.0)
+
+
+def _text_content_factor(text_elem: ET.Element, tspan_descendants: int, has_text_path: bool) -> float:
+    """Content-driven complexity of a single text or tspan element."""
+    factor = 0.0
+
+    # Text length
+    if len(text_elem.text or '') > 50:
+        factor += 0.3
+
+    # Multiple tspan children
+    if tspan_descendants > 3:
+        factor += 0.4
+
+    # Complex positioning
+    if text_elem.get('dx') or text_elem.get('dy'):
+        factor += 0.2
+
+    # Text on path
+    if has_text_path:
+        factor += 0.5
+
+    return min(factor, 1.0)
+
+
+def _path_command_score(path_data: str) -> float:
+    """Weighted command-mix complexity of a path ``d`` attribute."""
+    if not path_data:
+        return 0.0
+
+    commands = {
+        'M': path_data.count('M') + path_data.count('m'),
+        'L': path_data.count('L') + path_data.count('l'),
+        'C': path_data.count('C') + path_data.count('c'),
+        'Q': path_data.count('Q') + path_data.count('q'),
+        'A': path_data.count('A') + path_data.count('a'),
+        'Z': path_data.count('Z') + path_data.count('z'),
+    }
+
+    total_commands = sum(commands.values())
+    if total_commands == 0:
+        return 0.0
+
+    # Weighted complexity (curves are more complex than lines)
+    weighted_complexity = (
+        commands['M'] * 0.1 +
+        commands['L'] * 0.2 +
+        commands['C'] * 0.8 +
+        commands['Q'] * 0.6 +
+        commands['A'] * 1.0 +
+        commands['Z'] * 0.1
+    )
+
+    return min(weighted_complexity / max(total_commands, 1), 1.0)
+
+
+def _path_data_score(path_data: str) -> float:
+    """Curve ratio and length complexity of a path ``d`` attribute."""
+    if not path_data:
+        return 0.0
+
+    curve_commands = path_data.count('C') + path_data.count('c') + \
+                     path_data.count('Q') + path_data.count('q') + \
+                     path_data.count('A') + path_data.count('a')
+
+    total_commands = sum(1 for c in path_data if c.isalpha())
+    if total_commands == 0:
+        return 0.0
+
+    # Higher ratio of curves = higher complexity
+    curve_ratio = curve_commands / total_commands
+    path_length_factor = min(len(path_data) / 1000.0, 1.0)  # Long paths are complex
+
+    return min(curve_ratio * 0.7 + path_length_factor * 0.3, 1.0)
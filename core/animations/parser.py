@@ -14,7 +14,7 @@ Key Features:
 """
 
 import re
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from lxml import etree
 
@@ -28,6 +28,9 @@ from .core import (
     TransformType,
 )
 
+if TYPE_CHECKING:
+    from ..parse.document_index import DocumentIndex
+
 
 class SMILParsingError(Exception):
     """Exception raised during SMIL parsing."""
@@ -47,18 +50,21 @@ class SMILParser:
         }
         self.svg_namespace = self._namespace_map['svg']
 
-    def parse_svg_animations(self, svg_element: etree.Element) -> list[AnimationDefinition]:
+    def parse_svg_animations(self, svg_element: etree.Element,
+                             document_index: Optional['DocumentIndex'] = None) -> list[AnimationDefinition]:
         """
         Parse all SMIL animations from an SVG element.
 
         Args:
             svg_element: Root SVG element containing animations
+            document_index: Optional index of ``svg_element`` from the parser,
+                used instead of XPath searches
 
         Returns:
             List of parsed animation definitions
         """
         animations = []
-        animation_elements = self._find_animation_elements(svg_element)
+        animation_elements = self._find_animation_elements(svg_element, document_index)
 
         for anim_elem in animation_elements:
             try:
@@ -79,13 +85,20 @@ class SMILParser:
 
         return animations
 
-    def _find_animation_elements(self, svg_element: etree.Element) -> list[etree.Element]:
+    def _find_animation_elements(self, svg_element: etree.Element,
+                                 document_index: Optional['DocumentIndex'] = None) -> list[etree.Element]:
         """Find all animation elements in the SVG."""
         animation_tags = [
             'animate', 'animateTransform', 'animateColor', 'animateMotion', 'set',
         ]
 
         elements = []
+        if document_index is not None and document_index.root is svg_element:
+            for tag in animation_tags:
+                elements.extend(document_index.find_all(tag, namespace=None))
+                elements.extend(document_index.find_all(tag, namespace=self.svg_namespace))
+            return [element for element in elements if element is not svg_element]
+
         for tag in animation_tags:
             # Search with and without namespace
             no_ns = svg_element.xpath(f'.//{tag}')
@@ -19,6 +19,7 @@ try:
         convert_single_svg,
         extract_and_process_zip,
         merge_presentations,
+        package_presentations,
         periodic_cleanup,
         process_svg_batch,
     )
@@ -29,6 +30,7 @@ try:
         'huey',
         'convert_single_svg',
         'merge_presentations',
+        'package_presentations',
         'cleanup_temp_files', 
         'process_svg_batch',
         'extract_and_process_zip',
@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+Conversion Executor for Async Callers
+
+Runs CPU-bound conversions for asyncio code (the FastAPI handlers) on a warm
+process pool, so one large SVG never stalls the event loop. Each worker
+process keeps initialized converters in its ConverterPool across requests.
+
+Admission is bounded: at most ``max_workers + max_queue`` conversions are in
+flight, and further submissions fail fast with ExecutorSaturatedError so the
+API can answer 429 instead of letting latency grow without bound. Each
+submission also carries a timeout; a conversion that times out while still
+queued is cancelled. One already running is stopped by killing the one
+worker process running it, which is restarted for the next conversion, so
+a hung conversion cannot wedge a worker and conversions running on the
+other workers are unaffected. Thread workers cannot be stopped, so there a
+timed-out conversion keeps its slot until it finishes and admission still
+reflects real worker load.
+
+Workers are started with forkserver (spawn where unavailable) rather than
+fork, so they never inherit the API process's threads, locks or sockets.
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+from ..utils.process_pool import process_pool_context
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 120.0
+
+_WARMUP_SVG = ('<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">'
+               '<rect width="5" height="5" fill="red"/><text x="1" y="9">A</text></svg>')
+
+
+class ExecutorSaturatedError(Exception):
+    """Exception raised when the conversion queue is full"""
+    pass
+
+
+class ConversionTimeoutError(Exception):
+    """Exception raised when a conversion exceeds its timeout"""
+    pass
+
+
+def _init_conversion_worker(config_data: dict[str, Any] | None) -> None:
+    """Build and exercise a converter so the first request finds it warm."""
+    try:
+        _convert_in_worker(_WARMUP_SVG, config_data)
+    except Exception as e:
+        logger.warning(f"Conversion worker warm-up failed: {e}")
+
+
+def _convert_in_worker(svg_content: str | bytes, config_data: dict[str, Any] | None = None) -> bytes:
+    from ..pipeline.config import PipelineConfig
+    from .converter_pool import get_converter_pool
+
+    if isinstance(svg_content, bytes):
+        svg_content = svg_content.decode('utf-8', errors='replace')
+    config = PipelineConfig.from_dict(config_data) if config_data else None
+    with get_converter_pool().acquire(config) as converter:
+        return converter.convert_string(svg_content).output_data
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _worker_main(conn: Any, initializer: Callable[..., Any] | None, initargs: tuple) -> None:
+    """Run callables received over conn until the pipe closes."""
+    if initializer is not None:
+        try:
+            initializer(*initargs)
+        except Exception as e:
+            logger.warning(f"Conversion worker initializer failed: {e}")
+
+    while True:
+        try:
+            fn = conn.recv()
+        except (EOFError, OSError):
+            return
+        if fn is None:
+            return
+        try:
+            outcome = (True, fn())
+        except BaseException as e:
+            outcome = (False, e)
+        try:
+            conn.send(outcome)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            conn.send((False, RuntimeError(f"Unpicklable conversion outcome: {e!r}")))
+
+
+class _WorkerSlot:
+    """One worker process and the pipe it receives callables on."""
+
+    def __init__(self, context: multiprocessing.context.BaseContext,
+                 initializer: Callable[..., Any] | None, initargs: tuple):
+        self._context = context
+        self._initializer = initializer
+        self._initargs = initargs
+        self.process: multiprocessing.process.BaseProcess | None = None
+        self._conn = None
+
+    def ensure_started(self) -> None:
+        if self.process is not None and self.process.is_alive():
+            return
+        self.discard()
+        parent_conn, child_conn = self._context.Pipe()
+        self.process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self._initializer, self._initargs),
+            name='svg2pptx-convert',
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self._conn = parent_conn
+
+    def send(self, fn: Callable[[], Any]) -> None:
+        """Hand fn to the worker, starting it first if needed."""
+        self.ensure_started()
+        try:
+            self._conn.send(fn)
+        except (EOFError, OSError) as e:
+            self.discard()
+            raise BrokenProcessPool("Conversion worker process terminated abruptly") from e
+
+    def receive(self) -> Any:
+        """Wait for the result of the last send; BrokenProcessPool if the worker dies first."""
+        try:
+            ok, value = self._conn.recv()
+        except (EOFError, OSError) as e:
+            self.discard()
+            raise BrokenProcessPool("Conversion worker process terminated abruptly") from e
+        if not ok:
+            raise value
+        return value
+
+    def kill(self) -> None:
+        process = self.process
+        if process is not None and process.is_alive():
+            process.kill()
+            process.join()
+
+    def stop(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.send(None)
+            except (OSError, ValueError):
+                pass
+        if self.process is not None:
+            self.process.join(timeout=5)
+        self.discard()
+
+    def discard(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self.process is not None:
+            if self.process.is_alive():
+                self.process.kill()
+            self.process.join()
+            self.process = None
+
+
+class _Task:
+    """Callable submitted to a _WorkerProcessPool, with the slot running it."""
+
+    def __init__(self, fn: Callable[[], Any]):
+        self.fn = fn
+        self.slot: _WorkerSlot | None = None
+        self.cancelled = False
+
+
+class _WorkerProcessPool(Executor):
+    """
+    Process pool whose workers can be killed one at a time.
+
+    ProcessPoolExecutor marks the whole pool broken when any worker dies, so
+    stopping one hung conversion would fail every other running one. Here
+    each worker process is driven by its own dispatch thread; a killed or
+    crashed worker fails only the conversion it was running and is
+    restarted for the next one.
+    """
+
+    def __init__(self, max_workers: int, mp_context: multiprocessing.context.BaseContext,
+                 initializer: Callable[..., Any] | None = None, initargs: tuple = ()):
+        self._slots = [_WorkerSlot(mp_context, initializer, initargs) for _ in range(max_workers)]
+        self._idle: queue.SimpleQueue[_WorkerSlot] = queue.SimpleQueue()
+        for slot in self._slots:
+            self._idle.put(slot)
+        self._dispatcher = ThreadPoolExecutor(max_workers=max_workers,
+                                              thread_name_prefix='svg2pptx-dispatch')
+        self._tasks: dict[Future, _Task] = {}
+        self._lock = threading.Lock()
+
+    def start_workers(self) -> None:
+        """Start every worker process now instead of on first use."""
+        for slot in self._slots:
+            slot.ensure_started()
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        task = _Task(functools.partial(fn, *args, **kwargs) if args or kwargs else fn)
+        future = self._dispatcher.submit(self._dispatch, task)
+        with self._lock:
+            self._tasks[future] = task
+        future.add_done_callback(self._forget)
+        return future
+
+    def terminate(self, future: Future) -> bool:
+        """
+        Stop future's callable: kill its worker if it was sent, else never send it.
+
+        Returns:
+            False if the callable already finished
+        """
+        with self._lock:
+            # Under the lock the slot cannot be handed to another task yet
+            task = self._tasks.get(future)
+            if task is None:
+                return False
+            task.cancelled = True
+            if task.slot is not None:
+                task.slot.kill()
+            return True
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        def stop_workers() -> None:
+            self._dispatcher.shutdown(wait=True, cancel_futures=cancel_futures)
+            for slot in self._slots:
+                slot.stop()
+
+        if wait:
+            stop_workers()
+        else:
+            threading.Thread(target=stop_workers, name='svg2pptx-pool-shutdown', daemon=True).start()
+
+    def _dispatch(self, task: _Task) -> Any:
+        # At most max_workers dispatches run at once, so an idle slot is always free
+        slot = self._idle.get()
+        try:
+            slot.ensure_started()
+            # Check and send under the lock: a terminate() landing before this
+            # point must not let a restarted worker run the task anyway
+            with self._lock:
+                if task.cancelled:
+                    raise ConversionTimeoutError("Conversion was terminated before it started")
+                task.slot = slot
+                slot.send(task.fn)
+            return slot.receive()
+        finally:
+            with self._lock:
+                task.slot = None
+            self._idle.put(slot)
+
+    def _forget(self, future: Future) -> None:
+        with self._lock:
+            self._tasks.pop(future, None)
+
+
+class ConversionExecutor:
+    """
+    Bounded process pool for converting SVGs from async code.
+
+    ``run`` and ``convert`` are coroutines; they never block the event loop.
+    """
+
+    def __init__(self,
+                 max_workers: int | None = None,
+                 max_queue: int | None = None,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 config_data: dict[str, Any] | None = None,
+                 use_processes: bool = True):
+        """
+        Initialize conversion executor.
+
+        Args:
+            max_workers: Worker processes (CPU count if None)
+            max_queue: Conversions allowed to wait for a worker (2x workers if None)
+            timeout: Default per-conversion timeout in seconds
+            config_data: PipelineConfig dict used to warm the workers
+            use_processes: Use a process pool (a thread pool is used when False
+                or when running inside a daemonic process, which cannot fork)
+        """
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.max_queue = max(0, self.max_workers * 2 if max_queue is None else max_queue)
+        self.timeout = timeout
+        self.config_data = config_data
+        self.use_processes = use_processes and not multiprocessing.current_process().daemon
+
+        self._executor: Executor | None = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self.stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'rejected': 0,
+            'timed_out': 0,
+        }
+
+    @property
+    def capacity(self) -> int:
+        """Maximum conversions admitted at once (running + queued)."""
+        return self.max_workers + self.max_queue
+
+    @property
+    def in_flight(self) -> int:
+        """Conversions currently running or queued."""
+        return self._in_flight
+
+    def start(self, warm: bool = True) -> None:
+        """
+        Start the worker pool.
+
+        Args:
+            warm: Start every worker now and build its converter, rather
+                than on the first requests
+        """
+        with self._lock:
+            if self._executor is not None:
+                return
+            if self.use_processes:
+                self._executor = _WorkerProcessPool(
+                    max_workers=self.max_workers,
+                    mp_context=process_pool_context(),
+                    initializer=_init_conversion_worker if warm else None,
+                    initargs=(self.config_data,) if warm else (),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='svg2pptx-convert')
+            executor = self._executor
+
+        if warm:
+            if isinstance(executor, _WorkerProcessPool):
+                executor.start_workers()
+            # Workers start on demand; one task per worker waits until they are warm
+            for future in [executor.submit(_ping) for _ in range(self.max_workers)]:
+                future.result()
+            logger.info(f"Started {self.max_workers} warm conversion workers "
+                        f"({type(executor).__name__}, queue {self.max_queue})")
+
+    async def run(self, fn: Callable[..., Any], *args: Any,
+                  timeout: float | None = None, **kwargs: Any) -> Any:
+        """
+        Run a picklable callable on the pool.
+
+        Args:
+            fn: Module-level callable
+            *args: Positional arguments for ``fn``
+            timeout: Seconds to wait (executor default if None)
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            Value returned by ``fn``
+
+        Raises:
+            ExecutorSaturatedError: If running + queued conversions are at capacity
+            ConversionTimeoutError: If the conversion does not finish in time
+        """
+        if self._executor is None:
+            self.start(warm=False)
+
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self.stats['rejected'] += 1
+                raise ExecutorSaturatedError(
+                    f"Conversion queue full ({self._in_flight}/{self.capacity} in flight)"
+                )
+            self._in_flight += 1
+            self.stats['submitted'] += 1
+
+        executor = self._executor
+        try:
+            future = executor.submit(functools.partial(fn, *args, **kwargs))
+        except BaseException:
+            self._release(None)
+            raise
+        # Free the slot when the worker is done, not when the caller gives up
+        future.add_done_callback(self._release)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.stats['timed_out'] += 1
+            if not future.cancelled():
+                # Already running: stop its worker rather than let it hold a slot
+                self._recycle(executor, future)
+            raise ConversionTimeoutError(
+                f"Conversion did not finish within {timeout or self.timeout:g}s"
+            ) from None
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory); it is restarted for the next conversion
+            logger.error("Conversion worker died, restarting it on next request")
+            raise
+
+    async def convert(self, svg_content: str | bytes, config_data: dict[str, Any] | None = None,
+                      timeout: float | None = None) -> bytes:
+        """
+        Convert one SVG to PPTX bytes on a warm worker.
+
+        Args:
+            svg_content: SVG document
+            config_data: PipelineConfig dict (executor's config if None)
+            timeout: Seconds to wait (executor default if None)
+
+        Returns:
+            PPTX package bytes
+        """
+        return await self.run(_convert_in_worker, svg_content, config_data or self.config_data,
+                              timeout=timeout)
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get admission and outcome statistics"""
+        with self._lock:
+            return {
+                **self.stats,
+                'in_flight': self._in_flight,
+                'capacity': self.capacity,
+                'max_workers': self.max_workers,
+                'max_queue': self.max_queue,
+                'executor': 'process' if self.use_processes else 'thread',
+                'started': self._executor is not None,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool, cancelling queued conversions"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _recycle(self, executor: Executor, future: Future) -> None:
+        """Kill the worker process running a timed-out conversion."""
+        if isinstance(executor, _WorkerProcessPool) and executor.terminate(future):
+            logger.warning("Conversion timed out while running, stopping it")
+
+    def _release(self, future: Future | None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if future is None or future.cancelled():
+                return
+            if future.exception() is None:
+                self.stats['completed'] += 1
+            else:
+                self.stats['failed'] += 1
+
+
+_conversion_executor: ConversionExecutor | None = None
+_executor_pid: int | None = None
+_registry_lock = threading.Lock()
+
+
+def get_conversion_executor() -> ConversionExecutor:
+    """Get the process-wide conversion executor (rebuilt after a fork)."""
+    global _conversion_executor, _executor_pid
+    with _registry_lock:
+        if _conversion_executor is None or _executor_pid != os.getpid():
+            _conversion_executor = ConversionExecutor()
+            _executor_pid = os.getpid()
+        return _conversion_executor
+
+
+def configure_conversion_executor(**kwargs: Any) -> ConversionExecutor:
+    """
+    Replace the process-wide conversion executor.
+
+    Args:
+        **kwargs: ConversionExecutor arguments
+
+    Returns:
+        The new process-wide executor (not yet started)
+    """
+    global _conversion_executor, _executor_pid
+    executor = ConversionExecutor(**kwargs)
+    with _registry_lock:
+        previous, _conversion_executor, _executor_pid = _conversion_executor, executor, os.getpid()
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return executor
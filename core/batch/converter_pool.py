@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Converter Pool for Batch Workers
+
+Keeps initialized CleanSlateConverter instances alive across Huey tasks in a
+worker process, so services, policy engine, mappers and embedder are built
+once per process instead of once per file.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import asdict
+from typing import Any, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class ConverterPool:
+    """
+    Per-process pool of idle converters keyed by pipeline configuration.
+
+    A converter is checked out exclusively for one conversion at a time, so
+    the pool is safe to share between thread-based workers. Per-conversion
+    state is reset on every checkout. Converters dropped from the pool are
+    closed, releasing any mapping worker pool they started.
+    """
+
+    def __init__(self, max_idle: int = 4, factory: Callable[[Any], Any] | None = None):
+        """
+        Initialize converter pool.
+
+        Args:
+            max_idle: Maximum idle converters kept across all configurations
+            factory: Callable building a converter (with ``close()``) from a
+                PipelineConfig (or None)
+        """
+        self.max_idle = max_idle
+        self._factory = factory or _create_converter
+        self._idle: OrderedDict[str, list[Any]] = OrderedDict()
+        self._idle_count = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            'acquisitions': 0,
+            'created': 0,
+            'reused': 0,
+            'evicted': 0,
+            'setup_time_ms': 0.0,
+        }
+
+    @contextmanager
+    def acquire(self, config=None) -> Iterator[Any]:
+        """
+        Check out a converter for ``config``, returning it to the pool on exit.
+
+        Args:
+            config: PipelineConfig for the converter (defaults if None)
+
+        Yields:
+            Converter with per-conversion state reset
+        """
+        key = _config_key(config)
+        converter = self._take_idle(key)
+
+        if converter is None:
+            start = time.perf_counter()
+            converter = self._factory(config)
+            setup_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self._stats['created'] += 1
+                self._stats['setup_time_ms'] += setup_ms
+        else:
+            converter.reset_conversion_state()
+
+        try:
+            yield converter
+        finally:
+            self._release(key, converter)
+
+    def _take_idle(self, key: str) -> Any | None:
+        with self._lock:
+            self._stats['acquisitions'] += 1
+            converters = self._idle.get(key)
+            if not converters:
+                return None
+
+            converter = converters.pop()
+            self._idle_count -= 1
+            if not converters:
+                del self._idle[key]
+            self._stats['reused'] += 1
+            return converter
+
+    def _release(self, key: str, converter: Any) -> None:
+        evicted = []
+        with self._lock:
+            self._idle.setdefault(key, []).append(converter)
+            self._idle.move_to_end(key)
+            self._idle_count += 1
+
+            # Evict from the least recently used configuration
+            while self._idle_count > self.max_idle:
+                oldest_key = next(iter(self._idle))
+                converters = self._idle[oldest_key]
+                evicted.append(converters.pop(0))
+                self._idle_count -= 1
+                self._stats['evicted'] += 1
+                if not converters:
+                    del self._idle[oldest_key]
+
+        _close_converters(evicted)
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get reuse statistics"""
+        with self._lock:
+            acquisitions = self._stats['acquisitions']
+            return {
+                **self._stats,
+                'idle_converters': self._idle_count,
+                'configurations': len(self._idle),
+                'reuse_rate': self._stats['reused'] / max(acquisitions, 1),
+                'avg_setup_time_ms': self._stats['setup_time_ms'] / max(self._stats['created'], 1),
+                'pid': os.getpid(),
+            }
+
+    def clear(self) -> None:
+        """Close and drop all idle converters"""
+        with self._lock:
+            idle = [converter for converters in self._idle.values() for converter in converters]
+            self._idle.clear()
+            self._idle_count = 0
+
+        _close_converters(idle)
+
+
+def _create_converter(config=None):
+    from ..pipeline.converter import CleanSlateConverter
+    return CleanSlateConverter(config)
+
+
+def _close_converters(converters: list[Any]) -> None:
+    for converter in converters:
+        try:
+            converter.close()
+        except Exception as e:
+            logger.warning(f"Failed to close pooled converter: {e}")
+
+
+def _config_key(config) -> str:
+    if config is None:
+        return 'default'
+    # PipelineConfig.to_dict() keeps only the policy target; key on every
+    # field, thresholds and policy flags included
+    return json.dumps(asdict(config), sort_keys=True, default=str)
+
+
+# Process-wide instance; rebuilt after fork so workers never share converters
+_default_pool = None
+_default_pool_pid = None
+_default_pool_lock = threading.Lock()
+
+
+def get_converter_pool() -> ConverterPool:
+    """Get the converter pool for the current worker process."""
+    global _default_pool, _default_pool_pid
+    with _default_pool_lock:
+        if _default_pool is None or _default_pool_pid != os.getpid():
+            max_idle = int(os.getenv('SVG2PPTX_CONVERTER_POOL_SIZE', '4'))
+            _default_pool = ConverterPool(max_idle=max_idle)
+            _default_pool_pid = os.getpid()
+        return _default_pool
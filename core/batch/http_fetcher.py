@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Fetcher for SVG Sources
+
+One connection-pooled ``requests`` session and a bounded thread pool shared
+by the batch downloader and the API, backed by an on-disk response cache
+that revalidates with ETag / Last-Modified (conditional GET). Sources that
+answer ``304 Not Modified`` are served from disk without re-transferring
+the body, and are flagged so callers can skip re-converting them.
+
+The cache directory is safe to share between processes: entries are written
+to a temporary file and atomically renamed into place. The directory is kept
+within a byte budget by pruning the least recently used entries, and
+responses marked ``Cache-Control: no-store`` or ``private`` are not stored.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Environment variable overriding the response cache directory
+HTTP_CACHE_DIR_ENV = "SVG2PPTX_HTTP_CACHE_DIR"
+
+USER_AGENT = 'svg2pptx/1.0'
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_TIMEOUT = 30
+
+_ENTRY_SUFFIX = ".http"
+_CHUNK_SIZE = 8192
+_PRUNE_INTERVAL = 32  # Writes between disk size checks
+_UNCACHEABLE_DIRECTIVES = frozenset({'no-store', 'private'})
+
+
+class FetchError(Exception):
+    """Exception raised when a response cannot be accepted"""
+    pass
+
+
+@dataclass
+class CachedResponse:
+    """Stored response body with its validators"""
+    url: str
+    content: bytes
+    content_type: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass
+class FetchResult:
+    """Result of fetching one URL"""
+    url: str
+    content: bytes
+    content_type: str
+    content_hash: str
+    not_modified: bool = False  # Revalidated with a 304, body served from cache
+
+
+def default_cache_dir() -> Path:
+    """Get the response cache location (``$SVG2PPTX_HTTP_CACHE_DIR`` or user cache)."""
+    override = os.environ.get(HTTP_CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "svg2pptx" / "http"
+
+
+class HTTPResponseCache:
+    """On-disk store of response bodies keyed by URL, with HTTP validators."""
+
+    def __init__(self, cache_dir: str | os.PathLike,
+                 max_disk_size: int = 256 * 1024 * 1024):  # 256MB
+        """
+        Initialize response cache.
+
+        Args:
+            cache_dir: Directory for cached responses
+            max_disk_size: Disk budget in bytes before oldest entries are pruned
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_disk_size = max_disk_size
+
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self.stats = {
+            'disk_writes': 0,
+            'pruned': 0,
+        }
+
+    def get(self, url: str) -> CachedResponse | None:
+        """
+        Get the cached response for ``url``.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            CachedResponse, or None if nothing usable is stored
+        """
+        entry = self._entry_path(url)
+        try:
+            with open(entry, 'rb') as f:
+                header, _, content = f.read().partition(b'\n')
+            meta = json.loads(header)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable HTTP cache entry {entry}: {e}")
+            self._discard(entry)
+            return None
+
+        if meta.get('url') != url or meta.get('size') != len(content):
+            self._discard(entry)
+            return None
+
+        # Refresh recency so pruning in any process keeps hot entries
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+
+        return CachedResponse(
+            url=url,
+            content=content,
+            content_type=meta.get('content_type', ''),
+            etag=meta.get('etag'),
+            last_modified=meta.get('last_modified'),
+        )
+
+    def put(self, response: CachedResponse) -> None:
+        """
+        Store a response that carries at least one validator.
+
+        Args:
+            response: Response body and validators
+        """
+        if not (response.etag or response.last_modified):
+            return
+
+        header = json.dumps({
+            'url': response.url,
+            'content_type': response.content_type,
+            'etag': response.etag,
+            'last_modified': response.last_modified,
+            'size': len(response.content),
+        }).encode()
+
+        entry = self._entry_path(response.url)
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(header + b'\n' + response.content)
+                # Atomic publish: readers see either the old or the new entry
+                os.replace(temp_path, entry)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write HTTP cache entry {entry}: {e}")
+            return
+
+        with self._lock:
+            self.stats['disk_writes'] += 1
+            self._writes_since_prune += 1
+            prune = self._writes_since_prune >= _PRUNE_INTERVAL
+            if prune:
+                self._writes_since_prune = 0
+        if prune:
+            self._prune_disk()
+
+    def invalidate(self, url: str) -> None:
+        """Remove the cached response for ``url``, if any"""
+        self._discard(self._entry_path(url))
+
+    def clear(self) -> None:
+        """Remove every cached response"""
+        for entry in self.cache_dir.glob(f"*{_ENTRY_SUFFIX}"):
+            self._discard(entry)
+
+    def _prune_disk(self) -> None:
+        """Remove least recently used entries once the disk budget is exceeded."""
+        entries = []
+        total_size = 0
+        for entry in self.cache_dir.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+            total_size += stat.st_size
+
+        if total_size <= self.max_disk_size:
+            return
+
+        # Oldest first, leaving some headroom
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total_size -= size
+            with self._lock:
+                self.stats['pruned'] += 1
+            if total_size <= self.max_disk_size * 0.8:
+                break
+
+    def _entry_path(self, url: str) -> Path:
+        digest = hashlib.blake2b(url.encode(), digest_size=20).hexdigest()
+        return self.cache_dir / f"{digest}{_ENTRY_SUFFIX}"
+
+    @staticmethod
+    def _discard(entry: Path) -> None:
+        try:
+            entry.unlink()
+        except OSError:
+            pass
+
+
+class HTTPFetcher:
+    """
+    Connection-pooled, bounded-concurrency fetcher with conditional GET.
+
+    One instance is meant to be shared per process: the session keeps
+    keep-alive connections per host and the thread pool caps how many
+    requests are in flight at once.
+    """
+
+    def __init__(self,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 cache: HTTPResponseCache | None = None,
+                 timeout: float = DEFAULT_TIMEOUT):
+        """
+        Initialize fetcher.
+
+        Args:
+            max_workers: Maximum concurrent requests (also connections per host)
+            cache: Response cache for conditional requests (None disables)
+            timeout: Default request timeout in seconds
+        """
+        self.max_workers = max(1, max_workers)
+        self.cache = cache
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix='svg2pptx-fetch')
+        self._lock = threading.Lock()
+        self.stats = {
+            'requests': 0,
+            'not_modified': 0,
+            'bytes_downloaded': 0,
+            'errors': 0,
+        }
+
+    def fetch(self, url: str, timeout: float | None = None,
+              max_bytes: int | None = None) -> FetchResult:
+        """
+        Fetch one URL, revalidating a cached copy when there is one.
+
+        Args:
+            url: HTTP(S) URL
+            timeout: Request timeout in seconds (fetcher default if None)
+            max_bytes: Maximum accepted body size (unlimited if None)
+
+        Returns:
+            FetchResult with the body (fresh or from cache)
+
+        Raises:
+            requests.RequestException: On connection or HTTP errors
+            FetchError: If the body exceeds ``max_bytes``
+        """
+        cached = self.cache.get(url) if self.cache else None
+        headers = {'User-Agent': USER_AGENT}
+        if cached is not None:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+
+        try:
+            response = self.session.get(
+                url,
+                timeout=timeout or self.timeout,
+                stream=True,
+                headers=headers,
+            )
+            try:
+                if cached is not None and response.status_code == 304:
+                    self._count(requests=1, not_modified=1)
+                    return FetchResult(
+                        url=url,
+                        content=cached.content,
+                        content_type=cached.content_type,
+                        content_hash=_content_hash(cached.content),
+                        not_modified=True,
+                    )
+
+                response.raise_for_status()
+                content = _read_limited(response, max_bytes)
+                response_headers = response.headers
+            finally:
+                response.close()
+        except Exception:
+            self._count(errors=1)
+            raise
+
+        self._count(requests=1, bytes_downloaded=len(content))
+        content_type = response_headers.get('Content-Type', '')
+        if self.cache is not None and not _is_storable(response_headers.get('Cache-Control')):
+            self.cache.invalidate(url)
+        elif self.cache is not None:
+            self.cache.put(CachedResponse(
+                url=url,
+                content=content,
+                content_type=content_type,
+                etag=response_headers.get('ETag'),
+                last_modified=response_headers.get('Last-Modified'),
+            ))
+
+        return FetchResult(
+            url=url,
+            content=content,
+            content_type=content_type,
+            content_hash=_content_hash(content),
+        )
+
+    def fetch_all(self, urls: list[str], timeout: float | None = None,
+                  max_bytes: int | None = None) -> list[FetchResult | Exception]:
+        """
+        Fetch URLs concurrently, at most ``max_workers`` at a time.
+
+        Args:
+            urls: HTTP(S) URLs
+            timeout: Per-request timeout in seconds
+            max_bytes: Maximum accepted body size per URL
+
+        Returns:
+            One FetchResult or raised exception per URL, in input order
+        """
+        futures = [self._executor.submit(self.fetch, url, timeout, max_bytes) for url in urls]
+        results: list[FetchResult | Exception] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get request, revalidation and transfer statistics"""
+        with self._lock:
+            stats = dict(self.stats)
+        stats['max_workers'] = self.max_workers
+        stats['cache_dir'] = str(self.cache.cache_dir) if self.cache else None
+        return stats
+
+    def close(self) -> None:
+        """Shut down the worker threads and close pooled connections"""
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    def _count(self, **increments: int) -> None:
+        with self._lock:
+            for name, value in increments.items():
+                self.stats[name] += value
+
+
+def _read_limited(response: Any, max_bytes: int | None) -> bytes:
+    """Read a streamed response body, enforcing a size limit."""
+    chunks = []
+    total_size = 0
+    for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+        if chunk:
+            total_size += len(chunk)
+            if max_bytes is not None and total_size > max_bytes:
+                raise FetchError(f"Response exceeds {max_bytes} byte limit")
+            chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def _is_storable(cache_control: str | None) -> bool:
+    """Whether a response's Cache-Control allows a shared on-disk copy."""
+    if not cache_control:
+        return True
+    directives = {part.split('=', 1)[0].strip().lower() for part in cache_control.split(',')}
+    return not (directives & _UNCACHEABLE_DIRECTIVES)
+
+
+def _content_hash(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=20).hexdigest()
+
+
+_http_fetcher: HTTPFetcher | None = None
+_fetcher_pid: int | None = None
+_registry_lock = threading.Lock()
+
+
+def _create_default_fetcher(max_workers: int = DEFAULT_MAX_WORKERS,
+                            cache_dir: str | os.PathLike | None = None) -> HTTPFetcher:
+    cache_dir = cache_dir or default_cache_dir()
+    try:
+        cache = HTTPResponseCache(cache_dir)
+    except OSError as e:
+        logger.warning(f"HTTP response cache disabled, cannot use {cache_dir}: {e}")
+        cache = None
+    return HTTPFetcher(max_workers=max_workers, cache=cache)
+
+
+def get_http_fetcher() -> HTTPFetcher:
+    """Get the process-wide fetcher (rebuilt after a fork)."""
+    global _http_fetcher, _fetcher_pid
+    with _registry_lock:
+        # Pooled sockets and worker threads do not survive fork()
+        if _http_fetcher is None or _fetcher_pid != os.getpid():
+            _http_fetcher = _create_default_fetcher()
+            _fetcher_pid = os.getpid()
+        return _http_fetcher
+
+
+def configure_http_fetcher(max_workers: int = DEFAULT_MAX_WORKERS,
+                           cache_dir: str | os.PathLike | None = None) -> HTTPFetcher:
+    """
+    Replace the process-wide fetcher.
+
+    Args:
+        max_workers: Maximum concurrent requests
+        cache_dir: Response cache directory (default location if None)
+
+    Returns:
+        The new process-wide fetcher
+    """
+    global _http_fetcher, _fetcher_pid
+    fetcher = _create_default_fetcher(max_workers, cache_dir)
+    with _registry_lock:
+        previous, _http_fetcher, _fetcher_pid = _http_fetcher, fetcher, os.getpid()
+    if previous is not None:
+        previous.close()
+    return fetcher
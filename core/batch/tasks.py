@@ -4,15 +4,21 @@ Huey tasks for SVG to PowerPoint conversion.
 """
 
 import logging
+import multiprocessing
+import os
 import tempfile
+import threading
 import time
 import uuid
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
 from core.utils.powerpoint_merger import PPTXMergeError, PPTXMerger
+from core.utils.process_pool import process_pool_context
 
 from .huey_app import huey
 
@@ -59,6 +65,10 @@ def convert_single_svg(file_data: dict[str, Any], conversion_options: dict[str,
         options.get('slide_height', 7.5)
         options.get('quality', 'high')
         
+        # In-memory mode: hand back the embedded slide for direct packaging
+        if options.get('return_embedder_result'):
+            return _convert_to_embedder_result(filename, content, options)
+        
         # Create temporary files
         with tempfile.NamedTemporaryFile(suffix='.svg', delete=False) as svg_file:
             svg_file.write(content)
@@ -68,7 +78,8 @@ def convert_single_svg(file_data: dict[str, Any], conversion_options: dict[str,
             start_time = time.time()
 
             # Actual SVG to PowerPoint conversion using Clean Slate pipeline
-            from ..pipeline.converter import CleanSlateConverter
+            from .converter_pool import get_converter_pool
+            converter_pool = get_converter_pool()
 
             # Create output file path
             output_filename = filename.replace('.svg', '.pptx')
@@ -80,12 +91,11 @@ def convert_single_svg(file_data: dict[str, Any], conversion_options: dict[str,
             try:
                 logger.debug(f"Queue processing: Converting {filename}")
 
-                # Create Clean Slate converter
-                converter = CleanSlateConverter()
-
-                # Execute the conversion (convert bytes to string)
-                svg_string = content.decode('utf-8')
-                conversion_result = converter.convert_string(svg_string)
+                # Reuse an initialized Clean Slate converter from this worker's pool
+                with converter_pool.acquire() as converter:
+                    # Execute the conversion (convert bytes to string)
+                    svg_string = content.decode('utf-8')
+                    conversion_result = converter.convert_string(svg_string)
 
                 # Write output to file
                 with open(output_path, 'wb') as f:
@@ -118,6 +128,7 @@ Generated: {datetime.utcnow().isoformat()}
                 'output_size': output_path.stat().st_size,
                 'processing_time': actual_processing_time,
                 'conversion_options': options,
+                'converter_pool': converter_pool.get_statistics(),
                 'completed_at': datetime.utcnow().isoformat(),
             }
             
@@ -149,6 +160,40 @@ Generated: {datetime.utcnow().isoformat()}
         }
 
 
+def _convert_to_embedder_result(filename: str, content: bytes, options: dict[str, Any]) -> dict[str, Any]:
+    """Convert one SVG to an EmbedderResult without writing a single-slide PPTX."""
+    from ..pipeline.config import OutputFormat, PipelineConfig
+    from .converter_pool import get_converter_pool
+
+    start_time = time.time()
+    converter_pool = get_converter_pool()
+
+    # Slide XML output skips building a throwaway single-slide package
+    config = PipelineConfig(output_format=OutputFormat.SLIDE_XML)
+    try:
+        with converter_pool.acquire(config) as converter:
+            conversion_result = converter.convert_string(content.decode('utf-8'))
+    except Exception as e:
+        raise ConversionError(f"Conversion failed for {filename}: {e}") from e
+
+    processing_time = time.time() - start_time
+    logger.info(f"Converted {filename} to slide content in {processing_time:.2f}s")
+
+    return {
+        'success': True,
+        'input_filename': filename,
+        'output_filename': filename.replace('.svg', '.pptx'),
+        'output_path': None,
+        'input_size': len(content),
+        'output_size': len(conversion_result.output_data),
+        'processing_time': processing_time,
+        'conversion_options': options,
+        'converter_pool': converter_pool.get_statistics(),
+        'embedder_result': conversion_result.embedder_result,
+        'completed_at': datetime.utcnow().isoformat(),
+    }
+
+
 @huey.task()
 def merge_presentations(conversion_results: list[dict[str, Any]], output_format: str = 'single_pptx') -> dict[str, Any]:
     """
@@ -311,6 +356,79 @@ def merge_presentations(conversion_results: list[dict[str, Any]], output_format:
         }
 
 
+@huey.task()
+def package_presentations(conversion_results: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Assemble one multi-slide PowerPoint directly from in-memory slide results.
+    
+    Unlike merge_presentations this never writes or reopens per-file PPTX
+    packages: each successful result carries its EmbedderResult, and the
+    PackageWriter emits all slides into a single package in input order.
+    
+    Args:
+        conversion_results: Results from convert_single_svg with
+            ``return_embedder_result`` enabled
+        
+    Returns:
+        Dictionary with merge result and final output path
+    """
+    try:
+        from ..io.package_writer import PackageWriter
+
+        successful_results = [
+            r for r in conversion_results
+            if r.get('success', False) and r.get('embedder_result') is not None
+        ]
+        failed_count = len(conversion_results) - len(successful_results)
+        
+        if not successful_results:
+            raise ConversionError("No successful conversions to package")
+        
+        logger.info(f"Packaging {len(successful_results)} slides in memory ({failed_count} failed)")
+        
+        batch_id = uuid.uuid4().hex[:8]
+        output_dir = Path(f"/tmp/svg2pptx_output/batches/{batch_id}")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        merged_path = output_dir / f"merged_presentation_{batch_id}.pptx"
+        
+        with open(merged_path, 'wb') as f:
+            package_stats = PackageWriter().write_package_stream(
+                [r['embedder_result'] for r in successful_results], f,
+            )
+        
+        # Slide content is already in the package; keep task results small
+        individual_results = [
+            {k: v for k, v in r.items() if k != 'embedder_result'}
+            for r in conversion_results
+        ]
+        
+        result = {
+            'success': True,
+            'batch_id': batch_id,
+            'output_format': 'single_pptx',
+            'output_path': str(merged_path),
+            'output_size': package_stats['package_size_bytes'],
+            'total_files_processed': len(successful_results),
+            'failed_files': failed_count,
+            'total_input_size': sum(r.get('input_size', 0) for r in successful_results),
+            'total_processing_time': sum(r.get('processing_time', 0) for r in successful_results),
+            'individual_results': individual_results,
+            'completed_at': datetime.utcnow().isoformat(),
+        }
+        
+        logger.info(f"Packaged {len(successful_results)} slides into {merged_path}")
+        return result
+        
+    except Exception as e:
+        logger.error(f"Error packaging presentations: {e}")
+        return {
+            'success': False,
+            'error_message': str(e),
+            'error_type': 'merge_error',
+            'failed_at': datetime.utcnow().isoformat(),
+        }
+
+
 @huey.task()
 def cleanup_temp_files(file_paths: list[str]) -> dict[str, Any]:
     """
@@ -348,6 +466,144 @@ def cleanup_temp_files(file_paths: list[str]) -> dict[str, Any]:
     }
 
 
+def _resolve_batch_workers(file_count: int, options: dict[str, Any]) -> int:
+    """Number of parallel conversions for a batch (``max_workers`` option or env)."""
+    max_workers = options.get('max_workers') or os.getenv('SVG2PPTX_BATCH_WORKERS')
+    max_workers = int(max_workers) if max_workers else (os.cpu_count() or 1)
+    return max(1, min(max_workers, file_count))
+
+
+def _convert_file(file_data: dict[str, Any], options: dict[str, Any]) -> dict[str, Any]:
+    """Run one conversion in the current process (picklable for process pools)."""
+    return convert_single_svg.call_local(file_data, dict(options))
+
+
+def _processing_error(file_data: dict[str, Any], error: Exception) -> dict[str, Any]:
+    return {
+        'success': False,
+        'input_filename': file_data.get('filename', 'unknown'),
+        'error_message': str(error),
+        'error_type': 'processing_error',
+        'failed_at': datetime.utcnow().isoformat(),
+    }
+
+
+# Conversion process pools shared by every batch in this worker, by size
+_batch_pools: dict[int, ProcessPoolExecutor] = {}
+_batch_pools_pid: int | None = None
+_batch_pools_lock = threading.Lock()
+_daemon_fallback_logged = False
+
+
+def _get_batch_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Get this process's conversion pool of ``max_workers`` processes, starting it once."""
+    global _batch_pools_pid
+    with _batch_pools_lock:
+        # Pools do not survive fork(); a forked child starts its own
+        if _batch_pools_pid != os.getpid():
+            _batch_pools.clear()
+            _batch_pools_pid = os.getpid()
+        pool = _batch_pools.get(max_workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=process_pool_context())
+            _batch_pools[max_workers] = pool
+        return pool
+
+
+def _discard_batch_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next batch starts a fresh one."""
+    with _batch_pools_lock:
+        for size, current in list(_batch_pools.items()):
+            if current is pool:
+                del _batch_pools[size]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_batch_pools(wait: bool = True) -> None:
+    """Stop the conversion pools started by this process."""
+    with _batch_pools_lock:
+        pools = list(_batch_pools.values())
+        _batch_pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
+
+
+def convert_files_parallel(file_list: list[dict[str, Any]], options: dict[str, Any] = None) -> list[dict[str, Any]]:
+    """
+    Convert SVG files concurrently, returning results in input order.
+    
+    Uses a process pool, started once per Huey worker process with
+    forkserver and reused by every batch, so conversions scale across
+    cores and each pool process keeps its converters warm. Huey
+    ``process`` workers are daemonic and cannot start children, so a
+    thread pool is used there instead; run the consumer with thread
+    workers for process parallelism. A failing file only produces a
+    failed result entry.
+    
+    Args:
+        file_list: List of file data dictionaries
+        options: Conversion parameters (``max_workers`` limits parallelism)
+        
+    Returns:
+        Conversion results, one per input file, in input order
+    """
+    global _daemon_fallback_logged
+    options = options or {}
+    max_workers = _resolve_batch_workers(len(file_list), options)
+    
+    if max_workers == 1:
+        results = []
+        for file_data in file_list:
+            try:
+                results.append(_convert_file(file_data, options))
+            except Exception as e:
+                logger.error(f"Failed to process {file_data.get('filename', 'unknown')}: {e}")
+                results.append(_processing_error(file_data, e))
+        return results
+    
+    if multiprocessing.current_process().daemon:
+        if not _daemon_fallback_logged:
+            _daemon_fallback_logged = True
+            logger.warning("Daemonic worker process cannot start a conversion pool; "
+                           "batch conversions use threads (run Huey with thread workers)")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results, _ = _collect_results(executor, file_list, options)
+            return results
+    
+    pool = _get_batch_pool(max_workers)
+    logger.info(f"Converting {len(file_list)} files on {max_workers} pooled conversion processes")
+    results, broken = _collect_results(pool, file_list, options)
+    if broken:
+        # A conversion process died; the next batch starts a fresh pool
+        _discard_batch_pool(pool)
+    return results
+
+
+def _collect_results(executor: ThreadPoolExecutor | ProcessPoolExecutor,
+                     file_list: list[dict[str, Any]],
+                     options: dict[str, Any]) -> tuple[list[dict[str, Any]], bool]:
+    """Submit every file and collect results in input order, noting a broken pool."""
+    futures = []
+    for file_data in file_list:
+        try:
+            futures.append(executor.submit(_convert_file, file_data, options))
+        except BrokenProcessPool as e:
+            futures.append(e)
+    
+    results = []
+    broken = False
+    for file_data, future in zip(file_list, futures):
+        try:
+            if isinstance(future, BrokenProcessPool):
+                raise future
+            results.append(future.result())
+        except Exception as e:
+            broken = broken or isinstance(e, BrokenProcessPool)
+            logger.error(f"Failed to process {file_data.get('filename', 'unknown')}: {e}")
+            results.append(_processing_error(file_data, e))
+    return results, broken
+
+
 @huey.task()
 def process_svg_batch(file_list: list[dict[str, Any]], conversion_options: dict[str, Any] = None) -> dict[str, Any]:
     """
@@ -366,25 +622,20 @@ def process_svg_batch(file_list: list[dict[str, Any]], conversion_options: dict[
         
         logger.info(f"Starting batch processing of {len(file_list)} SVG files")
         
-        # Process each file individually
-        conversion_results = []
-        for file_data in file_list:
-            try:
-                # Call convert_single_svg synchronously since we're already in a task
-                result = convert_single_svg(file_data, options)
-                conversion_results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to process {file_data.get('filename', 'unknown')}: {e}")
-                conversion_results.append({
-                    'success': False,
-                    'input_filename': file_data.get('filename', 'unknown'),
-                    'error_message': str(e),
-                    'error_type': 'processing_error',
-                    'failed_at': datetime.utcnow().isoformat(),
-                })
+        # A single deck is packaged straight from slide results unless the
+        # python-pptx merger is requested explicitly
+        in_memory = output_format == 'single_pptx' and options.get('merge_strategy', 'package') == 'package'
+        if in_memory:
+            options = {**options, 'return_embedder_result': True}
+        
+        # Fan out conversions; results come back in input order
+        conversion_results = convert_files_parallel(file_list, options)
         
         # Merge results
-        merge_result = merge_presentations(conversion_results, output_format)
+        if in_memory:
+            merge_result = package_presentations.call_local(conversion_results)
+        else:
+            merge_result = merge_presentations.call_local(conversion_results, output_format)
         
         # Schedule cleanup of individual files (keep merged result)
         temp_files = [
@@ -466,7 +717,7 @@ def extract_and_process_zip(zip_content: bytes, conversion_options: dict[str, An
         logger.info(f"Extracted {len(file_list)} valid SVG files from ZIP")
         
         # Process the extracted files
-        return process_svg_batch(file_list, conversion_options)
+        return process_svg_batch.call_local(file_list, conversion_options)
         
     except ConversionError:
         raise
@@ -7,12 +7,14 @@ Downloads SVG files from URLs to temporary storage for batch conversion.
 
 import logging
 import tempfile
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import requests
 
+from .http_fetcher import DEFAULT_MAX_WORKERS, FetchError, HTTPFetcher, get_http_fetcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +30,8 @@ class DownloadResult:
     file_paths: list[str]
     errors: list[dict[str, Any]]
     temp_dir: str | None = None
+    unchanged_urls: list[str] = field(default_factory=list)  # Revalidated with a 304
+    content_hashes: dict[str, str] = field(default_factory=dict)  # URL -> body digest
 
 
 def download_svgs_to_temp(
@@ -35,15 +39,21 @@ def download_svgs_to_temp(
     timeout: int = 30,
     max_size_mb: int = 10,
     job_id: str | None = None,
+    fetcher: HTTPFetcher | None = None,
 ) -> DownloadResult:
     """
     Download SVG files from URLs to temporary directory.
 
+    URLs are fetched concurrently through the shared connection-pooled
+    fetcher; sources cached from an earlier run are revalidated with a
+    conditional GET and reported in ``unchanged_urls`` when not modified.
+
     Args:
         urls: List of HTTP(S) URLs to SVG files
         timeout: Request timeout in seconds (default 30)
         max_size_mb: Maximum file size in MB (default 10)
         job_id: Optional job ID for temp directory naming
+        fetcher: HTTP fetcher to use (process-wide fetcher if None)
 
     Returns:
         DownloadResult with file paths and any errors
@@ -65,50 +75,42 @@ def download_svgs_to_temp(
 
     file_paths = []
     errors = []
+    unchanged_urls = []
+    content_hashes = {}
     max_size_bytes = max_size_mb * 1024 * 1024
+    fetcher = fetcher or get_http_fetcher()
 
     try:
-        for i, url in enumerate(urls):
-            try:
-                logger.info(f"Downloading {i+1}/{len(urls)}: {url}")
+        logger.info(f"Downloading {len(urls)} URLs (up to {fetcher.max_workers} concurrently)")
+        fetched = fetcher.fetch_all(urls, timeout=timeout, max_bytes=max_size_bytes)
 
-                # Download with timeout and size limit
-                response = requests.get(
-                    url,
-                    timeout=timeout,
-                    stream=True,
-                    headers={'User-Agent': 'svg2pptx/1.0'},
-                )
-                response.raise_for_status()
+        for i, (url, result) in enumerate(zip(urls, fetched)):
+            try:
+                if isinstance(result, FetchError):
+                    raise DownloadError(f"File exceeds {max_size_mb}MB limit")
+                if isinstance(result, Exception):
+                    raise result
 
                 # Check content type
-                content_type = response.headers.get('Content-Type', '')
-                if not _is_svg_content_type(content_type):
-                    logger.warning(f"Non-SVG content type for {url}: {content_type}")
-
-                # Read content with size limit
-                content_chunks = []
-                total_size = 0
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        total_size += len(chunk)
-                        if total_size > max_size_bytes:
-                            raise DownloadError(f"File exceeds {max_size_mb}MB limit")
-                        content_chunks.append(chunk)
-
-                content = b''.join(content_chunks)
+                if not _is_svg_content_type(result.content_type):
+                    logger.warning(f"Non-SVG content type for {url}: {result.content_type}")
 
                 # Validate SVG content
-                if not _is_valid_svg_content(content):
+                if not _is_valid_svg_content(result.content):
                     raise DownloadError("Downloaded content is not valid SVG")
 
                 # Save to temp file
                 filename = _get_safe_filename(url, i)
                 file_path = Path(temp_dir) / filename
-                file_path.write_bytes(content)
+                file_path.write_bytes(result.content)
 
                 file_paths.append(str(file_path))
-                logger.info(f"✅ Downloaded {url} → {file_path} ({total_size} bytes)")
+                content_hashes[url] = result.content_hash
+                if result.not_modified:
+                    unchanged_urls.append(url)
+                    logger.info(f"✅ Not modified {url} → {file_path} (served from cache)")
+                else:
+                    logger.info(f"✅ Downloaded {url} → {file_path} ({len(result.content)} bytes)")
 
             except requests.RequestException as e:
                 error_msg = f"HTTP error downloading {url}: {e}"
@@ -155,6 +157,8 @@ def download_svgs_to_temp(
             file_paths=file_paths,
             errors=errors,
             temp_dir=temp_dir,
+            unchanged_urls=unchanged_urls,
+            content_hashes=content_hashes,
         )
 
     except Exception as e:
@@ -274,10 +278,13 @@ def get_downloader_info() -> dict[str, Any]:
             'size_limiting': True,
             'batch_download': True,
             'error_recovery': True,
+            'concurrent_download': True,
+            'conditional_get': True,
         },
         'defaults': {
             'timeout_seconds': 30,
             'max_size_mb': 10,
+            'max_concurrent_downloads': DEFAULT_MAX_WORKERS,
         },
         'supported_content_types': [
             'image/svg+xml',
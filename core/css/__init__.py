@@ -13,6 +13,12 @@ from .resolver import (
     parse_font_size,
     normalize_font_weight,
 )
+from .declaration_cache import (
+    InlineDeclarationCache,
+    configure_declaration_cache,
+    get_declaration_cache,
+    parse_inline_declarations,
+)
 from .animation_extractor import CSSAnimationExtractor
 
 __all__ = [
@@ -21,5 +27,9 @@ __all__ = [
     "parse_color",
     "parse_font_size",
     "normalize_font_weight",
+    "InlineDeclarationCache",
+    "configure_declaration_cache",
+    "get_declaration_cache",
+    "parse_inline_declarations",
     "CSSAnimationExtractor",
 ]
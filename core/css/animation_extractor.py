@@ -26,6 +26,7 @@ from ..animations import (
     TransformType,
 )
 from ..css import StyleResolver, StyleContext
+from .declaration_cache import parse_inline_declarations
 
 # Supported animation properties for MVP
 ANIMATED_PROPERTIES = {
@@ -175,20 +176,9 @@ class CSSAnimationExtractor:
 
             inline = element.get("style")
             if inline:
-                decls = tinycss2.parse_declaration_list(
-                    inline,
-                    skip_whitespace=True,
-                    skip_comments=True,
-                )
-                for decl in decls:
-                    if decl.type != "declaration":
-                        continue
+                for name, value, important in parse_inline_declarations(inline):
                     order_counter += 1
-                    props_for_element[decl.name.lower()] = (
-                        tinycss2.serialize(decl.value).strip(),
-                        bool(decl.important),
-                        order_counter,
-                    )
+                    props_for_element[name] = (value, important, order_counter)
 
             if props_for_element:
                 styles[element] = props_for_element
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Inline Declaration Cache
+
+Process-wide LRU from raw ``style=""`` strings to their parsed declarations.
+Exported SVGs repeat a small set of style strings across thousands of
+elements; the resolver, the style service and the CSS animation extractor
+all read the same strings, so each distinct string is parsed once per
+parser and the immutable result is shared by every consumer.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Tuple
+
+import tinycss2
+
+# (property name, value, !important)
+Declaration = Tuple[str, str, bool]
+DeclarationParser = Callable[[str], Tuple[Declaration, ...]]
+
+DEFAULT_MAX_SIZE = 8192
+
+
+def parse_declarations_tinycss2(style_str: str) -> tuple[Declaration, ...]:
+    """Tokenize a declaration list with tinycss2 (uncached, names lower-cased)."""
+    try:
+        declarations = tinycss2.parse_declaration_list(
+            style_str,
+            skip_whitespace=True,
+            skip_comments=True,
+        )
+    except Exception:
+        return ()
+
+    return tuple(
+        (decl.name.lower(), tinycss2.serialize(decl.value).strip(), bool(decl.important))
+        for decl in declarations
+        if decl.type == "declaration"
+    )
+
+
+class InlineDeclarationCache:
+    """
+    Thread-safe bounded LRU of parsed declaration lists.
+
+    Entries are keyed by (parser, style string) so consumers with different
+    parsing rules share one bounded store without seeing each other's output.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Initialize declaration cache.
+
+        Args:
+            max_size: Maximum cached style strings (0 disables caching)
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[DeclarationParser, str], tuple[Declaration, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def parse(self, style_str: str | None,
+              parser: DeclarationParser = parse_declarations_tinycss2) -> tuple[Declaration, ...]:
+        """
+        Get the parsed declarations for a style string.
+
+        Args:
+            style_str: Raw declaration list (``style`` attribute or rule body)
+            parser: Uncached parser producing the declarations
+
+        Returns:
+            Tuple of (name, value, important) declarations
+        """
+        if not style_str:
+            return ()
+
+        key = (parser, style_str)
+        with self._lock:
+            declarations = self._entries.get(key)
+            if declarations is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return declarations
+            self.misses += 1
+
+        declarations = parser(style_str)
+        if self.max_size <= 0:
+            return declarations
+
+        with self._lock:
+            self._entries[key] = declarations
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return declarations
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get cache size and hit statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Drop all cached declarations and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_declaration_cache = InlineDeclarationCache()
+
+
+def get_declaration_cache() -> InlineDeclarationCache:
+    """Get the process-wide inline declaration cache."""
+    return _declaration_cache
+
+
+def configure_declaration_cache(max_size: int) -> InlineDeclarationCache:
+    """
+    Replace the process-wide cache with one of a different size.
+
+    Args:
+        max_size: Maximum cached style strings (0 disables caching)
+
+    Returns:
+        The new process-wide cache
+    """
+    global _declaration_cache
+    _declaration_cache = InlineDeclarationCache(max_size)
+    return _declaration_cache
+
+
+def parse_inline_declarations(style_str: str | None,
+                              parser: DeclarationParser = parse_declarations_tinycss2) -> tuple[Declaration, ...]:
+    """Parse a declaration list through the process-wide cache."""
+    return _declaration_cache.parse(style_str, parser)
@@ -13,10 +13,9 @@ import re
 from dataclasses import dataclass
 from typing import Callable, Dict, Iterable, Optional, Tuple
 
-import tinycss2
-
 from ..color.css_colors import get_css_color
 from ..units.core import ConversionContext, UnitConverter
+from .declaration_cache import parse_inline_declarations
 
 # --------------------------------------------------------------------------- #
 # Utility parsers                                                            #
@@ -272,26 +271,8 @@ class StyleResolver:
         self,
         style_str: str,
     ) -> Iterable[Tuple[str, str, bool]]:
-        if not style_str:
-            return []
-
-        try:
-            declarations = tinycss2.parse_declaration_list(
-                style_str,
-                skip_whitespace=True,
-                skip_comments=True,
-            )
-        except Exception:
-            return []
-
-        result = []
-        for decl in declarations:
-            if decl.type != "declaration":
-                continue
-            name = decl.name.lower()
-            value = tinycss2.serialize(decl.value).strip()
-            result.append((name, value, bool(decl.important)))
-        return result
+        # Shared process-wide cache: text and paint passes reuse one parse
+        return parse_inline_declarations(style_str)
 
     def _apply_text_property(
         self,
@@ -10,6 +10,24 @@ import struct
 from enum import IntEnum
 from typing import List
 
+import numpy as np
+
+EMF_HEADER_SIZE = 108
+EMF_SIGNATURE = 0x464D4520  # ' EMF'
+EMF_VERSION = 0x10000
+EMU_PER_PIXEL = 9525  # 96 DPI reference device
+EMU_PER_HUNDREDTH_MM = 360
+
+# Graphics-mode constants used by path drawing
+MM_ANISOTROPIC = 8
+ALTERNATE = 1
+WINDING = 2
+PS_SOLID = 0
+NULL_BRUSH = 0x80000005
+NULL_PEN = 0x80000008
+
+_INT16_MIN, _INT16_MAX = -32768, 32767
+
 
 class EMFRecordType(IntEnum):
     """EMF record types for metafile generation."""
@@ -136,7 +154,12 @@ class EMFHatchStyle(IntEnum):
 
 
 class EMFBlob:
-    """Enhanced Metafile blob generator for PowerPoint compatibility."""
+    """Enhanced Metafile blob generator for PowerPoint compatibility.
+
+    Records are appended to a single growing ``bytearray``; point records
+    pack their whole coordinate array with one numpy conversion instead of
+    a ``struct.pack`` call per point.
+    """
 
     def __init__(self, width: int = 100, height: int = 100):
         """Initialize EMF blob generator.
@@ -147,51 +170,39 @@ class EMFBlob:
         """
         self.width = width
         self.height = height
-        self.records: list[bytes] = []
+        self._buffer = bytearray()
+        self.record_count = 0
         self.object_handles = []
         self.next_handle = 1
 
         # Initialize EMF header
         self._init_header()
 
-    def _init_header(self) -> None:
-        """Initialize EMF header record."""
-        # EMF header structure
-        header_size = 108  # Size of EMF header
-        header_data = struct.pack('<I', EMFRecordType.EMR_HEADER)  # Record type
-        header_data += struct.pack('<I', header_size)  # Record size
-
-        # Bounds rectangle (logical units)
-        header_data += struct.pack('<4l', 0, 0, self.width, self.height)
-
-        # Frame rectangle (device units, .01mm)
-        frame_width = self.width * 2540 // 914400  # Convert EMU to .01mm
-        frame_height = self.height * 2540 // 914400
-        header_data += struct.pack('<4l', 0, 0, frame_width, frame_height)
-
-        # Signature 'ENHMETA'
-        header_data += b'ENHMETA '
-
-        # Version, size, number of records (to be updated)
-        header_data += struct.pack('<III', 0x10000, 0, 0)
-
-        # Number of handles, reserved, description length, description offset
-        header_data += struct.pack('<HHHH', 0, 0, 0, 0)
-
-        # Palette entries, device width, device height
-        header_data += struct.pack('<III', 0, frame_width // 100, frame_height // 100)
-
-        # Device resolution
-        header_data += struct.pack('<II', 96, 96)  # 96 DPI
+    @property
+    def device_size(self) -> tuple[int, int]:
+        """Canvas size in reference device pixels (96 DPI)."""
+        return (max(1, self.width // EMU_PER_PIXEL), max(1, self.height // EMU_PER_PIXEL))
 
-        # Millimeter size
-        header_data += struct.pack('<II', frame_width // 100, frame_height // 100)
-
-        # Pad to header size
-        padding = header_size - len(header_data)
-        header_data += b'\x00' * padding
-
-        self.records.append(header_data)
+    def _init_header(self) -> None:
+        """Initialize EMF header record (size, count and handles filled by finalize)."""
+        header = bytearray(EMF_HEADER_SIZE)
+        device_width, device_height = self.device_size
+        frame_width = self.width // EMU_PER_HUNDREDTH_MM
+        frame_height = self.height // EMU_PER_HUNDREDTH_MM
+
+        struct.pack_into('<II', header, 0, EMFRecordType.EMR_HEADER, EMF_HEADER_SIZE)
+        # Bounds (device units, inclusive) and frame (.01mm)
+        struct.pack_into('<4l', header, 8, 0, 0, device_width - 1, device_height - 1)
+        struct.pack_into('<4l', header, 24, 0, 0, frame_width, frame_height)
+        struct.pack_into('<II', header, 40, EMF_SIGNATURE, EMF_VERSION)
+        # Reference device size in pixels and millimeters
+        struct.pack_into('<2l2l', header, 72, device_width, device_height,
+                         frame_width // 100, frame_height // 100)
+        # Reference device size in micrometers
+        struct.pack_into('<2l', header, 100, frame_width * 10, frame_height * 10)
+
+        self._buffer += header
+        self.record_count = 1
 
     def _add_record(self, record_type: EMFRecordType, data: bytes) -> None:
         """Add a record to the EMF blob.
@@ -200,9 +211,28 @@ class EMFBlob:
             record_type: EMF record type
             data: Record data
         """
-        record_size = 8 + len(data)  # Header + data
-        record = struct.pack('<II', record_type, record_size) + data
-        self.records.append(record)
+        self._buffer += struct.pack('<II', record_type, 8 + len(data))
+        self._buffer += data
+        self.record_count += 1
+
+    def _add_points_record(self, record_type: EMFRecordType, points: np.ndarray,
+                           dtype: str) -> None:
+        """Add a bounds + count + points record.
+
+        Args:
+            record_type: Poly record type
+            points: ``(n, 2)`` integer logical coordinates
+            dtype: ``'<i2'`` for 16-bit POINTS records, ``'<i4'`` for POINTL
+        """
+        packed = np.ascontiguousarray(points, dtype=dtype)
+        count = len(packed)
+        min_x, min_y = packed.min(axis=0).tolist()
+        max_x, max_y = packed.max(axis=0).tolist()
+
+        self._buffer += struct.pack('<II4lI', record_type, 28 + packed.nbytes,
+                                    min_x, min_y, max_x, max_y, count)
+        self._buffer += memoryview(packed).cast('B')
+        self.record_count += 1
 
     def _allocate_handle(self) -> int:
         """Allocate a new object handle."""
@@ -372,28 +402,128 @@ class EMFBlob:
         rect_data = struct.pack('<4l', x, y, x + width, y + height)
         self._add_record(EMFRecordType.EMR_RECTANGLE, rect_data)
 
+    def add_solid_brush(self, color: int) -> int:
+        """Add a solid brush.
+
+        Args:
+            color: Brush color (COLORREF, 0x00BBGGRR)
+
+        Returns:
+            Handle to the created brush object
+        """
+        handle = self._allocate_handle()
+        self._add_record(EMFRecordType.EMR_CREATEBRUSHINDIRECT,
+                        struct.pack('<IIII', handle, EMFBrushStyle.BS_SOLID, color, 0))
+        return handle
+
+    def add_pen(self, color: int, width: int = 1) -> int:
+        """Add a solid pen.
+
+        Args:
+            color: Pen color (COLORREF, 0x00BBGGRR)
+            width: Pen width in logical units
+
+        Returns:
+            Handle to the created pen object
+        """
+        handle = self._allocate_handle()
+        self._add_record(EMFRecordType.EMR_CREATEPEN,
+                        struct.pack('<IIllI', handle, PS_SOLID, max(0, width), 0, color))
+        return handle
+
+    def select_object(self, handle: int) -> None:
+        """Select a created object or stock object (e.g. ``NULL_PEN``) into the DC."""
+        self._add_record(EMFRecordType.EMR_SELECTOBJECT, struct.pack('<I', handle))
+
+    def set_logical_extent(self, width: int, height: int) -> None:
+        """Map a ``width`` x ``height`` logical space onto the whole canvas.
+
+        Args:
+            width: Logical window width
+            height: Logical window height
+        """
+        self._add_record(EMFRecordType.EMR_SETMAPMODE, struct.pack('<I', MM_ANISOTROPIC))
+        self._add_record(EMFRecordType.EMR_SETWINDOWEXTEX, struct.pack('<2l', max(1, width), max(1, height)))
+        self._add_record(EMFRecordType.EMR_SETVIEWPORTEXTEX, struct.pack('<2l', *self.device_size))
+
+    def set_poly_fill_mode(self, mode: int = WINDING) -> None:
+        """Set polygon fill mode (``WINDING`` matches SVG nonzero, ``ALTERNATE`` evenodd)."""
+        self._add_record(EMFRecordType.EMR_SETPOLYFILLMODE, struct.pack('<I', mode))
+
+    def begin_path(self) -> None:
+        """Open a path bracket."""
+        self._add_record(EMFRecordType.EMR_BEGINPATH, b'')
+
+    def end_path(self) -> None:
+        """Close the path bracket."""
+        self._add_record(EMFRecordType.EMR_ENDPATH, b'')
+
+    def close_figure(self) -> None:
+        """Close the current figure in the path bracket."""
+        self._add_record(EMFRecordType.EMR_CLOSEFIGURE, b'')
+
+    def move_to(self, x: int, y: int) -> None:
+        """Start a new figure at ``(x, y)``."""
+        self._add_record(EMFRecordType.EMR_MOVETOEX, struct.pack('<2l', x, y))
+
+    def poly_bezier_to(self, points: np.ndarray) -> None:
+        """Append cubic Beziers from the current position.
+
+        Args:
+            points: ``(3 * n, 2)`` control1, control2, end triples in logical units
+        """
+        self._add_poly(EMFRecordType.EMR_POLYBEZIERTO16, EMFRecordType.EMR_POLYBEZIERTO, points)
+
+    def poly_line_to(self, points: np.ndarray) -> None:
+        """Append line segments from the current position to each of ``points``."""
+        self._add_poly(EMFRecordType.EMR_POLYLINETO16, EMFRecordType.EMR_POLYLINETO, points)
+
+    def polygon(self, points: np.ndarray) -> None:
+        """Draw a closed polygon with the selected pen and brush."""
+        self._add_poly(EMFRecordType.EMR_POLYGON16, EMFRecordType.EMR_POLYGON, points)
+
+    def fill_path(self) -> None:
+        """Fill the closed path bracket with the selected brush."""
+        self._add_record(EMFRecordType.EMR_FILLPATH, self._bounds())
+
+    def stroke_path(self) -> None:
+        """Outline the path bracket with the selected pen."""
+        self._add_record(EMFRecordType.EMR_STROKEPATH, self._bounds())
+
+    def stroke_and_fill_path(self) -> None:
+        """Fill and outline the path bracket."""
+        self._add_record(EMFRecordType.EMR_STROKEANDFILLPATH, self._bounds())
+
+    def _add_poly(self, record_16: EMFRecordType, record_32: EMFRecordType,
+                  points: np.ndarray) -> None:
+        """Emit a 16-bit poly record when every coordinate fits, else the 32-bit form."""
+        points = np.asarray(points).reshape(-1, 2)
+        if len(points) == 0:
+            return
+        if points.min() >= _INT16_MIN and points.max() <= _INT16_MAX:
+            self._add_points_record(record_16, points, '<i2')
+        else:
+            self._add_points_record(record_32, points, '<i4')
+
+    def _bounds(self) -> bytes:
+        """Canvas bounds RECTL in device units."""
+        device_width, device_height = self.device_size
+        return struct.pack('<4l', 0, 0, device_width - 1, device_height - 1)
+
     def finalize(self) -> bytes:
         """Finalize the EMF and return the complete blob.
 
         Returns:
             Complete EMF blob as bytes
         """
-        # Add EOF record
-        self._add_record(EMFRecordType.EMR_EOF, struct.pack('<III', 0, 0, 0))
-
-        # Calculate total size and update header
-        total_size = sum(len(record) for record in self.records)
-        num_records = len(self.records)
-
-        # Update header with correct values
-        header = bytearray(self.records[0])
-        struct.pack_into('<I', header, 44, total_size)  # Total size
-        struct.pack_into('<I', header, 48, num_records)  # Number of records
-        struct.pack_into('<H', header, 52, len(self.object_handles))  # Number of handles
-        self.records[0] = bytes(header)
-
-        # Combine all records
-        return b''.join(self.records)
+        blob = bytearray(self._buffer)
+        blob += struct.pack('<IIIII', EMFRecordType.EMR_EOF, 20, 0, 16, 20)
+
+        # Update header with correct totals (handle 0 is reserved)
+        struct.pack_into('<IIH', blob, 48, len(blob), self.record_count + 1,
+                         len(self.object_handles) + 1)
+
+        return bytes(blob)
 
     def xml_tile_fill(self, brush_handle: int) -> str:
         """Generate PowerPoint XML for tiled fill using EMF pattern.
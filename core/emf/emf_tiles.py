@@ -248,7 +248,7 @@ class EMFTileLibrary:
             'height': tile.height,
             'category': self._get_category_from_name(pattern_name),
             'handles': len(tile.object_handles),
-            'records': len(tile.records)
+            'records': tile.record_count
         }
 
     def _get_category_from_name(self, name: str) -> str:
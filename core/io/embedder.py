@@ -6,19 +6,78 @@ Embeds mapped IR elements into PowerPoint slide structures.
 Handles XML injection, relationship management, and slide coordination.
 """
 
+import hashlib
 import logging
+import re
 import time
 from dataclasses import dataclass, field
 from typing import Any
 
-from lxml import etree as ET
-
 from ..ir import IRElement, Rect, SceneGraph
-from ..map.base import MapperResult, OutputFormat
-from ..xml.safe_iter import walk
+from ..map.base import SHAPE_ID_PLACEHOLDER, MapperResult, OutputFormat
 
 logger = logging.getLogger(__name__)
 
+# Placeholder inside an id attribute starts a new shape; any later occurrence
+# (e.g. in the name attribute) reuses that shape's ID
+_PLACEHOLDER_PATTERN = re.compile(r'(\bid=")?' + re.escape(SHAPE_ID_PLACEHOLDER))
+# First non-visual properties tag of legacy shape XML without placeholders
+_CNVPR_TAG_PATTERN = re.compile(r'<(?:\w+:)?cNvPr\b[^>]*>')
+_ID_ATTR_PATTERN = re.compile(r'\bid="[^"]*"')
+# Relationship references in mapper XML (r:embed / r:link)
+_REL_REF_PATTERN = re.compile(r'(\br:(?:embed|link)=")([^"]*)(")')
+
+IMAGE_RELATIONSHIP_TYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/image'
+# Slide relationship rId1 is always the slide layout
+_FIRST_MEDIA_RELATIONSHIP_ID = 2
+
+_CONTENT_TYPE_EXTENSIONS = {
+    'image/png': 'png',
+    'image/jpeg': 'jpeg',
+    'image/jpg': 'jpeg',
+    'image/gif': 'gif',
+    'image/webp': 'webp',
+    'image/bmp': 'bmp',
+    'image/tiff': 'tiff',
+    'image/svg+xml': 'svg',
+    'application/emf': 'emf',
+    'image/emf': 'emf',
+    'image/x-emf': 'emf',
+    'image/x-wmf': 'wmf',
+}
+
+
+def media_extension(media: dict[str, Any]) -> str:
+    """Get the file extension for a mapper media entry."""
+    media_format = media.get('format')
+    if media_format:
+        return str(media_format).lower().lstrip('.')
+    if media.get('type') == 'emf':
+        return 'emf'
+    extension = _CONTENT_TYPE_EXTENSIONS.get(str(media.get('content_type', '')).lower())
+    if extension:
+        return extension
+    filename = media.get('filename')
+    if filename and '.' in filename:
+        return filename.rsplit('.', 1)[-1].lower()
+    return 'bin'
+
+
+def content_addressed_filename(data: bytes, extension: str) -> str:
+    """
+    Name a media part after its content so identical bytes share one part.
+
+    Args:
+        data: Media bytes
+        extension: File extension without dot
+
+    Returns:
+        Filename such as ``image_<sha256 prefix>.png``
+    """
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    prefix = 'emf' if extension == 'emf' else 'image'
+    return f'{prefix}_{digest}.{extension}'
+
 
 class EmbeddingError(Exception):
     """Exception raised when embedding fails"""
@@ -69,9 +128,9 @@ class DrawingMLEmbedder:
         self.slide_height_emu = slide_height_emu
         self.logger = logging.getLogger(__name__)
 
-        # Counters for unique IDs
-        self._shape_id_counter = 1
-        self._relationship_id_counter = 1
+        # Counters for unique IDs (shape ID 1 is the spTree group itself)
+        self._shape_id_counter = 2
+        self._relationship_id_counter = _FIRST_MEDIA_RELATIONSHIP_ID
 
         # Statistics
         self._stats = {
@@ -99,14 +158,13 @@ class DrawingMLEmbedder:
         start_time = time.perf_counter()
 
         try:
-            # Generate slide XML structure
-            slide_xml, shape_id_map = self._generate_slide_xml(scene, mapper_results, animation_xml)
+            # Deduplicate media by content and assign slide relationships
+            relationship_data, media_files, rel_id_remaps = self._extract_media(mapper_results)
 
-            # Extract relationship data for EMF elements
-            relationship_data = self._extract_relationships(mapper_results)
-
-            # Extract media files for embedded content
-            media_files = self._extract_media_files(mapper_results)
+            # Generate slide XML structure
+            slide_xml, shape_id_map = self._generate_slide_xml(
+                scene, mapper_results, animation_xml, rel_id_remaps,
+            )
 
             # Calculate statistics
             native_count = sum(1 for r in mapper_results if r.output_format == OutputFormat.NATIVE_DML)
@@ -165,7 +223,8 @@ class DrawingMLEmbedder:
 
         return self.embed_scene(minimal_scene, mapper_results)
 
-    def _generate_slide_xml(self, scene: SceneGraph, mapper_results: list[MapperResult], animation_xml: str | None = None) -> tuple[str, dict[str, list[str]]]:
+    def _generate_slide_xml(self, scene: SceneGraph, mapper_results: list[MapperResult], animation_xml: str | None = None,
+                            rel_id_remaps: list[dict[str, str]] | None = None) -> tuple[str, dict[str, list[str]]]:
         """Generate complete slide XML with embedded elements"""
         try:
             # Generate background if present
@@ -176,10 +235,14 @@ class DrawingMLEmbedder:
             # Combine all element XML content
             shape_xmls = []
             shape_id_map: dict[str, list[str]] = {}
-            for result in mapper_results:
+            for index, result in enumerate(mapper_results):
                 # Assign unique shape ID
                 shape_xml, assigned_id = self._assign_shape_id(result.xml_content)
 
+                # Point media references at the deduplicated relationships
+                if rel_id_remaps and rel_id_remaps[index]:
+                    shape_xml = self._remap_relationship_ids(shape_xml, rel_id_remaps[index])
+
                 source_id = None
                 if isinstance(result.metadata, dict):
                     source_id = result.metadata.get('source_id')
@@ -231,88 +294,123 @@ class DrawingMLEmbedder:
             raise EmbeddingError(f"Failed to generate slide XML: {e}", cause=e)
 
     def _assign_shape_id(self, shape_xml: str) -> tuple[str, int]:
-        """Assign unique ID to shape XML"""
+        """
+        Assign unique shape IDs to mapper XML without parsing it.
+
+        Templates carrying SHAPE_ID_PLACEHOLDER get a fresh ID per placeholder
+        (so group children stay unique). Legacy XML has the id attribute of its
+        first ``cNvPr`` rewritten in place.
+        """
+        first_id = self._shape_id_counter
+
+        if SHAPE_ID_PLACEHOLDER in shape_xml:
+            current_id = first_id
+
+            def substitute(match: re.Match) -> str:
+                nonlocal current_id
+                if match.group(1):
+                    current_id = self._shape_id_counter
+                    self._shape_id_counter += 1
+                    return f'id="{current_id}'
+                return str(current_id)
+
+            return _PLACEHOLDER_PATTERN.sub(substitute, shape_xml), first_id
+
         assigned_id = self._shape_id_counter
-        try:
-            # Parse XML to modify ID attribute
-            root = ET.fromstring(f"<root>{shape_xml}</root>")
-
-            # Find first element with cNvPr and update ID
-            id_assigned = False
-            for elem in walk(root):
-                if elem.tag.endswith('cNvPr'):
-                    elem.set('id', str(assigned_id))
-                    elem.set('name', f"Shape_{assigned_id}")
-                    id_assigned = True
-                    break
-
-            if not id_assigned:
-                # Fallback: try assigning to first element with id attribute
-                for elem in walk(root):
-                    if 'id' in elem.attrib:
-                        elem.set('id', str(assigned_id))
-                        id_assigned = True
-                        break
-
-            # Extract modified content
-            modified_xml = "".join(ET.tostring(child, encoding='unicode') for child in root)
-        except ET.ParseError:
-            # If XML parsing fails, return original with basic ID replacement
-            modified_xml = shape_xml.replace('id="1"', f'id="{assigned_id}"', 1)
-        finally:
-            self._shape_id_counter += 1
-
-        return modified_xml, assigned_id
-
-    def _extract_relationships(self, mapper_results: list[MapperResult]) -> list[dict[str, Any]]:
-        """Extract relationship data for EMF and media elements"""
-        relationships = []
+        self._shape_id_counter += 1
+
+        tag_match = _CNVPR_TAG_PATTERN.search(shape_xml)
+        if tag_match:
+            tag = _ID_ATTR_PATTERN.sub(f'id="{assigned_id}"', tag_match.group(0), count=1)
+            return shape_xml[:tag_match.start()] + tag + shape_xml[tag_match.end():], assigned_id
+
+        # No cNvPr: fall back to the first id attribute
+        return _ID_ATTR_PATTERN.sub(f'id="{assigned_id}"', shape_xml, count=1), assigned_id
+
+    @staticmethod
+    def _remap_relationship_ids(shape_xml: str, remap: dict[str, str]) -> str:
+        """Rewrite r:embed/r:link values according to ``remap``"""
+        def substitute(match: re.Match) -> str:
+            return match.group(1) + remap.get(match.group(2), match.group(2)) + match.group(3)
+
+        return _REL_REF_PATTERN.sub(substitute, shape_xml)
+
+    def _next_relationship_id(self, used_ids: set[str]) -> str:
+        """Allocate the next slide relationship ID not already in use"""
+        while True:
+            rel_id = f"rId{self._relationship_id_counter}"
+            self._relationship_id_counter += 1
+            if rel_id not in used_ids:
+                return rel_id
+
+    def _extract_media(self, mapper_results: list[MapperResult]) -> tuple[
+            list[dict[str, Any]], list[dict[str, Any]], list[dict[str, str]]]:
+        """
+        Extract relationships and media files, deduplicated by content.
+
+        Media with identical bytes becomes a single content-addressed part with
+        one slide relationship. Mapper relationship IDs are kept where they are
+        unique; duplicates and collisions are remapped.
+
+        Returns:
+            Tuple of (relationship_data, media_files, per-result rel ID remaps)
+        """
+        relationships: list[dict[str, Any]] = []
+        media_files: list[dict[str, Any]] = []
+        rel_id_remaps: list[dict[str, str]] = []
+
+        used_ids = {'rId1'}
+        rel_ids_by_digest: dict[str, str] = {}
 
         for result in mapper_results:
+            remap: dict[str, str] = {}
+            rel_id_remaps.append(remap)
+            element_type = type(result.element).__name__ if result.element else None
+
             if result.media_files:
                 for media in result.media_files:
-                    rel_id = media.get('relationship_id') or f"rId{self._relationship_id_counter}"
-                    self._relationship_id_counter += 1
+                    data = media.get('data') or b''
+                    original_id = media.get('relationship_id')
+
+                    if isinstance(data, (bytes, bytearray)) and data:
+                        digest = hashlib.sha256(data).hexdigest()
+                        existing_id = rel_ids_by_digest.get(digest)
+                        if existing_id is not None:
+                            # Same bytes already embedded on this slide
+                            if original_id and original_id != existing_id:
+                                remap[original_id] = existing_id
+                            continue
+
+                        if original_id and original_id not in used_ids:
+                            rel_id = original_id
+                        else:
+                            rel_id = self._next_relationship_id(used_ids)
+                        if original_id and original_id != rel_id:
+                            remap[original_id] = rel_id
+
+                        used_ids.add(rel_id)
+                        rel_ids_by_digest[digest] = rel_id
+                        filename = content_addressed_filename(bytes(data), media_extension(media))
+                    else:
+                        rel_id = original_id if original_id and original_id not in used_ids \
+                            else self._next_relationship_id(used_ids)
+                        used_ids.add(rel_id)
+                        filename = media.get('filename') or f"emf{self._relationship_id_counter}.emf"
 
-                    filename = media.get('filename') or f"emf{self._relationship_id_counter}.emf"
-                    target = media.get('part_name') or f"../media/{filename}"
                     content_type = media.get('content_type', 'application/octet-stream')
-
                     relationships.append({
                         'id': rel_id,
-                        'type': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/image',
-                        'target': target,
+                        'type': IMAGE_RELATIONSHIP_TYPE,
+                        'target': f"../media/{filename}",
                         'content_type': content_type,
                         'element_type': type(result.element).__name__,
                         'fallback_reason': result.metadata.get('fallback_reason', 'clip_media'),
                     })
-                continue
-
-            if result.output_format in [OutputFormat.EMF_VECTOR, OutputFormat.EMF_RASTER]:
-                # EMF elements need relationship entries
-                rel_id = f"rId{self._relationship_id_counter}"
-                self._relationship_id_counter += 1
-
-                relationships.append({
-                    'id': rel_id,
-                    'type': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/image',
-                    'target': f'../media/emf{self._relationship_id_counter}.emf',
-                    'content_type': 'application/emf',
-                    'element_type': type(result.element).__name__,
-                    'fallback_reason': result.metadata.get('fallback_reason', 'Complex element requires EMF'),
-                })
-
-        return relationships
-
-    def _extract_media_files(self, mapper_results: list[MapperResult]) -> list[dict[str, Any]]:
-        """Extract media files that need to be included in PPTX package"""
-        media_files = []
 
-        for result in mapper_results:
-            if result.media_files:
-                for media in result.media_files:
                     entry = dict(media)
-                    entry.setdefault('element_type', type(result.element).__name__ if result.element else None)
+                    entry['relationship_id'] = rel_id
+                    entry['filename'] = filename
+                    entry.setdefault('element_type', element_type)
                     media_files.append(entry)
                 continue
 
@@ -322,20 +420,34 @@ class DrawingMLEmbedder:
                     'filename': result.metadata.get('media_filename', 'unknown'),
                     'content_type': result.metadata.get('content_type', 'application/octet-stream'),
                     'data': result.metadata['media_data'],
-                    'element_type': type(result.element).__name__,
+                    'element_type': element_type,
                 })
 
-            # EMF elements also generate media files
-            elif result.output_format in [OutputFormat.EMF_VECTOR, OutputFormat.EMF_RASTER]:
-                media_files.append({
-                    'filename': f'emf{len(media_files) + 1}.emf',
+            if result.output_format in [OutputFormat.EMF_VECTOR, OutputFormat.EMF_RASTER]:
+                # EMF elements without media get a placeholder part to render later
+                rel_id = self._next_relationship_id(used_ids)
+                used_ids.add(rel_id)
+                filename = f'emf{self._relationship_id_counter}.emf'
+
+                relationships.append({
+                    'id': rel_id,
+                    'type': IMAGE_RELATIONSHIP_TYPE,
+                    'target': f'../media/{filename}',
                     'content_type': 'application/emf',
-                    'data': b'',  # EMF data would be generated separately
                     'element_type': type(result.element).__name__,
-                    'requires_rendering': True,
+                    'fallback_reason': result.metadata.get('fallback_reason', 'Complex element requires EMF'),
                 })
 
-        return media_files
+                if 'media_data' not in result.metadata:
+                    media_files.append({
+                        'filename': filename,
+                        'content_type': 'application/emf',
+                        'data': b'',  # EMF data would be generated separately
+                        'element_type': element_type,
+                        'requires_rendering': True,
+                    })
+
+        return relationships, media_files, rel_id_remaps
 
     def _generate_background_xml(self, background: Any) -> str:
         """Generate background XML if scene has background"""
@@ -378,6 +490,11 @@ class DrawingMLEmbedder:
             'total_time_ms': 0.0,
         }
 
+    def reset_id_counters(self) -> None:
+        """Restart shape and relationship IDs for a new slide"""
+        self._shape_id_counter = 2
+        self._relationship_id_counter = _FIRST_MEDIA_RELATIONSHIP_ID
+
     def get_slide_dimensions(self) -> tuple[int, int]:
         """Get slide dimensions in EMU"""
         return (self.slide_width_emu, self.slide_height_emu)
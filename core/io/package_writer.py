@@ -7,16 +7,54 @@ Handles final PPTX package assembly from slide XML and relationships.
 
 import io
 import logging
+import os
+import tempfile
+import threading
 import time
 import zipfile
+import zlib
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
 
-from .embedder import EmbedderResult
+from .embedder import EmbedderResult, content_addressed_filename, media_extension
 
 logger = logging.getLogger(__name__)
 
+# Media formats that are already compressed and gain nothing from deflate
+STORED_MEDIA_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'gif', 'webp'})
+
+_TEMPLATE_DIR = Path(__file__).parent.parent.parent / 'archive' / 'presentationml'
+
+# ZipFile internals used to append pre-deflated entries; absent ones mean writestr
+_RAW_WRITE_ATTRIBUTES = ('_lock', '_seekable', 'start_dir', '_writecheck', '_didModify',
+                         'fp', 'filelist', 'NameToInfo')
+
+
+@contextmanager
+def atomic_output_file(output_path: str | Path) -> Iterator[BinaryIO]:
+    """
+    Open a temporary file beside output_path and move it into place on success.
+
+    On failure the temporary file is removed, so a partially written package
+    never appears at the caller's path.
+    """
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=f'.{output_file.name}.', suffix='.tmp',
+                                     dir=output_file.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+        os.replace(temp_path, output_file)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
 
 class PackageError(Exception):
     """Exception raised when package writing fails"""
@@ -39,12 +77,83 @@ class PackageManifest:
     created_date: str | None = None
 
 
+@dataclass(frozen=True)
+class _PrecompressedPart:
+    """Static package part deflated once and reused across packages"""
+    arcname: str
+    data: bytes
+    crc: int
+    file_size: int
+    date_time: tuple
+
+    @classmethod
+    def deflate(cls, arcname: str, content: str) -> '_PrecompressedPart':
+        raw = content.encode('utf-8')
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        data = compressor.compress(raw) + compressor.flush()
+        return cls(arcname, data, zlib.crc32(raw), len(raw), time.localtime()[:6])
+
+    def write_to(self, zip_file: zipfile.ZipFile) -> None:
+        """Append the pre-deflated entry, mirroring ZipFile.writestr bookkeeping"""
+        zinfo = zipfile.ZipInfo(self.arcname, date_time=self.date_time)
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.external_attr = 0o600 << 16
+
+        if not self.supports_raw_write(zip_file):
+            # Private ZipFile layout differs on this interpreter; deflate again
+            zip_file.writestr(zinfo, zlib.decompress(self.data, -15))
+            return
+
+        zinfo.file_size = self.file_size
+        zinfo.compress_size = len(self.data)
+        zinfo.CRC = self.crc
+
+        with zip_file._lock:
+            if zip_file._seekable:
+                zip_file.fp.seek(zip_file.start_dir)
+            zinfo.header_offset = zip_file.fp.tell()
+            zip_file._writecheck(zinfo)
+            zip_file._didModify = True
+            zip_file.fp.write(zinfo.FileHeader(False))
+            zip_file.fp.write(self.data)
+            zip_file.start_dir = zip_file.fp.tell()
+            zip_file.filelist.append(zinfo)
+            zip_file.NameToInfo[zinfo.filename] = zinfo
+
+    @staticmethod
+    def supports_raw_write(zip_file: zipfile.ZipFile) -> bool:
+        """Check that the ZipFile exposes the internals write_to appends through"""
+        return (all(hasattr(zip_file, name) for name in _RAW_WRITE_ATTRIBUTES)
+                and not getattr(zip_file, '_writing', False))
+
+
+class _CountingWriter:
+    """Write-only wrapper giving unseekable targets (sockets, pipes) a byte count"""
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._count = 0
+
+    def write(self, data: bytes) -> int:
+        self._stream.write(data)
+        self._count += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._count
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
 class PackageWriter:
     """
     Writes complete PPTX packages from embedded slide content.
 
     Handles ZIP assembly, content types, relationships, and media files
-    to create valid PowerPoint presentations.
+    to create valid PowerPoint presentations. Packages are streamed entry by
+    entry into the target file or stream; static theme/master/layout parts
+    are deflated once per process and copied into every package.
 
     Args:
         enable_debug: Enable debug data collection for tracing (default: False)
@@ -81,6 +190,10 @@ class PackageWriter:
             'image_emf': 'application/emf',
         }
 
+    # Pre-deflated static parts, per writer class (generators may be overridden)
+    _static_parts_cache: dict[type, tuple[_PrecompressedPart, ...]] = {}
+    _static_parts_lock = threading.Lock()
+
     def write_package(self, embedder_results: list[EmbedderResult],
                      output_path: str, manifest: PackageManifest = None) -> dict[str, Any]:
         """
@@ -94,8 +207,8 @@ class PackageWriter:
         Returns:
             Dictionary with package statistics and metadata.
             When enable_debug=True, includes 'debug_data' with:
-                - package_creation_ms: Time to create ZIP in memory
-                - file_write_ms: Time to write file to disk
+                - package_creation_ms: Time to stream ZIP entries into the file
+                - file_write_ms: Time to open, close and move the file into place
                 - package_size_bytes: Final package size
                 - compression_ratio: Compression ratio achieved
                 - zip_structure: Counts of ZIP components
@@ -114,13 +227,18 @@ class PackageWriter:
             if self.enable_debug:
                 self._debug_data['packaging_start'] = time.perf_counter()
 
-            # Create package in memory first
-            package_data = self._create_package_data(embedder_results, manifest)
+            # Stream the package into a temporary file, moved into place when complete
+            open_start = time.perf_counter()
+            with atomic_output_file(output_path) as f:
+                creation_start = time.perf_counter()
+                package_size = self._write_package_zip(f, embedder_results, manifest)
+                creation_end = time.perf_counter()
+            close_end = time.perf_counter()
 
             if self.enable_debug:
-                package_creation_time = (time.perf_counter() - self._debug_data['packaging_start']) * 1000
-                self._debug_data['package_creation_ms'] = package_creation_time
-                self._debug_data['package_size_bytes'] = len(package_data)
+                self._debug_data['package_creation_ms'] = (creation_end - creation_start) * 1000
+                self._debug_data['file_write_ms'] = ((creation_start - open_start) + (close_end - creation_end)) * 1000
+                self._debug_data['package_size_bytes'] = package_size
 
                 # Track ZIP structure
                 self._debug_data['zip_structure'] = {
@@ -130,20 +248,8 @@ class PackageWriter:
                     'content_types': len(manifest.content_types),
                 }
 
-            # Track file write timing
-            if self.enable_debug:
-                file_write_start = time.perf_counter()
-
-            # Write to output file
-            self._write_package_file(package_data, output_path)
-
-            if self.enable_debug:
-                file_write_time = (time.perf_counter() - file_write_start) * 1000
-                self._debug_data['file_write_ms'] = file_write_time
-
             # Calculate statistics
             processing_time = (time.perf_counter() - start_time) * 1000
-            package_size = len(package_data)
             compression_ratio = self._estimate_compression_ratio(embedder_results, package_size)
 
             if self.enable_debug:
@@ -187,14 +293,11 @@ class PackageWriter:
             if manifest is None:
                 manifest = self._create_default_manifest(embedder_results)
 
-            # Create package data
-            package_data = self._create_package_data(embedder_results, manifest)
-
-            # Write to stream
-            stream.write(package_data)
+            # Stream entries directly into the target
+            package_size = self._write_package_zip(stream, embedder_results, manifest)
 
             return {
-                'package_size_bytes': len(package_data),
+                'package_size_bytes': package_size,
                 'slide_count': len(embedder_results),
                 'media_files': len(manifest.media_files),
                 'relationships': len(manifest.relationships),
@@ -206,11 +309,21 @@ class PackageWriter:
     def _create_package_data(self, embedder_results: list[EmbedderResult],
                            manifest: PackageManifest) -> bytes:
         """Create complete PPTX package data in memory"""
+        package_buffer = io.BytesIO()
+        self._write_package_zip(package_buffer, embedder_results, manifest)
+        return package_buffer.getvalue()
+
+    def _write_package_zip(self, target: BinaryIO, embedder_results: list[EmbedderResult],
+                           manifest: PackageManifest) -> int:
+        """Stream the complete PPTX package into target, returning bytes written"""
         try:
-            # Use BytesIO to build package in memory
-            package_buffer = io.BytesIO()
+            try:
+                start_offset = target.tell()
+            except (AttributeError, OSError):
+                target = _CountingWriter(target)
+                start_offset = 0
 
-            with zipfile.ZipFile(package_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as zip_file:
                 # Write core structure files
                 self._write_core_structure(zip_file)
 
@@ -241,23 +354,11 @@ class PackageWriter:
                 pres_rels = self._generate_presentation_relationships(len(embedder_results))
                 zip_file.writestr('ppt/_rels/presentation.xml.rels', pres_rels)
 
-            return package_buffer.getvalue()
+            return target.tell() - start_offset
 
         except Exception as e:
             raise PackageError(f"Failed to create package data: {e}", cause=e)
 
-    def _write_package_file(self, package_data: bytes, output_path: str) -> None:
-        """Write package data to file"""
-        try:
-            output_file = Path(output_path)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output_file, 'wb') as f:
-                f.write(package_data)
-
-        except Exception as e:
-            raise PackageError(f"Failed to write package file: {e}", cause=e)
-
     def _create_default_manifest(self, embedder_results: list[EmbedderResult]) -> PackageManifest:
         """Create default package manifest from embedder results"""
         all_relationships = []
@@ -270,7 +371,7 @@ class PackageWriter:
         return PackageManifest(
             slides=[f'slide{i+1}.xml' for i in range(len(embedder_results))],
             relationships=all_relationships,
-            media_files=all_media_files,
+            media_files=self._unique_media_files(all_media_files),
             content_types=self._generate_content_type_list(embedder_results),
             title="SVG2PPTX Generated Presentation",
             author="SVG2PPTX Clean Slate Architecture",
@@ -289,34 +390,50 @@ class PackageWriter:
         zip_file.writestr('ppt/media/', '')
         zip_file.writestr('_rels/', '')
 
-        # Copy theme, master, and layouts from presentationml templates
-        from pathlib import Path
-        template_dir = Path(__file__).parent.parent.parent / 'archive' / 'presentationml'
+        # Theme, master, and layouts are identical in every package
+        for part in self._get_static_parts():
+            part.write_to(zip_file)
+
+    def _get_static_parts(self) -> tuple[_PrecompressedPart, ...]:
+        """Get pre-deflated theme, master, and layout parts, building them once"""
+        cls = type(self)
+        with cls._static_parts_lock:
+            parts = cls._static_parts_cache.get(cls)
+            if parts is None:
+                parts = tuple(
+                    _PrecompressedPart.deflate(arcname, content)
+                    for arcname, content in self._static_part_sources()
+                )
+                cls._static_parts_cache[cls] = parts
+            return parts
+
+    def _static_part_sources(self) -> list[tuple[str, str]]:
+        """Theme, master, and layouts from presentationml templates, or generated defaults"""
+        sources = []
 
         # Copy theme
-        theme_file = template_dir / 'theme.xml'
+        theme_file = _TEMPLATE_DIR / 'theme.xml'
         if theme_file.exists():
-            zip_file.writestr('ppt/theme/theme1.xml', theme_file.read_text())
+            sources.append(('ppt/theme/theme1.xml', theme_file.read_text()))
         else:
-            theme_xml = self._generate_theme_xml()
-            zip_file.writestr('ppt/theme/theme1.xml', theme_xml)
+            sources.append(('ppt/theme/theme1.xml', self._generate_theme_xml()))
 
         # Copy slide master
-        master_file = template_dir / 'slideMaster.xml'
+        master_file = _TEMPLATE_DIR / 'slideMaster.xml'
         if master_file.exists():
-            zip_file.writestr('ppt/slideMasters/slideMaster1.xml', master_file.read_text())
+            sources.append(('ppt/slideMasters/slideMaster1.xml', master_file.read_text()))
         else:
-            master_xml = self._generate_slide_master_xml()
-            zip_file.writestr('ppt/slideMasters/slideMaster1.xml', master_xml)
+            sources.append(('ppt/slideMasters/slideMaster1.xml', self._generate_slide_master_xml()))
 
         # Copy all slide layouts
-        layouts_dir = template_dir / 'slideLayouts'
+        layouts_dir = _TEMPLATE_DIR / 'slideLayouts'
         if layouts_dir.exists():
             for layout_file in sorted(layouts_dir.glob('slideLayout*.xml')):
-                zip_file.writestr(f'ppt/slideLayouts/{layout_file.name}', layout_file.read_text())
+                sources.append((f'ppt/slideLayouts/{layout_file.name}', layout_file.read_text()))
         else:
-            layout_xml = self._generate_slide_layout_xml()
-            zip_file.writestr('ppt/slideLayouts/slideLayout1.xml', layout_xml)
+            sources.append(('ppt/slideLayouts/slideLayout1.xml', self._generate_slide_layout_xml()))
+
+        return sources
 
     def _generate_presentation_xml(self, slide_count: int) -> str:
         """Generate presentation.xml"""
@@ -339,31 +456,66 @@ class PackageWriter:
 </p:presentation>'''
 
     def _generate_slide_relationships(self, relationship_data: list[dict[str, Any]]) -> str:
-        """Generate slide relationship XML"""
-        if not relationship_data:
-            return '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
-    <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout" Target="../slideLayouts/slideLayout1.xml"/>
-</Relationships>'''
-
-        relationships = ['<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout" Target="../slideLayouts/slideLayout1.xml"/>']
-
-        for i, rel in enumerate(relationship_data, 2):
-            relationships.append(f'<Relationship Id="rId{i}" Type="{rel["type"]}" Target="{rel["target"]}"/>')
+        """Generate slide relationship XML, keeping the IDs referenced by the slide"""
+        layout_type = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout'
+        relationships = [f'<Relationship Id="rId1" Type="{layout_type}" Target="../slideLayouts/slideLayout1.xml"/>']
+        used_ids = {'rId1'}
+        next_id = 2
+
+        for rel in relationship_data:
+            rel_id = rel.get('id')
+            if rel_id in used_ids:
+                if rel.get('type') in (layout_type, 'layout') or rel_id == 'rId1':
+                    # Layout relationship is always written as rId1
+                    continue
+                rel_id = None
+            if not rel_id:
+                while f'rId{next_id}' in used_ids:
+                    next_id += 1
+                rel_id = f'rId{next_id}'
+
+            used_ids.add(rel_id)
+            relationships.append(f'<Relationship Id="{rel_id}" Type="{rel["type"]}" Target="{rel["target"]}"/>')
 
         return f'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
     {chr(10).join(relationships)}
 </Relationships>'''
 
-    def _write_media_files(self, zip_file: zipfile.ZipFile, media_files: list[dict[str, Any]]) -> None:
-        """Write media files to package"""
+    @staticmethod
+    def _media_filename(media: dict[str, Any]) -> str | None:
+        """Get the part filename for a media entry, content-addressed if unnamed"""
+        filename = media.get('filename')
+        if filename:
+            return filename
+        data = media.get('data')
+        if data:
+            return content_addressed_filename(bytes(data), media_extension(media))
+        return None
+
+    def _unique_media_files(self, media_files: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Collapse media entries sharing a part filename, keeping the first"""
+        unique = {}
         for media in media_files:
+            filename = self._media_filename(media)
+            if filename is None or filename in unique:
+                continue
+            if 'filename' not in media:
+                media = {**media, 'filename': filename}
+            unique[filename] = media
+        return list(unique.values())
+
+    def _write_media_files(self, zip_file: zipfile.ZipFile, media_files: list[dict[str, Any]]) -> None:
+        """Write media files to package, one part per unique filename"""
+        for media in self._unique_media_files(media_files):
             filename = media['filename']
             data = media.get('data', b'')
 
             if data or not media.get('requires_rendering', False):
-                zip_file.writestr(f'ppt/media/{filename}', data)
+                # Already-compressed images are stored as-is
+                extension = filename.rsplit('.', 1)[-1].lower()
+                compress_type = zipfile.ZIP_STORED if extension in STORED_MEDIA_EXTENSIONS else zipfile.ZIP_DEFLATED
+                zip_file.writestr(f'ppt/media/{filename}', data, compress_type=compress_type)
 
     def _generate_content_types(self, manifest: PackageManifest) -> str:
         """Generate [Content_Types].xml"""
@@ -375,6 +527,14 @@ class PackageWriter:
             '<Default Extension="emf" ContentType="application/emf"/>',
         ]
 
+        # Add defaults for other media extensions in the package
+        known_extensions = {'rels', 'xml', 'png', 'jpeg', 'emf'}
+        for entry in manifest.content_types:
+            extension = entry.get('extension', '').lower()
+            if extension and extension not in known_extensions:
+                known_extensions.add(extension)
+                defaults.append(f'<Default Extension="{extension}" ContentType="{entry["content_type"]}"/>')
+
         overrides = [
             '<Override PartName="/ppt/presentation.xml" ContentType="application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml"/>',
             '<Override PartName="/ppt/slideMasters/slideMaster1.xml" ContentType="application/vnd.openxmlformats-officedocument.presentationml.slideMaster+xml"/>',
@@ -516,7 +676,9 @@ class PackageWriter:
         for result in embedder_results:
             for media in result.media_files:
                 content_type = media.get('content_type', 'application/octet-stream')
-                filename = media['filename']
+                filename = self._media_filename(media)
+                if filename is None:
+                    continue
                 extension = Path(filename).suffix.lstrip('.')
 
                 content_types.append({
@@ -16,6 +16,7 @@ from .font_metadata import *
 from .geometry import *
 from .paint import *
 from .scene import *
+from .segment_buffer import *
 from .shapes import *
 from .text import *
 from .text_path import *
@@ -30,6 +31,7 @@ __all__ = [
 
     # Geometry primitives
     "Point", "Rect", "Segment", "BezierSegment", "LineSegment",
+    "SegmentBuffer", "SegmentView", "SEGMENT_LINE", "SEGMENT_CUBIC",
 
     # Paint and styling
     "Paint", "SolidPaint", "LinearGradientPaint", "RadialGradientPaint", "PatternPaint",
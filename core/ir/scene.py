@@ -8,6 +8,7 @@ All SVG complexity is preprocessed before reaching this layer.
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from typing import List, Literal, Optional, Union
 
 from .geometry import Point, Rect, SegmentType
@@ -15,6 +16,7 @@ from .geometry import Point, Rect, SegmentType
 # Use shared numpy compatibility
 from .numpy_compat import np
 from .paint import Paint, Stroke
+from .segment_buffer import SegmentBuffer, SegmentView
 from .shapes import Circle, Ellipse, Rectangle
 from .text import TextFrame
 
@@ -54,8 +56,11 @@ class Path:
     All arcs converted to Bezier curves by preprocessors.
     Transforms already applied to coordinates.
     Ready for direct mapping to DrawingML or EMF.
+
+    ``segments`` is either a list of segment objects or a SegmentView over
+    columnar geometry (see ``Path.from_buffer``).
     """
-    segments: list[SegmentType]
+    segments: list[SegmentType] | SegmentView
     fill: Paint = None
     stroke: Stroke | None = None
     clip: ClipRef | None = None
@@ -68,12 +73,27 @@ class Path:
         if not self.segments:
             raise ValueError("Path must have at least one segment")
 
+    @classmethod
+    def from_buffer(cls, buffer: SegmentBuffer, **kwargs) -> 'Path':
+        """Create a path backed by columnar segment geometry."""
+        return cls(segments=SegmentView(buffer), **kwargs)
+
     @property
+    def geometry(self) -> SegmentBuffer:
+        """Segments as a SegmentBuffer (shared, not copied, for buffer-backed paths)"""
+        if isinstance(self.segments, SegmentView):
+            return self.segments.buffer
+        return SegmentBuffer.from_segments(self.segments)
+
+    @cached_property
     def bbox(self) -> Rect:
-        """Calculate bounding box of all segments"""
+        """Bounding box of all segments, computed on first access"""
         if not self.segments:
             return Rect(0, 0, 0, 0)
 
+        if isinstance(self.segments, SegmentView):
+            return self.segments.buffer.bbox()
+
         # Get all points from segments
         xs, ys = [], []
         for segment in self.segments:
@@ -103,6 +123,12 @@ class Path:
         if len(self.segments) < 2:
             return False
 
+        if isinstance(self.segments, SegmentView):
+            coords = self.segments.buffer.coords
+            dx = abs(coords[0, 0] - coords[-1, 6])
+            dy = abs(coords[0, 1] - coords[-1, 7])
+            return bool(dx < 0.1 and dy < 0.1)
+
         first_point = getattr(self.segments[0], 'start', None)
         last_point = getattr(self.segments[-1], 'end', None)
 
@@ -147,6 +173,10 @@ class Group:
 
     Represents SVG groups with applied transforms and clipping.
     Children are flattened when possible for optimization.
+
+    Subtree summaries (bbox, nesting depth, element count) are computed once
+    per node from the children's cached values, so ``children`` must not be
+    mutated after the group is built.
     """
     children: list[Union['Path', 'Circle', 'Ellipse', 'Rectangle', 'TextFrame', 'Group', 'Image']]
     clip: ClipRef | None = None
@@ -157,25 +187,26 @@ class Group:
         if not (0.0 <= self.opacity <= 1.0):
             raise ValueError(f"Group opacity must be 0.0-1.0, got {self.opacity}")
 
-    @property
+    @cached_property
     def bbox(self) -> Rect:
-        """Calculate bounding box of all children"""
+        """Bounding box of all children, computed on first access"""
         if not self.children:
             return Rect(0, 0, 0, 0)
 
-        bboxes = []
+        min_x = min_y = float('inf')
+        max_x = max_y = float('-inf')
         for child in self.children:
-            if hasattr(child, 'bbox'):
-                bboxes.append(child.bbox)
-
-        if not bboxes:
+            bbox = getattr(child, 'bbox', None)
+            if bbox is None:
+                continue
+            min_x = min(min_x, bbox.x)
+            min_y = min(min_y, bbox.y)
+            max_x = max(max_x, bbox.x + bbox.width)
+            max_y = max(max_y, bbox.y + bbox.height)
+
+        if min_x == float('inf'):
             return Rect(0, 0, 0, 0)
 
-        min_x = min(bbox.x for bbox in bboxes)
-        min_y = min(bbox.y for bbox in bboxes)
-        max_x = max(bbox.x + bbox.width for bbox in bboxes)
-        max_y = max(bbox.y + bbox.height for bbox in bboxes)
-
         return Rect(min_x, min_y, max_x - min_x, max_y - min_y)
 
     @property
@@ -183,7 +214,15 @@ class Group:
         """Check if group contains only primitive elements (no nested groups)"""
         return all(not isinstance(child, Group) for child in self.children)
 
-    @property
+    @cached_property
+    def nesting_depth(self) -> int:
+        """Maximum depth of nested groups below this one (0 for a leaf group)"""
+        return max(
+            (child.nesting_depth + 1 for child in self.children if isinstance(child, Group)),
+            default=0,
+        )
+
+    @cached_property
     def total_element_count(self) -> int:
         """Count total elements including nested groups"""
         count = len(self.children)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Array-backed path segments for IR
+
+Stores a run of line and cubic Bezier segments as one float64 array and a
+segment-kind array, so path data can be parsed and transformed in bulk
+before (or instead of) materializing Point/Segment objects.
+"""
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
+from .geometry import BezierSegment, LineSegment, Point, Rect, SegmentType
+from .numpy_compat import np
+
+__all__ = ["SegmentBuffer", "SegmentView", "SEGMENT_LINE", "SEGMENT_CUBIC"]
+
+# Segment kind codes
+SEGMENT_LINE = 0
+SEGMENT_CUBIC = 1
+
+# Segments materialized per step when iterating a SegmentView
+_VIEW_CHUNK_SIZE = 1024
+
+
+@dataclass(frozen=True, eq=False)
+class SegmentBuffer:
+    """Columnar storage for path segments
+
+    ``coords`` has one row per segment laid out as
+    ``[x0, y0, x1, y1, x2, y2, x3, y3]`` (start, control1, control2, end).
+    Line segments repeat their start and end in the control columns, so
+    every row is a valid cubic and bounds can be taken over all columns.
+    """
+    kinds: np.ndarray    # uint8, shape (n,)
+    coords: np.ndarray   # float64, shape (n, 8)
+
+    @classmethod
+    def empty(cls) -> 'SegmentBuffer':
+        return cls(np.zeros(0, dtype=np.uint8), np.zeros((0, 8), dtype=np.float64))
+
+    @classmethod
+    def from_segments(cls, segments: list[SegmentType]) -> 'SegmentBuffer':
+        """Build a buffer from Line/Bezier segment objects."""
+        if not segments:
+            return cls.empty()
+
+        kinds = []
+        rows = []
+        for segment in segments:
+            if isinstance(segment, BezierSegment):
+                kinds.append(SEGMENT_CUBIC)
+                rows.append((segment.start.x, segment.start.y,
+                             segment.control1.x, segment.control1.y,
+                             segment.control2.x, segment.control2.y,
+                             segment.end.x, segment.end.y))
+            else:
+                kinds.append(SEGMENT_LINE)
+                rows.append((segment.start.x, segment.start.y,
+                             segment.start.x, segment.start.y,
+                             segment.end.x, segment.end.y,
+                             segment.end.x, segment.end.y))
+
+        return cls(np.array(kinds, dtype=np.uint8), np.array(rows, dtype=np.float64))
+
+    @classmethod
+    def from_polyline(cls, points, closed: bool = False) -> 'SegmentBuffer':
+        """
+        Build line segments joining consecutive points.
+
+        Args:
+            points: ``(n, 2)`` array-like of x, y coordinates
+            closed: Append a segment from the last point back to the first
+                (only when there are more than two points)
+
+        Returns:
+            SegmentBuffer with ``n - 1`` (or ``n`` when closed) line segments
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if len(points) < 2:
+            return cls.empty()
+        if closed and len(points) > 2:
+            points = np.vstack((points, points[:1]))
+
+        starts = points[:-1]
+        ends = points[1:]
+        return cls(np.full(len(starts), SEGMENT_LINE, dtype=np.uint8),
+                   np.hstack((starts, starts, ends, ends)))
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index: slice) -> 'SegmentBuffer':
+        """Slice to a sub-buffer (views, no copy)."""
+        if not isinstance(index, slice):
+            raise TypeError("SegmentBuffer only supports slicing")
+        return SegmentBuffer(self.kinds[index], self.coords[index])
+
+    @property
+    def points(self) -> np.ndarray:
+        """All control/end points as an ``(n * 4, 2)`` view."""
+        return self.coords.reshape(-1, 2)
+
+    def with_points(self, points: np.ndarray) -> 'SegmentBuffer':
+        """Return a buffer with the same kinds and replaced ``points``."""
+        return SegmentBuffer(self.kinds, np.asarray(points, dtype=np.float64).reshape(-1, 8))
+
+    def transformed(self, matrix: np.ndarray) -> 'SegmentBuffer':
+        """Apply a 3x3 affine matrix to every point as one array operation."""
+        if len(self) == 0:
+            return self
+        xs = self.points[:, 0]
+        ys = self.points[:, 1]
+        points = np.empty_like(self.points)
+        points[:, 0] = matrix[0][0] * xs + matrix[0][1] * ys + matrix[0][2]
+        points[:, 1] = matrix[1][0] * xs + matrix[1][1] * ys + matrix[1][2]
+        return self.with_points(points)
+
+    def bbox(self) -> Rect:
+        """Bounding box over all points (control points included)."""
+        if len(self) == 0:
+            return Rect(0, 0, 0, 0)
+        xs = self.coords[:, 0::2]
+        ys = self.coords[:, 1::2]
+        min_x, max_x = float(xs.min()), float(xs.max())
+        min_y, max_y = float(ys.min()), float(ys.max())
+        return Rect(min_x, min_y, max_x - min_x, max_y - min_y)
+
+    def to_segments(self) -> list[SegmentType]:
+        """Materialize Line/Bezier segment objects."""
+        coords = self.coords
+        start_xs, start_ys, end_xs, end_ys = (coords[:, column].tolist() for column in (0, 1, 6, 7))
+        controls = iter(coords[self.kinds == SEGMENT_CUBIC, 2:6].tolist())
+
+        segments: list[SegmentType] = []
+        append = segments.append
+        end = None
+        end_x = end_y = None
+        for kind, x0, y0, x3, y3 in zip(self.kinds.tolist(), start_xs, start_ys, end_xs, end_ys):
+            # Contiguous segments share the Point joining them
+            start = end if (x0 == end_x and y0 == end_y) else Point(x0, y0)
+            end = Point(x3, y3)
+            end_x, end_y = x3, y3
+            if kind == SEGMENT_CUBIC:
+                x1, y1, x2, y2 = next(controls)
+                append(BezierSegment(start=start, control1=Point(x1, y1), control2=Point(x2, y2), end=end))
+            else:
+                append(LineSegment(start=start, end=end))
+        return segments
+
+
+class SegmentView(Sequence):
+    """Read-only segment sequence backed by a SegmentBuffer
+
+    Segment objects are built on access and not retained, so a Path holding
+    a view keeps only the buffer arrays alive.
+    """
+    __slots__ = ('buffer',)
+
+    def __init__(self, buffer: SegmentBuffer):
+        self.buffer = buffer
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SegmentView(self.buffer[index])
+
+        size = len(self.buffer)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("segment index out of range")
+        return self.buffer[index:index + 1].to_segments()[0]
+
+    def __iter__(self) -> Iterator[SegmentType]:
+        for start in range(0, len(self.buffer), _VIEW_CHUNK_SIZE):
+            yield from self.buffer[start:start + _VIEW_CHUNK_SIZE].to_segments()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SegmentView):
+            return (np.array_equal(self.buffer.kinds, other.buffer.kinds)
+                    and np.array_equal(self.buffer.coords, other.buffer.coords))
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"SegmentView({len(self)} segments)"
@@ -14,6 +14,11 @@ from ..ir import IRElement
 from ..policy import Policy, PolicyDecision
 
 
+# Token mappers emit for ``p:cNvPr/@id``. The embedder substitutes slide-unique
+# IDs with a string replace, so shape XML never has to be re-parsed.
+SHAPE_ID_PLACEHOLDER = "__SHAPE_ID__"
+
+
 class OutputFormat(Enum):
     """Output format for mapped elements"""
     NATIVE_DML = "native_dml"    # Native DrawingML
@@ -135,6 +140,11 @@ class Mapper(ABC):
             'avg_time_ms': self._stats['total_time_ms'] / total,
         }
 
+    def merge_statistics(self, stats: dict[str, Any]) -> None:
+        """Add counters from another mapper's get_statistics() (e.g. in a worker process)"""
+        for key in self._stats:
+            self._stats[key] += stats.get(key, 0)
+
     def reset_statistics(self) -> None:
         """Reset mapping statistics"""
         self._stats = {
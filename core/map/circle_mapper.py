@@ -17,7 +17,7 @@ from ..ir.geometry import Point, BezierSegment
 from ..ir.scene import Path
 from ..policy.shape_policy import decide_shape_strategy
 from ..units import unit
-from .base import MapperResult, OutputFormat
+from .base import SHAPE_ID_PLACEHOLDER, MapperResult, OutputFormat
 from .shape_helpers import (
     generate_fill_xml,
     generate_stroke_xml,
@@ -84,7 +84,7 @@ class CircleMapper:
         diameter_emu = r_emu * 2
 
         # Get shape ID from circle metadata or use default
-        shape_id = getattr(circle, 'shape_id', 1)
+        shape_id = getattr(circle, 'shape_id', SHAPE_ID_PLACEHOLDER)
 
         # Generate complete shape XML with effects
         shape_props = generate_shape_properties_xml(
@@ -16,7 +16,7 @@ from ..ir.shapes import Ellipse
 from ..ir.geometry import Point, BezierSegment
 from ..ir.scene import Path
 from ..policy.shape_policy import decide_shape_strategy
-from .base import MapperResult, OutputFormat
+from .base import SHAPE_ID_PLACEHOLDER, MapperResult, OutputFormat
 from .shape_helpers import (
     generate_shape_properties_xml,
     generate_style_xml,
@@ -72,7 +72,7 @@ class EllipseMapper:
         height_emu = ry_emu * 2
 
         # Get shape ID
-        shape_id = getattr(ellipse, 'shape_id', 1)
+        shape_id = getattr(ellipse, 'shape_id', SHAPE_ID_PLACEHOLDER)
 
         # Generate shape properties with effects
         shape_props = generate_shape_properties_xml(
@@ -10,24 +10,32 @@ import logging
 from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
+
 # Import existing EMF system
 try:
-    from ..emf.emf_blob import EMFBlob, EMFBrushStyle, EMFRecordType
-    from ..emf.emf_packaging import EMFPackager
+    from ..emf.emf_blob import EMU_PER_PIXEL, NULL_BRUSH, NULL_PEN, WINDING, EMFBlob
     EMF_AVAILABLE = True
 except ImportError:
     EMF_AVAILABLE = False
     logging.warning("EMF system not available - EMF adapter will use placeholder")
 
 from ..ir import (
-    BezierSegment,
+    SEGMENT_CUBIC,
     LinearGradientPaint,
-    LineSegment,
     Path,
     Point,
     RadialGradientPaint,
+    Rect,
     SolidPaint,
 )
+from ..performance.fallback_cache import fallback_cache_key, get_fallback_cache
+
+# Logical coordinate range the path bbox is normalized into (fits EMR_*16 records)
+EMF_LOGICAL_EXTENT = 16384
+
+# Bump when record emission changes so shared fallback caches drop stale blobs
+EMF_CACHE_VERSION = 3
 
 
 @dataclass
@@ -39,6 +47,9 @@ class EMFResult:
     height_emu: int
     quality_score: float
     metadata: dict[str, Any]
+    # Canvas origin on the slide (path bbox grown by half the stroke width)
+    x_emu: int | None = None
+    y_emu: int | None = None
 
 
 class EMFPathAdapter:
@@ -85,32 +96,29 @@ class EMFPathAdapter:
         try:
             # Calculate EMF canvas dimensions from path bounds
             bbox = path.bbox  # bbox is a property, not an attribute
-            if bbox and bbox.width > 0 and bbox.height > 0:
-                width_emu = max(914400, int(bbox.width * 12700))  # At least 1 inch
-                height_emu = max(914400, int(bbox.height * 12700))
+            frame = self._emf_frame(path)
+            x_emu = y_emu = None
+            if frame and frame.width > 0 and frame.height > 0:
+                # Canvas covers the path and its stroke so the picture frame places it 1:1
+                width_emu = max(EMU_PER_PIXEL, int(frame.width * 12700))
+                height_emu = max(EMU_PER_PIXEL, int(frame.height * 12700))
+                x_emu = int(frame.x * 12700)
+                y_emu = int(frame.y * 12700)
             else:
                 # Default EMF size
                 width_emu = height_emu = 914400
 
-            # Create EMF blob generator
-            emf = EMFBlob(width=width_emu, height=height_emu)
-
-            # Set up drawing context
-            self._setup_emf_context(emf, path)
-
-            # Generate path geometry
-            self._add_path_to_emf(emf, path)
-
-            # Generate fill if present
-            if path.fill:
-                self._add_fill_to_emf(emf, path.fill, path)
+            # Identical geometry and paint render to identical bytes; reuse
+            # them from the shared fallback cache when one is configured
+            cache = get_fallback_cache()
+            cache_key = self._emf_cache_key(path, width_emu, height_emu) if cache else None
+            emf_data = cache.get(cache_key) if cache else None
+            cache_status = 'hit' if emf_data is not None else ('miss' if cache else None)
 
-            # Generate stroke if present
-            if path.stroke:
-                self._add_stroke_to_emf(emf, path.stroke, path)
-
-            # Finalize EMF blob
-            emf_data = emf.finalize()
+            if emf_data is None:
+                emf_data = self._render_emf(path, width_emu, height_emu)
+                if cache:
+                    cache.put(cache_key, emf_data)
 
             # Generate relationship ID for PPTX embedding
             relationship_id = f"rId{hash(emf_data) % 1000000}"
@@ -124,13 +132,16 @@ class EMFPathAdapter:
                 width_emu=width_emu,
                 height_emu=height_emu,
                 quality_score=quality_score,
+                x_emu=x_emu,
+                y_emu=y_emu,
                 metadata={
                     'emf_size_bytes': len(emf_data),
                     'path_segments': len(path.segments),
                     'has_fill': path.fill is not None,
                     'has_stroke': path.stroke is not None,
                     'bbox': bbox,
-                    'generation_method': 'existing_emf_system',
+                    'generation_method': 'emf_path_records',
+                    'fallback_cache': cache_status,
                 },
             )
 
@@ -138,106 +149,175 @@ class EMFPathAdapter:
             self.logger.error(f"Failed to generate EMF blob: {e}")
             raise ValueError(f"EMF generation failed: {e}")
 
+    def _render_emf(self, path: Path, width_emu: int, height_emu: int) -> bytes:
+        """Render path geometry, fill and stroke into a finalized EMF blob"""
+        # Create EMF blob generator
+        emf = EMFBlob(width=width_emu, height=height_emu)
+
+        # Set up drawing context
+        self._setup_emf_context(emf, path)
+
+        # Select fill brush and stroke pen (null objects when absent)
+        has_fill = self._add_fill_to_emf(emf, path.fill, path)
+        has_stroke = self._add_stroke_to_emf(emf, path.stroke, path)
+
+        # Generate path geometry
+        self._add_path_to_emf(emf, path, has_fill, has_stroke)
+
+        return emf.finalize()
+
+    def _emf_cache_key(self, path: Path, width_emu: int, height_emu: int) -> str:
+        """Content address of everything _render_emf reads"""
+        geometry = path.geometry
+        coords = self._points_to_emf_coords(geometry.points, path)
+        frame = self._emf_frame(path)
+        return fallback_cache_key(
+            'emf-path', EMF_CACHE_VERSION, width_emu, height_emu,
+            geometry.kinds.tobytes(), coords.tobytes(),
+            repr(path.fill), repr(path.stroke),
+            (frame.width, frame.height) if frame else None,
+        )
+
+    def _emf_frame(self, path: Path) -> Rect | None:
+        """Canvas area in user units: the path bbox padded by half the stroke width"""
+        bbox = path.bbox
+        if not bbox:
+            return None
+        stroke = path.stroke
+        pad = stroke.width / 2 if getattr(stroke, 'paint', None) is not None and stroke.width > 0 else 0.0
+        if not pad:
+            return bbox
+        return Rect(bbox.x - pad, bbox.y - pad, bbox.width + 2 * pad, bbox.height + 2 * pad)
+
     def _setup_emf_context(self, emf: 'EMFBlob', path: Path) -> None:
         """Set up EMF drawing context for path"""
-        # EMF context setup is handled by EMFBlob initialization
-        # Additional setup can be added here if needed
-        pass
+        # Normalized path coordinates span the whole canvas; SVG default fill rule is nonzero
+        emf.set_logical_extent(EMF_LOGICAL_EXTENT, EMF_LOGICAL_EXTENT)
+        emf.set_poly_fill_mode(WINDING)
+
+    def _add_path_to_emf(self, emf: 'EMFBlob', path: Path,
+                         has_fill: bool = True, has_stroke: bool = False) -> None:
+        """Add path geometry to EMF blob as polygon or path-bracket records"""
+        if not path.segments or not (has_fill or has_stroke):
+            return
 
-    def _add_path_to_emf(self, emf: 'EMFBlob', path: Path) -> None:
-        """Add path geometry to EMF blob"""
-        if not path.segments:
+        geometry = path.geometry
+        coords = self._points_to_emf_coords(geometry.points, path).reshape(-1, 4, 2)
+        kinds = geometry.kinds
+
+        # A new figure starts wherever a segment does not begin at the previous end
+        breaks = np.flatnonzero(np.any(coords[1:, 0] != coords[:-1, 3], axis=1)) + 1
+        figures = np.split(np.arange(len(coords)), breaks)
+
+        closed = [np.array_equal(coords[figure[0], 0], coords[figure[-1], 3]) for figure in figures]
+
+        if (len(figures) == 1 and not np.any(kinds == SEGMENT_CUBIC) and has_fill
+                and (closed[0] or not has_stroke)):
+            # Single straight-edged figure: one EMR_POLYGON16 fills and strokes it.
+            # Polygons always close, so an open stroked figure takes the bracket path.
+            points = np.vstack((coords[:1, 0], coords[:, 3]))
+            if len(points) > 1 and np.array_equal(points[0], points[-1]):
+                points = points[:-1]
+            if len(points) >= 3:
+                self._add_polygon_to_emf(emf, points)
+                return
+
+        if has_fill and has_stroke and not all(closed):
+            # STROKEANDFILLPATH closes open figures before stroking; SVG only
+            # closes them for the fill, so fill and stroke separate brackets
+            self._add_figures_to_emf(emf, coords, kinds, figures, closed)
+            emf.fill_path()
+            self._add_figures_to_emf(emf, coords, kinds, figures, closed)
+            emf.stroke_path()
             return
 
-        # Convert path segments to EMF-compatible points
-        points = []
-
-        for segment in path.segments:
-            if isinstance(segment, LineSegment):
-                # Add line segment points
-                points.extend([
-                    self._point_to_emf_coords(segment.start, path),
-                    self._point_to_emf_coords(segment.end, path),
-                ])
-
-            elif isinstance(segment, BezierSegment):
-                # Add bezier control points
-                points.extend([
-                    self._point_to_emf_coords(segment.start, path),
-                    self._point_to_emf_coords(segment.control1, path),
-                    self._point_to_emf_coords(segment.control2, path),
-                    self._point_to_emf_coords(segment.end, path),
-                ])
-
-        # Remove duplicate consecutive points
-        unique_points = []
-        for point in points:
-            if not unique_points or point != unique_points[-1]:
-                unique_points.append(point)
-
-        if len(unique_points) >= 3:
-            # Use existing EMF methods for polygon/polyline drawing
-            # Note: EMFBlob has methods for basic shapes but may need extension for complex paths
-            self._add_polygon_to_emf(emf, unique_points)
-
-    def _add_polygon_to_emf(self, emf: 'EMFBlob', points: list[tuple[int, int]]) -> None:
-        """Add polygon points to EMF using existing EMF system"""
-        # This would integrate with EMF system's polygon drawing
-        # For now, use rectangle as fallback since EMFBlob has limited path support
-        if len(points) >= 2:
-            min_x = min(p[0] for p in points)
-            min_y = min(p[1] for p in points)
-            max_x = max(p[0] for p in points)
-            max_y = max(p[1] for p in points)
-
-            # Use existing rectangle method as fallback
-            emf.fill_rectangle(
-                x=min_x,
-                y=min_y,
-                width=max_x - min_x,
-                height=max_y - min_y,
-                brush_handle=1,  # Default brush
-            )
+        self._add_figures_to_emf(emf, coords, kinds, figures, closed)
+        if has_fill and has_stroke:
+            emf.stroke_and_fill_path()
+        elif has_fill:
+            emf.fill_path()
+        else:
+            emf.stroke_path()
+
+    def _add_figures_to_emf(self, emf: 'EMFBlob', coords: np.ndarray, kinds: np.ndarray,
+                            figures: list[np.ndarray], closed: list[bool]) -> None:
+        """Write one path bracket holding every figure; only closed figures get CLOSEFIGURE"""
+        emf.begin_path()
+        for figure, is_closed in zip(figures, closed):
+            first, last = figure[0], figure[-1] + 1
+            emf.move_to(*coords[first, 0].tolist())
+
+            # One poly record per figure; lines inside a curved figure become
+            # degenerate cubics (control points on the endpoints)
+            figure_coords = coords[first:last]
+            cubic = kinds[first:last] == SEGMENT_CUBIC
+            if cubic.any():
+                controls = figure_coords[:, 1:4].copy()
+                controls[~cubic, 0] = figure_coords[~cubic, 0]
+                controls[~cubic, 1] = figure_coords[~cubic, 3]
+                emf.poly_bezier_to(controls)
+            else:
+                emf.poly_line_to(figure_coords[:, 3])
 
-    def _add_fill_to_emf(self, emf: 'EMFBlob', fill: Any, path: Path) -> None:
-        """Add fill styling to EMF blob"""
-        if isinstance(fill, SolidPaint):
-            # Convert hex color to EMF RGB
-            color_rgb = self._hex_to_rgb(fill.rgb)
+            if is_closed:
+                emf.close_figure()
+        emf.end_path()
 
-            # Use existing EMF brush creation
-            # Note: EMFBlob has brush methods that can be leveraged
-            emf.add_hatch(pattern="solid", color=color_rgb)
+    def _add_polygon_to_emf(self, emf: 'EMFBlob', points: Any) -> None:
+        """Add a closed polygon (``(n, 2)`` logical coordinates) to EMF"""
+        emf.polygon(np.asarray(points))
+
+    def _add_fill_to_emf(self, emf: 'EMFBlob', fill: Any, path: Path) -> bool:
+        """Create and select the fill brush; returns True if the path is filled"""
+        if isinstance(fill, SolidPaint):
+            # Convert hex color to EMF COLORREF
+            brush = emf.add_solid_brush(self._hex_to_rgb(fill.rgb))
 
         elif isinstance(fill, (LinearGradientPaint, RadialGradientPaint)):
             # Complex gradients may need EMF pattern tiles
             # Use pattern fallback for now
-            emf.add_hatch(pattern="horizontal", color=0x808080)
+            brush = emf.add_hatch(pattern="horizontal", color=0x808080)
 
-    def _add_stroke_to_emf(self, emf: 'EMFBlob', stroke: Any, path: Path) -> None:
-        """Add stroke styling to EMF blob"""
-        # EMF stroke handling - integrate with existing EMF pen creation
-        # This would use EMF pen records for stroke properties
-        pass
+        else:
+            emf.select_object(NULL_BRUSH)
+            return False
+
+        emf.select_object(brush)
+        return True
+
+    def _add_stroke_to_emf(self, emf: 'EMFBlob', stroke: Any, path: Path) -> bool:
+        """Create and select the stroke pen; returns True if the path is stroked"""
+        paint = getattr(stroke, 'paint', None)
+        if paint is None or stroke.width <= 0:
+            emf.select_object(NULL_PEN)
+            return False
+
+        color = self._hex_to_rgb(paint.rgb) if isinstance(paint, SolidPaint) else 0x808080
+
+        # Pen width is in logical units; GDI scales it with the x-axis factor
+        frame = self._emf_frame(path)
+        extent = frame.width if frame else 0
+        scale = EMF_LOGICAL_EXTENT / extent if extent > 0 else 10
+        emf.select_object(emf.add_pen(color, max(1, round(stroke.width * scale))))
+        return True
+
+    def _points_to_emf_coords(self, points: np.ndarray, path: Path) -> np.ndarray:
+        """Vectorized _point_to_emf_coords for an ``(n, 2)`` point array"""
+        frame = self._emf_frame(path)
+        if frame and (frame.width > 0 or frame.height > 0):
+            # Normalize to EMF logical space; a degenerate axis collapses to 0
+            offsets = np.asarray(points, dtype=np.float64) - (frame.x, frame.y)
+            extent = np.array((frame.width, frame.height))
+            normalized = np.divide(offsets, extent, out=np.zeros_like(offsets), where=extent > 0)
+            return (normalized * EMF_LOGICAL_EXTENT).astype(np.int32)
+
+        # Fallback coordinate mapping
+        return (np.asarray(points) * 10).astype(np.int32)
 
     def _point_to_emf_coords(self, point: Point, path: Path) -> tuple[int, int]:
         """Convert IR Point to EMF coordinate system"""
-        # Convert to EMF coordinate space
-        bbox = path.bbox
-        if bbox and bbox.width > 0 and bbox.height > 0:
-            # Normalize to EMF canvas size
-            x_norm = (point.x - bbox.x) / bbox.width if bbox.width > 0 else 0
-            y_norm = (point.y - bbox.y) / bbox.height if bbox.height > 0 else 0
-
-            # Scale to EMF dimensions (EMF uses device units)
-            emf_x = int(x_norm * 1000)  # Scale to reasonable EMF units
-            emf_y = int(y_norm * 1000)
-        else:
-            # Fallback coordinate mapping
-            emf_x = int(point.x * 10)
-            emf_y = int(point.y * 10)
-
-        return (emf_x, emf_y)
+        x, y = self._points_to_emf_coords(np.array([[point.x, point.y]]), path)[0].tolist()
+        return (x, y)
 
     def _hex_to_rgb(self, hex_color: str) -> int:
         """Convert hex color string to RGB integer"""
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+XML Fragment Cache
+
+Content-addressed LRU of generated DrawingML fragments (custGeom path
+bodies, fill and stroke XML). Mappers key fragments by exactly the inputs
+the generator reads, so repeated geometry such as chart markers or icons
+is formatted once and the same string object is reused for every copy.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class XMLFragmentCache:
+    """Thread-safe LRU mapping content keys to XML fragment strings."""
+
+    def __init__(self, max_size: int = 4096):
+        """
+        Initialize fragment cache.
+
+        Args:
+            max_size: Maximum cached fragments (0 disables caching)
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key: Hashable | None, build: Callable[[], str]) -> str:
+        """
+        Get the fragment cached for ``key``, building and caching it on a miss.
+
+        Args:
+            key: Content key, or None when the inputs are not hashable
+            build: Zero-argument callable producing the fragment
+
+        Returns:
+            Cached or freshly built XML fragment
+        """
+        if key is None or self.max_size <= 0:
+            return build()
+
+        with self._lock:
+            fragment = self._entries.get(key)
+            if fragment is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return fragment
+
+        fragment = build()
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = fragment
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return fragment
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get cache size and hit statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Drop all cached fragments and reset hit counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def fragment_key(kind: str, value: Any) -> tuple | None:
+    """Build a cache key for a hashable IR value, or None if it is unhashable."""
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return (kind, value)
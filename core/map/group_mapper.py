@@ -13,7 +13,7 @@ from typing import Any, Dict, Optional
 from ..ir import Group, Image, IRElement, Path, TextFrame
 from ..ir.shapes import Circle, Ellipse, Rectangle
 from ..policy import GroupDecision, Policy
-from .base import Mapper, MapperResult, MappingError, OutputFormat
+from .base import SHAPE_ID_PLACEHOLDER, Mapper, MapperResult, MappingError, OutputFormat
 
 logger = logging.getLogger(__name__)
 
@@ -159,7 +159,7 @@ class GroupMapper(Mapper):
             # Create group shape
             xml_content = f"""<p:grpSp>
     <p:nvGrpSpPr>
-        <p:cNvPr id="1" name="Group"/>
+        <p:cNvPr id="{SHAPE_ID_PLACEHOLDER}" name="Group"/>
         <p:cNvGrpSpPr/>
         <p:nvPr/>
     </p:nvGrpSpPr>
@@ -209,7 +209,7 @@ class GroupMapper(Mapper):
 
             xml_content = f"""<p:pic>
     <p:nvPicPr>
-        <p:cNvPr id="1" name="EMF_Group"/>
+        <p:cNvPr id="{SHAPE_ID_PLACEHOLDER}" name="EMF_Group"/>
         <p:cNvPicPr/>
         <p:nvPr/>
     </p:nvPicPr>
@@ -12,7 +12,7 @@ from typing import Any, Dict
 
 from ..ir import ClipRef, Image, IRElement
 from ..policy import ImageDecision, Policy
-from .base import Mapper, MapperResult, MappingError, OutputFormat
+from .base import SHAPE_ID_PLACEHOLDER, Mapper, MapperResult, MappingError, OutputFormat
 
 logger = logging.getLogger(__name__)
 
@@ -246,7 +246,7 @@ class ImageMapper(Mapper):
 
         xml_content = f"""<p:pic>
     <p:nvPicPr>
-        <p:cNvPr id="1" name="Image"/>
+        <p:cNvPr id="{SHAPE_ID_PLACEHOLDER}" name="Image"/>
         <p:cNvPicPr>
             <a:picLocks noChangeAspect="1"/>
         </p:cNvPicPr>
@@ -289,7 +289,7 @@ class ImageMapper(Mapper):
         # Vector images are rendered as EMF for best fidelity
         xml_content = f"""<p:pic>
     <p:nvPicPr>
-        <p:cNvPr id="1" name="VectorImage"/>
+        <p:cNvPr id="{SHAPE_ID_PLACEHOLDER}" name="VectorImage"/>
         <p:cNvPicPr>
             <a:picLocks noChangeAspect="1"/>
         </p:cNvPicPr>
@@ -10,11 +10,12 @@ import logging
 import time
 from typing import Any, Optional
 
+import numpy as np
+
 from ..ir import (
-    BezierSegment,
+    SEGMENT_CUBIC,
     IRElement,
     LinearGradientPaint,
-    LineSegment,
     Path,
     ClipRef,
     PatternPaint,
@@ -22,7 +23,8 @@ from ..ir import (
     SolidPaint,
 )
 from ..policy import PathDecision, Policy
-from .base import Mapper, MapperResult, MappingError, OutputFormat
+from .base import SHAPE_ID_PLACEHOLDER, Mapper, MapperResult, MappingError, OutputFormat
+from .fragment_cache import XMLFragmentCache, fragment_key
 
 logger = logging.getLogger(__name__)
 
@@ -37,13 +39,15 @@ class PathMapper(Mapper):
     Integrates with existing PathSystem for battle-tested path processing.
     """
 
-    def __init__(self, policy: Policy, path_system: Any | None = None):
+    def __init__(self, policy: Policy, path_system: Any | None = None,
+                 fragment_cache_size: int = 4096):
         """
         Initialize path mapper.
 
         Args:
             policy: Policy engine for decision making
             path_system: Optional existing PathSystem for integration
+            fragment_cache_size: Maximum cached path/fill/stroke XML fragments (0 disables)
         """
         super().__init__(policy)
         self.logger = logging.getLogger(__name__)
@@ -55,6 +59,9 @@ class PathMapper(Mapper):
         self._drawingml_adapter = None
         self._emf_adapter = None
 
+        # Repeated geometry (markers, icons) reuses its generated XML fragments
+        self._fragment_cache = XMLFragmentCache(fragment_cache_size)
+
     def can_map(self, element: IRElement) -> bool:
         """Check if element is a Path"""
         return isinstance(element, Path)
@@ -137,10 +144,16 @@ class PathMapper(Mapper):
             path_data = self._generate_path_data(path)
 
             # Generate fill XML
-            fill_xml = self._generate_fill_xml(path.fill) if path.fill else ""
+            fill_xml = self._fragment_cache.get_or_build(
+                fragment_key('fill', path.fill),
+                lambda: self._generate_fill_xml(path.fill),
+            ) if path.fill else ""
 
             # Generate stroke XML
-            stroke_xml = self._generate_stroke_xml(path.stroke) if path.stroke else ""
+            stroke_xml = self._fragment_cache.get_or_build(
+                fragment_key('stroke', path.stroke),
+                lambda: self._generate_stroke_xml(path.stroke),
+            ) if path.stroke else ""
 
             # Generate clipping XML
             clip_xml = ""
@@ -164,7 +177,7 @@ class PathMapper(Mapper):
                 width_emu = height_emu = 914400  # 1 inch in EMU
 
             # Get shape ID from path metadata or use default
-            shape_id = getattr(path, 'shape_id', 1)
+            shape_id = getattr(path, 'shape_id', SHAPE_ID_PLACEHOLDER)
 
             # Generate complete shape XML with required PowerPoint elements
             xml_content = f"""<p:sp>
@@ -265,10 +278,17 @@ class PathMapper(Mapper):
             # Generate actual EMF blob
             emf_result = emf_adapter.generate_emf_blob(path)
 
+            bbox = getattr(path, 'bbox', None)
+            x_emu = int(bbox.x * 12700) if bbox else 0
+            y_emu = int(bbox.y * 12700) if bbox else 0
+            if emf_result.x_emu is not None and emf_result.y_emu is not None:
+                # Canvas is padded to fit the stroke; place its origin, not the bbox's
+                x_emu, y_emu = emf_result.x_emu, emf_result.y_emu
+
             # Create proper EMF picture XML with real relationship
             xml_content = f"""<p:pic>
     <p:nvPicPr>
-        <p:cNvPr id="1" name="EMF_Path"/>
+        <p:cNvPr id="{SHAPE_ID_PLACEHOLDER}" name="EMF_Path"/>
         <p:cNvPicPr/>
         <p:nvPr/>
     </p:nvPicPr>
@@ -286,7 +306,7 @@ class PathMapper(Mapper):
     </p:blipFill>
     <p:spPr>
         <a:xfrm>
-            <a:off x="0" y="0"/>
+            <a:off x="{x_emu}" y="{y_emu}"/>
             <a:ext cx="{emf_result.width_emu}" cy="{emf_result.height_emu}"/>
         </a:xfrm>
         <a:prstGeom prst="rect">
@@ -337,7 +357,7 @@ class PathMapper(Mapper):
             # Placeholder EMF uses generic picture shape
             xml_content = f"""<p:pic>
     <p:nvPicPr>
-        <p:cNvPr id="1" name="EMF_Path_Placeholder"/>
+        <p:cNvPr id="{SHAPE_ID_PLACEHOLDER}" name="EMF_Path_Placeholder"/>
         <p:cNvPicPr/>
         <p:nvPr/>
     </p:nvPicPr>
@@ -387,35 +407,63 @@ class PathMapper(Mapper):
 
     def _generate_path_data(self, path: Path) -> str:
         """Generate DrawingML path data string from IR segments"""
-        commands = []
+        geometry = path.geometry
+        if len(geometry) == 0:
+            return ''
 
         # Get bounding box for coordinate normalization
         bbox = getattr(path, 'bbox', None)
 
-        for i, segment in enumerate(path.segments):
-            if isinstance(segment, LineSegment):
-                if i == 0:
-                    # First segment needs moveTo
-                    commands.append(f'<a:moveTo><a:pt x="{self._coord_to_drawingml(segment.start.x, bbox)}" y="{self._coord_to_drawingml(segment.start.y, bbox, is_y=True)}"/></a:moveTo>')
-                commands.append(f'<a:lnTo><a:pt x="{self._coord_to_drawingml(segment.end.x, bbox)}" y="{self._coord_to_drawingml(segment.end.y, bbox, is_y=True)}"/></a:lnTo>')
+        # Normalize every point in one pass; rows are [start, control1, control2, end]
+        xs, ys = self._points_to_drawingml(geometry.points, bbox)
+        is_closed = path.is_closed
+
+        # Normalized coordinates are translation and scale invariant, so
+        # identical shapes at different offsets share one cached path body
+        key = ('path', geometry.kinds.tobytes(), xs.tobytes(), ys.tobytes(), is_closed)
+        return self._fragment_cache.get_or_build(
+            key,
+            lambda: self._format_path_data(geometry.kinds, xs, ys, is_closed),
+        )
+
+    def _format_path_data(self, kinds: np.ndarray, xs: np.ndarray, ys: np.ndarray, is_closed: bool) -> str:
+        """Format normalized segment coordinates as DrawingML path commands"""
+        xs = xs.reshape(-1, 4).tolist()
+        ys = ys.reshape(-1, 4).tolist()
 
-            elif isinstance(segment, BezierSegment):
-                if i == 0:
-                    # First segment needs moveTo
-                    commands.append(f'<a:moveTo><a:pt x="{self._coord_to_drawingml(segment.start.x, bbox)}" y="{self._coord_to_drawingml(segment.start.y, bbox, is_y=True)}"/></a:moveTo>')
+        # First segment needs moveTo
+        commands = [f'<a:moveTo><a:pt x="{xs[0][0]}" y="{ys[0][0]}"/></a:moveTo>']
 
+        for kind, (_, x1, x2, x3), (_, y1, y2, y3) in zip(kinds.tolist(), xs, ys):
+            if kind == SEGMENT_CUBIC:
                 commands.append(f'''<a:cubicBezTo>
-    <a:pt x="{self._coord_to_drawingml(segment.control1.x, bbox)}" y="{self._coord_to_drawingml(segment.control1.y, bbox, is_y=True)}"/>
-    <a:pt x="{self._coord_to_drawingml(segment.control2.x, bbox)}" y="{self._coord_to_drawingml(segment.control2.y, bbox, is_y=True)}"/>
-    <a:pt x="{self._coord_to_drawingml(segment.end.x, bbox)}" y="{self._coord_to_drawingml(segment.end.y, bbox, is_y=True)}"/>
+    <a:pt x="{x1}" y="{y1}"/>
+    <a:pt x="{x2}" y="{y2}"/>
+    <a:pt x="{x3}" y="{y3}"/>
 </a:cubicBezTo>''')
+            else:
+                commands.append(f'<a:lnTo><a:pt x="{x3}" y="{y3}"/></a:lnTo>')
 
         # Close path if it's closed
-        if path.is_closed:
+        if is_closed:
             commands.append('<a:close/>')
 
         return '\n'.join(commands)
 
+    def _points_to_drawingml(self, points: np.ndarray, bbox: Any = None) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized _coord_to_drawingml for an ``(n, 2)`` point array"""
+        if bbox:
+            # Both axes at once; a degenerate axis collapses to 0
+            offsets = points - (bbox.x, bbox.y)
+            extent = np.array((bbox.width, bbox.height))
+            normalized = np.divide(offsets, extent, out=np.zeros_like(offsets), where=extent > 0) * 21600
+            scaled = normalized.clip(0, 21600).astype(np.int64)
+            return scaled[:, 0], scaled[:, 1]
+
+        # Fallback: simple scaling
+        scaled = np.clip(np.trunc(points * 100), 0, 21600).astype(np.int64)
+        return scaled[:, 0], scaled[:, 1]
+
     def _coord_to_drawingml(self, coord: float, bbox: Any = None, is_y: bool = False) -> str:
         """Convert coordinate to DrawingML units (0-21600 range) normalized to bounding box"""
         if bbox:
@@ -596,7 +644,7 @@ class PathMapper(Mapper):
 
         return f"""<p:sp>
     <p:nvSpPr>
-        <p:cNvPr id="1" name="Path_Existing"/>
+        <p:cNvPr id="{SHAPE_ID_PLACEHOLDER}" name="Path_Existing"/>
         <p:cNvSpPr/>
         <p:nvPr/>
     </p:nvSpPr>
@@ -611,6 +659,16 @@ class PathMapper(Mapper):
     </p:spPr>
 </p:sp>"""
 
+    def get_statistics(self) -> dict[str, Any]:
+        """Get mapping statistics including XML fragment cache reuse"""
+        stats = super().get_statistics()
+        stats['fragment_cache'] = self._fragment_cache.get_statistics()
+        return stats
+
+    def clear_fragment_cache(self) -> None:
+        """Drop cached path, fill and stroke XML fragments"""
+        self._fragment_cache.clear()
+
     def set_drawingml_adapter(self, adapter: Any) -> None:
         """Set adapter for legacy DrawingML generation"""
         self._drawingml_adapter = adapter
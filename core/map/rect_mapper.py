@@ -17,7 +17,7 @@ from ..ir.shapes import Rectangle
 from ..ir.geometry import Point, LineSegment
 from ..ir.scene import Path
 from ..policy.shape_policy import decide_shape_strategy
-from .base import MapperResult, OutputFormat
+from .base import SHAPE_ID_PLACEHOLDER, MapperResult, OutputFormat
 from .shape_helpers import (
     generate_shape_properties_xml,
     generate_style_xml,
@@ -67,7 +67,7 @@ class RectangleMapper:
         height_emu = int(rect.bounds.height * 12700)
 
         # Get shape ID
-        shape_id = getattr(rect, 'shape_id', 1)
+        shape_id = getattr(rect, 'shape_id', SHAPE_ID_PLACEHOLDER)
 
         # Use preset name from decision (rect or roundRect)
         preset_name = decision.preset_name or 'rect'
@@ -33,6 +33,7 @@ except ImportError:
     logging.warning("Legacy text system not available")
 
 from ..ir import RichTextFrame, TextAnchor, TextFrame
+from .base import SHAPE_ID_PLACEHOLDER
 
 
 @dataclass
@@ -399,7 +400,7 @@ class TextProcessingAdapter:
 {metrics_comment}
 <p:sp>
     <p:nvSpPr>
-        <p:cNvPr id="1" name="EnhancedTextFrame"/>
+        <p:cNvPr id="{SHAPE_ID_PLACEHOLDER}" name="EnhancedTextFrame"/>
         <p:cNvSpPr txBox="1"/>
         <p:nvPr/>
     </p:nvSpPr>
@@ -498,7 +499,7 @@ class TextProcessingAdapter:
         # Generate Clean Slate enhanced text shape XML (debug comments removed)
         xml_content = f"""<p:sp>
     <p:nvSpPr>
-        <p:cNvPr id="1" name="CleanSlateTextFrame"/>
+        <p:cNvPr id="{SHAPE_ID_PLACEHOLDER}" name="CleanSlateTextFrame"/>
         <p:cNvSpPr txBox="1"/>
         <p:nvPr/>
     </p:nvSpPr>
@@ -583,7 +584,7 @@ class TextProcessingAdapter:
         xml_content = f"""<!-- Basic text processing -->
 <p:sp>
     <p:nvSpPr>
-        <p:cNvPr id="1" name="BasicTextFrame"/>
+        <p:cNvPr id="{SHAPE_ID_PLACEHOLDER}" name="BasicTextFrame"/>
         <p:cNvSpPr txBox="1"/>
         <p:nvPr/>
     </p:nvSpPr>
@@ -12,7 +12,7 @@ from typing import Optional
 
 from ..ir import IRElement, RichTextFrame, Run, TextAnchor, TextFrame
 from ..policy import Policy, TextDecision
-from .base import Mapper, MapperResult, MappingError, OutputFormat
+from .base import SHAPE_ID_PLACEHOLDER, Mapper, MapperResult, MappingError, OutputFormat
 
 logger = logging.getLogger(__name__)
 
@@ -257,7 +257,7 @@ class TextMapper(Mapper):
         # Generate complete text shape XML
         xml_content = f"""<p:sp>
     <p:nvSpPr>
-        <p:cNvPr id="1" name="TextFrame"/>
+        <p:cNvPr id="{SHAPE_ID_PLACEHOLDER}" name="TextFrame"/>
         <p:cNvSpPr txBox="1"/>
         <p:nvPr/>
     </p:nvSpPr>
@@ -299,7 +299,7 @@ class TextMapper(Mapper):
 
             xml_content = f"""<p:pic>
     <p:nvPicPr>
-        <p:cNvPr id="1" name="EMF_Text"/>
+        <p:cNvPr id="{SHAPE_ID_PLACEHOLDER}" name="EMF_Text"/>
         <p:cNvPicPr/>
         <p:nvPr/>
     </p:nvPicPr>
@@ -9,18 +9,36 @@ This replaces the unwieldy 7000+ line multislide implementation with a clean,
 maintainable approach focused on common use cases.
 """
 
+import io
 import logging
+import multiprocessing
 import time
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 from ..io import PackageWriter
-from ..pipeline.config import PipelineConfig
+from ..pipeline.config import OutputFormat, PipelineConfig
 from ..pipeline.converter import CleanSlateConverter, ConversionResult
+from ..utils.process_pool import process_pool_context
 
 logger = logging.getLogger(__name__)
 
+# Warm converter held by each page worker process
+_worker_converter: CleanSlateConverter | None = None
+
+
+def _init_page_worker(config: PipelineConfig) -> None:
+    global _worker_converter
+    _worker_converter = CleanSlateConverter(config)
+
+
+def _convert_page_in_worker(content: str) -> ConversionResult:
+    _worker_converter.reset_conversion_state()
+    return _worker_converter.convert_string(content)
+
 
 @dataclass
 class PageSource:
@@ -76,18 +94,25 @@ class CleanSlateMultiPageConverter:
     - Clean error handling
     """
 
-    def __init__(self, config: PipelineConfig = None):
+    def __init__(self, config: PipelineConfig = None, max_workers: int = 1):
         """
         Initialize multi-page converter.
 
         Args:
             config: Pipeline configuration for individual page conversion
+            max_workers: Worker processes for page conversion (1 = sequential)
         """
         self.config = config or PipelineConfig()
+        self.max_workers = max_workers
         self.logger = logging.getLogger(__name__)
 
-        # Initialize Clean Slate converter for page processing
-        self.page_converter = CleanSlateConverter(self.config)
+        # Initialize Clean Slate converter for page processing. Pages only
+        # need their embedded slides, so skip per-page PPTX packaging.
+        self._page_config = replace(self.config, output_format=OutputFormat.SLIDE_XML)
+        self.page_converter = CleanSlateConverter(self._page_config)
+
+        # Page worker pool, created on first parallel conversion
+        self._executor: ProcessPoolExecutor | None = None
 
         # Initialize package writer for multi-page output
         # Pass enable_debug from config to enable E2E tracing
@@ -126,18 +151,10 @@ class CleanSlateMultiPageConverter:
             self.logger.info(f"Converting {len(pages)} pages to multi-page PPTX")
 
             # Convert each page using Clean Slate pipeline
-            for i, page in enumerate(pages):
-                try:
-                    self.logger.debug(f"Converting page {i+1}/{len(pages)}")
-
-                    # Convert page content using Clean Slate converter
-                    page_result = self.page_converter.convert_string(page.content)
-                    page_results.append(page_result)
-
-                except Exception as e:
-                    self.logger.error(f"Failed to convert page {i+1}: {e}")
-                    # Continue with other pages but track the error
-                    continue
+            if self._use_workers(len(pages)):
+                page_results = self._convert_pages_parallel(pages)
+            else:
+                page_results = self._convert_pages_sequential(pages)
 
             if not page_results:
                 raise ValueError("No pages were successfully converted")
@@ -172,6 +189,81 @@ class CleanSlateMultiPageConverter:
             self._record_failure()
             raise ValueError(f"Multi-page conversion failed: {e}") from e
 
+    def _use_workers(self, page_count: int) -> bool:
+        # Daemonic processes (e.g. queue workers) cannot start a process pool
+        return (
+            self.max_workers > 1
+            and page_count > 1
+            and not multiprocessing.current_process().daemon
+        )
+
+    def _convert_pages_sequential(self, pages: list[PageSource]) -> list[ConversionResult]:
+        """Convert pages one after another with the local page converter."""
+        page_results = []
+
+        for i, page in enumerate(pages):
+            try:
+                self.logger.debug(f"Converting page {i+1}/{len(pages)}")
+
+                # Convert page content using Clean Slate converter; each
+                # slide numbers its shapes independently, as in the workers
+                self.page_converter.reset_conversion_state(reset_statistics=False)
+                page_result = self.page_converter.convert_string(page.content)
+                page_results.append(page_result)
+
+            except Exception as e:
+                self.logger.error(f"Failed to convert page {i+1}: {e}")
+                # Continue with other pages but track the error
+                continue
+
+        return page_results
+
+    def _convert_pages_parallel(self, pages: list[PageSource]) -> list[ConversionResult]:
+        """Convert pages on the worker pool, collecting results in page order."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=process_pool_context(),
+                initializer=_init_page_worker,
+                initargs=(self._page_config,),
+            )
+
+        self.logger.debug(f"Converting {len(pages)} pages on {self.max_workers} workers")
+        executor = self._executor
+        try:
+            futures = [executor.submit(_convert_page_in_worker, page.content) for page in pages]
+        except BrokenProcessPool:
+            self._discard_executor(executor)
+            raise
+
+        page_results = []
+        for i, future in enumerate(futures):
+            try:
+                page_results.append(future.result())
+            except BrokenProcessPool as e:
+                # A worker died; the next call starts a fresh pool
+                self.logger.error(f"Failed to convert page {i+1}: page worker pool broken: {e}")
+                self._discard_executor(executor)
+                continue
+            except Exception as e:
+                self.logger.error(f"Failed to convert page {i+1}: {e}")
+                # Continue with other pages but track the error
+                continue
+
+        return page_results
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        """Drop a broken page worker pool so the next call rebuilds it."""
+        if self._executor is executor:
+            self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self) -> None:
+        """Shut down the page worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
     def convert_files(self, svg_files: list[str | Path], output_path: str) -> MultiPageResult:
         """
         Convert multiple SVG files to a multi-page PPTX.
@@ -210,48 +302,8 @@ class CleanSlateMultiPageConverter:
     def _generate_multipage_package(self, page_results: list[ConversionResult], output_path: str = None) -> dict[str, Any]:
         """Generate multi-page PPTX package from individual page results."""
         try:
-            # Extract embedder results from page conversion results
-            embedder_results = []
-
-            for page_result in page_results:
-                # For Clean Slate results, we need to extract the embedder result
-                # This would normally be available from the conversion pipeline
-                # For now, create a mock embedder result from the page result data
-
-                from ..io.embedder import EmbedderResult
-
-                # Convert the page result to an embedder result
-                embedder_result = EmbedderResult(
-                    slide_xml='''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<p:sld xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"
-       xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">
-    <p:cSld>
-        <p:spTree>
-            <p:nvGrpSpPr>
-                <p:cNvPr id="1" name="Slide"/>
-                <p:cNvGrpSpPr/>
-                <p:nvPr/>
-            </p:nvGrpSpPr>
-            <p:grpSpPr>
-                <a:xfrm>
-                    <a:off x="0" y="0"/>
-                    <a:ext cx="9144000" cy="6858000"/>
-                    <a:chOff x="0" y="0"/>
-                    <a:chExt cx="9144000" cy="6858000"/>
-                </a:xfrm>
-            </p:grpSpPr>
-            <!-- Converted content would go here -->
-        </p:spTree>
-    </p:cSld>
-</p:sld>''',
-                    relationship_data=[],
-                    media_files=[],
-                    elements_embedded=page_result.elements_processed,
-                    native_elements=page_result.native_elements,
-                    emf_elements=page_result.emf_elements,
-                    total_size_bytes=len(page_result.output_data),
-                )
-                embedder_results.append(embedder_result)
+            # Each page carries the slide embedded by the Clean Slate pipeline
+            embedder_results = [page_result.embedder_result for page_result in page_results]
 
             # Generate PPTX package
             if output_path:
@@ -259,7 +311,6 @@ class CleanSlateMultiPageConverter:
                 with open(output_path, 'rb') as f:
                     package_data = f.read()
             else:
-                import io
                 output_stream = io.BytesIO()
                 package_stats = self.package_writer.write_package_stream(embedder_results, output_stream)
                 package_data = output_stream.getvalue()
@@ -315,14 +366,15 @@ class CleanSlateMultiPageConverter:
         self.page_converter.reset_statistics()
 
 
-def create_multipage_converter(config: PipelineConfig = None) -> CleanSlateMultiPageConverter:
+def create_multipage_converter(config: PipelineConfig = None, max_workers: int = 1) -> CleanSlateMultiPageConverter:
     """
     Create Clean Slate Multi-Page Converter.
 
     Args:
         config: Pipeline configuration for page conversion
+        max_workers: Worker processes for page conversion (1 = sequential)
 
     Returns:
         Configured CleanSlateMultiPageConverter
     """
-    return CleanSlateMultiPageConverter(config)
\ No newline at end of file
+    return CleanSlateMultiPageConverter(config, max_workers=max_workers)
\ No newline at end of file
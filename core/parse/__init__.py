@@ -6,10 +6,14 @@ Provides SVG parsing and normalization capabilities.
 """
 
 from .parser import ParseResult, SVGParser
+from .path_data import PathTokens, parse_path_data, tokenize_path_data
 from .safe_svg_normalization import SafeSVGNormalizer as SVGNormalizer
 
 __all__ = [
     'SVGParser',
     'ParseResult',
     'SVGNormalizer',
+    'PathTokens',
+    'parse_path_data',
+    'tokenize_path_data',
 ]
\ No newline at end of file
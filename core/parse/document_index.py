@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Per-document element index.
+
+Built once by ``SVGParser.parse`` with a single C-level ``iter(ET.Element)``
+pass (comments and processing instructions are skipped by lxml itself) and
+attached to ``ParseResult``. The parser (statistics, clip collection and
+IR conversion) and the SMIL animation parser query it instead of
+re-walking or re-running XPath over the tree.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from typing import Any, NamedTuple
+
+from lxml import etree as ET
+
+SVG_NAMESPACE = 'http://www.w3.org/2000/svg'
+XLINK_HREF = '{http://www.w3.org/1999/xlink}href'
+
+_HREF_ATTRIBUTES = ('href', XLINK_HREF)
+_URL_REFERENCE_RE = re.compile(r"url\(\s*['\"]?#([^'\")\s]+)")
+_EXTERNAL_SCHEMES = ('http://', 'https://', 'file://')
+
+
+class Reference(NamedTuple):
+    """A same-document reference (``url(#id)`` or ``href="#id"``)."""
+    element: Any  # ET.Element
+    attribute: str
+    target_id: str
+
+
+class DocumentIndex:
+    """
+    Flat, document-ordered index of an SVG tree.
+
+    Attributes:
+        root: Indexed root element
+        elements: Elements in document order (root first)
+        parents: Position of each element's parent (-1 for the root)
+        depths: Depth of each element (root is 0)
+        subtree_ends: Exclusive end position of each element's subtree
+        ids: id attribute -> first element carrying it
+        tags: Clark-notation tag -> elements in document order
+        external_references: (element, attribute, value) for external
+            images, fonts and stylesheets
+
+    Same-document references are parsed lazily from the elements the build
+    pass flagged as carrying href/url() attributes.
+    """
+
+    def __init__(self, root: Any):
+        self.root = root
+        self.elements: list[Any] = []
+        self.parents: list[int] = []
+        self.depths: list[int] = []
+        self.subtree_ends: list[int] = []
+        self.ids: dict[str, Any] = {}
+        self.tags: dict[str, list[Any]] = {}
+        self._positions: dict[Any, int] = {}
+        self._linked_elements: list[Any] = []
+        self._references: list[Reference] | None = None
+        self.external_references: list[tuple[Any, str, str]] = []
+        self._references_by_target: dict[str, list[Reference]] | None = None
+
+    @classmethod
+    def build(cls, root: Any) -> DocumentIndex:
+        """
+        Index a tree in one pass.
+
+        Args:
+            root: Root element of the parsed document
+
+        Returns:
+            Populated DocumentIndex
+        """
+        index = cls(root)
+        elements = index.elements
+        parents = index.parents
+        depths = index.depths
+        positions = index._positions
+        ids = index.ids
+        tags = index.tags
+        linked = index._linked_elements
+        external = index.external_references
+
+        for position, element in enumerate(root.iter(ET.Element)):
+            elements.append(element)
+            positions[element] = position
+
+            parent_position = positions.get(element.getparent(), -1) if position else -1
+            parents.append(parent_position)
+            depths.append(depths[parent_position] + 1 if parent_position >= 0 else 0)
+
+            tag = element.tag
+            bucket = tags.get(tag)
+            if bucket is None:
+                tags[tag] = [element]
+            else:
+                bucket.append(element)
+
+            for name, value in element.items():
+                if name == 'id':
+                    ids.setdefault(value, element)
+                elif name in _HREF_ATTRIBUTES:
+                    if not linked or linked[-1] is not element:
+                        linked.append(element)
+                    if value.startswith(_EXTERNAL_SCHEMES):
+                        external.append((element, name, value))
+                elif 'url(' in value:
+                    if not linked or linked[-1] is not element:
+                        linked.append(element)
+                    if name == 'font-family':
+                        external.append((element, name, value))
+
+        for tag, bucket in tags.items():
+            if tag == 'style' or tag.endswith('}style'):
+                for element in bucket:
+                    css = element.text or ''
+                    if '@import' in css or 'url(' in css:
+                        external.append((element, 'style', css))
+
+        # Subtree ranges: walk backwards so children close before parents
+        subtree_ends = list(range(1, len(elements) + 1))
+        for position in range(len(elements) - 1, 0, -1):
+            parent_position = parents[position]
+            if subtree_ends[position] > subtree_ends[parent_position]:
+                subtree_ends[parent_position] = subtree_ends[position]
+        index.subtree_ends = subtree_ends
+        return index
+
+    @property
+    def element_count(self) -> int:
+        """Number of indexed elements (comments/PIs excluded)."""
+        return len(self.elements)
+
+    @property
+    def references(self) -> list[Reference]:
+        """Same-document url()/href references in document order."""
+        if self._references is None:
+            self._scan_links()
+        return self._references
+
+    @property
+    def has_external_references(self) -> bool:
+        """True if any element references an external resource."""
+        return bool(self.external_references)
+
+    def _scan_links(self) -> None:
+        references: list[Reference] = []
+        for element in self._linked_elements:
+            for name, value in element.items():
+                if name in _HREF_ATTRIBUTES:
+                    if value.startswith('#'):
+                        references.append(Reference(element, name, value[1:]))
+                elif 'url(' in value:
+                    for target in _URL_REFERENCE_RE.findall(value):
+                        references.append(Reference(element, name, target))
+        self._references = references
+
+    def get_element_by_id(self, element_id: str) -> Any | None:
+        """Get the first element with the given id."""
+        return self.ids.get(element_id)
+
+    def find_all(self, local_name: str, namespace: str | None = SVG_NAMESPACE,
+                 include_unqualified: bool = False) -> list[Any]:
+        """
+        Get elements with a tag, in document order.
+
+        Args:
+            local_name: Tag local name (e.g. ``"clipPath"``)
+            namespace: Tag namespace, None for unqualified tags only
+            include_unqualified: Also return un-namespaced elements
+
+        Returns:
+            Matching elements (root included if it matches)
+        """
+        qualified = self.tags.get(f'{{{namespace}}}{local_name}' if namespace else local_name, [])
+        if not include_unqualified or not namespace:
+            return list(qualified)
+        unqualified = self.tags.get(local_name, [])
+        if not unqualified:
+            return list(qualified)
+        return sorted(qualified + unqualified, key=self._positions.__getitem__)
+
+    def position(self, element: Any) -> int | None:
+        """Get an element's document-order position, or None if not indexed."""
+        return self._positions.get(element)
+
+    def parent(self, element: Any) -> Any | None:
+        """Get an element's parent element."""
+        position = self._positions.get(element)
+        if position is None or self.parents[position] < 0:
+            return None
+        return self.elements[self.parents[position]]
+
+    def depth(self, element: Any) -> int | None:
+        """Get an element's depth below the root."""
+        position = self._positions.get(element)
+        return None if position is None else self.depths[position]
+
+    def has_ancestor(self, element: Any, tag: str) -> bool:
+        """True if an ancestor of ``element`` has the given Clark-notation tag."""
+        position = self._positions.get(element)
+        if position is None:
+            return False
+        position = self.parents[position]
+        while position >= 0:
+            if self.elements[position].tag == tag:
+                return True
+            position = self.parents[position]
+        return False
+
+    def iter_subtree(self, element: Any) -> Iterator[Any]:
+        """Yield ``element`` and its descendants in document order."""
+        position = self._positions.get(element)
+        if position is None:
+            return iter(())
+        return iter(self.elements[position:self.subtree_ends[position]])
+
+    def references_to(self, target_id: str) -> list[Reference]:
+        """Get every same-document reference to ``target_id``."""
+        if self._references_by_target is None:
+            by_target: dict[str, list[Reference]] = {}
+            for reference in self.references:
+                by_target.setdefault(reference.target_id, []).append(reference)
+            self._references_by_target = by_target
+        return self._references_by_target.get(target_id, [])
@@ -15,7 +15,9 @@ from typing import Any, Optional
 
 from lxml import etree as ET
 
-from ..xml.safe_iter import children, walk
+from ..xml.safe_iter import children
+from .document_index import DocumentIndex
+from .path_data import apply_coordinate_space, parse_path_data
 from .safe_svg_normalization import SafeSVGNormalizer as SVGNormalizer
 from ..css import StyleResolver, StyleContext, parse_color
 from ..ir.geometry import BezierSegment, LineSegment, Point, Rect, SegmentType
@@ -54,6 +56,9 @@ class ParseResult:
     normalization_changes: dict[str, Any] = None
     clip_paths: dict[str, "ClipDefinition"] | None = None
 
+    # Element index of svg_root as parsed, shared by downstream stages
+    document_index: DocumentIndex | None = None
+
     def __post_init__(self):
         if self.normalization_changes is None:
             self.normalization_changes = {}
@@ -84,6 +89,7 @@ class SVGParser:
         self.filter_service = None
         self._style_context: StyleContext | None = None
         self._clip_definitions: dict[str, ClipDefinition] = {}
+        self._document_index: DocumentIndex | None = None
         self._transform_parser = TransformParser()
         self.coord_space = CoordinateSpace(Matrix.identity())
 
@@ -126,14 +132,18 @@ class SVGParser:
             # Prepare style context for downstream consumers
             self._style_context = self._create_style_context(svg_root)
 
+            # Index the final tree once; later stages query it instead of walking
+            document_index = DocumentIndex.build(svg_root)
+            self._document_index = document_index
+
             # Collect clipPath definitions for downstream use
-            clip_definitions = self._collect_clip_definitions(svg_root)
+            clip_definitions = self._collect_clip_definitions(svg_root, document_index)
             self._clip_definitions = clip_definitions
 
             # Collect statistics
-            element_count = len(list(walk(svg_root)))
+            element_count = document_index.element_count
             namespace_count = len(self._extract_namespaces(svg_root))
-            has_external_refs = self._has_external_references(svg_root)
+            has_external_refs = document_index.has_external_references
 
             processing_time = (time.perf_counter() - start_time) * 1000
 
@@ -147,6 +157,7 @@ class SVGParser:
                 normalization_applied=self.enable_normalization,
                 normalization_changes=normalization_changes,
                 clip_paths=clip_definitions,
+                document_index=document_index,
             )
 
             self.logger.debug(f"SVG parsed successfully in {processing_time:.2f}ms, "
@@ -308,26 +319,6 @@ class SVGParser:
 
         return namespaces
 
-    def _has_external_references(self, svg_root: ET.Element) -> bool:
-        """Check if SVG has external references (images, fonts, etc.)"""
-        for element in walk(svg_root):
-            # Check for external image references
-            href = element.get('href') or element.get('{http://www.w3.org/1999/xlink}href')
-            if href and (href.startswith('http://') or href.startswith('https://') or href.startswith('file://')):
-                return True
-
-            # Check for external font references
-            if element.get('font-family') and 'url(' in str(element.get('font-family')):
-                return True
-
-            # Check for external stylesheets
-            if self._get_local_tag(element.tag) == 'style':
-                style_content = element.text or ''
-                if '@import' in style_content or 'url(' in style_content:
-                    return True
-
-        return False
-
     def _get_local_tag(self, tag: str) -> str:
         """Extract local tag name from namespaced tag"""
         if '}' in tag:
@@ -386,34 +377,62 @@ class SVGParser:
             # Return empty SceneGraph (list) with the error
             return [], parse_result
 
-        # Convert DOM to IR
+        scene = self.convert_parse_result_to_ir(parse_result)
+        return scene, parse_result
+
+    def convert_parse_result_to_ir(self, parse_result: ParseResult) -> list:
+        """
+        Convert an already parsed DOM to Clean Slate IR without re-parsing.
+
+        The DOM produced by :meth:`parse` is shared as-is, so callers that
+        already hold a ``ParseResult`` (analyzer, pipeline) avoid serializing
+        the tree and running parse, normalization and clip collection twice.
+
+        Args:
+            parse_result: Successful result returned by :meth:`parse`
+
+        Returns:
+            SceneGraph as a list of IRElements (possibly empty, never None).
+            On conversion failure ``parse_result`` is marked unsuccessful.
+        """
+        if not parse_result.success or parse_result.svg_root is None:
+            return []
+
+        # Clip definitions belong to the parsed document, not to whichever
+        # document this parser instance saw last
+        self._clip_definitions = parse_result.clip_paths or {}
+        self._document_index = parse_result.document_index
+
         try:
             scene = self._convert_dom_to_ir(parse_result.svg_root)
             # Ensure a list is always returned
-            scene = scene or []
-            return scene, parse_result
+            return scene or []
         except Exception as e:
             # Update parse result with conversion error
             parse_result.success = False
             parse_result.error = f"IR conversion failed: {e}"
-            return [], parse_result
+            return []
 
     # ------------------------------------------------------------------
     # ClipPath collection and helpers
     # ------------------------------------------------------------------
 
-    def _collect_clip_definitions(self, svg_root: ET.Element) -> dict[str, ClipDefinition]:
+    def _collect_clip_definitions(self, svg_root: ET.Element,
+                                  document_index: DocumentIndex | None = None) -> dict[str, ClipDefinition]:
         if svg_root is None:
             return {}
 
-        namespaces = {k or 'svg': v for k, v in svg_root.nsmap.items() if v}
-        if 'svg' not in namespaces:
-            namespaces['svg'] = 'http://www.w3.org/2000/svg'
+        if document_index is not None and document_index.root is svg_root:
+            clip_paths = [el for el in document_index.find_all('clipPath') if el is not svg_root]
+        else:
+            namespaces = {k or 'svg': v for k, v in svg_root.nsmap.items() if v}
+            if 'svg' not in namespaces:
+                namespaces['svg'] = 'http://www.w3.org/2000/svg'
 
-        try:
-            clip_paths = svg_root.xpath('.//svg:clipPath', namespaces=namespaces)
-        except Exception:
-            clip_paths = []
+            try:
+                clip_paths = svg_root.xpath('.//svg:clipPath', namespaces=namespaces)
+            except Exception:
+                clip_paths = []
 
         definitions: dict[str, ClipDefinition] = {}
 
@@ -1294,11 +1313,10 @@ class SVGParser:
         if not d:
             return None
 
-        # Use simplified path parsing for now - this could be enhanced
-        # to use the existing path parsing from core/paths/parser.py
-        segments = self._parse_path_data(d)
+        # Geometry stays columnar; segment objects are only built on access
+        buffer = apply_coordinate_space(parse_path_data(d), self.coord_space)
 
-        if not segments:
+        if len(buffer) == 0:
             return None
 
         # Extract styling
@@ -1309,8 +1327,8 @@ class SVGParser:
 
         clip_ref = self._extract_clip_reference(element)
 
-        return Path(
-            segments=segments,
+        return Path.from_buffer(
+            buffer,
             fill=fill,
             stroke=stroke,
             opacity=opacity,
@@ -1319,7 +1337,7 @@ class SVGParser:
 
     def _convert_polygon_to_ir(self, element: ET.Element, closed: bool = True):
         """Convert SVG polygon/polyline to IR Path"""
-        from ..ir import LineSegment, Path, Point
+        from ..ir import Path, SegmentBuffer
 
         points_str = element.get('points', '')
         if not points_str:
@@ -1327,41 +1345,28 @@ class SVGParser:
 
         # Parse points string - handle both "x1,y1 x2,y2" and "x1 y1 x2 y2" formats
         try:
-            points_svg = []
             # First normalize: replace all commas with spaces
             normalized = points_str.replace(',', ' ')
             # Split into individual coordinate values
             coords = [float(x) for x in normalized.split() if x.strip()]
 
             # Group coordinates into (x, y) pairs
-            for i in range(0, len(coords) - 1, 2):
-                points_svg.append((coords[i], coords[i + 1]))
-
-            if len(points_svg) < 2:
+            point_count = len(coords) // 2
+            if point_count < 2:
                 return None
 
-            # Apply CTM to transform all points (baked transforms)
-            if self.coord_space is not None:
-                points = [Point(*self.coord_space.apply_ctm(x, y)) for x, y in points_svg]
-            else:
-                points = [Point(x, y) for x, y in points_svg]
-
-            # Create line segments between consecutive points
-            segments = []
-            for i in range(len(points) - 1):
-                segments.append(LineSegment(start=points[i], end=points[i + 1]))
-
-            # Close the polygon if needed
-            if closed and len(points) > 2:
-                segments.append(LineSegment(start=points[-1], end=points[0]))
+            # Line segments between consecutive points, closed for polygons,
+            # with the CTM baked into all points at once
+            buffer = SegmentBuffer.from_polyline(coords[:point_count * 2], closed=closed)
+            buffer = apply_coordinate_space(buffer, self.coord_space)
 
             # Extract styling
             fill, stroke, opacity, effects = self._extract_styling(element)
 
             clip_ref = self._extract_clip_reference(element)
 
-            return Path(
-                segments=segments,
+            return Path.from_buffer(
+                buffer,
                 fill=fill if closed else None,  # Only polygons have fill
                 stroke=stroke,
                 opacity=opacity,
@@ -1724,165 +1729,9 @@ class SVGParser:
         return weight_map.get(weight_str, weight_str)
 
     def _parse_path_data(self, d: str):
-        """Basic path data parser with baked transform support"""
-        from ..ir import BezierSegment, LineSegment, Point
-
-        segments = []
-
-        # Very simplified path parsing - just handle basic commands
-        # In a full implementation, this would use the existing path parser
-        commands = re.findall(r'[MmLlHhVvCcSsQqTtAaZz][^MmLlHhVvCcSsQqTtAaZz]*', d)
-
-        # Helper to transform a point with current CTM
-        def transform_point(x, y):
-            if self.coord_space is not None:
-                return Point(*self.coord_space.apply_ctm(x, y))
-            return Point(x, y)
-
-        current_point_svg = (0.0, 0.0)  # Track in SVG coordinates
-        current_point = transform_point(0, 0)  # Transformed coordinates
-        last_control = None  # Track last control point for T command
-
-        for command in commands:
-            cmd = command[0]
-            params = command[1:].replace(',', ' ').split()
-            coords = [float(p) for p in params if p]
-
-            if cmd.upper() == 'M':  # Move to
-                if len(coords) >= 2:
-                    if cmd.isupper():
-                        # Absolute: use coords directly
-                        current_point_svg = (coords[0], coords[1])
-                    else:
-                        # Relative: add to current SVG position
-                        current_point_svg = (current_point_svg[0] + coords[0], current_point_svg[1] + coords[1])
-                    current_point = transform_point(*current_point_svg)
-                last_control = None
-
-            elif cmd.upper() == 'L':  # Line to
-                if len(coords) >= 2:
-                    if cmd.isupper():
-                        end_point_svg = (coords[0], coords[1])
-                    else:
-                        end_point_svg = (current_point_svg[0] + coords[0], current_point_svg[1] + coords[1])
-
-                    end_point = transform_point(*end_point_svg)
-                    segments.append(LineSegment(start=current_point, end=end_point))
-                    current_point_svg = end_point_svg
-                    current_point = end_point
-                last_control = None
-
-            elif cmd.upper() == 'H':  # Horizontal line
-                if len(coords) >= 1:
-                    if cmd.isupper():
-                        end_point_svg = (coords[0], current_point_svg[1])
-                    else:
-                        end_point_svg = (current_point_svg[0] + coords[0], current_point_svg[1])
-
-                    end_point = transform_point(*end_point_svg)
-                    segments.append(LineSegment(start=current_point, end=end_point))
-                    current_point_svg = end_point_svg
-                    current_point = end_point
-                last_control = None
-
-            elif cmd.upper() == 'V':  # Vertical line
-                if len(coords) >= 1:
-                    if cmd.isupper():
-                        end_point_svg = (current_point_svg[0], coords[0])
-                    else:
-                        end_point_svg = (current_point_svg[0], current_point_svg[1] + coords[0])
-
-                    end_point = transform_point(*end_point_svg)
-                    segments.append(LineSegment(start=current_point, end=end_point))
-                    current_point_svg = end_point_svg
-                    current_point = end_point
-                last_control = None
-
-            elif cmd.upper() == 'C':  # Cubic Bezier
-                if len(coords) >= 6:
-                    if cmd.isupper():
-                        cp1_svg = (coords[0], coords[1])
-                        cp2_svg = (coords[2], coords[3])
-                        end_svg = (coords[4], coords[5])
-                    else:
-                        cp1_svg = (current_point_svg[0] + coords[0], current_point_svg[1] + coords[1])
-                        cp2_svg = (current_point_svg[0] + coords[2], current_point_svg[1] + coords[3])
-                        end_svg = (current_point_svg[0] + coords[4], current_point_svg[1] + coords[5])
-
-                    control1 = transform_point(*cp1_svg)
-                    control2 = transform_point(*cp2_svg)
-                    end_point = transform_point(*end_svg)
-
-                    segments.append(BezierSegment(start=current_point, control1=control1, control2=control2, end=end_point))
-                    last_control = control2
-                    current_point_svg = end_svg
-                    current_point = end_point
-
-            elif cmd.upper() == 'Q':  # Quadratic Bezier - convert to cubic
-                if len(coords) >= 4:
-                    # Get quadratic control point and end point in SVG coords
-                    if cmd.isupper():
-                        qcp_svg = (coords[0], coords[1])
-                        end_svg = (coords[2], coords[3])
-                    else:
-                        qcp_svg = (current_point_svg[0] + coords[0], current_point_svg[1] + coords[1])
-                        end_svg = (current_point_svg[0] + coords[2], current_point_svg[1] + coords[3])
-
-                    # Transform all points
-                    qcp = transform_point(*qcp_svg)
-                    end_point = transform_point(*end_svg)
-
-                    # Convert Q to C using formula: CP1 = P0 + 2/3*(QCP - P0), CP2 = P2 + 2/3*(QCP - P2)
-                    # Note: This conversion happens AFTER transformation
-                    control1 = Point(
-                        current_point.x + 2/3 * (qcp.x - current_point.x),
-                        current_point.y + 2/3 * (qcp.y - current_point.y),
-                    )
-                    control2 = Point(
-                        end_point.x + 2/3 * (qcp.x - end_point.x),
-                        end_point.y + 2/3 * (qcp.y - end_point.y),
-                    )
-
-                    segments.append(BezierSegment(start=current_point, control1=control1, control2=control2, end=end_point))
-                    last_control = qcp  # Store transformed quadratic control for T command
-                    current_point_svg = end_svg
-                    current_point = end_point
-
-            elif cmd.upper() == 'T':  # Smooth quadratic - convert to cubic
-                if len(coords) >= 2:
-                    # Calculate reflected control point (in transformed space)
-                    if last_control:
-                        qcp = Point(
-                            2 * current_point.x - last_control.x,
-                            2 * current_point.y - last_control.y,
-                        )
-                    else:
-                        qcp = current_point
-
-                    # Get end point
-                    if cmd.isupper():
-                        end_svg = (coords[0], coords[1])
-                    else:
-                        end_svg = (current_point_svg[0] + coords[0], current_point_svg[1] + coords[1])
-
-                    end_point = transform_point(*end_svg)
-
-                    # Convert to cubic (in transformed space)
-                    control1 = Point(
-                        current_point.x + 2/3 * (qcp.x - current_point.x),
-                        current_point.y + 2/3 * (qcp.y - current_point.y),
-                    )
-                    control2 = Point(
-                        end_point.x + 2/3 * (qcp.x - end_point.x),
-                        end_point.y + 2/3 * (qcp.y - end_point.y),
-                    )
-
-                    segments.append(BezierSegment(start=current_point, control1=control1, control2=control2, end=end_point))
-                    last_control = qcp
-                    current_point_svg = end_svg
-                    current_point = end_point
-
-        return segments
+        """Parse path data into segments with the current CTM baked in"""
+        buffer = apply_coordinate_space(parse_path_data(d), self.coord_space)
+        return buffer.to_segments()
 
     def _convert_foreignobject_to_ir(self, element: ET.Element):
         """
@@ -2214,10 +2063,15 @@ class SVGParser:
         }
         complexity += type_complexity.get(payload_type, 40)
 
+        # One traversal of the payload subtree, shared by all checks below
+        document_index = self._document_index
+        if document_index is not None and document_index.position(payload_element) is not None:
+            payload_elements = list(document_index.iter_subtree(payload_element))
+        else:
+            payload_elements = list(walk(payload_element))
+
         # Count descendant elements (DOM complexity)
-        element_count = 0
-        for element in walk(payload_element):
-            element_count += 1
+        element_count = len(payload_elements)
 
         # Penalize deep nesting
         if element_count > 10:
@@ -2226,7 +2080,7 @@ class SVGParser:
         # Check for complex features
         complex_features = []
 
-        for element in walk(payload_element):
+        for element in payload_elements:
             if not hasattr(element, 'tag'):
                 continue
 
@@ -2254,7 +2108,7 @@ class SVGParser:
 
         # Namespace complexity
         namespaces = set()
-        for element in walk(payload_element):
+        for element in payload_elements:
             if hasattr(element, 'tag') and '}' in str(element.tag):
                 namespace = str(element.tag).split('}')[0][1:]
                 namespaces.add(namespace)
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Path Data Tokenizer
+
+Fast SVG path ``d`` parsing for the IR converters. The path string is split
+into a command-code array and one float64 value array, then resolved to
+absolute coordinates in a SegmentBuffer. Long implicit-repeat runs of
+lineto/curveto commands (typical of map and chart exports) are resolved with
+NumPy cumulative sums, and the CTM is applied to every point in one batch.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from ..ir.segment_buffer import SEGMENT_CUBIC, SEGMENT_LINE, SegmentBuffer
+
+_COMMAND_SPLIT_RE = re.compile(r'([MmLlHhVvCcSsQqTtAaZz])')
+_NUMBER = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+_NUMBER_RE = re.compile(_NUMBER)
+# Numbers written back to back without a separator, e.g. ``.5.5``
+_COMPACT_DECIMAL_RE = re.compile(r'\.\d*\.')
+# One elliptical arc argument group; flags may be written without separators
+_ARC_ARGS_RE = re.compile(
+    r'[\s,]*({0})[\s,]*({0})[\s,]*({0})[\s,]*([01])[\s,]*([01])[\s,]*({0})[\s,]*({0})'.format(_NUMBER),
+)
+
+# Number of arguments consumed per command repetition
+COMMAND_ARITY = {
+    'M': 2, 'L': 2, 'H': 1, 'V': 1, 'C': 6,
+    'S': 4, 'Q': 4, 'T': 2, 'A': 7, 'Z': 0,
+}
+
+# Lookup tables indexed by command code; moveto, closepath and arcs are
+# never merged with a preceding identical command
+_ARITY_BY_CODE = np.zeros(128, dtype=np.int64)
+_REPEATABLE_BY_CODE = np.zeros(128, dtype=bool)
+for _letter, _arity in COMMAND_ARITY.items():
+    for _code in (ord(_letter), ord(_letter.lower())):
+        _ARITY_BY_CODE[_code] = _arity
+        _REPEATABLE_BY_CODE[_code] = _letter not in 'MZA'
+
+# Repetition count from which L/C runs are resolved with NumPy
+VECTORIZE_MIN_RUN = 16
+
+_TWO_THIRDS = 2.0 / 3.0
+
+
+@dataclass(frozen=True)
+class PathTokens:
+    """Tokenized path data
+
+    Arguments of command ``i`` are ``values[offsets[i]:offsets[i + 1]]``.
+    """
+    commands: np.ndarray  # uint8 ASCII command letters, shape (n,)
+    offsets: np.ndarray   # int64, shape (n + 1,)
+    values: np.ndarray    # float64 arguments for all commands
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+
+def tokenize_path_data(d: str) -> PathTokens:
+    """
+    Split path data into command codes and a flat argument array.
+
+    Args:
+        d: SVG path data string
+
+    Returns:
+        PathTokens for the path (text before the first command is ignored)
+    """
+    d = d or ''
+    if '+' not in d and _COMPACT_DECIMAL_RE.search(d) is None:
+        # Separators, including a minus sign that starts a number, become
+        # whitespace so plain str.split can do the number tokenizing
+        normalized = d.replace(',', ' ').replace('-', ' -').replace('e -', 'e-').replace('E -', 'E-')
+        try:
+            return _tokenize(normalized, str.split)
+        except ValueError:
+            pass  # Stray characters; let the regex tokenizer skip them
+
+    return _tokenize(d, _NUMBER_RE.findall)
+
+
+def _tokenize(d: str, split_numbers: Callable[[str], list[str]]) -> PathTokens:
+    """Tokenize ``d`` with ``split_numbers`` extracting each command's arguments."""
+    parts = _COMMAND_SPLIT_RE.split(d)
+    commands = bytearray()
+    offsets = [0]
+    numbers: list[str] = []
+
+    # parts alternates [prefix, command, args, command, args, ...]
+    for index in range(1, len(parts), 2):
+        command = parts[index]
+        if command == 'A' or command == 'a':
+            numbers.extend(_tokenize_arc_args(parts[index + 1]))
+        else:
+            numbers.extend(split_numbers(parts[index + 1]))
+        commands.append(ord(command))
+        offsets.append(len(numbers))
+
+    return PathTokens(
+        commands=np.frombuffer(bytes(commands), dtype=np.uint8),
+        offsets=np.array(offsets, dtype=np.int64),
+        values=np.array(numbers, dtype=np.float64),
+    )
+
+
+def _tokenize_arc_args(args: str) -> list[str]:
+    """Tokenize arc arguments, allowing compact flags such as ``0 01 10 10``."""
+    tokens: list[str] = []
+    position = 0
+    while True:
+        match = _ARC_ARGS_RE.match(args, position)
+        if match is None:
+            return tokens
+        tokens.extend(match.groups())
+        position = match.end()
+
+
+def parse_path_data(d: str) -> SegmentBuffer:
+    """
+    Parse path data into absolute line and cubic segments.
+
+    Quadratic curves and arcs are converted to cubics; ``Z`` adds a closing
+    line when the current point is not already at the subpath start.
+
+    Args:
+        d: SVG path data string
+
+    Returns:
+        SegmentBuffer in untransformed SVG user coordinates
+    """
+    return build_segment_buffer(tokenize_path_data(d))
+
+
+def build_segment_buffer(tokens: PathTokens) -> SegmentBuffer:
+    """
+    Resolve tokenized path data to absolute segments.
+
+    Args:
+        tokens: Output of tokenize_path_data
+
+    Returns:
+        SegmentBuffer in untransformed SVG user coordinates
+    """
+    if len(tokens) == 0:
+        return SegmentBuffer.empty()
+
+    commands, offsets = _coalesce_repeated_commands(tokens.commands, tokens.offsets)
+    values = tokens.values
+    flat = values.tolist()
+    offsets = offsets.tolist()
+
+    blocks: list[np.ndarray] = []   # Finished (n, 8) arrays, in order
+    block_kinds: list[np.ndarray] = []
+    rows: list[float] = []          # Pending scalar rows, 8 floats each
+    kinds: list[int] = []
+
+    def flush_rows() -> None:
+        if kinds:
+            blocks.append(np.array(rows, dtype=np.float64).reshape(-1, 8))
+            block_kinds.append(np.array(kinds, dtype=np.uint8))
+            rows.clear()
+            kinds.clear()
+
+    def add_block(block: np.ndarray, kind: int) -> None:
+        flush_rows()
+        blocks.append(block)
+        block_kinds.append(np.full(len(block), kind, dtype=np.uint8))
+
+    x = y = 0.0               # Current point
+    start_x = start_y = 0.0   # Subpath start
+    cubic_control = None      # Last cubic control2 (for S)
+    quad_control = None       # Last quadratic control (for T)
+
+    for index, code in enumerate(commands.tolist()):
+        command = chr(code)
+        upper = command.upper()
+        relative = command != upper
+        first = offsets[index]
+
+        if upper == 'Z':
+            if x != start_x or y != start_y:
+                rows.extend((x, y, x, y, start_x, start_y, start_x, start_y))
+                kinds.append(SEGMENT_LINE)
+            x, y = start_x, start_y
+            cubic_control = quad_control = None
+            continue
+
+        arity = COMMAND_ARITY[upper]
+        count = (offsets[index + 1] - first) // arity
+        if count == 0:
+            continue
+
+        if upper == 'M':
+            if relative:
+                x, y = x + flat[first], y + flat[first + 1]
+            else:
+                x, y = flat[first], flat[first + 1]
+            start_x, start_y = x, y
+            cubic_control = quad_control = None
+            # Extra coordinate pairs are implicit lineto commands
+            first += 2
+            count -= 1
+            upper = 'L'
+            if count == 0:
+                continue
+
+        if upper == 'L' and count >= VECTORIZE_MIN_RUN:
+            args = values[first:first + 2 * count].reshape(-1, 2)
+            ends = np.cumsum(args, axis=0) + (x, y) if relative else args
+            starts = np.vstack(((x, y), ends[:-1]))
+            add_block(np.hstack((starts, starts, ends, ends)), SEGMENT_LINE)
+            x, y = ends[-1].tolist()
+            cubic_control = quad_control = None
+            continue
+
+        if upper == 'C' and count >= VECTORIZE_MIN_RUN:
+            args = values[first:first + 6 * count].reshape(-1, 6)
+            if relative:
+                ends = np.cumsum(args[:, 4:6], axis=0) + (x, y)
+                starts = np.vstack(((x, y), ends[:-1]))
+                block = np.hstack((starts, args[:, 0:2] + starts, args[:, 2:4] + starts, ends))
+            else:
+                starts = np.vstack(((x, y), args[:-1, 4:6]))
+                block = np.hstack((starts, args))
+            add_block(block, SEGMENT_CUBIC)
+            x, y = block[-1, 6:8].tolist()
+            cubic_control = tuple(block[-1, 4:6].tolist())
+            quad_control = None
+            continue
+
+        for repeat in range(count):
+            i = first + repeat * arity
+            dx, dy = (x, y) if relative else (0.0, 0.0)
+
+            if upper == 'L':
+                end_x, end_y = dx + flat[i], dy + flat[i + 1]
+                rows.extend((x, y, x, y, end_x, end_y, end_x, end_y))
+                kinds.append(SEGMENT_LINE)
+                cubic_control = quad_control = None
+
+            elif upper == 'H':
+                end_x, end_y = dx + flat[i], y
+                rows.extend((x, y, x, y, end_x, end_y, end_x, end_y))
+                kinds.append(SEGMENT_LINE)
+                cubic_control = quad_control = None
+
+            elif upper == 'V':
+                end_x, end_y = x, dy + flat[i]
+                rows.extend((x, y, x, y, end_x, end_y, end_x, end_y))
+                kinds.append(SEGMENT_LINE)
+                cubic_control = quad_control = None
+
+            elif upper == 'C' or upper == 'S':
+                if upper == 'C':
+                    c1x, c1y = dx + flat[i], dy + flat[i + 1]
+                    i += 2
+                elif cubic_control is not None:
+                    c1x, c1y = 2 * x - cubic_control[0], 2 * y - cubic_control[1]
+                else:
+                    c1x, c1y = x, y
+                c2x, c2y = dx + flat[i], dy + flat[i + 1]
+                end_x, end_y = dx + flat[i + 2], dy + flat[i + 3]
+                rows.extend((x, y, c1x, c1y, c2x, c2y, end_x, end_y))
+                kinds.append(SEGMENT_CUBIC)
+                cubic_control = (c2x, c2y)
+                quad_control = None
+
+            elif upper == 'Q' or upper == 'T':
+                if upper == 'Q':
+                    qx, qy = dx + flat[i], dy + flat[i + 1]
+                    i += 2
+                elif quad_control is not None:
+                    qx, qy = 2 * x - quad_control[0], 2 * y - quad_control[1]
+                else:
+                    qx, qy = x, y
+                end_x, end_y = dx + flat[i], dy + flat[i + 1]
+                # Degree elevation: CP1 = P0 + 2/3 (Q - P0), CP2 = P2 + 2/3 (Q - P2)
+                rows.extend((
+                    x, y,
+                    x + _TWO_THIRDS * (qx - x), y + _TWO_THIRDS * (qy - y),
+                    end_x + _TWO_THIRDS * (qx - end_x), end_y + _TWO_THIRDS * (qy - end_y),
+                    end_x, end_y,
+                ))
+                kinds.append(SEGMENT_CUBIC)
+                quad_control = (qx, qy)
+                cubic_control = None
+
+            else:  # 'A'
+                end_x, end_y = dx + flat[i + 5], dy + flat[i + 6]
+                _append_arc(rows, kinds, x, y, flat[i], flat[i + 1], flat[i + 2],
+                            flat[i + 3] != 0, flat[i + 4] != 0, end_x, end_y)
+                cubic_control = quad_control = None
+
+            x, y = end_x, end_y
+
+    flush_rows()
+    if not blocks:
+        return SegmentBuffer.empty()
+    if len(blocks) == 1:
+        return SegmentBuffer(block_kinds[0], blocks[0])
+    return SegmentBuffer(np.concatenate(block_kinds), np.concatenate(blocks))
+
+
+def _coalesce_repeated_commands(commands: np.ndarray, offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Merge ``L1 2 L3 4`` into ``L1 2 3 4`` so per-point commands form runs."""
+    if len(commands) < 2:
+        return commands, offsets
+
+    counts = np.diff(offsets)
+    complete = counts[:-1] % np.maximum(_ARITY_BY_CODE[commands[:-1]], 1) == 0
+    merge = (commands[1:] == commands[:-1]) & _REPEATABLE_BY_CODE[commands[1:]] & complete
+    if not merge.any():
+        return commands, offsets
+
+    keep = np.concatenate(([True], ~merge))
+    return commands[keep], np.append(offsets[:-1][keep], offsets[-1])
+
+
+def _append_arc(rows: list[float], kinds: list[int], x: float, y: float,
+                rx: float, ry: float, rotation: float, large_arc: bool, sweep: bool,
+                end_x: float, end_y: float) -> None:
+    """Append an elliptical arc as cubic segments (a line for zero radii)."""
+    if x == end_x and y == end_y:
+        return
+    if rx == 0 or ry == 0:
+        rows.extend((x, y, x, y, end_x, end_y, end_x, end_y))
+        kinds.append(SEGMENT_LINE)
+        return
+
+    from ..paths.a2c import arc_to_cubic_bezier
+
+    for curve in arc_to_cubic_bezier(x, y, rx, ry, rotation, large_arc, sweep, end_x, end_y):
+        rows.extend(curve)
+        kinds.append(SEGMENT_CUBIC)
+
+
+def apply_coordinate_space(buffer: SegmentBuffer, coord_space) -> SegmentBuffer:
+    """
+    Bake the current CTM of ``coord_space`` into every point of ``buffer``.
+
+    Args:
+        buffer: Segments in SVG user coordinates
+        coord_space: CoordinateSpace (or any object exposing ``apply_ctm``)
+
+    Returns:
+        Transformed SegmentBuffer (``buffer`` itself when there is no CTM)
+    """
+    if coord_space is None or len(buffer) == 0:
+        return buffer
+
+    apply_to_array = getattr(coord_space, 'apply_ctm_to_array', None)
+    if apply_to_array is not None:
+        return buffer.with_points(apply_to_array(buffer.points))
+
+    apply_ctm = coord_space.apply_ctm
+    return buffer.with_points([apply_ctm(px, py) for px, py in buffer.points.tolist()])
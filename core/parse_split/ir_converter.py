@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import re
 from typing import Callable, Iterable
 
 from lxml import etree as ET
@@ -16,6 +15,8 @@ from ..ir.geometry import (
     Rect,
     SegmentType,
 )
+from ..ir.segment_buffer import SegmentBuffer
+from ..parse.path_data import apply_coordinate_space, parse_path_data
 from ..pipeline.navigation import NavigationSpec
 from ..transforms.coordinate_space import CoordinateSpace
 from ..transforms.parser import TransformParser
@@ -63,8 +64,6 @@ class IRConverter:
         self.coord_space: CoordinateSpace | None = None
         self._current_navigation: NavigationSpec | None = None
 
-        self._path_command_pattern = re.compile(r"[MmLlHhVvCcSsQqTtAaZz][^MmLlHhVvCcSsQqTtAaZz]*")
-
     def register_filter_service(self, filter_service) -> None:
         """Inject optional filter resolution service."""
         self._filter_service = filter_service
@@ -396,15 +395,16 @@ class IRConverter:
         if not d:
             return None
 
-        segments = self._parse_path_data(d)
-        if not segments:
+        buffer = parse_path_data(d)[:MAX_SIMPLE_PATH_SEGMENTS]
+        buffer = apply_coordinate_space(buffer, self.coord_space)
+        if len(buffer) == 0:
             return None
 
         fill, stroke, opacity, _effects = self._extract_styling(element)
         clip_ref = self._extract_clip_reference(element)
 
-        return Path(
-            segments=segments[:MAX_SIMPLE_PATH_SEGMENTS],
+        return Path.from_buffer(
+            buffer,
             fill=fill,
             stroke=stroke,
             opacity=opacity,
@@ -422,26 +422,15 @@ class IRConverter:
         if len(coords) < 4:
             return None
 
-        points = [Point(coords[i], coords[i + 1]) for i in range(0, len(coords) - 1, 2)]
-        segments: list[SegmentType] = []
-        for idx in range(len(points) - 1):
-            segments.append(LineSegment(points[idx], points[idx + 1]))
-        if closed and len(points) > 2:
-            segments.append(LineSegment(points[-1], points[0]))
-
-        if self.coord_space is not None:
-            transformed = []
-            for segment in segments:
-                start = self.coord_space.apply_ctm(segment.start.x, segment.start.y)
-                end = self.coord_space.apply_ctm(segment.end.x, segment.end.y)
-                transformed.append(LineSegment(Point(*start), Point(*end)))
-            segments = transformed
+        point_count = len(coords) // 2
+        buffer = SegmentBuffer.from_polyline(coords[:point_count * 2], closed=closed)
+        buffer = apply_coordinate_space(buffer, self.coord_space)
 
         fill, stroke, opacity, _effects = self._extract_styling(element)
         clip_ref = self._extract_clip_reference(element)
 
-        return Path(
-            segments=segments,
+        return Path.from_buffer(
+            buffer,
             fill=fill,
             stroke=stroke,
             opacity=opacity,
@@ -877,95 +866,12 @@ class IRConverter:
             return None
 
     def _parse_path_data(self, d: str):
-        segments = []
-        commands = self._path_command_pattern.findall(d)
-
-        current_point = Point(0, 0)
-        start_point = Point(0, 0)
-
-        for command in commands:
-            cmd_type = command[0]
-            params = command[1:].strip()
-            values = [float(v) for v in re.findall(r"-?\d+(?:\.\d+)?", params)]
-
-            is_relative = cmd_type.islower()
-            cmd_type = cmd_type.upper()
-
-            if cmd_type == "M":
-                if len(values) >= 2:
-                    current_point = Point(values[0], values[1])
-                    start_point = current_point
-            elif cmd_type == "L":
-                for i in range(0, len(values), 2):
-                    x = values[i]
-                    y = values[i + 1]
-                    point = Point(x, y)
-                    if is_relative:
-                        point = Point(current_point.x + x, current_point.y + y)
-                    segments.append(LineSegment(start=current_point, end=point))
-                    current_point = point
-            elif cmd_type == "H":
-                for value in values:
-                    x = value
-                    point = Point(x, current_point.y)
-                    if is_relative:
-                        point = Point(current_point.x + x, current_point.y)
-                    segments.append(LineSegment(start=current_point, end=point))
-                    current_point = point
-            elif cmd_type == "V":
-                for value in values:
-                    y = value
-                    point = Point(current_point.x, y)
-                    if is_relative:
-                        point = Point(current_point.x, current_point.y + y)
-                    segments.append(LineSegment(start=current_point, end=point))
-                    current_point = point
-            elif cmd_type == "C":
-                for i in range(0, len(values), 6):
-                    control1 = Point(values[i], values[i + 1])
-                    control2 = Point(values[i + 2], values[i + 3])
-                    end_point = Point(values[i + 4], values[i + 5])
-                    if is_relative:
-                        control1 = Point(current_point.x + control1.x, current_point.y + control1.y)
-                        control2 = Point(current_point.x + control2.x, current_point.y + control2.y)
-                        end_point = Point(current_point.x + end_point.x, current_point.y + end_point.y)
-                    segments.append(
-                        BezierSegment(
-                            start=current_point,
-                            control1=control1,
-                            control2=control2,
-                            end=end_point,
-                        )
-                    )
-                    current_point = end_point
-            elif cmd_type == "Z":
-                segments.append(LineSegment(start=current_point, end=start_point))
-                current_point = start_point
-
+        buffer = parse_path_data(d)
         if self.coord_space is None:
-            return segments
-
-        transformed_segments = []
-        for segment in segments[:MAX_SIMPLE_PATH_SEGMENTS]:
-            if isinstance(segment, LineSegment):
-                start = self.coord_space.apply_ctm(segment.start.x, segment.start.y)
-                end = self.coord_space.apply_ctm(segment.end.x, segment.end.y)
-                transformed_segments.append(LineSegment(Point(*start), Point(*end)))
-            elif isinstance(segment, BezierSegment):
-                start = self.coord_space.apply_ctm(segment.start.x, segment.start.y)
-                control1 = self.coord_space.apply_ctm(segment.control1.x, segment.control1.y)
-                control2 = self.coord_space.apply_ctm(segment.control2.x, segment.control2.y)
-                end = self.coord_space.apply_ctm(segment.end.x, segment.end.y)
-                transformed_segments.append(
-                    BezierSegment(
-                        start=Point(*start),
-                        control1=Point(*control1),
-                        control2=Point(*control2),
-                        end=Point(*end),
-                    )
-                )
+            return buffer.to_segments()
 
-        return transformed_segments
+        buffer = apply_coordinate_space(buffer[:MAX_SIMPLE_PATH_SEGMENTS], self.coord_space)
+        return buffer.to_segments()
 
     # ForeignObject helpers -------------------------------------------------------------
 
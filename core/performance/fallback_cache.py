@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Shared fallback media cache.
+
+Content-addressed store for generated fallback media (EMF path blobs,
+raster filter fallbacks). Entries are keyed by a digest of everything the
+generator reads - normalized geometry, paint and filter chain - so identical
+effects are produced once and then reused across documents.
+
+The on-disk layer is safe to share between processes (Huey workers, API
+workers, parallel mapping pools): entries are written to a temporary file
+and atomically renamed into place, and recency is tracked with file mtimes.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Environment variable naming a cache directory shared by every process
+FALLBACK_CACHE_DIR_ENV = "SVG2PPTX_FALLBACK_CACHE_DIR"
+
+_ENTRY_SUFFIX = ".bin"
+_PRUNE_INTERVAL = 64  # Writes between disk size checks
+
+
+def fallback_cache_key(namespace: str, *parts: Any) -> str:
+    """
+    Build a content address from a namespace and key parts.
+
+    Args:
+        namespace: Producer namespace (e.g. ``"emf-path"``)
+        *parts: Bytes, strings or values with a stable ``repr``
+
+    Returns:
+        Hex digest usable as a cache key
+    """
+    digest = hashlib.blake2b(namespace.encode(), digest_size=20)
+    for part in parts:
+        if isinstance(part, (bytes, bytearray, memoryview)):
+            data = bytes(part)
+        elif isinstance(part, str):
+            data = part.encode()
+        else:
+            data = repr(part).encode()
+        # Length prefix keeps ("ab", "c") and ("a", "bc") distinct
+        digest.update(len(data).to_bytes(8, 'little'))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class FallbackMediaCache:
+    """Two-level (memory LRU + shared disk) content-addressed media cache."""
+
+    def __init__(self,
+                 cache_dir: str | os.PathLike,
+                 max_disk_size: int = 512 * 1024 * 1024,  # 512MB
+                 max_memory_size: int = 32 * 1024 * 1024,  # 32MB
+                 compression_level: int = 6):
+        """
+        Initialize fallback media cache.
+
+        Args:
+            cache_dir: Directory for the shared on-disk store
+            max_disk_size: Disk budget in bytes before oldest entries are pruned
+            max_memory_size: In-process LRU budget in bytes
+            compression_level: zlib compression level (0-9)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_disk_size = max_disk_size
+        self.max_memory_size = max_memory_size
+        self.compression_level = compression_level
+
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_usage = 0
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+
+        self.stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'disk_writes': 0,
+            'pruned': 0,
+        }
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Get cached media for ``key``.
+
+        Args:
+            key: Content address from ``fallback_cache_key``
+
+        Returns:
+            Media bytes, or None on a miss
+        """
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.stats['memory_hits'] += 1
+                return data
+
+        data = self._read_disk(key)
+        with self._lock:
+            if data is None:
+                self.stats['misses'] += 1
+                return None
+            self.stats['disk_hits'] += 1
+            self._remember(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Store media under ``key`` in memory and on disk.
+
+        Args:
+            key: Content address from ``fallback_cache_key``
+            data: Media bytes
+        """
+        with self._lock:
+            self._remember(key, data)
+        self._write_disk(key, data)
+
+    def get_or_create(self, key: str, factory: Callable[[], bytes]) -> bytes:
+        """Get cached media for ``key``, generating and storing it on a miss."""
+        data = self.get(key)
+        if data is None:
+            data = factory()
+            self.put(key, data)
+        return data
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get cache hit and size statistics"""
+        hits = self.stats['memory_hits'] + self.stats['disk_hits']
+        lookups = hits + self.stats['misses']
+        return {
+            **self.stats,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'memory_entries': len(self._memory),
+            'memory_usage_bytes': self._memory_usage,
+            'cache_dir': str(self.cache_dir),
+        }
+
+    def clear(self, memory_only: bool = False) -> None:
+        """Drop cached entries (and disk files unless ``memory_only``)."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_usage = 0
+        if not memory_only:
+            for entry in self.cache_dir.glob(f"*/*{_ENTRY_SUFFIX}"):
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{_ENTRY_SUFFIX}"
+
+    def _remember(self, key: str, data: bytes) -> None:
+        """Insert into the memory LRU (caller holds the lock)."""
+        if len(data) > self.max_memory_size:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_usage -= len(previous)
+        self._memory[key] = data
+        self._memory_usage += len(data)
+        while self._memory_usage > self.max_memory_size:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_usage -= len(evicted)
+
+    def _read_disk(self, key: str) -> bytes | None:
+        entry = self._entry_path(key)
+        try:
+            with open(entry, 'rb') as f:
+                data = zlib.decompress(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, zlib.error) as e:
+            logger.warning(f"Discarding unreadable fallback cache entry {entry}: {e}")
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+            return None
+
+        # Refresh recency so pruning in any process keeps hot entries
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return data
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        entry = self._entry_path(key)
+        try:
+            entry.parent.mkdir(exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=entry.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(zlib.compress(data, self.compression_level))
+                # Atomic publish: readers see either no entry or a complete one
+                os.replace(temp_path, entry)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write fallback cache entry {entry}: {e}")
+            return
+
+        with self._lock:
+            self.stats['disk_writes'] += 1
+            self._writes_since_prune += 1
+            prune = self._writes_since_prune >= _PRUNE_INTERVAL
+            if prune:
+                self._writes_since_prune = 0
+        if prune:
+            self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        """Remove least recently used entries once the disk budget is exceeded."""
+        entries = []
+        total_size = 0
+        for entry in self.cache_dir.glob(f"*/*{_ENTRY_SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+            total_size += stat.st_size
+
+        if total_size <= self.max_disk_size:
+            return
+
+        # Oldest first, leaving some headroom
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total_size -= size
+            self.stats['pruned'] += 1
+            if total_size <= self.max_disk_size * 0.8:
+                break
+
+
+_fallback_caches: dict[str, FallbackMediaCache] = {}
+_configured_cache_dir: str | None = None
+_registry_lock = threading.Lock()
+
+
+def configure_fallback_cache(cache_dir: str | os.PathLike | None) -> None:
+    """
+    Set the process-wide fallback cache directory.
+
+    Args:
+        cache_dir: Shared cache directory, or None to defer to
+            ``$SVG2PPTX_FALLBACK_CACHE_DIR`` (disabled when unset)
+    """
+    global _configured_cache_dir
+    _configured_cache_dir = os.fspath(cache_dir) if cache_dir else None
+
+
+def get_fallback_cache() -> FallbackMediaCache | None:
+    """Get the process-wide fallback cache, or None when caching is not configured."""
+    cache_dir = _configured_cache_dir or os.environ.get(FALLBACK_CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+
+    with _registry_lock:
+        cache = _fallback_caches.get(cache_dir)
+        if cache is None:
+            try:
+                cache = FallbackMediaCache(cache_dir)
+            except OSError as e:
+                logger.warning(f"Fallback cache disabled, cannot use {cache_dir}: {e}")
+                return None
+            _fallback_caches[cache_dir] = cache
+        return cache
@@ -13,16 +13,9 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from lxml import etree as ET
 
-try:
-    from src.emf_blob import EMFBlob
-    from src.performance.cache import ConversionCache
-except ImportError:
-    # Handle import for testing
-    import os
-    import sys
-    sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-    from emf_blob import EMFBlob
-    from performance.cache import ConversionCache
+from ..emf.emf_blob import EMFBlob
+from .cache import ConversionCache
+from .fallback_cache import fallback_cache_key, get_fallback_cache
 
 
 @dataclass
@@ -236,7 +229,8 @@ class RasterFallbackManager:
         start_time = time.time()
 
         # Check cache first
-        if self.config.enable_caching and self.cache:
+        caching = self.config.enable_caching and (self.cache or get_fallback_cache())
+        if caching:
             cache_key = self._generate_cache_key(filter_chain, input_data, context)
             cached_result = self._get_cached_fallback(cache_key)
             if cached_result:
@@ -271,7 +265,7 @@ class RasterFallbackManager:
         }
 
         # Cache result
-        if self.config.enable_caching and self.cache:
+        if caching:
             self._cache_fallback(cache_key, result)
 
         # Update statistics
@@ -373,7 +367,8 @@ class RasterFallbackManager:
             import hashlib
             import json
             key_data = {
-                'filters': [self._get_filter_type(f) for f in filter_chain],
+                # Full primitive markup, not just tags: parameters change the output
+                'filters': [ET.tostring(f, encoding='unicode') for f in filter_chain],
                 'input': str(input_data),
                 'context': str(context),
             }
@@ -382,6 +377,17 @@ class RasterFallbackManager:
 
     def _get_cached_fallback(self, cache_key: str) -> dict[str, Any] | None:
         """Get cached raster fallback result."""
+        # Shared cross-process store first
+        shared = get_fallback_cache()
+        if shared is not None:
+            emf_blob = shared.get(fallback_cache_key('raster-fallback', cache_key))
+            if emf_blob is not None:
+                return {
+                    'emf_blob': emf_blob,
+                    'fallback_type': 'raster_32bpp',
+                    'cached': True,
+                }
+
         if not self.cache:
             return None
 
@@ -402,6 +408,10 @@ class RasterFallbackManager:
 
     def _cache_fallback(self, cache_key: str, result: dict[str, Any]):
         """Cache raster fallback result."""
+        shared = get_fallback_cache()
+        if shared is not None:
+            shared.put(fallback_cache_key('raster-fallback', cache_key), result['emf_blob'])
+
         if not self.cache:
             return
 
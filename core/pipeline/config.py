@@ -41,9 +41,14 @@ class SlideConfig:
 class PerformanceConfig:
     """Performance optimization settings"""
     enable_caching: bool = True
-    parallel_processing: bool = False
+    parallel_processing: bool = False  # Map scene elements on a worker pool
     max_workers: int = 4
     memory_limit_mb: int = 512
+    parallel_executor: str = "process"  # "process" or "thread"
+    parallel_min_elements: int = 32  # Smaller scenes are mapped in-process
+    # Shared on-disk EMF/raster fallback cache; processes pointing at the same
+    # directory reuse each other's output (None defers to $SVG2PPTX_FALLBACK_CACHE_DIR)
+    fallback_cache_dir: str | None = None
 
 
 @dataclass
@@ -76,6 +81,10 @@ class PipelineConfig:
     enable_path_optimization: bool = True
     enable_image_conversion: bool = True
 
+    # Share the parsed DOM between analysis and IR conversion instead of
+    # serializing and re-parsing it inside the analyzer
+    single_parse: bool = True
+
     def __post_init__(self):
         """Initialize default sub-configurations"""
         if self.policy_config is None:
@@ -160,6 +169,9 @@ class PipelineConfig:
                 'parallel_processing': self.performance_config.parallel_processing,
                 'max_workers': self.performance_config.max_workers,
                 'memory_limit_mb': self.performance_config.memory_limit_mb,
+                'parallel_executor': self.performance_config.parallel_executor,
+                'parallel_min_elements': self.performance_config.parallel_min_elements,
+                'fallback_cache_dir': self.performance_config.fallback_cache_dir,
             },
             'enable_debug': self.enable_debug,
             'verbose_logging': self.verbose_logging,
@@ -167,6 +179,7 @@ class PipelineConfig:
             'enable_group_flattening': self.enable_group_flattening,
             'enable_path_optimization': self.enable_path_optimization,
             'enable_image_conversion': self.enable_image_conversion,
+            'single_parse': self.single_parse,
         }
 
         # Add policy config if present
@@ -201,7 +214,7 @@ class PipelineConfig:
         # Copy simple boolean flags
         for flag in ['enable_debug', 'verbose_logging', 'enable_text_fixes',
                     'enable_group_flattening', 'enable_path_optimization',
-                    'enable_image_conversion']:
+                    'enable_image_conversion', 'single_parse']:
             if flag in data:
                 setattr(config, flag, data[flag])
 
@@ -8,17 +8,24 @@ Main end-to-end conversion pipeline from SVG to PPTX using clean slate architect
 import io
 import json
 import logging
+import multiprocessing
+import pickle
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 # Import migrated systems for integration
 from core.animations import SMILParser
+from core.performance.fallback_cache import configure_fallback_cache
 from core.performance.measurement import BenchmarkEngine
 
 from ..analyze import AnalysisResult, SVGAnalyzer
+from ..css.declaration_cache import get_declaration_cache
 from ..io import DrawingMLEmbedder, EmbedderResult, PackageWriter
+from ..io.package_writer import atomic_output_file
 from ..ir import IRElement, SceneGraph
 from ..map import GroupMapper, ImageMapper, PathMapper
 from ..map.base import Mapper, MapperResult
@@ -29,6 +36,7 @@ from ..map.rect_mapper import RectangleMapper
 from ..parse import ParseResult, SVGParser
 from ..policy import PolicyConfig, PolicyEngine
 from ..services.conversion_services import ConversionServices
+from ..utils.process_pool import process_pool_context
 from .config import OutputFormat, PipelineConfig
 from .error_reporter import ErrorCategory, ErrorSeverity, PipelineErrorReporter
 
@@ -36,6 +44,61 @@ from .error_reporter import ErrorCategory, ErrorSeverity, PipelineErrorReporter
 
 logger = logging.getLogger(__name__)
 
+# Converter owned by a mapping worker process (see _init_mapping_worker)
+_mapping_worker_converter: 'CleanSlateConverter | None' = None
+
+
+def _init_mapping_worker(config: PipelineConfig) -> None:
+    global _mapping_worker_converter
+    _mapping_worker_converter = CleanSlateConverter(config)
+
+
+def _map_chunk_in_worker(elements: list[IRElement]) -> tuple[list[tuple], dict, Any]:
+    """
+    Map a chunk of elements in a worker process.
+
+    Returns:
+        (outcomes, mapper statistics, policy metrics) for this chunk only, so
+        the parent can fold the worker's counters into its own
+    """
+    converter = _mapping_worker_converter
+    mappers = _statistics_mappers(converter.mappers)
+    for mapper in mappers.values():
+        mapper.reset_statistics()
+    converter.policy.reset_metrics()
+
+    outcomes = []
+    for element in elements:
+        status, value, error = converter._map_element(element)
+        if status == 'mapped':
+            # The parent reattaches its own element; don't ship it back
+            value.element = None
+        elif status == 'failed':
+            error = _picklable_exception(error)
+        outcomes.append((status, value, error))
+
+    mapper_stats = {name: mapper.get_statistics() for name, mapper in mappers.items()}
+    return outcomes, mapper_stats, converter.policy.get_metrics()
+
+
+def _statistics_mappers(mappers: dict[str, Mapper]) -> dict[str, Mapper]:
+    """Mappers that keep mergeable statistics, each once (TextMapper has two names)"""
+    unique = {}
+    seen = set()
+    for name, mapper in mappers.items():
+        if hasattr(mapper, 'merge_statistics') and id(mapper) not in seen:
+            seen.add(id(mapper))
+            unique[name] = mapper
+    return unique
+
+
+def _picklable_exception(error: Exception) -> Exception:
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
 
 class ConversionError(Exception):
     """Exception raised when conversion fails"""
@@ -48,9 +111,12 @@ class ConversionError(Exception):
 @dataclass
 class ConversionResult:
     """Result of complete SVG to PPTX conversion"""
-    # Output data
+    # Output data (empty for PPTX packages streamed to a file or stream;
+    # see output_size/output_path)
     output_data: bytes
     output_format: OutputFormat
+    output_size: int = 0
+    output_path: str | None = None  # Set by convert_file
 
     # Pipeline statistics
     total_time_ms: float = 0.0
@@ -78,6 +144,9 @@ class ConversionResult:
     # Debug information
     debug_data: dict[str, Any] = None
 
+    # Embedded slide, for callers assembling multi-slide packages
+    embedder_result: EmbedderResult | None = None
+
 
 class CleanSlateConverter:
     """
@@ -107,6 +176,9 @@ class CleanSlateConverter:
         # Initialize error reporter
         self.error_reporter = PipelineErrorReporter()
 
+        # Element mapping pool, started on first parallel conversion
+        self._mapping_executor: Executor | None = None
+
         # Statistics
         self._stats = {
             'total_conversions': 0,
@@ -124,7 +196,9 @@ class CleanSlateConverter:
             output_path: Path for output file (auto-generated if None)
 
         Returns:
-            ConversionResult with output data and statistics
+            ConversionResult with output_path, output_size and statistics.
+            PPTX packages are streamed into the file, so output_data is empty
+            for them; other formats also carry the output in output_data.
 
         Raises:
             ConversionError: If conversion fails
@@ -143,16 +217,16 @@ class CleanSlateConverter:
                 else:
                     output_path = svg_file.with_suffix('.json')
 
-            # Convert content
-            result = self.convert_string(svg_content)
-
-            # Write output file
+            # Convert content, streaming packages straight into the output file
             if self.config.output_format == OutputFormat.PPTX:
-                with open(output_path, 'wb') as f:
-                    f.write(result.output_data)
+                with atomic_output_file(output_path) as f:
+                    result = self.convert_string(svg_content, output_stream=f)
             else:
+                result = self.convert_string(svg_content)
                 with open(output_path, 'w', encoding='utf-8') as f:
                     f.write(result.output_data.decode('utf-8'))
+            result.output_path = str(output_path)
+            result.output_size = Path(output_path).stat().st_size
 
             self.logger.info(f"Converted {svg_path} to {output_path}")
             return result
@@ -162,15 +236,19 @@ class CleanSlateConverter:
             raise ConversionError(f"Failed to convert file {svg_path}: {e}",
                                 stage="file_conversion", cause=e)
 
-    def convert_string(self, svg_content: str) -> ConversionResult:
+    def convert_string(self, svg_content: str,
+                       output_stream: BinaryIO | None = None) -> ConversionResult:
         """
         Convert SVG string to PPTX.
 
         Args:
             svg_content: SVG content as string
+            output_stream: Binary stream to write the PPTX package into instead of
+                returning it in output_data (PPTX output only)
 
         Returns:
-            ConversionResult with output data and statistics
+            ConversionResult with output data (empty when streamed), output
+            size and statistics
 
         Raises:
             ConversionError: If conversion fails
@@ -203,7 +281,14 @@ class CleanSlateConverter:
             # Stage 2: Analyze SVG structure
             analyze_start = time.perf_counter()
             try:
-                analysis_result = self.analyzer.analyze(parse_result.svg_root)
+                if self.config.single_parse:
+                    analysis_result = self.analyzer.analyze(
+                        parse_result.svg_root,
+                        parse_result=parse_result,
+                        parser=self.parser,
+                    )
+                else:
+                    analysis_result = self.analyzer.analyze(parse_result.svg_root)
                 analyze_time = (time.perf_counter() - analyze_start) * 1000
             except Exception as e:
                 analyze_time = (time.perf_counter() - analyze_start) * 1000
@@ -216,7 +301,10 @@ class CleanSlateConverter:
 
             # Stage 2.5: Check for animations (using migrated animation system)
             try:
-                animations = self.animation_parser.parse_svg_animations(parse_result.svg_root)
+                animations = self.animation_parser.parse_svg_animations(
+                    parse_result.svg_root,
+                    document_index=parse_result.document_index,
+                )
                 if animations:
                     self.logger.info(f"Detected {len(animations)} animations in SVG")
                     # TODO: In future, integrate animations into conversion pipeline
@@ -249,7 +337,7 @@ class CleanSlateConverter:
 
             # Stage 6: Generate final output
             packaging_start = time.perf_counter()
-            output_data = self._generate_output(embedder_result, analysis_result)
+            output_data, output_size = self._generate_output(embedder_result, analysis_result, output_stream)
             packaging_time = (time.perf_counter() - packaging_start) * 1000
 
             # Calculate total time and statistics
@@ -259,6 +347,7 @@ class CleanSlateConverter:
             result = ConversionResult(
                 output_data=output_data,
                 output_format=self.config.output_format,
+                output_size=output_size,
                 total_time_ms=total_time,
                 parse_time_ms=parse_time,
                 analyze_time_ms=analyze_time,
@@ -273,6 +362,7 @@ class CleanSlateConverter:
                 slide_count=1,
                 media_files=len(embedder_result.media_files),
                 relationships=len(embedder_result.relationship_data),
+                embedder_result=embedder_result,
             )
 
             # Add debug data if enabled
@@ -314,6 +404,11 @@ class CleanSlateConverter:
     def _initialize_components(self) -> None:
         """Initialize pipeline components based on configuration"""
         try:
+            # Point EMF/raster fallback generation at the shared media cache
+            performance = self.config.performance_config
+            if performance.enable_caching and performance.fallback_cache_dir:
+                configure_fallback_cache(performance.fallback_cache_dir)
+
             # Initialize services first
             self.services = ConversionServices.create_default()
 
@@ -386,8 +481,6 @@ class CleanSlateConverter:
 
     def _map_scene_elements(self, scene: SceneGraph) -> list[MapperResult]:
         """Map all elements in scene using appropriate mappers"""
-        mapper_results = []
-
         # Defensive: accept SceneGraph, list, or None
         if scene is None:
             self.logger.warning("Scene is None; treating as empty scene.")
@@ -403,43 +496,144 @@ class CleanSlateConverter:
             self.logger.error("Scene elements not iterable; treating as empty scene.")
             return []
 
-        for element in elements:
+        if self._use_parallel_mapping(elements):
             try:
-                # Find appropriate mapper
-                mapper = self._find_mapper(element)
-                if not mapper:
-                    element_type = type(element).__name__
-                    self.error_reporter.report_mapping_error(
-                        message=f"No mapper found for element type: {element_type}",
-                        element_type=element_type,
-                    )
-                    self.logger.warning(f"No mapper found for element type: {element_type}")
-                    continue
+                outcomes = self._map_elements_parallel(elements)
+            except Exception as e:
+                # Pool failures (e.g. unpicklable elements) fall back to in-process mapping
+                self.logger.warning(f"Parallel mapping failed, mapping sequentially: {e}")
+                self.close()
+            else:
+                mapper_results = []
+                for element, outcome in zip(elements, outcomes):
+                    self._collect_mapping_outcome(element, outcome, mapper_results)
+                return mapper_results
 
-                # Map element
-                result = mapper.map(element)
-                mapper_results.append(result)
+        mapper_results = []
+        for element in elements:
+            self._collect_mapping_outcome(element, self._map_element(element), mapper_results)
 
-            except Exception as e:
-                element_type = type(element).__name__
-                mapper_name = type(mapper).__name__ if mapper else "unknown"
+        return mapper_results
 
-                self.error_reporter.report_mapping_error(
-                    message=f"Failed to map element {element_type}: {e}",
-                    element_type=element_type,
-                    mapper_name=mapper_name,
-                    exception=e,
+    def _map_element(self, element: IRElement) -> tuple[str, Any, Exception | None]:
+        """
+        Map one element, capturing failures for the caller to report.
+
+        Returns:
+            ('mapped', MapperResult, None), ('unmapped', None, None) or
+            ('failed', mapper name, exception)
+        """
+        mapper = None
+        try:
+            # Find appropriate mapper
+            mapper = self._find_mapper(element)
+            if not mapper:
+                return ('unmapped', None, None)
+
+            # Map element
+            return ('mapped', mapper.map(element), None)
+
+        except Exception as e:
+            return ('failed', type(mapper).__name__ if mapper else "unknown", e)
+
+    def _collect_mapping_outcome(self, element: IRElement, outcome: tuple,
+                                 mapper_results: list[MapperResult]) -> None:
+        """Append a mapped result or report the element's mapping error"""
+        status, value, error = outcome
+        element_type = type(element).__name__
+
+        if status == 'mapped':
+            value.element = element
+            mapper_results.append(value)
+
+        elif status == 'unmapped':
+            self.error_reporter.report_mapping_error(
+                message=f"No mapper found for element type: {element_type}",
+                element_type=element_type,
+            )
+            self.logger.warning(f"No mapper found for element type: {element_type}")
+
+        else:
+            mapper_name = value
+            self.error_reporter.report_mapping_error(
+                message=f"Failed to map element {element_type}: {error}",
+                element_type=element_type,
+                mapper_name=mapper_name,
+                exception=error,
+            )
+
+            self.logger.error(f"Failed to map element {element_type} with {mapper_name}: {error}")
+            if self.config.enable_debug:
+                # Re-raise in debug mode; continue with other elements in production
+                raise error
+
+    def _use_parallel_mapping(self, elements) -> bool:
+        performance = self.config.performance_config
+        return (
+            performance.parallel_processing
+            and performance.max_workers > 1
+            and hasattr(elements, '__len__')
+            and len(elements) >= max(performance.parallel_min_elements, 2)
+        )
+
+    def _map_elements_parallel(self, elements: list[IRElement]) -> list[tuple]:
+        """Map top-level elements on the worker pool, returning outcomes in z-order."""
+        performance = self.config.performance_config
+        elements = list(elements)
+
+        if self._mapping_executor is None:
+            # Daemonic processes (e.g. queue workers) cannot start a process pool
+            if performance.parallel_executor == 'thread' or multiprocessing.current_process().daemon:
+                self._mapping_executor = ThreadPoolExecutor(max_workers=performance.max_workers)
+            else:
+                self._mapping_executor = ProcessPoolExecutor(
+                    max_workers=performance.max_workers,
+                    mp_context=process_pool_context(),
+                    initializer=_init_mapping_worker,
+                    initargs=(self.config,),
                 )
+        executor = self._mapping_executor
 
-                self.logger.error(f"Failed to map element {element_type} with {mapper_name}: {e}")
-                if not self.config.enable_debug:
-                    # Continue with other elements in production
-                    continue
-                else:
-                    # Re-raise in debug mode
-                    raise
+        if isinstance(executor, ThreadPoolExecutor):
+            # Mappers and the policy engine are shared; decisions are reentrant
+            return list(executor.map(self._map_element, elements))
 
-        return mapper_results
+        # Several chunks per worker keeps IPC low while balancing uneven elements
+        chunk_size = max(1, len(elements) // (performance.max_workers * 4))
+        chunks = [elements[i:i + chunk_size] for i in range(0, len(elements), chunk_size)]
+        self.logger.debug(f"Mapping {len(elements)} elements in {len(chunks)} chunks "
+                          f"on {performance.max_workers} workers")
+
+        try:
+            chunk_results = list(executor.map(_map_chunk_in_worker, chunks))
+        except BrokenProcessPool:
+            # A worker died; the next conversion starts a fresh pool
+            self._discard_mapping_executor(executor)
+            raise
+
+        # Worker mappers and policy counted these elements, not ours; merge only
+        # once every chunk succeeded so a sequential fallback never double counts
+        outcomes = []
+        mappers = _statistics_mappers(self.mappers)
+        for chunk_outcomes, mapper_stats, policy_metrics in chunk_results:
+            outcomes.extend(chunk_outcomes)
+            for name, stats in mapper_stats.items():
+                if name in mappers:
+                    mappers[name].merge_statistics(stats)
+            self.policy.merge_metrics(policy_metrics)
+        return outcomes
+
+    def _discard_mapping_executor(self, executor: Executor) -> None:
+        """Drop a broken element mapping pool so the next call rebuilds it."""
+        if self._mapping_executor is executor:
+            self._mapping_executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self) -> None:
+        """Shut down the element mapping pool, if one was started."""
+        if self._mapping_executor is not None:
+            self._mapping_executor.shutdown()
+            self._mapping_executor = None
 
     def _find_mapper(self, element: IRElement) -> Mapper | None:
         """Find appropriate mapper for IR element"""
@@ -457,20 +651,23 @@ class CleanSlateConverter:
         return None
 
     def _generate_output(self, embedder_result: EmbedderResult,
-                        analysis_result: AnalysisResult) -> bytes:
-        """Generate final output in requested format"""
+                        analysis_result: AnalysisResult,
+                        output_stream: BinaryIO | None = None) -> tuple[bytes, int]:
+        """Generate final output in requested format, returning (data, size in bytes)"""
         try:
             if self.config.output_format == OutputFormat.PPTX:
-                # Generate complete PPTX package
-                self.package_writer.write_package_stream(
-                    [embedder_result],
-                    output_stream := io.BytesIO(),
-                )
-                return output_stream.getvalue()
+                # Stream the package into the caller's target when given
+                if output_stream is not None:
+                    stats = self.package_writer.write_package_stream([embedder_result], output_stream)
+                    return b'', stats['package_size_bytes']
+
+                buffer = io.BytesIO()
+                self.package_writer.write_package_stream([embedder_result], buffer)
+                output_data = buffer.getvalue()
 
             elif self.config.output_format == OutputFormat.SLIDE_XML:
                 # Return just the slide XML
-                return embedder_result.slide_xml.encode('utf-8')
+                output_data = embedder_result.slide_xml.encode('utf-8')
 
             elif self.config.output_format == OutputFormat.DEBUG_JSON:
                 # Return debug JSON
@@ -493,11 +690,13 @@ class CleanSlateConverter:
                         for media in embedder_result.media_files
                     ],
                 }
-                return json.dumps(debug_data, indent=2).encode('utf-8')
+                output_data = json.dumps(debug_data, indent=2).encode('utf-8')
 
             else:
                 raise ConversionError(f"Unsupported output format: {self.config.output_format}")
 
+            return output_data, len(output_data)
+
         except Exception as e:
             raise ConversionError(f"Failed to generate output: {e}",
                                 stage="output_generation", cause=e)
@@ -566,8 +765,10 @@ class CleanSlateConverter:
             'mapper_stats': {
                 name: mapper.get_statistics()
                 for name, mapper in self.mappers.items()
+                if hasattr(mapper, 'get_statistics')
             },
             'embedder_stats': self.embedder.get_statistics(),
+            'style_declaration_cache': get_declaration_cache().get_statistics(),
         }
 
     def reset_statistics(self) -> None:
@@ -581,8 +782,23 @@ class CleanSlateConverter:
 
         # Reset component statistics
         for mapper in self.mappers.values():
-            mapper.reset_statistics()
+            if hasattr(mapper, 'reset_statistics'):
+                mapper.reset_statistics()
         self.embedder.reset_statistics()
+        self.policy.reset_metrics()
+
+    def reset_conversion_state(self, reset_statistics: bool = True) -> None:
+        """
+        Clear per-conversion state so the converter can be reused for a new document.
+
+        Args:
+            reset_statistics: Also reset converter, mapper and policy statistics
+                (False keeps them accumulating, e.g. across pages of one deck)
+        """
+        self.error_reporter = PipelineErrorReporter()
+        self.embedder.reset_id_counters()
+        if reset_statistics:
+            self.reset_statistics()
 
     def get_config(self) -> PipelineConfig:
         """Get current pipeline configuration"""
@@ -590,6 +806,7 @@ class CleanSlateConverter:
 
     def update_config(self, config: PipelineConfig) -> None:
         """Update pipeline configuration and reinitialize components"""
+        self.close()
         self.config = config
         self._initialize_components()
 
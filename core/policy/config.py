@@ -135,6 +135,9 @@ class PolicyConfig:
     enable_metrics: bool = True
     log_decisions: bool = False            # Log all policy decisions
 
+    # Memoize path/text/gradient decisions by structural fingerprint (0 disables)
+    decision_cache_size: int = 4096
+
     def __post_init__(self):
         if self.thresholds is None:
             self.thresholds = self._get_default_thresholds()
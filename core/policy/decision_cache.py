@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Policy Decision Cache
+
+Bounded LRU of policy decisions keyed by a structural fingerprint: a tuple
+of exactly the element properties a decision reads. Repetitive content
+(icon grids, charts) then pays for the threshold analysis once per shape
+profile instead of once per element.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from .targets import PolicyDecision
+
+
+class DecisionCache:
+    """Thread-safe LRU mapping fingerprints to (immutable) decisions."""
+
+    def __init__(self, max_size: int = 4096):
+        """
+        Initialize decision cache.
+
+        Args:
+            max_size: Maximum cached decisions (0 disables caching)
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, PolicyDecision] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> PolicyDecision | None:
+        """Get the decision cached for ``key``, marking it recently used."""
+        with self._lock:
+            decision = self._entries.get(key)
+            if decision is not None:
+                self._entries.move_to_end(key)
+            return decision
+
+    def put(self, key: Hashable, decision: PolicyDecision) -> None:
+        """Cache ``decision`` under ``key``, evicting the least recently used."""
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = decision
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached decisions"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
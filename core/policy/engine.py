@@ -7,6 +7,7 @@ Centralized, configurable, and transparent decision making.
 """
 
 import logging
+import threading
 import time
 from typing import Any, Optional, Union
 
@@ -34,6 +35,7 @@ from ..ir import (
     TextFrame,
 )
 from .config import OutputTarget, PolicyConfig
+from .decision_cache import DecisionCache
 from .targets import (
     AnimationDecision,
     ClipPathDecision,
@@ -55,6 +57,10 @@ class Policy:
 
     Makes smart decisions about when to use native DrawingML vs EMF fallback
     based on element complexity, target quality, and performance constraints.
+
+    Decisions are pure functions of the element and configuration, so one
+    instance can be shared across threads. Metrics are accumulated per thread
+    and merged when read.
     """
 
     def __init__(self, config: PolicyConfig = None):
@@ -65,9 +71,16 @@ class Policy:
             config: Policy configuration (defaults to BALANCED)
         """
         self.config = config or PolicyConfig()
-        self.metrics = PolicyMetrics()
         self.logger = logging.getLogger(__name__)
 
+        # Per-thread metrics, registered so reads can merge them
+        self._local = threading.local()
+        self._thread_metrics: list[PolicyMetrics] = []
+        self._metrics_lock = threading.Lock()
+
+        # Memoized decisions for repetitive content (see _decide_cached)
+        self._decision_cache = DecisionCache(self.config.decision_cache_size)
+
         if self.config.log_decisions:
             self.logger.setLevel(logging.DEBUG)
 
@@ -81,15 +94,7 @@ class Policy:
         Returns:
             PathDecision with reasoning
         """
-        start_time = time.perf_counter()
-
-        try:
-            decision = self._analyze_path(path)
-            return decision
-        finally:
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            if hasattr(self, '_current_decision'):
-                self.metrics.record_decision(self._current_decision, elapsed_ms)
+        return self._decide_cached(self._path_fingerprint, self._analyze_path, path)
 
     def decide_text(self, text) -> TextDecision:
         """
@@ -106,30 +111,24 @@ class Policy:
         """
         start_time = time.perf_counter()
 
-        try:
-            # Import here to avoid circular dependency
-            from ..ir.text import TextFrame, RichTextFrame
-
-            # Convert RichTextFrame to TextFrame if needed
-            if isinstance(text, RichTextFrame):
-                text = text.to_text_frame()
-
-            # Defensively handle unknown types
-            if not isinstance(text, TextFrame):
-                # Return safe default for unknown text types
-                return TextDecision(
-                    use_native=True,
-                    reasons=[],
-                    estimated_quality=0.9,
-                    estimated_performance=0.95,
-                )
+        # Import here to avoid circular dependency
+        from ..ir.text import RichTextFrame, TextFrame
+
+        # Convert RichTextFrame to TextFrame if needed
+        if isinstance(text, RichTextFrame):
+            text = text.to_text_frame()
+
+        # Defensively handle unknown types
+        if not isinstance(text, TextFrame):
+            # Return safe default for unknown text types
+            return TextDecision(
+                use_native=True,
+                reasons=[],
+                estimated_quality=0.9,
+                estimated_performance=0.95,
+            )
 
-            decision = self._analyze_text(text)
-            return decision
-        finally:
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            if hasattr(self, '_current_decision'):
-                self.metrics.record_decision(self._current_decision, elapsed_ms)
+        return self._decide_cached(self._text_fingerprint, self._analyze_text, text, start_time=start_time)
 
     def decide_group(self, group: Group) -> GroupDecision:
         """
@@ -142,14 +141,9 @@ class Policy:
             GroupDecision with reasoning
         """
         start_time = time.perf_counter()
-
-        try:
-            decision = self._analyze_group(group)
-            return decision
-        finally:
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            if hasattr(self, '_current_decision'):
-                self.metrics.record_decision(self._current_decision, elapsed_ms)
+        decision = self._analyze_group(group)
+        self._record_decision(decision, (time.perf_counter() - start_time) * 1000)
+        return decision
 
     def decide_image(self, image: Image) -> ImageDecision:
         """
@@ -162,14 +156,62 @@ class Policy:
             ImageDecision with reasoning
         """
         start_time = time.perf_counter()
+        decision = self._analyze_image(image)
+        self._record_decision(decision, (time.perf_counter() - start_time) * 1000)
+        return decision
 
-        try:
-            decision = self._analyze_image(image)
-            return decision
-        finally:
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            if hasattr(self, '_current_decision'):
-                self.metrics.record_decision(self._current_decision, elapsed_ms)
+    def _decide_cached(self, fingerprint, analyze, *args, start_time: float | None = None):
+        """
+        Run ``analyze(*args)`` unless a decision for the same fingerprint is cached.
+
+        Decisions are frozen, so one instance is safely shared by every
+        element with the same fingerprint.
+        """
+        if start_time is None:
+            start_time = time.perf_counter()
+
+        key = fingerprint(*args) if self._decision_cache.max_size > 0 else None
+        decision = self._decision_cache.get(key) if key is not None else None
+        cache_hit = decision is not None
+
+        if not cache_hit:
+            decision = analyze(*args)
+            if key is not None:
+                self._decision_cache.put(key, decision)
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self._record_decision(decision, elapsed_ms, cache_hit=cache_hit if key is not None else None)
+        return decision
+
+    def _path_fingerprint(self, path: Path) -> tuple:
+        """Properties _analyze_path reads (directly or via path.has_complex_features)"""
+        stroke = path.stroke
+        return (
+            'path',
+            len(path.segments),
+            path.complexity_score,
+            path.clip is not None,
+            getattr(path.clip, 'strategy', None),
+            self._has_complex_stroke(stroke),
+            self._has_complex_fill(path.fill),
+            bool(stroke and stroke.is_dashed),
+        )
+
+    def _text_fingerprint(self, text: TextFrame) -> tuple | None:
+        """Properties _analyze_text reads; transformed or on-path text is not cached"""
+        if getattr(text, 'transform', None) is not None or getattr(text, 'text_path', None):
+            return None
+        return (
+            'text',
+            len(text.runs),
+            text.complexity_score,
+            any(run.has_decoration for run in text.runs),
+            text.is_multiline,
+        )
+
+    @staticmethod
+    def _gradient_fingerprint(gradient_type: str, stop_count: int, mesh_rows: int, mesh_cols: int) -> tuple:
+        return ('gradient', gradient_type, stop_count, mesh_rows, mesh_cols)
 
     def _analyze_path(self, path: Path) -> PathDecision:
         """Analyze path and make policy decision"""
@@ -192,7 +234,6 @@ class Policy:
                 has_complex_fill=has_complex_fill,
                 confidence=0.9,
             )
-            self._current_decision = decision
             return decision
 
         # Check segment count threshold
@@ -208,7 +249,6 @@ class Policy:
                 has_complex_fill=has_complex_fill,
                 confidence=0.95,
             )
-            self._current_decision = decision
             return decision
 
         # Check complexity score threshold
@@ -230,7 +270,6 @@ class Policy:
                 has_complex_fill=has_complex_fill,
                 confidence=0.85,
             )
-            self._current_decision = decision
             return decision
 
         # Check for unsupported features
@@ -245,7 +284,6 @@ class Policy:
                 has_complex_fill=has_complex_fill,
                 confidence=0.9,
             )
-            self._current_decision = decision
             return decision
 
         # Use native DrawingML
@@ -265,7 +303,6 @@ class Policy:
             estimated_quality=0.98,
             estimated_performance=0.9,
         )
-        self._current_decision = decision
         return decision
 
     def _analyze_text(self, text: TextFrame) -> TextDecision:
@@ -292,7 +329,6 @@ class Policy:
                 has_multiline=has_multiline,
                 confidence=0.9,
             )
-            self._current_decision = decision
             return decision
 
         # Check run count threshold
@@ -308,7 +344,6 @@ class Policy:
                 has_multiline=has_multiline,
                 confidence=0.85,
             )
-            self._current_decision = decision
             return decision
 
         # Check complexity score
@@ -325,7 +360,6 @@ class Policy:
                 has_multiline=has_multiline,
                 confidence=0.8,
             )
-            self._current_decision = decision
             return decision
 
         # Check for missing fonts
@@ -340,7 +374,6 @@ class Policy:
                 has_multiline=has_multiline,
                 confidence=0.95,
             )
-            self._current_decision = decision
             return decision
 
         # Check transform complexity for WordArt compatibility
@@ -359,7 +392,6 @@ class Policy:
                 transform_complexity=transform_analysis,
                 confidence=0.9,
             )
-            self._current_decision = decision
             return decision
 
         # Check for WordArt pattern if text has a path
@@ -381,7 +413,6 @@ class Policy:
                 estimated_quality=0.95,  # WordArt maintains high quality
                 estimated_performance=0.98,  # WordArt is very fast
             )
-            self._current_decision = decision
             return decision
 
         # Use native DrawingML
@@ -400,7 +431,6 @@ class Policy:
             estimated_quality=0.98,
             estimated_performance=0.95,
         )
-        self._current_decision = decision
         return decision
 
     def _analyze_group(self, group: Group) -> GroupDecision:
@@ -423,7 +453,6 @@ class Policy:
                 has_complex_clipping=has_complex_clipping,
                 confidence=0.9,
             )
-            self._current_decision = decision
             return decision
 
         # Check nesting depth
@@ -438,7 +467,6 @@ class Policy:
                 has_complex_clipping=has_complex_clipping,
                 confidence=0.85,
             )
-            self._current_decision = decision
             return decision
 
         # Use native DrawingML
@@ -455,7 +483,6 @@ class Policy:
             estimated_quality=0.95,
             estimated_performance=0.85,
         )
-        self._current_decision = decision
         return decision
 
     def _analyze_image(self, image: Image) -> ImageDecision:
@@ -475,7 +502,6 @@ class Policy:
             estimated_quality=0.98,
             estimated_performance=0.9,
         )
-        self._current_decision = decision
         return decision
 
     def _has_complex_stroke(self, stroke: Stroke | None) -> bool:
@@ -685,12 +711,7 @@ class Policy:
 
     def _calculate_nesting_depth(self, group: Group, current_depth: int = 0) -> int:
         """Calculate maximum nesting depth of group"""
-        max_depth = current_depth
-        for child in group.children:
-            if isinstance(child, Group):
-                child_depth = self._calculate_nesting_depth(child, current_depth + 1)
-                max_depth = max(max_depth, child_depth)
-        return max_depth
+        return current_depth + group.nesting_depth
 
     def _should_flatten_group(self, group: Group) -> bool:
         """Check if group should be flattened"""
@@ -718,8 +739,7 @@ class Policy:
         decision = self._analyze_filter(filter_type, primitive_count)
         elapsed_ms = (time.time() - start_time) * 1000.0
 
-        if self.config.enable_metrics:
-            self.metrics.record_decision(decision, elapsed_ms)
+        self._record_decision(decision, elapsed_ms)
 
         return decision
 
@@ -809,14 +829,10 @@ class Policy:
         Returns:
             GradientDecision with reasoning
         """
-        start_time = time.time()
-        decision = self._analyze_gradient(gradient_type, stop_count, mesh_rows, mesh_cols)
-        elapsed_ms = (time.time() - start_time) * 1000.0
-
-        if self.config.enable_metrics:
-            self.metrics.record_decision(decision, elapsed_ms)
-
-        return decision
+        return self._decide_cached(
+            self._gradient_fingerprint, self._analyze_gradient,
+            gradient_type, stop_count, mesh_rows, mesh_cols,
+        )
 
     def _analyze_gradient(self, gradient_type: str, stop_count: int,
                          mesh_rows: int, mesh_cols: int) -> GradientDecision:
@@ -892,8 +908,7 @@ class Policy:
                                            elements_per_page, page_titles)
         elapsed_ms = (time.time() - start_time) * 1000.0
 
-        if self.config.enable_metrics:
-            self.metrics.record_decision(decision, elapsed_ms)
+        self._record_decision(decision, elapsed_ms)
 
         return decision
 
@@ -979,8 +994,7 @@ class Policy:
         decision = self._analyze_animation(animation_type, keyframe_count, duration_ms, interpolation)
         elapsed_ms = (time.time() - start_time) * 1000.0
 
-        if self.config.enable_metrics:
-            self.metrics.record_decision(decision, elapsed_ms)
+        self._record_decision(decision, elapsed_ms)
 
         return decision
 
@@ -1049,8 +1063,7 @@ class Policy:
                                           has_boolean_ops, boolean_op_type)
         elapsed_ms = (time.time() - start_time) * 1000.0
 
-        if self.config.enable_metrics:
-            self.metrics.record_decision(decision, elapsed_ms)
+        self._record_decision(decision, elapsed_ms)
 
         return decision
 
@@ -1124,13 +1137,55 @@ class Policy:
             boolean_op_type=boolean_op_type,
         )
 
+    def _record_decision(self, decision, elapsed_ms: float, cache_hit: bool | None = None) -> None:
+        """Record a decision (and decision cache lookup) in the calling thread's metrics"""
+        if not self.config.enable_metrics:
+            return
+
+        metrics = getattr(self._local, 'metrics', None)
+        if metrics is None:
+            metrics = PolicyMetrics()
+            with self._metrics_lock:
+                self._thread_metrics.append(metrics)
+            self._local.metrics = metrics
+        metrics.record_decision(decision, elapsed_ms)
+
+        if cache_hit is True:
+            metrics.decision_cache_hits += 1
+        elif cache_hit is False:
+            metrics.decision_cache_misses += 1
+
+    @property
+    def metrics(self) -> PolicyMetrics:
+        """Policy decision metrics merged across threads"""
+        merged = PolicyMetrics()
+        with self._metrics_lock:
+            thread_metrics = list(self._thread_metrics)
+        for metrics in thread_metrics:
+            merged.merge(metrics)
+        return merged
+
     def get_metrics(self) -> PolicyMetrics:
         """Get policy decision metrics"""
         return self.metrics
 
+    def merge_metrics(self, metrics: PolicyMetrics) -> None:
+        """Fold metrics recorded by another engine (e.g. in a worker process) into this one"""
+        if not self.config.enable_metrics:
+            return
+        with self._metrics_lock:
+            self._thread_metrics.append(metrics)
+
+    def clear_decision_cache(self) -> None:
+        """Drop memoized decisions (e.g. after changing the configuration)"""
+        self._decision_cache.clear()
+
     def reset_metrics(self):
         """Reset policy metrics"""
-        self.metrics = PolicyMetrics()
+        with self._metrics_lock:
+            self._thread_metrics = []
+            # Threads re-register on their next decision
+            self._local = threading.local()
 
 
 def create_policy(target: str | OutputTarget = OutputTarget.BALANCED, **kwargs) -> Policy:
@@ -68,12 +68,7 @@ class GroupPolicy:
         )
 
     def _calculate_nesting_depth(self, group: Group, current_depth: int = 0) -> int:
-        max_depth = current_depth
-        for child in group.children:
-            if isinstance(child, Group):
-                child_depth = self._calculate_nesting_depth(child, current_depth + 1)
-                max_depth = max(max_depth, child_depth)
-        return max_depth
+        return current_depth + group.nesting_depth
 
     def _should_flatten_group(self, group: Group) -> bool:
         return (
@@ -674,6 +674,10 @@ class PolicyMetrics:
     max_decision_time_ms: float = 0.0
     total_decision_time_ms: float = 0.0
 
+    # Decision cache lookups
+    decision_cache_hits: int = 0
+    decision_cache_misses: int = 0
+
     def __post_init__(self):
         if self.reason_counts is None:
             self.reason_counts = {}
@@ -690,6 +694,12 @@ class PolicyMetrics:
         """Percentage of decisions using EMF fallback"""
         return 100.0 - self.native_percentage
 
+    @property
+    def decision_cache_hit_rate(self) -> float:
+        """Fraction of cacheable decisions served from the decision cache"""
+        lookups = self.decision_cache_hits + self.decision_cache_misses
+        return self.decision_cache_hits / lookups if lookups else 0.0
+
     def record_decision(self, decision: ElementDecision, time_ms: float):
         """Record a policy decision and its timing"""
         self.total_decisions += 1
@@ -730,6 +740,27 @@ class PolicyMetrics:
             reason_key = reason.value
             self.reason_counts[reason_key] = self.reason_counts.get(reason_key, 0) + 1
 
+    def merge(self, other: 'PolicyMetrics') -> 'PolicyMetrics':
+        """Add another metrics instance into this one (returns self)"""
+        for name in (
+            'total_decisions', 'native_decisions', 'emf_decisions',
+            'path_decisions', 'text_decisions', 'group_decisions', 'image_decisions',
+            'filter_decisions', 'gradient_decisions', 'multipage_decisions',
+            'animation_decisions', 'clippath_decisions', 'total_decision_time_ms',
+            'decision_cache_hits', 'decision_cache_misses',
+        ):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+        self.max_decision_time_ms = max(self.max_decision_time_ms, other.max_decision_time_ms)
+        if self.total_decisions:
+            self.avg_decision_time_ms = self.total_decision_time_ms / self.total_decisions
+
+        # Copy first: the owning thread may still be adding reasons
+        for reason_key, count in dict(other.reason_counts).items():
+            self.reason_counts[reason_key] = self.reason_counts.get(reason_key, 0) + count
+
+        return self
+
     def to_dict(self) -> dict:
         """Serialize metrics to dictionary"""
         return {
@@ -752,4 +783,9 @@ class PolicyMetrics:
                 "clippaths": self.clippath_decisions,
             },
             "by_reason": self.reason_counts,
+            "decision_cache": {
+                "hits": self.decision_cache_hits,
+                "misses": self.decision_cache_misses,
+                "hit_rate": round(self.decision_cache_hit_rate, 3),
+            },
         }
\ No newline at end of file
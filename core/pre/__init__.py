@@ -20,6 +20,7 @@ from .chain import (
 )
 from .expand_use import *
 from .normalize_transforms import *
+from .reference_index import ReferenceIndex
 from .resolve_clips import *
 from .text_layout_prep import *
 
@@ -34,5 +35,5 @@ __all__ = [
     "PreprocessorChain", "create_standard_chain",
 
     # Utilities
-    "preprocess_svg", "validate_preprocessed_svg",
+    "preprocess_svg", "validate_preprocessed_svg", "ReferenceIndex",
 ]
\ No newline at end of file
@@ -10,6 +10,8 @@ from abc import ABC, abstractmethod
 
 from lxml import etree as ET
 
+from .reference_index import ReferenceIndex
+
 
 class BasePreprocessor(ABC):
     """
@@ -19,6 +21,9 @@ class BasePreprocessor(ABC):
     the process method.
     """
 
+    # Index shared across a preprocessor chain run (set by PreprocessorChain)
+    reference_index: ReferenceIndex | None = None
+
     @abstractmethod
     def process(self, svg_root: ET.Element) -> ET.Element:
         """
@@ -51,6 +56,21 @@ class BasePreprocessor(ABC):
 
         return True
 
+    def get_reference_index(self, svg_root: ET.Element) -> ReferenceIndex:
+        """
+        Get the shared reference index for ``svg_root``, building one if needed.
+
+        Args:
+            svg_root: Root SVG element
+
+        Returns:
+            ReferenceIndex covering the current tree
+        """
+        index = self.reference_index
+        if index is None or index.root is not svg_root:
+            index = ReferenceIndex(svg_root)
+        return index
+
     def get_svg_namespace_uri(self) -> str:
         """Get the SVG namespace URI."""
         return "http://www.w3.org/2000/svg"
@@ -22,6 +22,7 @@ from ..xml.safe_iter import walk
 from .base import BasePreprocessor
 from .expand_use import ExpandUsePreprocessor
 from .normalize_transforms import NormalizeTransformsPreprocessor
+from .reference_index import ReferenceIndex
 from .resolve_clips import ResolveClipsPreprocessor
 from .text_layout_prep import TextLayoutPrepPreprocessor
 
@@ -65,6 +66,9 @@ class PreprocessorChain:
         current_svg = svg_root
         processor_metrics = {}
 
+        # One reference index for the whole run; processors keep it current
+        reference_index = ReferenceIndex(svg_root)
+
         for i, processor in enumerate(self.processors):
             processor_name = processor.__class__.__name__
             self.logger.debug(f"Running processor {i+1}/{len(self.processors)}: {processor_name}")
@@ -72,9 +76,19 @@ class PreprocessorChain:
             try:
                 # Run processor
                 processor_start = time.perf_counter()
-                current_svg = processor.process(current_svg)
+                if isinstance(processor, BasePreprocessor):
+                    processor.reference_index = reference_index
+                try:
+                    current_svg = processor.process(current_svg)
+                finally:
+                    if isinstance(processor, BasePreprocessor):
+                        processor.reference_index = None
                 processor_duration = time.perf_counter() - processor_start
 
+                # A processor returning a new root invalidates the shared index
+                if current_svg is not reference_index.root:
+                    reference_index = ReferenceIndex(current_svg)
+
                 # Record metrics
                 processor_metrics[processor_name] = {
                     'duration_sec': processor_duration,
@@ -18,6 +18,7 @@ from typing import Dict, Optional, Set
 from lxml import etree as ET
 
 from .base import BasePreprocessor
+from .reference_index import ReferenceIndex
 
 
 class ExpandUsePreprocessor(BasePreprocessor):
@@ -33,6 +34,7 @@ class ExpandUsePreprocessor(BasePreprocessor):
         self.logger = logging.getLogger(__name__)
         self.id_map: dict[str, ET.Element] = {}
         self.expanded_uses: set[str] = set()
+        self._index: ReferenceIndex | None = None
 
     def process(self, svg_root: ET.Element) -> ET.Element:
         """
@@ -45,15 +47,19 @@ class ExpandUsePreprocessor(BasePreprocessor):
             SVG with expanded use elements
         """
         self.logger.debug("Starting USE element expansion")
+        self._index = self.get_reference_index(svg_root)
 
-        # Build ID map for quick lookups
-        self._build_id_map(svg_root)
+        try:
+            # Build ID map for quick lookups
+            self._build_id_map(svg_root)
 
-        # Expand use elements recursively
-        self._expand_use_elements(svg_root)
+            # Expand use elements recursively
+            self._expand_use_elements(svg_root)
 
-        # Clean up unused defs (optional optimization)
-        self._cleanup_unused_defs(svg_root)
+            # Clean up unused defs (optional optimization)
+            self._cleanup_unused_defs(svg_root)
+        finally:
+            self._index = None
 
         self.logger.debug(f"Expanded {len(self.expanded_uses)} use elements")
         return svg_root
@@ -61,11 +67,7 @@ class ExpandUsePreprocessor(BasePreprocessor):
     def _build_id_map(self, root: ET.Element) -> None:
         """Build map of ID -> element for reference resolution."""
         self.id_map.clear()
-
-        for element in root.xpath(".//*[@id]"):
-            element_id = element.get('id')
-            if element_id:
-                self.id_map[element_id] = element
+        self.id_map.update(self._index.elements_by_id)
 
         self.logger.debug(f"Built ID map with {len(self.id_map)} entries")
 
@@ -114,6 +116,7 @@ class ExpandUsePreprocessor(BasePreprocessor):
                 use_index = list(parent).index(use_elem)
                 parent.remove(use_elem)
                 parent.insert(use_index, expanded)
+                self._index.replace_subtree(use_elem, expanded)
 
             self.logger.debug(f"Expanded use element referencing {ref_id}")
 
@@ -246,12 +249,13 @@ class ExpandUsePreprocessor(BasePreprocessor):
 
             for child in defs:
                 child_id = child.get('id')
-                if child_id and not self._is_referenced(svg_root, child_id):
+                if child_id and not self._index.is_referenced(child_id):
                     unused_children.append(child)
 
             # Remove unused definitions
             for unused in unused_children:
                 defs.remove(unused)
+                self._index.remove_subtree(unused)
                 self.logger.debug(f"Removed unused definition: {unused.get('id')}")
 
             # Remove empty defs elements
@@ -262,15 +266,8 @@ class ExpandUsePreprocessor(BasePreprocessor):
 
     def _is_referenced(self, root: ET.Element, ref_id: str) -> bool:
         """Check if an ID is referenced anywhere in the document."""
-        # Look for url(#id) references
-        xpath_expr = f".//*[contains(@fill, 'url(#{ref_id})') or " \
-                     f"contains(@stroke, 'url(#{ref_id})') or " \
-                     f"contains(@clip-path, 'url(#{ref_id})') or " \
-                     f"contains(@mask, 'url(#{ref_id})') or " \
-                     f"contains(@filter, 'url(#{ref_id})')]"
-
-        matches = root.xpath(xpath_expr)
-        return len(matches) > 0
+        index = self._index if self._index is not None and self._index.root is root else ReferenceIndex(root)
+        return index.is_referenced(ref_id)
 
 
 def expand_use_elements(svg_root: ET.Element) -> ET.Element:
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Reference Index
+
+Single-pass index of element IDs and the elements that reference them via
+url(#id) attribute values or href/xlink:href="#id". Shared by preprocessors
+so reference lookups and unused-definition cleanup do not rescan the
+document per ID.
+"""
+
+import re
+from collections import defaultdict
+
+from lxml import etree as ET
+
+XLINK_HREF = '{http://www.w3.org/1999/xlink}href'
+
+_URL_REF_PATTERN = re.compile(r"url\(\s*['\"]?#([^'\")\s]+)['\"]?\s*\)")
+
+
+class ReferenceIndex:
+    """
+    Index of id -> element and id -> referencing elements for one SVG tree.
+
+    Preprocessors that restructure the tree keep the index current with
+    replace_subtree/remove_subtree instead of rebuilding it.
+    """
+
+    def __init__(self, svg_root: ET.Element):
+        """
+        Build the index in one walk over ``svg_root``.
+
+        Args:
+            svg_root: SVG root element
+        """
+        self.root = svg_root
+        self.elements_by_id: dict[str, ET.Element] = {}
+        self._referrers: dict[str, list[ET.Element]] = defaultdict(list)
+        self.add_subtree(svg_root)
+
+    def get_element(self, element_id: str) -> ET.Element | None:
+        """Get the element with ``element_id``, if any."""
+        return self.elements_by_id.get(element_id)
+
+    def get_referrers(self, element_id: str) -> list[ET.Element]:
+        """Get elements referencing ``element_id``, in indexing order."""
+        return list(self._referrers.get(element_id, ()))
+
+    def is_referenced(self, element_id: str) -> bool:
+        """Check whether any indexed element references ``element_id``."""
+        return bool(self._referrers.get(element_id))
+
+    def add_subtree(self, element: ET.Element) -> None:
+        """Index ``element`` and its descendants."""
+        for node in element.iter():
+            if not isinstance(node.tag, str):
+                continue
+
+            element_id = node.get('id')
+            if element_id:
+                self.elements_by_id.setdefault(element_id, node)
+
+            for ref_id in extract_references(node):
+                self._referrers[ref_id].append(node)
+
+    def remove_subtree(self, element: ET.Element) -> None:
+        """Drop ``element`` and its descendants from the index."""
+        for node in element.iter():
+            if not isinstance(node.tag, str):
+                continue
+
+            element_id = node.get('id')
+            if element_id and self.elements_by_id.get(element_id) is node:
+                del self.elements_by_id[element_id]
+
+            for ref_id in extract_references(node):
+                referrers = self._referrers.get(ref_id)
+                if referrers:
+                    referrers[:] = [r for r in referrers if r is not node]
+                    if not referrers:
+                        del self._referrers[ref_id]
+
+    def replace_subtree(self, old: ET.Element, new: ET.Element) -> None:
+        """Update the index after ``old`` was replaced by ``new`` in the tree."""
+        self.remove_subtree(old)
+        self.add_subtree(new)
+
+
+def extract_references(element: ET.Element) -> list[str]:
+    """
+    Get IDs referenced by an element's own attributes.
+
+    Args:
+        element: Element to inspect
+
+    Returns:
+        Referenced IDs from url(#id) values (including style) and local hrefs
+    """
+    refs = []
+
+    for name, value in element.attrib.items():
+        if name == 'href' or name == XLINK_HREF:
+            if value.startswith('#') and len(value) > 1:
+                refs.append(value[1:])
+        elif 'url(' in value:
+            refs.extend(_URL_REF_PATTERN.findall(value))
+
+    return refs
@@ -21,13 +21,14 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from lxml import etree as ET
 
-from .base import PreprocessingContext, PreprocessingPlugin
+from .base import BasePreprocessor, PreprocessingContext, PreprocessingPlugin
 from .geometry import (
     create_boolean_engine,
     create_path_spec,
     create_service_adapters,
     normalize_fill_rule,
 )
+from .reference_index import ReferenceIndex
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +52,10 @@ class ResolveClipPathsPlugin(PreprocessingPlugin):
     name = "resolve_clippath"
     description = "Resolves clipPath elements into boolean path intersections"
 
+    # Index shared with the other core/pre preprocessors for one run (set by the caller)
+    reference_index: ReferenceIndex | None = None
+    get_reference_index = BasePreprocessor.get_reference_index
+
     def __init__(self, config: dict[str, Any] | None = None):
         """
         Initialize clipPath resolution plugin.
@@ -168,7 +173,12 @@ class ResolveClipPathsPlugin(PreprocessingPlugin):
     def _handle_no_boolean_engine_element(self, element: ET.Element, context: PreprocessingContext) -> bool:
         """Handle element when no boolean engine is available."""
         if self.fallback_behavior == "remove_clips" and element.get('clip-path'):
+            index = self._shared_index()
+            if index is not None:
+                index.remove_subtree(element)
             element.attrib.pop('clip-path', None)
+            if index is not None:
+                index.add_subtree(element)
             logger.debug(f"Removed clip-path attribute from {element.tag}")
             return True
         elif self.fallback_behavior == "hide_clipped" and element.get('clip-path'):
@@ -611,6 +621,17 @@ class ResolveClipPathsPlugin(PreprocessingPlugin):
         parent.remove(original_element)
         parent.insert(element_index, new_path)
 
+        index = self._shared_index()
+        if index is not None:
+            index.replace_subtree(original_element, new_path)
+
+    def _shared_index(self) -> ReferenceIndex | None:
+        """Shared reference index to keep current, if one covers this document."""
+        index = self.reference_index
+        if index is not None and index.root is self._svg_root:
+            return index
+        return None
+
     def _cleanup_clippath_definitions(self, svg_root: ET.Element,
                                     clippath_definitions: dict[str, ET.Element]) -> int:
         """
@@ -623,20 +644,17 @@ class ResolveClipPathsPlugin(PreprocessingPlugin):
         Returns:
             Number of definitions removed
         """
-        # Find all remaining clipPath references
-        remaining_refs = set()
-        for element in svg_root.findall(".//*[@clip-path]"):
-            clip_id = self._parse_clippath_reference(element.get('clip-path'))
-            if clip_id:
-                remaining_refs.add(clip_id)
+        # Reuse the run's url()/href index; built in one pass only when absent
+        reference_index = self.get_reference_index(svg_root)
 
         # Remove unused definitions
         removed_count = 0
         for clip_id, clippath_element in clippath_definitions.items():
-            if clip_id not in remaining_refs:
+            if not reference_index.is_referenced(clip_id):
                 parent = clippath_element.getparent()
                 if parent is not None:
                     parent.remove(clippath_element)
+                    reference_index.remove_subtree(clippath_element)
                     removed_count += 1
                     logger.debug(f"Removed unused clipPath definition: {clip_id}")
 
@@ -18,6 +18,7 @@ from typing import Dict, Optional, Set
 from lxml import etree as ET
 
 from .base import BasePreprocessor
+from .reference_index import ReferenceIndex
 
 
 class ResolveClipsPreprocessor(BasePreprocessor):
@@ -34,6 +35,7 @@ class ResolveClipsPreprocessor(BasePreprocessor):
         self.flatten_nested_clips = flatten_nested_clips
         self.clippath_defs: dict[str, ET.Element] = {}
         self.processed_clips: set[str] = set()
+        self._index: ReferenceIndex | None = None
 
     def process(self, svg_root: ET.Element) -> ET.Element:
         """
@@ -46,19 +48,23 @@ class ResolveClipsPreprocessor(BasePreprocessor):
             SVG with resolved clip paths
         """
         self.logger.debug("Starting clip path resolution")
+        self._index = self.get_reference_index(svg_root)
 
-        # Build clipPath definitions map
-        self._build_clippath_map(svg_root)
+        try:
+            # Build clipPath definitions map
+            self._build_clippath_map(svg_root)
 
-        # Resolve clip-path references
-        self._resolve_clippath_references(svg_root)
+            # Resolve clip-path references
+            self._resolve_clippath_references(svg_root)
 
-        # Flatten nested clipping if enabled
-        if self.flatten_nested_clips:
-            self._flatten_nested_clipping(svg_root)
+            # Flatten nested clipping if enabled
+            if self.flatten_nested_clips:
+                self._flatten_nested_clipping(svg_root)
 
-        # Cleanup unused clipPath definitions
-        self._cleanup_unused_clippath_defs(svg_root)
+            # Cleanup unused clipPath definitions
+            self._cleanup_unused_clippath_defs(svg_root)
+        finally:
+            self._index = None
 
         self.logger.debug(f"Resolved {len(self.processed_clips)} clip path references")
         return svg_root
@@ -102,16 +108,26 @@ class ResolveClipsPreprocessor(BasePreprocessor):
             self.logger.warning(f"ClipPath definition not found: {clip_id}")
             return
 
+        parent = element.getparent()
+        if parent is None:
+            return
+
         try:
-            # Create clipping group
+            # Build the group before touching the tree, so a failure leaves
+            # the document and the reference index as they were
+            element_index = parent.index(element)
             clipping_group = self._create_clipping_group(element, clippath_def)
 
             # Replace element with clipping group
-            parent = element.getparent()
-            if parent is not None:
-                element_index = list(parent).index(element)
-                parent.remove(element)
-                parent.insert(element_index, clipping_group)
+            parent.remove(element)
+            parent.insert(element_index, clipping_group)
+            clipping_group.insert(0, element)
+
+            # Drop the element's old references (clip-path included) before
+            # removing the attribute, then index the inserted group
+            self._index.remove_subtree(element)
+            del element.attrib['clip-path']
+            self._index.add_subtree(clipping_group)
 
             self.processed_clips.add(clip_id)
             self.logger.debug(f"Resolved clip-path reference: {clip_id}")
@@ -132,7 +148,7 @@ class ResolveClipsPreprocessor(BasePreprocessor):
         return None
 
     def _create_clipping_group(self, element: ET.Element, clippath_def: ET.Element) -> ET.Element:
-        """Create a group that applies clipping to the element."""
+        """Create the clipping group for an element (the caller moves the element into it)."""
         # Create wrapper group
         clip_group = self.create_svg_element('g')
 
@@ -141,17 +157,10 @@ class ResolveClipsPreprocessor(BasePreprocessor):
             if attr != 'clip-path':
                 clip_group.set(attr, value)
 
-        # Remove clip-path from original element
-        if element.get('clip-path'):
-            del element.attrib['clip-path']
-
         # Add clipping metadata for downstream processing
         clip_group.set('data-clip-operation', 'intersect')
         clip_group.set('data-clip-source', clippath_def.get('id', ''))
 
-        # Add clipped element
-        clip_group.append(element)
-
         # Add clipping paths as data
         for clip_child in clippath_def:
             if self.is_svg_element(clip_child, 'path'):
@@ -179,12 +188,11 @@ class ResolveClipsPreprocessor(BasePreprocessor):
         ref_id = href[1:]
 
         # Find referenced element in the document
-        svg_root = clip_group.getroottree().getroot()
-        ref_element = svg_root.xpath(f".//*[@id='{ref_id}']")
+        ref_element = self._index.get_element(ref_id)
 
-        if ref_element:
+        if ref_element is not None:
             # Clone referenced element as clipping path
-            clip_path = self._clone_element(ref_element[0])
+            clip_path = self._clone_element(ref_element)
             clip_path.set('data-clip-role', 'mask')
 
             # Apply use element transforms
@@ -242,6 +250,7 @@ class ResolveClipsPreprocessor(BasePreprocessor):
             nested_index = list(nested_parent).index(nested_group)
             nested_parent.remove(nested_group)
             nested_parent.insert(nested_index, combined_group)
+            self._index.replace_subtree(nested_group, combined_group)
 
     def _cleanup_unused_clippath_defs(self, svg_root: ET.Element) -> None:
         """Remove unused clipPath definitions."""
@@ -258,6 +267,7 @@ class ResolveClipsPreprocessor(BasePreprocessor):
                 clippath_id = clippath.get('id')
                 if clippath_id in self.processed_clips:
                     defs.remove(clippath)
+                    self._index.remove_subtree(clippath)
                     self.logger.debug(f"Removed processed clipPath definition: {clippath_id}")
 
             # Remove empty defs elements
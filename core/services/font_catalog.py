@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Persistent system font catalog.
+
+Scans font directories once, reads family/weight/style from each font's
+``name`` and ``OS/2`` tables, and keeps the result in an on-disk JSON index.
+The index stores every scanned directory with its mtime: on start-up only
+directories whose mtime changed are re-listed, and only files whose size or
+mtime changed are re-parsed. Lookups are dictionary hits on a normalized
+family name.
+"""
+
+import json
+import logging
+import os
+import platform
+import tempfile
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from fontTools.ttLib import TTCollection, TTFont
+from fontTools.ttLib.ttFont import TTLibError
+
+logger = logging.getLogger(__name__)
+
+# Environment variable overriding the on-disk index location
+FONT_CATALOG_PATH_ENV = "SVG2PPTX_FONT_CATALOG"
+
+FONT_EXTENSIONS = ('.ttf', '.otf', '.ttc', '.otc', '.woff', '.woff2')
+COLLECTION_EXTENSIONS = ('.ttc', '.otc')
+
+_INDEX_VERSION = 1
+_REGULAR_WEIGHT = 400
+_NORMAL_WIDTH = 5
+
+
+def normalize_family(family: str) -> str:
+    """Normalize a family name for lookup ("Times New Roman" -> "timesnewroman")."""
+    return ''.join(ch for ch in family.lower() if ch not in ' -_\'"')
+
+
+def default_index_path() -> Path:
+    """Get the on-disk index location (``$SVG2PPTX_FONT_CATALOG`` or user cache)."""
+    override = os.environ.get(FONT_CATALOG_PATH_ENV)
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "svg2pptx" / "font_catalog.json"
+
+
+def system_font_directories() -> list[str]:
+    """
+    Get platform-specific system font directories.
+
+    Returns:
+        Existing directories where fonts are typically installed
+    """
+    system = platform.system().lower()
+    directories = []
+
+    if system == "darwin":  # macOS
+        directories.extend([
+            "/System/Library/Fonts",
+            "/Library/Fonts",
+            os.path.expanduser("~/Library/Fonts"),
+        ])
+    elif system == "windows":
+        directories.extend([
+            "C:/Windows/Fonts",
+            os.path.expanduser("~/AppData/Local/Microsoft/Windows/Fonts"),
+        ])
+    elif system == "linux":
+        directories.extend([
+            "/usr/share/fonts",
+            "/usr/local/share/fonts",
+            os.path.expanduser("~/.fonts"),
+            os.path.expanduser("~/.local/share/fonts"),
+        ])
+
+    # Filter to existing directories
+    return [d for d in directories if os.path.exists(d)]
+
+
+@dataclass(frozen=True)
+class FontRecord:
+    """Catalog entry for one face in a font file."""
+    path: str
+    family: str | None           # None when the file could not be parsed
+    subfamily: str = ""
+    weight: int = _REGULAR_WEIGHT  # OS/2 usWeightClass
+    width: int = _NORMAL_WIDTH     # OS/2 usWidthClass
+    italic: bool = False
+    font_number: int = 0          # Face index inside .ttc/.otc collections
+    aliases: tuple[str, ...] = ()  # Other family names (legacy/localized)
+
+    @property
+    def in_collection(self) -> bool:
+        """Whether the face lives in a .ttc/.otc collection (path alone cannot load it)."""
+        return self.path.lower().endswith(COLLECTION_EXTENSIONS)
+
+
+def read_font_records(path: str) -> list[FontRecord]:
+    """
+    Read catalog records from a font file.
+
+    Args:
+        path: Font file path
+
+    Returns:
+        One record per face; a single family-less record if the file
+        cannot be parsed (so it stays reachable by filename)
+    """
+    try:
+        if path.lower().endswith(COLLECTION_EXTENSIONS):
+            collection = TTCollection(path, lazy=True)
+            try:
+                return [_record_from_font(path, font, index)
+                        for index, font in enumerate(collection.fonts)]
+            finally:
+                collection.close()
+
+        font = TTFont(path, lazy=True)
+        try:
+            return [_record_from_font(path, font, 0)]
+        finally:
+            font.close()
+    except (TTLibError, OSError, KeyError, ValueError, AssertionError, ImportError) as e:
+        logger.debug(f"Indexing {path} by filename only: {e}")
+        return [FontRecord(path=path, family=None)]
+
+
+def _record_from_font(path: str, font: TTFont, font_number: int) -> FontRecord:
+    name_table = font['name'] if 'name' in font else None
+
+    def name(*name_ids: int) -> str | None:
+        if name_table is None:
+            return None
+        for name_id in name_ids:
+            value = name_table.getDebugName(name_id)
+            if value:
+                return value.strip()
+        return None
+
+    # Typographic names (16/17) group all weights under one family
+    family = name(16, 1)
+    subfamily = name(17, 2) or ""
+    legacy = name(1)
+    aliases = (legacy,) if legacy and legacy != family else ()
+
+    weight = _REGULAR_WEIGHT
+    width = _NORMAL_WIDTH
+    italic = any(token in subfamily.lower() for token in ('italic', 'oblique'))
+    if 'OS/2' in font:
+        os2 = font['OS/2']
+        weight = int(os2.usWeightClass) or _REGULAR_WEIGHT
+        width = int(os2.usWidthClass) or _NORMAL_WIDTH
+        italic = italic or bool(os2.fsSelection & 0x01)
+    elif 'head' in font:
+        italic = italic or bool(font['head'].macStyle & 0x02)
+
+    return FontRecord(
+        path=path,
+        family=family,
+        subfamily=subfamily,
+        weight=weight,
+        width=width,
+        italic=italic,
+        font_number=font_number,
+        aliases=aliases,
+    )
+
+
+class FontCatalog:
+    """Indexed, persistent catalog of fonts found under a set of directories."""
+
+    def __init__(self, font_directories: list[str], index_path: str | os.PathLike | None = None):
+        """
+        Initialize font catalog.
+
+        Args:
+            font_directories: Directories to index (recursively)
+            index_path: JSON index location, defaults to ``default_index_path()``
+        """
+        self.font_directories = [os.path.abspath(d) for d in font_directories]
+        self.index_path = Path(index_path) if index_path else default_index_path()
+
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._records: list[FontRecord] = []
+        self._by_family: dict[str, list[FontRecord]] = {}
+
+        self.stats = {
+            'directories_reused': 0,
+            'directories_scanned': 0,
+            'files_reused': 0,
+            'files_parsed': 0,
+        }
+
+    @property
+    def records(self) -> list[FontRecord]:
+        """All catalogued font faces."""
+        self._ensure_loaded()
+        return self._records
+
+    def families(self) -> list[str]:
+        """Get the family names present in the catalog."""
+        self._ensure_loaded()
+        return sorted({record.family for record in self._records if record.family})
+
+    def find(self, family: str, weight: int = _REGULAR_WEIGHT, italic: bool = False,
+             include_collections: bool = True) -> FontRecord | None:
+        """
+        Find the closest face of a family.
+
+        Args:
+            family: Family name (case/space/hyphen insensitive)
+            weight: Requested CSS weight (100-900)
+            italic: Whether an italic/oblique face is wanted
+            include_collections: Consider faces inside .ttc/.otc collections;
+                callers that only pass the file path on must set this to False
+
+        Returns:
+            Best matching record, or None if the family is not installed
+        """
+        self._ensure_loaded()
+        candidates = self._by_family.get(normalize_family(family))
+        if candidates and not include_collections:
+            candidates = [record for record in candidates if not record.in_collection]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda record: (
+            record.italic != italic,
+            abs(record.weight - weight),
+            abs(record.width - _NORMAL_WIDTH),
+            record.path,
+        ))
+
+    def refresh(self) -> None:
+        """Re-validate against the file system on next access."""
+        with self._lock:
+            self._loaded = False
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get index reuse statistics"""
+        return {
+            **self.stats,
+            'fonts': len(self._records),
+            'families': len(self._by_family),
+            'index_path': str(self.index_path),
+        }
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            index = self._read_index()
+            stored = index.get('directories', {})
+            directories: dict[str, dict[str, Any]] = {}
+            for root in self.font_directories:
+                self._validate_tree(root, stored, directories)
+
+            # Keep other catalogs' directories, drop ones removed under our roots
+            merged = {d: e for d, e in stored.items() if not self._is_indexed_root(d)}
+            merged.update(directories)
+            if merged != stored:
+                index['directories'] = merged
+                self._write_index(index)
+
+            self._build_lookup(directories)
+            self._loaded = True
+
+    def _is_indexed_root(self, directory: str) -> bool:
+        return any(directory == root or directory.startswith(root + os.sep)
+                   for root in self.font_directories)
+
+    def _validate_tree(self, root: str, stored: dict[str, Any], result: dict[str, Any]) -> None:
+        """Collect up-to-date entries for ``root`` and its subdirectories."""
+        pending = [root]
+        while pending:
+            directory = pending.pop()
+            if directory in result:
+                continue
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+
+            entry = stored.get(directory)
+            if entry is not None and entry.get('mtime_ns') == mtime_ns:
+                self.stats['directories_reused'] += 1
+            else:
+                entry = self._scan_directory(directory, mtime_ns, entry)
+                if entry is None:
+                    continue
+            result[directory] = entry
+            pending.extend(os.path.join(directory, name) for name in entry['subdirs'])
+
+    def _scan_directory(self, directory: str, mtime_ns: int,
+                        previous: dict[str, Any] | None) -> dict[str, Any] | None:
+        """List one directory, re-parsing only new or modified font files."""
+        previous_files = previous.get('files', {}) if previous else {}
+        files: dict[str, Any] = {}
+        subdirs: list[str] = []
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            return None
+
+        for dir_entry in entries:
+            try:
+                if dir_entry.is_dir(follow_symlinks=False):
+                    subdirs.append(dir_entry.name)
+                    continue
+                if not dir_entry.name.lower().endswith(FONT_EXTENSIONS):
+                    continue
+                stat = dir_entry.stat()
+            except OSError:
+                continue
+
+            cached = previous_files.get(dir_entry.name)
+            if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+                files[dir_entry.name] = cached
+                self.stats['files_reused'] += 1
+                continue
+
+            records = read_font_records(dir_entry.path)
+            self.stats['files_parsed'] += 1
+            files[dir_entry.name] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'faces': [_record_to_json(record) for record in records],
+            }
+
+        self.stats['directories_scanned'] += 1
+        return {'mtime_ns': mtime_ns, 'subdirs': subdirs, 'files': files}
+
+    def _build_lookup(self, directories: dict[str, Any]) -> None:
+        records: list[FontRecord] = []
+        by_family: dict[str, list[FontRecord]] = {}
+        for directory, entry in directories.items():
+            for filename, file_entry in entry['files'].items():
+                path = os.path.join(directory, filename)
+                for face in file_entry['faces']:
+                    record = _record_from_json(path, face)
+                    records.append(record)
+                    if record.family is None:
+                        continue
+                    keys = {normalize_family(name) for name in (record.family, *record.aliases)}
+                    for key in keys:
+                        by_family.setdefault(key, []).append(record)
+        self._records = records
+        self._by_family = by_family
+
+    def _read_index(self) -> dict[str, Any]:
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            return {'version': _INDEX_VERSION, 'directories': {}}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable font catalog {self.index_path}: {e}")
+            return {'version': _INDEX_VERSION, 'directories': {}}
+
+        if not isinstance(index, dict) or index.get('version') != _INDEX_VERSION:
+            return {'version': _INDEX_VERSION, 'directories': {}}
+        return index
+
+    def _write_index(self, index: dict[str, Any]) -> None:
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.index_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(index, f, separators=(',', ':'))
+                # Atomic publish so concurrent workers never read a partial index
+                os.replace(temp_path, self.index_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write font catalog {self.index_path}: {e}")
+
+
+def _record_to_json(record: FontRecord) -> dict[str, Any]:
+    data = asdict(record)
+    del data['path']
+    data['aliases'] = list(record.aliases)
+    return data
+
+
+def _record_from_json(path: str, data: dict[str, Any]) -> FontRecord:
+    return FontRecord(path=path, **{**data, 'aliases': tuple(data.get('aliases', ()))})
+
+
+_catalogs: dict[tuple[str, ...], FontCatalog] = {}
+_registry_lock = threading.Lock()
+
+
+def get_font_catalog(font_directories: list[str] | None = None) -> FontCatalog:
+    """
+    Get the process-wide catalog for a set of font directories.
+
+    Args:
+        font_directories: Directories to index, defaults to system directories
+
+    Returns:
+        Shared FontCatalog instance
+    """
+    if font_directories is None:
+        font_directories = system_font_directories()
+    key = tuple(os.path.abspath(d) for d in font_directories)
+    with _registry_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = FontCatalog(list(key))
+            _catalogs[key] = catalog
+        return catalog
@@ -11,13 +11,15 @@ This is the foundation for the advanced font processing system.
 """
 
 import os
-import platform
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
 from fontTools.ttLib import TTFont
 from fontTools.ttLib.ttFont import TTLibError
 
+from ..ir.font_metadata import normalize_font_style, parse_font_weight
+from .font_catalog import FontCatalog, get_font_catalog, system_font_directories
+
 
 class FontServiceError(Exception):
     """Exception raised when font service operations fail."""
@@ -70,17 +72,22 @@ class FontService:
         '<': 0.58, '>': 0.58, '"': 0.35, "'": 0.19, '`': 0.33, '~': 0.58,
     }
 
-    def __init__(self, font_directories: list[str] | None = None):
+    def __init__(self, font_directories: list[str] | None = None, enable_indexing: bool = True):
         """
         Initialize FontService with system font directories.
 
         Args:
             font_directories: Optional list of directories to search for fonts.
                              If None, uses platform-specific defaults.
+            enable_indexing: Resolve fonts through the shared persistent
+                             FontCatalog instead of walking directories
         """
         self._font_cache: dict[str, TTFont] = {}
         self._font_directories = font_directories or self._get_system_font_directories()
         self._font_file_cache: dict[str, str | None] = {}
+        self._catalog: FontCatalog | None = (
+            get_font_catalog(self._font_directories) if enable_indexing else None
+        )
 
     def _get_system_font_directories(self) -> list[str]:
         """
@@ -89,30 +96,7 @@ class FontService:
         Returns:
             List of directory paths where fonts are typically installed
         """
-        system = platform.system().lower()
-        directories = []
-
-        if system == "darwin":  # macOS
-            directories.extend([
-                "/System/Library/Fonts",
-                "/Library/Fonts",
-                os.path.expanduser("~/Library/Fonts"),
-            ])
-        elif system == "windows":
-            directories.extend([
-                "C:/Windows/Fonts",
-                os.path.expanduser("~/AppData/Local/Microsoft/Windows/Fonts"),
-            ])
-        elif system == "linux":
-            directories.extend([
-                "/usr/share/fonts",
-                "/usr/local/share/fonts",
-                os.path.expanduser("~/.fonts"),
-                os.path.expanduser("~/.local/share/fonts"),
-            ])
-
-        # Filter to existing directories
-        return [d for d in directories if os.path.exists(d)]
+        return system_font_directories()
 
     def find_font_file(self, font_family: str, font_weight: str = "normal",
                        font_style: str = "normal") -> str | None:
@@ -132,6 +116,11 @@ class FontService:
         if cache_key in self._font_file_cache:
             return self._font_file_cache[cache_key]
 
+        if self._catalog is not None:
+            font_path = self._find_indexed_font_file(font_family, font_weight, font_style)
+            self._font_file_cache[cache_key] = font_path
+            return font_path
+
         font_path = None
 
         # Search in all font directories
@@ -156,6 +145,34 @@ class FontService:
         self._font_file_cache[cache_key] = font_path
         return font_path
 
+    def _find_indexed_font_file(self, font_family: str, font_weight: str,
+                                font_style: str) -> str | None:
+        """
+        Locate font file through the font catalog.
+
+        Matches on name-table family first, then falls back to filename
+        matching over catalogued paths (no directory walk). Faces inside
+        .ttc/.otc collections are skipped: TTFont(path) cannot load them.
+        """
+        if not font_family:
+            return None
+
+        record = self._catalog.find(
+            font_family,
+            weight=parse_font_weight(str(font_weight)),
+            italic=normalize_font_style(str(font_style)) == 'italic',
+            include_collections=False,
+        )
+        if record is not None:
+            return record.path
+
+        for record in self._catalog.records:
+            if record.in_collection:
+                continue
+            if self._matches_font_criteria(record.path, font_family, font_weight, font_style):
+                return record.path
+        return None
+
     def _matches_font_criteria(self, file_path: str, font_family: str,
                               font_weight: str, font_style: str) -> bool:
         """
@@ -303,6 +320,18 @@ class FontService:
         Returns:
             List of dictionaries with font information
         """
+        if self._catalog is not None:
+            paths = dict.fromkeys(record.path for record in self._catalog.records)
+            return [
+                {
+                    'path': path,
+                    'filename': os.path.basename(path),
+                    'directory': os.path.dirname(path),
+                }
+                for path in paths
+                if path.lower().endswith(('.ttf', '.otf'))
+            ]
+
         fonts = []
 
         for directory in self._font_directories:
@@ -326,9 +355,11 @@ class FontService:
         return fonts
 
     def clear_cache(self):
-        """Clear font and file caches."""
+        """Clear font and file caches and re-validate the font catalog."""
         self._font_cache.clear()
         self._font_file_cache.clear()
+        if self._catalog is not None:
+            self._catalog.refresh()
 
     def get_cache_stats(self) -> dict[str, int]:
         """
@@ -337,11 +368,14 @@ class FontService:
         Returns:
             Dictionary with cache size information
         """
-        return {
+        stats = {
             'loaded_fonts': len(self._font_cache),
             'font_file_paths': len(self._font_file_cache),
             'font_directories': len(self._font_directories),
         }
+        if self._catalog is not None:
+            stats['catalog_fonts'] = self._catalog.get_statistics()['fonts']
+        return stats
 
     def get_metrics(self, font_family: str) -> FontMetrics:
         """Get font metrics for family."""
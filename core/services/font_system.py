@@ -27,6 +27,7 @@ from ..ir.font_metadata import (
     normalize_font_style,
     parse_font_weight,
 )
+from .font_catalog import FontCatalog, get_font_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -329,8 +330,7 @@ class FontSystem:
             except ImportError:
                 logger.debug("Matplotlib not available for font detection")
 
-            # Basic fallback detector
-            from .basic_font_detector import BasicFontDetector
+            # Basic fallback detector backed by the shared font catalog
             return BasicFontDetector()
 
         except Exception as e:
@@ -419,9 +419,10 @@ def create_font_system(config: FontSystemConfig | None = None) -> FontSystem:
 
 # Basic font detector fallback
 class BasicFontDetector:
-    """Basic font detector that doesn't require external dependencies."""
+    """Basic font detector backed by the persistent system font catalog."""
 
-    def __init__(self):
+    def __init__(self, catalog: FontCatalog | None = None):
+        self._catalog = catalog or get_font_catalog()
         self._common_fonts = {
             'Arial', 'Helvetica', 'Times New Roman', 'Times',
             'Courier New', 'Courier', 'Verdana', 'Georgia',
@@ -431,9 +432,10 @@ class BasicFontDetector:
         }
 
     def find_font_file(self, family: str, weight: int, italic: bool) -> str | None:
-        """Basic font file detection (returns None - no embedding support)."""
-        return None
+        """Find an installed font file through the catalog."""
+        record = self._catalog.find(family, weight=weight, italic=italic, include_collections=False)
+        return record.path if record else None
 
     def list_system_fonts(self) -> list[str]:
-        """Return list of commonly available fonts."""
-        return list(self._common_fonts)
\ No newline at end of file
+        """Return commonly available fonts plus catalogued families."""
+        return sorted(self._common_fonts.union(self._catalog.families()))
\ No newline at end of file
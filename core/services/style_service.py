@@ -13,10 +13,13 @@ Lightweight CSS engine that properly handles:
 from __future__ import annotations
 
 import re
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from lxml import etree as ET
 
+from ..css.declaration_cache import parse_inline_declarations
+
 # Presentation attribute → CSS property mapping (SVG spec subset)
 PRESENTATION_MAP = {
     "fill": "fill",
@@ -70,15 +73,28 @@ RULE_SPLIT_RE = re.compile(r'}')
 SELECTOR_SPLIT_RE = re.compile(r'\s*,\s*')
 
 
-def parse_inline_style(style_value: str) -> dict[str, str]:
-    """Parse inline style attribute into property dict."""
-    out = {}
-    for m in DECL_RE.finditer(style_value or ""):
+IMPORTANT_RE = re.compile(r'\s*!\s*important\s*$', re.IGNORECASE)
+
+
+def _parse_declarations(style_value: str) -> tuple[tuple[str, str, bool], ...]:
+    """Parse a declaration list with the lightweight regex grammar (uncached)."""
+    out = []
+    for m in DECL_RE.finditer(style_value):
         prop, val = m.group(1).strip(), m.group(2).strip()
         # Remove !important for now (could track priority separately)
-        val = re.sub(r'\s*!\s*important\s*$', '', val, flags=re.IGNORECASE)
-        out[prop] = val
-    return out
+        stripped = IMPORTANT_RE.sub('', val)
+        out.append((prop, stripped, stripped != val))
+    return tuple(out)
+
+
+def parse_inline_style(style_value: str) -> dict[str, str]:
+    """
+    Parse inline style attribute into property dict.
+
+    Goes through the process-wide declaration cache shared with
+    StyleResolver, so each distinct style string is parsed once.
+    """
+    return {prop: val for prop, val, _important in parse_inline_declarations(style_value, _parse_declarations)}
 
 
 def _specificity(selector: str) -> tuple[int, int, int]:
@@ -172,6 +188,69 @@ def _matches(element: ET.Element, selector: str) -> bool:
     return tag == selector
 
 
+def _local_tag(element: ET.Element) -> str | None:
+    """Get element tag without namespace (None for comments/PIs)."""
+    tag = element.tag
+    if not isinstance(tag, str):
+        return None
+    if tag.startswith('{'):
+        return tag.split('}', 1)[1]
+    return tag
+
+
+class RuleIndex:
+    """
+    CSS rules bucketed by the key their selector tests.
+
+    Each element only looks up the buckets for its id, its classes and its
+    tag instead of testing every rule, so matching cost no longer grows with
+    the size of the stylesheet.
+    """
+
+    def __init__(self, rules: list[tuple[str, dict[str, str], tuple[int, int, int], int]]):
+        self.by_id: dict[str, list[tuple[tuple[int, int, int], int, int]]] = {}
+        self.by_class: dict[str, list[tuple[tuple[int, int, int], int, int]]] = {}
+        self.by_tag: dict[str, list[tuple[tuple[int, int, int], int, int]]] = {}
+
+        for position, (sel, _decls, spec, order) in enumerate(rules):
+            sel = sel.strip()
+            entry = (spec, order, position)
+            if sel.startswith('#'):
+                self.by_id.setdefault(sel[1:], []).append(entry)
+            elif sel.startswith('.'):
+                self.by_class.setdefault(sel[1:], []).append(entry)
+            else:
+                self.by_tag.setdefault(sel, []).append(entry)
+
+    def match(self, element: ET.Element) -> tuple[int, ...]:
+        """
+        Find rules matching an element.
+
+        Returns:
+            Positions into the rule list, in cascade order (ascending
+            specificity, then source order)
+        """
+        candidates = []
+
+        element_id = element.get('id')
+        if element_id is not None and element_id in self.by_id:
+            candidates.extend(self.by_id[element_id])
+
+        class_attr = element.get('class')
+        if class_attr and self.by_class:
+            for cls in dict.fromkeys(class_attr.split()):
+                bucket = self.by_class.get(cls)
+                if bucket:
+                    candidates.extend(bucket)
+
+        tag = _local_tag(element)
+        if tag is not None and tag in self.by_tag:
+            candidates.extend(self.by_tag[tag])
+
+        candidates.sort()
+        return tuple(position for _, _, position in candidates)
+
+
 def _merge(dst: dict[str, str], src: dict[str, str]) -> None:
     """Merge source properties into destination."""
     for k, v in src.items():
@@ -189,6 +268,8 @@ class StyleService:
     - Provides convenience methods for common property access
     """
 
+    STYLE_MEMO_SIZE = 4096
+
     def __init__(self, svg_root: Optional[Any] = None) -> None:  # ET.Element is not a type
         """
         Initialize StyleService.
@@ -197,6 +278,12 @@ class StyleService:
             svg_root: Optional SVG root element to parse styles from
         """
         self.rules: list[tuple[str, dict[str, str], tuple[int, int, int], int]] = []
+        self._rule_index: RuleIndex | None = None
+        self._rule_index_key: tuple[int, int] | None = None
+        # (matched rules, inherited values, presentation attrs, inline style) -> style
+        self._style_memo: OrderedDict[tuple, dict[str, str]] = OrderedDict()
+        self._memo_hits = 0
+        self._memo_misses = 0
         if svg_root is not None:
             self._collect_style_rules(svg_root)
 
@@ -210,6 +297,15 @@ class StyleService:
                 if css_text.strip():
                     self.rules.extend(parse_css(css_text))
 
+    def _get_rule_index(self) -> RuleIndex:
+        """Get the selector index, rebuilding it if ``self.rules`` changed."""
+        key = (id(self.rules), len(self.rules))
+        if self._rule_index is None or self._rule_index_key != key:
+            self._rule_index = RuleIndex(self.rules)
+            self._rule_index_key = key
+            self._style_memo.clear()
+        return self._rule_index
+
     def compute_style(self,
                      element: ET.Element,
                      parent_style: dict[str, str] | None = None) -> dict[str, str]:
@@ -222,43 +318,67 @@ class StyleService:
         3. Presentation attributes on the element
         4. Inline style="" attribute (highest priority)
 
+        Elements with the same matched rules, inherited values, presentation
+        attributes and inline style share one memoized result.
+
         Args:
             element: The element to compute style for
             parent_style: Parent element's computed style for inheritance
 
         Returns:
-            Dict of computed CSS properties
+            Dict of computed CSS properties (a fresh copy, safe to mutate)
         """
-        # 1) Start with inherited properties from parent
-        style: dict[str, str] = {}
-        if parent_style:
-            for k in INHERITED:
-                if k in parent_style:
-                    style[k] = parent_style[k]
+        matched = self._get_rule_index().match(element)
+        inherited = tuple(
+            (k, v) for k, v in parent_style.items() if k in INHERITED
+        ) if parent_style else ()
+        presentation = tuple(
+            (attr, value) for attr, value in element.attrib.items() if attr in PRESENTATION_MAP
+        )
+        inline = element.get('style')
 
-        # 2) Apply matching CSS rules sorted by specificity then source order
-        applicable = []
-        for sel, decls, spec, order in self.rules:
-            if _matches(element, sel):
-                applicable.append((spec, order, decls))
+        memo_key = (matched, inherited, presentation, inline)
+        style = self._style_memo.get(memo_key)
+        if style is not None:
+            self._style_memo.move_to_end(memo_key)
+            self._memo_hits += 1
+            return dict(style)
+        self._memo_misses += 1
 
-        # Sort by specificity (ascending), then by source order (ascending)
-        applicable.sort(key=lambda t: (t[0], t[1]))
+        # 1) Start with inherited properties from parent
+        style = dict(inherited)
 
-        for _, _, decls in applicable:
-            _merge(style, decls)
+        # 2) Apply matching CSS rules sorted by specificity then source order
+        for position in matched:
+            _merge(style, self.rules[position][1])
 
         # 3) Apply presentation attributes
-        for attr, prop in PRESENTATION_MAP.items():
-            if attr in element.attrib:
-                style[prop] = element.attrib[attr]
+        for attr, value in presentation:
+            style[PRESENTATION_MAP[attr]] = value
 
         # 4) Apply inline style="" (highest priority)
-        inline = element.get('style')
         if inline:
             _merge(style, parse_inline_style(inline))
 
-        return style
+        self._style_memo[memo_key] = style
+        if len(self._style_memo) > self.STYLE_MEMO_SIZE:
+            self._style_memo.popitem(last=False)
+        return dict(style)
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get rule index and computed-style memo statistics"""
+        index = self._get_rule_index()
+        lookups = self._memo_hits + self._memo_misses
+        return {
+            'rules': len(self.rules),
+            'id_buckets': len(index.by_id),
+            'class_buckets': len(index.by_class),
+            'tag_buckets': len(index.by_tag),
+            'memo_size': len(self._style_memo),
+            'memo_hits': self._memo_hits,
+            'memo_misses': self._memo_misses,
+            'memo_hit_rate': self._memo_hits / lookups if lookups else 0.0,
+        }
 
     # --- Convenience methods for common property access ---
 
@@ -8,6 +8,9 @@ and baked into coordinates, eliminating the need to store transform fields in IR
 """
 
 from typing import List, Optional
+
+import numpy as np
+
 from .core import Matrix
 
 
@@ -88,6 +91,26 @@ class CoordinateSpace:
         ctm = self.ctm_stack[-1]
         return ctm.transform_points(points)
 
+    def apply_ctm_to_array(self, points: np.ndarray) -> np.ndarray:
+        """
+        Apply current CTM to an ``(N, 2)`` coordinate array in one batch.
+
+        Args:
+            points: Array of x, y rows
+
+        Returns:
+            New ``(N, 2)`` float64 array of transformed coordinates
+        """
+        ctm = self.ctm_stack[-1]
+        points = np.asarray(points, dtype=np.float64)
+        xs = points[:, 0]
+        ys = points[:, 1]
+        result = np.empty_like(points)
+        # Same operation order as Matrix.transform_point, so results match exactly
+        result[:, 0] = ctm.a * xs + ctm.c * ys + ctm.e
+        result[:, 1] = ctm.b * xs + ctm.d * ys + ctm.f
+        return result
+
     @property
     def current_ctm(self) -> Matrix:
         """
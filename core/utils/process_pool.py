@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Process pool start method.
+
+Worker pools are created from threaded processes (the API server, Huey
+workers), so they start with forkserver (spawn where unavailable) rather
+than fork: forked children would inherit the parent's threads, locks and
+sockets in whatever state they were in.
+"""
+
+import multiprocessing
+
+
+def process_pool_context() -> multiprocessing.context.BaseContext:
+    """Get the multiprocessing context process pools should be started with."""
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
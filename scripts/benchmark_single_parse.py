@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Single-Parse Pipeline Benchmark
+
+Compares the parse + analyze stages of CleanSlateConverter with and without
+PipelineConfig.single_parse. In the legacy mode the analyzer serializes the
+parsed DOM and runs SVGParser.parse_to_ir on the string, so every document is
+parsed, normalized and clip-collected twice.
+
+Usage:
+    python scripts/benchmark_single_parse.py [element_count] [iterations]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.analyze import SVGAnalyzer
+from core.parse import SVGParser
+
+
+def generate_dashboard_svg(element_count: int) -> str:
+    """Generate a dashboard-like SVG with mixed shapes, paths and text."""
+    parts = ['<svg xmlns="http://www.w3.org/2000/svg" width="1920" height="1080" viewBox="0 0 1920 1080">']
+    per_group = 50
+    for group_index in range(0, element_count, per_group):
+        parts.append(f'<g transform="translate({group_index % 1800} {(group_index // 1800) * 20})">')
+        for i in range(min(per_group, element_count - group_index)):
+            kind = i % 4
+            if kind == 0:
+                parts.append(f'<rect x="{i}" y="{i % 7}" width="8" height="{4 + i % 9}" fill="#3366cc"/>')
+            elif kind == 1:
+                parts.append(f'<path d="M{i} 0 L{i + 5} 10 C{i} 12 {i + 3} 14 {i + 6} 16 Z" fill="#dc3912"/>')
+            elif kind == 2:
+                parts.append(f'<circle cx="{i}" cy="{i % 11}" r="3" fill="#ff9900"/>')
+            else:
+                parts.append(f'<text x="{i}" y="20" font-size="8">v{i}</text>')
+        parts.append('</g>')
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def run_stage(svg_content: str, single_parse: bool) -> tuple[float, float, int]:
+    """Run parse + analyze once, returning (time_ms, peak_mb, scene_size)."""
+    parser = SVGParser()
+    analyzer = SVGAnalyzer()
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    parse_result = parser.parse(svg_content)
+    if single_parse:
+        analysis = analyzer.analyze(parse_result.svg_root, parse_result=parse_result, parser=parser)
+    else:
+        analysis = analyzer.analyze(parse_result.svg_root)
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed_ms, peak / (1024 * 1024), len(analysis.scene)
+
+
+def main() -> None:
+    element_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    svg_content = generate_dashboard_svg(element_count)
+    print(f"Single-parse benchmark: {element_count:,} elements, {iterations} iterations")
+
+    results = {}
+    for label, single_parse in (("re-parse (before)", False), ("single-parse (after)", True)):
+        times, peaks = [], []
+        scene_size = 0
+        for _ in range(iterations):
+            elapsed_ms, peak_mb, scene_size = run_stage(svg_content, single_parse)
+            times.append(elapsed_ms)
+            peaks.append(peak_mb)
+        results[label] = (min(times), max(peaks))
+        print(f"  {label:<22} best {min(times):9.1f} ms   peak {max(peaks):8.1f} MB   scene {scene_size}")
+
+    before_ms, before_mb = results["re-parse (before)"]
+    after_ms, after_mb = results["single-parse (after)"]
+    print(f"  speedup: {before_ms / after_ms:.2f}x   peak memory: {after_mb / before_mb:.0%} of before")
+
+
+if __name__ == "__main__":
+    main()
@@ -144,7 +144,7 @@ def generate_baseline_pptx(svg_path: str, output_path: Path) -> Dict:
             "svg_path": svg_path,
             "pptx_path": str(output_path.relative_to(project_root)),
             "svg_size_bytes": len(svg_content),
-            "pptx_size_bytes": len(result.output_data),
+            "pptx_size_bytes": result.output_size,
             "conversion_time_ms": result.total_time_ms,
             "element_count": result.elements_processed,
             "success": True,
@@ -232,6 +232,26 @@ class TestSVGAnalyzer:
         assert result.complexity_score >= 0.0
         assert result.element_count >= 0
 
+    def test_shared_parse_result_skips_reparse(self, analyzer):
+        """Test that a ParseResult from the pipeline is converted without re-parsing."""
+        from core.parse import SVGParser
+
+        parser = SVGParser()
+        parse_result = parser.parse(
+            '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">'
+            '<rect x="10" y="10" width="20" height="20" fill="red"/>'
+            '<path d="M 0 0 L 50 50" stroke="blue"/>'
+            '</svg>'
+        )
+
+        with patch.object(SVGParser, 'parse', side_effect=AssertionError("re-parsed")):
+            shared = analyzer.analyze(parse_result.svg_root, parse_result=parse_result, parser=parser)
+
+        standalone = analyzer.analyze(parse_result.svg_root)
+
+        assert len(shared.scene) == len(standalone.scene) == 2
+        assert shared.complexity_score == pytest.approx(standalone.complexity_score)
+
     def test_performance_benchmarks(self, analyzer, complex_svg):
         """Test that analysis completes within reasonable time."""
         import time
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Unit tests for single-pass tree statistics collection.
+"""
+
+import pytest
+from lxml import etree as ET
+
+from core.analyze.tree_statistics import TreeStatistics, collect_tree_statistics
+
+
+@pytest.fixture
+def mixed_svg():
+    return ET.fromstring('''<svg xmlns="http://www.w3.org/2000/svg"
+        xmlns:xlink="http://www.w3.org/1999/xlink" width="400" height="300">
+        <!-- comments are not elements -->
+        <defs>
+            <linearGradient id="grad1"><stop offset="0.12345" stop-color="red"/></linearGradient>
+            <clipPath id="clip1"><rect width="10" height="10"/></clipPath>
+        </defs>
+        <g transform="translate(5 5)">
+            <g clip-path="url(#clip1)">
+                <path d="M 0 0 C 1 1 2 2 3 3 Z" fill="url(#grad1)"/>
+            </g>
+        </g>
+        <a><g><g><rect x="1.5" y="2" width="3" height="4"/></g></g></a>
+        <text x="10" y="20" dx="2">Hi <tspan/><tspan/><tspan/><tspan/></text>
+        <use xlink:href="#grad1"/>
+        <animate attributeName="opacity"/>
+    </svg>''')
+
+
+class TestCollectTreeStatistics:
+
+    def test_counts_each_element_once(self, mixed_svg):
+        stats = collect_tree_statistics(mixed_svg)
+
+        assert isinstance(stats, TreeStatistics)
+        assert stats.total_elements == 20
+        assert stats.element_counts['g'] == 4
+        assert stats.element_counts['tspan'] == 4
+        assert 'svg' not in stats.element_counts
+
+    def test_feature_flags(self, mixed_svg):
+        stats = collect_tree_statistics(mixed_svg)
+
+        assert stats.feature_flags() == {
+            'has_transforms': True,
+            'has_clipping': True,
+            'has_patterns': False,
+            'has_animations': True,
+        }
+        assert {'has_gradients', 'has_filters'} & stats.features == {'has_gradients'}
+
+    def test_group_nesting_follows_direct_group_chain(self, mixed_svg):
+        stats = collect_tree_statistics(mixed_svg)
+
+        # The <g><g> under <a> is not part of a direct chain from the root
+        assert stats.group_nesting_depth == 2
+        assert stats.max_nesting_depth == 4
+
+    def test_references_and_defs(self, mixed_svg):
+        stats = collect_tree_statistics(mixed_svg)
+
+        assert stats.defs_child_count == 2
+        assert stats.first_defs_child_count == 2
+        assert stats.url_reference_count == 2
+        assert stats.href_count == 1
+        assert stats.use_count == 1
+
+    def test_text_content_uses_descendant_tspans(self, mixed_svg):
+        stats = collect_tree_statistics(mixed_svg)
+
+        # <text> has 4 tspans (+0.4) and dx (+0.2); the four empty tspans score 0
+        assert stats.text_content_complexity == pytest.approx(0.6 / 5)
+
+    def test_precision_flags(self, mixed_svg):
+        stats = collect_tree_statistics(mixed_svg)
+
+        # offset="0.12345" is high precision but not a suggestion attribute
+        assert stats.precision_complexity == pytest.approx(0.5)
+        assert not stats.has_high_precision_coordinates
+
+    def test_empty_svg(self):
+        stats = collect_tree_statistics(ET.fromstring('<svg xmlns="http://www.w3.org/2000/svg"/>'))
+
+        assert stats.total_elements == 1
+        assert stats.element_counts == {}
+        assert stats.text_complexity == 0.0
+        assert stats.first_defs_child_count is None
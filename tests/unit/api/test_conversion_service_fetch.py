@@ -0,0 +1,107 @@
+"""
+Unit tests for ConversionService URL fetching through the shared HTTP fetcher.
+
+Tests _fetch_svg_content_pooled() validation and error mapping without
+touching the network or Google services.
+"""
+
+import sys
+import types
+
+import pytest
+import requests
+
+# Provide lightweight stubs for external services that the conversion service imports.
+for _name, _service, _error in (
+    ("api.services.google_drive", "GoogleDriveService", "GoogleDriveError"),
+    ("api.services.google_slides", "GoogleSlidesService", "GoogleSlidesError"),
+):
+    if _name not in sys.modules:
+        _stub = types.ModuleType(_name)
+        setattr(_stub, _service, type(_service, (), {}))
+        setattr(_stub, _error, RuntimeError)
+        sys.modules[_name] = _stub
+
+from api.services import conversion_service
+from api.services.conversion_service import MAX_SVG_BYTES, ConversionError, ConversionService
+from core.batch.http_fetcher import FetchError, FetchResult
+
+SVG = b'<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"/>'
+
+
+class FetcherStub:
+    """Records fetch calls and returns or raises a canned outcome."""
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.calls = []
+
+    def fetch(self, url, timeout=None, max_bytes=None):
+        self.calls.append((url, timeout, max_bytes))
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+def _result(content=SVG, content_type='image/svg+xml', not_modified=False):
+    return FetchResult(url='https://example.com/a.svg', content=content, content_type=content_type,
+                       content_hash='hash', not_modified=not_modified)
+
+
+@pytest.fixture
+def service():
+    # Skip __init__: it connects to Google Drive and Slides
+    return ConversionService.__new__(ConversionService)
+
+
+@pytest.fixture
+def use_fetcher(monkeypatch):
+    def install(outcome):
+        fetcher = FetcherStub(outcome)
+        monkeypatch.setattr(conversion_service, 'get_http_fetcher', lambda: fetcher)
+        return fetcher
+    return install
+
+
+class TestFetchSvgContentPooled:
+    """Test the pooled fetch path applies the shared checks."""
+
+    def test_returns_fetched_svg(self, service, use_fetcher):
+        fetcher = use_fetcher(_result(not_modified=True))
+
+        assert service._fetch_svg_content_pooled('https://example.com/a.svg') == SVG
+        assert fetcher.calls == [('https://example.com/a.svg', 30, MAX_SVG_BYTES)]
+
+    @pytest.mark.parametrize('url', ['ftp://example.com/a.svg', 'file:///etc/passwd', 'not a url'])
+    def test_rejects_unsupported_urls_before_fetching(self, service, use_fetcher, url):
+        fetcher = use_fetcher(_result())
+
+        with pytest.raises(ConversionError):
+            service._fetch_svg_content_pooled(url)
+        assert fetcher.calls == []
+
+    def test_rejects_non_svg_body(self, service, use_fetcher):
+        use_fetcher(_result(content=b'<html></html>', content_type='text/html'))
+
+        with pytest.raises(ConversionError, match='valid SVG'):
+            service._fetch_svg_content_pooled('https://example.com/a.svg')
+
+    def test_oversized_body_reported_as_too_large(self, service, use_fetcher):
+        use_fetcher(FetchError('body exceeds limit'))
+
+        with pytest.raises(ConversionError, match='too large'):
+            service._fetch_svg_content_pooled('https://example.com/a.svg')
+
+    def test_http_errors_mapped(self, service, use_fetcher):
+        response = requests.Response()
+        response.status_code = 404
+        use_fetcher(requests.HTTPError('not found', response=response))
+
+        with pytest.raises(ConversionError, match='HTTP 404'):
+            service._fetch_svg_content_pooled('https://example.com/a.svg')
+
+    def test_timeouts_mapped(self, service, use_fetcher):
+        use_fetcher(requests.Timeout('slow'))
+
+        with pytest.raises(ConversionError, match='Timeout'):
+            service._fetch_svg_content_pooled('https://example.com/a.svg')
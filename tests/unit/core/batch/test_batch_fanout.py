@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for parallel batch conversion fan-out.
+"""
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from core.batch.tasks import (
+    _get_batch_pool,
+    _resolve_batch_workers,
+    convert_files_parallel,
+    package_presentations,
+    process_svg_batch,
+    shutdown_batch_pools,
+)
+
+
+def _svg(width: int) -> bytes:
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="100">'
+        f'<rect x="0" y="0" width="{width}" height="50" fill="blue"/></svg>'
+    ).encode()
+
+
+@pytest.fixture
+def file_list():
+    return [
+        {'filename': 'first.svg', 'content': _svg(100)},
+        {'filename': 'broken.txt', 'content': b'not an svg'},
+        {'filename': 'third.svg', 'content': _svg(300)},
+    ]
+
+
+class TestConvertFilesParallel:
+    """Test that fan-out keeps input order and isolates failures."""
+
+    @pytest.mark.parametrize('max_workers', [1, 3])
+    def test_results_in_input_order(self, file_list, max_workers):
+        results = convert_files_parallel(file_list, {'max_workers': max_workers})
+
+        assert [r['input_filename'] for r in results] == ['first.svg', 'broken.txt', 'third.svg']
+        assert [r['success'] for r in results] == [True, False, True]
+        assert all(Path(r['output_path']).exists() for r in results if r['success'])
+
+    def test_worker_exception_isolated(self, file_list):
+        # Non-bytes content fails inside the worker
+        file_list[0]['content'] = None
+
+        results = convert_files_parallel(file_list, {'max_workers': 2})
+
+        assert results[0]['success'] is False
+        assert results[0]['input_filename'] == 'first.svg'
+        assert results[2]['success'] is True
+
+
+class TestResolveBatchWorkers:
+    """Test worker count resolution."""
+
+    def test_option_capped_by_file_count(self):
+        assert _resolve_batch_workers(3, {'max_workers': 8}) == 3
+
+    def test_environment_default(self, monkeypatch):
+        monkeypatch.setenv('SVG2PPTX_BATCH_WORKERS', '2')
+
+        assert _resolve_batch_workers(10, {}) == 2
+
+
+class TestInMemoryPackaging:
+    """Test single-deck batches packaged straight from embedder results."""
+
+    def test_batch_packaged_without_per_file_pptx(self, file_list):
+        result = process_svg_batch.call_local(file_list, {'max_workers': 1})
+
+        with zipfile.ZipFile(result['output_path']) as package:
+            slides = sorted(n for n in package.namelist() if n.startswith('ppt/slides/slide'))
+
+        assert result['success'] is True
+        assert result['total_files_processed'] == 2
+        assert result['failed_files'] == 1
+        assert slides == ['ppt/slides/slide1.xml', 'ppt/slides/slide2.xml']
+        assert all(r['output_path'] is None for r in result['individual_results'] if r['success'])
+        assert all('embedder_result' not in r for r in result['individual_results'])
+
+    def test_slide_order_follows_input(self, file_list):
+        results = convert_files_parallel(file_list, {'return_embedder_result': True, 'max_workers': 1})
+
+        package = package_presentations.call_local(results)
+
+        with zipfile.ZipFile(package['output_path']) as pptx:
+            slide1 = pptx.read('ppt/slides/slide1.xml')
+            slide2 = pptx.read('ppt/slides/slide2.xml')
+
+        assert slide1 == results[0]['embedder_result'].slide_xml.encode('utf-8')
+        assert slide2 == results[2]['embedder_result'].slide_xml.encode('utf-8')
+        assert [r['input_filename'] for r in package['individual_results']] == [
+            'first.svg', 'broken.txt', 'third.svg',
+        ]
+
+
+class TestBatchPoolReuse:
+    """Test that batches share one warm conversion pool per worker."""
+
+    def test_pool_reused_across_batches(self, file_list):
+        try:
+            convert_files_parallel(file_list, {'max_workers': 2})
+            pool = _get_batch_pool(2)
+            results = convert_files_parallel(file_list, {'max_workers': 2})
+
+            assert _get_batch_pool(2) is pool
+            assert [r['success'] for r in results] == [True, False, True]
+        finally:
+            shutdown_batch_pools()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded conversion executor used by the async API handlers.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from core.batch.conversion_executor import (
+    ConversionExecutor,
+    ConversionTimeoutError,
+    ExecutorSaturatedError,
+    _WorkerProcessPool,
+)
+from core.utils.process_pool import process_pool_context
+
+SVG = ('<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">'
+       '<rect x="10" y="10" width="50" height="40" fill="red"/></svg>')
+
+
+def _busy(seconds: float) -> float:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+    return seconds
+
+
+class TestConversionExecutor:
+    """Test warm conversion, backpressure and timeouts."""
+
+    def test_process_pool_converts_without_blocking_event_loop(self):
+        executor = ConversionExecutor(max_workers=1, max_queue=0)
+        executor.start()
+
+        async def scenario():
+            ticks = 0
+
+            async def heartbeat():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            beat = asyncio.create_task(heartbeat())
+            await executor.run(_busy, 0.5)
+            data = await executor.convert(SVG)
+            beat.cancel()
+            return ticks, data
+
+        try:
+            ticks, data = asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+
+        assert data.startswith(b'PK')
+        assert ticks >= 10
+        assert executor.get_statistics()['completed'] == 2
+
+    def test_rejects_when_saturated(self):
+        executor = ConversionExecutor(max_workers=1, max_queue=1, use_processes=False)
+
+        async def scenario():
+            tasks = [asyncio.create_task(executor.run(time.sleep, 0.2)) for _ in range(3)]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            results = asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+
+        assert [type(result) for result in results].count(ExecutorSaturatedError) == 1
+        stats = executor.get_statistics()
+        assert stats['rejected'] == 1
+        assert stats['in_flight'] == 0
+
+    def test_timeout_keeps_slot_until_worker_finishes(self):
+        executor = ConversionExecutor(max_workers=1, max_queue=1, use_processes=False)
+
+        async def scenario():
+            running = asyncio.create_task(executor.run(time.sleep, 0.3, timeout=0.05))
+            queued = asyncio.create_task(executor.run(time.sleep, 0.3, timeout=0.05))
+            outcomes = await asyncio.gather(running, queued, return_exceptions=True)
+            # The queued call was cancelled; the running one still occupies the worker
+            in_flight_after_timeout = executor.in_flight
+            await asyncio.sleep(0.4)
+            return outcomes, in_flight_after_timeout
+
+        try:
+            outcomes, in_flight_after_timeout = asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+
+        assert all(isinstance(outcome, ConversionTimeoutError) for outcome in outcomes)
+        assert in_flight_after_timeout == 1
+        assert executor.in_flight == 0
+        assert executor.get_statistics()['timed_out'] == 2
+
+    def test_timeout_recycles_hung_process_worker(self):
+        executor = ConversionExecutor(max_workers=1, max_queue=0)
+        executor.start(warm=False)
+
+        async def scenario():
+            first_pid = await executor.run(os.getpid)
+            with pytest.raises(ConversionTimeoutError):
+                await executor.run(_busy, 30.0, timeout=0.5)
+            # The hung worker was terminated, so its slot frees up right away
+            for _ in range(100):
+                if executor.in_flight == 0:
+                    break
+                await asyncio.sleep(0.05)
+            in_flight_after_timeout = executor.in_flight
+            return first_pid, await executor.run(os.getpid, timeout=30), in_flight_after_timeout
+
+        try:
+            first_pid, second_pid, in_flight_after_timeout = asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+
+        assert in_flight_after_timeout == 0
+        assert second_pid != first_pid
+        assert executor.get_statistics()['timed_out'] == 1
+
+    def test_timeout_spares_concurrent_conversions(self):
+        executor = ConversionExecutor(max_workers=2, max_queue=0)
+        executor.start(warm=False)
+
+        async def scenario():
+            survivor = asyncio.create_task(executor.run(_busy, 1.5, timeout=30))
+            hung = asyncio.create_task(executor.run(_busy, 30.0, timeout=0.5))
+            return await asyncio.gather(survivor, hung, return_exceptions=True)
+
+        try:
+            survivor, hung = asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+
+        assert survivor == 1.5
+        assert isinstance(hung, ConversionTimeoutError)
+        stats = executor.get_statistics()
+        assert stats['completed'] == 1
+        assert stats['timed_out'] == 1
+
+    def test_terminate_before_send_never_runs_task(self, tmp_path, monkeypatch):
+        pool = _WorkerProcessPool(max_workers=1, mp_context=process_pool_context())
+        slot = pool._slots[0]
+        started = threading.Event()
+        terminated = threading.Event()
+        ensure_started = slot.ensure_started
+
+        def start_then_wait_for_timeout():
+            ensure_started()
+            started.set()
+            terminated.wait(30)
+
+        monkeypatch.setattr(slot, 'ensure_started', start_then_wait_for_timeout)
+        marker = tmp_path / 'ran'
+        try:
+            future = pool.submit(Path.touch, marker)
+            assert started.wait(30)
+            # Timeout lands after the slot was picked but before the task was sent
+            assert pool.terminate(future)
+            terminated.set()
+            with pytest.raises(ConversionTimeoutError):
+                future.result(timeout=30)
+            assert pool.submit(os.getpid).result(timeout=30) == slot.process.pid
+        finally:
+            pool.shutdown()
+
+        assert not marker.exists()
+
+    def test_conversion_errors_propagate(self):
+        executor = ConversionExecutor(max_workers=1, use_processes=False)
+
+        try:
+            with pytest.raises(Exception):
+                asyncio.run(executor.convert('<not-svg'))
+        finally:
+            executor.shutdown()
+
+        assert executor.get_statistics()['failed'] == 1
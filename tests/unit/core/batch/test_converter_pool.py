@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-process converter pool used by batch workers.
+"""
+
+import pytest
+
+from core.batch.converter_pool import ConverterPool, get_converter_pool
+from core.pipeline.config import PipelineConfig
+from core.pipeline.error_reporter import ErrorCategory, ErrorSeverity
+from core.policy.config import PolicyConfig
+
+SVG = ('<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">'
+       '<rect x="10" y="10" width="50" height="40" fill="red"/></svg>')
+
+PATH_SVG = ('<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">'
+            '<path d="M0 0 L10 10 L0 10 Z" fill="red"/></svg>')
+
+
+class _FakeConverter:
+    def __init__(self, config=None):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class TestConverterPool:
+    """Test converter reuse and per-conversion state reset."""
+
+    def test_converter_reused_between_acquisitions(self):
+        pool = ConverterPool()
+
+        with pool.acquire() as first:
+            first.convert_string(SVG)
+        with pool.acquire() as second:
+            second.convert_string(SVG)
+
+        stats = pool.get_statistics()
+        assert second is first
+        assert stats['created'] == 1
+        assert stats['reused'] == 1
+        assert stats['reuse_rate'] == pytest.approx(0.5)
+
+    def test_reused_converter_produces_identical_output(self):
+        pool = ConverterPool()
+
+        with pool.acquire() as converter:
+            first = converter.convert_string(SVG).output_data
+            converter.error_reporter.report_error('stale', ErrorSeverity.MEDIUM, ErrorCategory.MAPPING)
+        with pool.acquire() as converter:
+            assert not converter.has_errors()
+            assert converter.embedder._shape_id_counter == 2
+            second = converter.convert_string(SVG).output_data
+
+        assert len(first) == len(second)
+
+    def test_statistics_do_not_leak_between_checkouts(self):
+        pool = ConverterPool()
+
+        with pool.acquire() as converter:
+            converter.convert_string(PATH_SVG)
+            assert converter.get_statistics()['mapper_stats']['path']['total_mapped'] == 1
+            assert converter.policy.get_metrics().total_decisions > 0
+        with pool.acquire() as converter:
+            stats = converter.get_statistics()
+            assert stats['total_conversions'] == 0
+            assert stats['mapper_stats']['path']['total_mapped'] == 0
+            assert converter.policy.get_metrics().total_decisions == 0
+
+    def test_converters_keyed_by_config(self):
+        pool = ConverterPool()
+
+        with pool.acquire() as default:
+            pass
+        with pool.acquire(PipelineConfig(enable_debug=True)) as debug:
+            pass
+
+        assert debug is not default
+        assert pool.get_statistics()['configurations'] == 2
+
+    def test_policy_fields_beyond_target_split_key(self):
+        pool = ConverterPool(factory=_FakeConverter)
+        conservative = PipelineConfig(policy_config=PolicyConfig(conservative_clipping=True))
+        relaxed = PipelineConfig(policy_config=PolicyConfig(conservative_clipping=False))
+
+        with pool.acquire(conservative) as first:
+            pass
+        with pool.acquire(relaxed) as second:
+            pass
+
+        assert second is not first
+        assert pool.get_statistics()['configurations'] == 2
+
+    def test_idle_converters_bounded(self):
+        pool = ConverterPool(max_idle=1, factory=_FakeConverter)
+
+        with pool.acquire() as first, pool.acquire() as second:
+            pass
+
+        stats = pool.get_statistics()
+        assert stats['idle_converters'] == 1
+        assert stats['evicted'] == 1
+        # The inner checkout is released first, so it is the oldest idle converter
+        assert second.closed
+        assert not first.closed
+
+    def test_clear_closes_idle_converters(self):
+        pool = ConverterPool(factory=_FakeConverter)
+
+        with pool.acquire() as converter:
+            pass
+        pool.clear()
+
+        assert converter.closed
+        assert pool.get_statistics()['idle_converters'] == 0
+
+    def test_converter_returned_when_conversion_raises(self):
+        pool = ConverterPool(factory=_FakeConverter)
+
+        with pytest.raises(RuntimeError):
+            with pool.acquire():
+                raise RuntimeError('boom')
+
+        assert pool.get_statistics()['idle_converters'] == 1
+
+    def test_process_pool_is_shared(self):
+        assert get_converter_pool() is get_converter_pool()
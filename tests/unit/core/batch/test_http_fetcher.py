@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared HTTP fetcher against a local HTTP server.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.batch.http_fetcher import CachedResponse, FetchError, HTTPFetcher, HTTPResponseCache
+from core.batch.url_downloader import cleanup_temp_directory, download_svgs_to_temp
+
+SVG = b'<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><rect width="5" height="5"/></svg>'
+LAST_MODIFIED = 'Wed, 01 Jan 2025 00:00:00 GMT'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive, so pooled connections are reused
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.client_address[1], dict(self.headers)))
+        time.sleep(server.delay)
+
+        body = server.bodies.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        etag = f'"{hash(body) & 0xffffffff:x}"'
+        if self.path.startswith('/etag/') and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        if self.path.startswith('/modified/') and self.headers.get('If-Modified-Since') == LAST_MODIFIED:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/svg+xml')
+        self.send_header('Content-Length', str(len(body)))
+        if self.path.startswith('/etag/'):
+            self.send_header('ETag', etag)
+        elif self.path.startswith('/nostore/'):
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'private, no-store')
+        elif self.path.startswith('/modified/'):
+            self.send_header('Last-Modified', LAST_MODIFIED)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.delay = 0.0
+    httpd.bodies = {
+        '/etag/a.svg': SVG,
+        '/modified/b.svg': SVG.replace(b'rect', b'circle'),
+        '/plain/c.svg': SVG,
+        '/nostore/d.svg': SVG,
+    }
+    httpd.url = f'http://127.0.0.1:{httpd.server_address[1]}'
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def fetcher(tmp_path):
+    fetcher = HTTPFetcher(max_workers=4, cache=HTTPResponseCache(tmp_path / 'http'))
+    yield fetcher
+    fetcher.close()
+
+
+class TestConditionalGet:
+    """Test validator caching and 304 revalidation."""
+
+    def test_etag_revalidation_skips_transfer(self, server, fetcher):
+        first = fetcher.fetch(f'{server.url}/etag/a.svg')
+        second = fetcher.fetch(f'{server.url}/etag/a.svg')
+
+        assert not first.not_modified
+        assert second.not_modified
+        assert second.content == first.content == SVG
+        assert second.content_hash == first.content_hash
+        assert 'If-None-Match' in server.requests[1][2]
+        assert fetcher.get_statistics()['bytes_downloaded'] == len(SVG)
+
+    def test_last_modified_revalidation(self, server, fetcher):
+        fetcher.fetch(f'{server.url}/modified/b.svg')
+        second = fetcher.fetch(f'{server.url}/modified/b.svg')
+
+        assert second.not_modified
+        assert server.requests[1][2]['If-Modified-Since'] == LAST_MODIFIED
+
+    def test_changed_source_is_downloaded_again(self, server, fetcher):
+        fetcher.fetch(f'{server.url}/etag/a.svg')
+        server.bodies['/etag/a.svg'] = SVG.replace(b'width="5"', b'width="6"')
+
+        second = fetcher.fetch(f'{server.url}/etag/a.svg')
+
+        assert not second.not_modified
+        assert b'width="6"' in second.content
+
+    def test_responses_without_validators_are_not_cached(self, server, fetcher):
+        fetcher.fetch(f'{server.url}/plain/c.svg')
+        second = fetcher.fetch(f'{server.url}/plain/c.svg')
+
+        assert not second.not_modified
+        assert 'If-None-Match' not in server.requests[1][2]
+        assert fetcher.cache.get(f'{server.url}/plain/c.svg') is None
+
+
+    def test_no_store_responses_are_not_cached(self, server, fetcher):
+        fetcher.fetch(f'{server.url}/nostore/d.svg')
+        second = fetcher.fetch(f'{server.url}/nostore/d.svg')
+
+        assert not second.not_modified
+        assert 'If-None-Match' not in server.requests[1][2]
+        assert fetcher.cache.get(f'{server.url}/nostore/d.svg') is None
+
+
+class TestResponseCacheBudget:
+    """Test that the on-disk cache stays within its byte budget."""
+
+    def test_oldest_entries_pruned(self, tmp_path):
+        cache = HTTPResponseCache(tmp_path / 'http', max_disk_size=20_000)
+        body = bytes(1000)
+
+        for i in range(64):
+            cache.put(CachedResponse(url=f'http://example.com/{i}.svg', content=body,
+                                     content_type='image/svg+xml', etag=f'"{i}"'))
+
+        total = sum(entry.stat().st_size for entry in (tmp_path / 'http').iterdir())
+        assert total <= 20_000
+        assert cache.stats['pruned'] > 0
+        assert cache.get('http://example.com/0.svg') is None
+        assert cache.get('http://example.com/63.svg').content == body
+
+
+class TestPoolingAndConcurrency:
+    """Test connection reuse, bounded concurrency and error reporting."""
+
+    def test_sequential_fetches_reuse_one_connection(self, server):
+        fetcher = HTTPFetcher(max_workers=1)
+        try:
+            for _ in range(3):
+                fetcher.fetch(f'{server.url}/plain/c.svg')
+        finally:
+            fetcher.close()
+
+        assert len({client_port for _, client_port, _ in server.requests}) == 1
+
+    def test_fetch_all_runs_concurrently_in_order(self, server, fetcher):
+        server.delay = 0.2
+        for i in range(4):
+            server.bodies[f'/plain/{i}.svg'] = SVG.replace(b'10', str(i).encode())
+        urls = [f'{server.url}/plain/{i}.svg' for i in range(4)] + [f'{server.url}/missing.svg']
+
+        start = time.perf_counter()
+        results = fetcher.fetch_all(urls)
+        elapsed = time.perf_counter() - start
+
+        assert [result.url for result in results[:4]] == urls[:4]
+        assert isinstance(results[4], Exception)
+        # Five 200ms requests on four workers: two rounds, not five
+        assert elapsed < 0.8
+
+    def test_size_limit(self, server, fetcher):
+        with pytest.raises(FetchError, match='limit'):
+            fetcher.fetch(f'{server.url}/plain/c.svg', max_bytes=10)
+
+
+class TestDownloaderRevalidation:
+    """Test the batch downloader reports unchanged sources."""
+
+    def test_second_download_reports_unchanged_urls(self, server, fetcher):
+        urls = [f'{server.url}/etag/a.svg', f'{server.url}/modified/b.svg', f'{server.url}/plain/c.svg']
+
+        first = download_svgs_to_temp(urls, fetcher=fetcher)
+        second = download_svgs_to_temp(urls, fetcher=fetcher)
+        try:
+            assert first.success and second.success
+            assert first.unchanged_urls == []
+            assert second.unchanged_urls == urls[:2]
+            assert second.content_hashes == first.content_hashes
+            assert len(second.file_paths) == 3
+        finally:
+            cleanup_temp_directory(first.temp_dir)
+            cleanup_temp_directory(second.temp_dir)
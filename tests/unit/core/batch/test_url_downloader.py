@@ -150,7 +150,7 @@ class TestFilenameGeneration:
 class TestSuccessfulDownload:
     """Test successful download scenarios"""
 
-    @patch('core.batch.url_downloader.requests.get')
+    @patch('core.batch.http_fetcher.requests.Session.get')
     def test_download_single_svg(self, mock_get, mock_response):
         """Test downloading single SVG file"""
         # Setup mock (use real temp directory)
@@ -174,7 +174,7 @@ class TestSuccessfulDownload:
         finally:
             cleanup_temp_directory(result.temp_dir)
 
-    @patch('core.batch.url_downloader.requests.get')
+    @patch('core.batch.http_fetcher.requests.Session.get')
     def test_download_multiple_svgs(self, mock_get):
         """Test downloading multiple SVG files"""
         # Create different responses for each URL
@@ -211,7 +211,7 @@ class TestSuccessfulDownload:
         finally:
             cleanup_temp_directory(result.temp_dir)
 
-    @patch('core.batch.url_downloader.requests.get')
+    @patch('core.batch.http_fetcher.requests.Session.get')
     @patch('core.batch.url_downloader.tempfile.mkdtemp')
     def test_download_with_job_id(self, mock_mkdtemp, mock_get, mock_response):
         """Test download with job_id in temp directory name"""
@@ -238,7 +238,7 @@ class TestSuccessfulDownload:
 class TestErrorHandling:
     """Test error handling scenarios"""
 
-    @patch('core.batch.url_downloader.requests.get')
+    @patch('core.batch.http_fetcher.requests.Session.get')
     @patch('core.batch.url_downloader.tempfile.mkdtemp')
     def test_http_404_error(self, mock_mkdtemp, mock_get):
         """Test handling of HTTP 404 error"""
@@ -260,7 +260,7 @@ class TestErrorHandling:
         # Temp dir should be cleaned up on complete failure
         # (cleanup happens in the function)
 
-    @patch('core.batch.url_downloader.requests.get')
+    @patch('core.batch.http_fetcher.requests.Session.get')
     @patch('core.batch.url_downloader.tempfile.mkdtemp')
     def test_timeout_error(self, mock_mkdtemp, mock_get):
         """Test handling of timeout error"""
@@ -278,7 +278,7 @@ class TestErrorHandling:
         assert len(result.errors) == 1
         assert result.errors[0]['error_type'] == 'http_error'
 
-    @patch('core.batch.url_downloader.requests.get')
+    @patch('core.batch.http_fetcher.requests.Session.get')
     @patch('core.batch.url_downloader.tempfile.mkdtemp')
     def test_invalid_svg_content(self, mock_mkdtemp, mock_get):
         """Test handling of invalid SVG content"""
@@ -301,7 +301,7 @@ class TestErrorHandling:
         assert len(result.errors) == 1
         assert result.errors[0]['error_type'] == 'download_error'
 
-    @patch('core.batch.url_downloader.requests.get')
+    @patch('core.batch.http_fetcher.requests.Session.get')
     @patch('core.batch.url_downloader.tempfile.mkdtemp')
     def test_file_size_limit_exceeded(self, mock_mkdtemp, mock_get):
         """Test handling of file size limit"""
@@ -332,7 +332,7 @@ class TestErrorHandling:
 class TestPartialSuccess:
     """Test scenarios where some downloads succeed and some fail"""
 
-    @patch('core.batch.url_downloader.requests.get')
+    @patch('core.batch.http_fetcher.requests.Session.get')
     def test_partial_download_success(self, mock_get):
         """Test some downloads succeed, some fail"""
         # First URL succeeds, second fails
@@ -394,7 +394,7 @@ class TestCleanup:
 class TestDownloadOptions:
     """Test download configuration options"""
 
-    @patch('core.batch.url_downloader.requests.get')
+    @patch('core.batch.http_fetcher.requests.Session.get')
     @patch('core.batch.url_downloader.tempfile.mkdtemp')
     def test_custom_timeout(self, mock_mkdtemp, mock_get, mock_response):
         """Test custom timeout option"""
@@ -416,7 +416,7 @@ class TestDownloadOptions:
         finally:
             cleanup_temp_directory(temp_dir)
 
-    @patch('core.batch.url_downloader.requests.get')
+    @patch('core.batch.http_fetcher.requests.Session.get')
     @patch('core.batch.url_downloader.tempfile.mkdtemp')
     def test_user_agent_header(self, mock_mkdtemp, mock_get, mock_response):
         """Test User-Agent header is set"""
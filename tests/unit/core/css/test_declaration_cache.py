@@ -0,0 +1,71 @@
+from lxml import etree as ET
+
+from core.css import StyleResolver, get_declaration_cache, parse_inline_declarations
+from core.css import declaration_cache
+from core.css.declaration_cache import InlineDeclarationCache, parse_declarations_tinycss2
+from core.services.style_service import StyleService, parse_inline_style
+
+
+def _fresh_cache(monkeypatch, max_size: int = 64) -> InlineDeclarationCache:
+    cache = InlineDeclarationCache(max_size)
+    monkeypatch.setattr(declaration_cache, "_declaration_cache", cache)
+    return cache
+
+
+def test_repeated_style_string_parsed_once(monkeypatch):
+    cache = _fresh_cache(monkeypatch)
+
+    first = parse_inline_declarations("Fill: #F00; stroke-width: 2 !important")
+    second = parse_inline_declarations("Fill: #F00; stroke-width: 2 !important")
+
+    assert first is second
+    assert first == (("fill", "#F00", False), ("stroke-width", "2", True))
+    assert cache.get_statistics()["hits"] == 1
+    assert cache.get_statistics()["misses"] == 1
+    assert parse_inline_declarations("") == ()
+
+
+def test_bounded_with_evictions():
+    cache = InlineDeclarationCache(max_size=2)
+    for style in ("fill: red", "fill: blue", "fill: green", "fill: red"):
+        cache.parse(style)
+
+    stats = cache.get_statistics()
+    assert len(cache) == 2
+    assert stats["evictions"] == 2
+    assert stats["hits"] == 0
+
+
+def test_resolver_text_and_paint_share_one_parse(monkeypatch):
+    cache = _fresh_cache(monkeypatch)
+    resolver = StyleResolver()
+    element = ET.fromstring('<text style="fill: #00ff00; font-size: 10pt; opacity: 0.5"/>')
+
+    paint = resolver.compute_paint_style(element)
+    text = resolver.compute_text_style(element)
+
+    assert paint["fill"] == "00FF00"
+    assert paint["opacity"] == 0.5
+    assert text["font_size_pt"] == 10.0
+    assert cache.get_statistics()["misses"] == 1
+    assert cache.get_statistics()["hits"] == 1
+
+
+def test_style_service_keeps_its_own_grammar(monkeypatch):
+    cache = _fresh_cache(monkeypatch)
+    style = "font-family: 'Arial Black', sans-serif; fill: red !important"
+
+    assert parse_inline_style(style) == {"font-family": "'Arial Black', sans-serif", "fill": "red"}
+    # Same string through the tinycss2 grammar is a separate entry
+    assert parse_inline_declarations(style)[0][1] == '"Arial Black", sans-serif'
+    assert len(cache) == 2
+
+    svg = ET.fromstring(f'<svg xmlns="http://www.w3.org/2000/svg"><rect style="{style}"/></svg>')
+    StyleService(svg).compute_style(svg[0])
+    assert cache.get_statistics()["hits"] == 1
+
+
+def test_uncached_parser_matches_cached():
+    style = "stroke: url(#a); /* note */ fill: none"
+
+    assert get_declaration_cache().parse(style) == parse_declarations_tinycss2(style)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Shape ID assignment in DrawingMLEmbedder without XML re-parsing."""
+
+import re
+from unittest.mock import Mock
+
+from lxml import etree as ET
+
+from core.io.embedder import DrawingMLEmbedder
+from core.ir.geometry import Rect
+from core.ir.shapes import Rectangle
+from core.map.base import SHAPE_ID_PLACEHOLDER, MapperResult, OutputFormat
+
+P_NS = 'http://schemas.openxmlformats.org/presentationml/2006/main'
+
+
+def _result(xml: str, source_id: str | None = None) -> MapperResult:
+    element = Rectangle(bounds=Rect(0, 0, 10, 10))
+    return MapperResult(
+        element=element,
+        output_format=OutputFormat.NATIVE_DML,
+        xml_content=xml,
+        policy_decision=Mock(),
+        metadata={'source_id': source_id} if source_id else {},
+    )
+
+
+def _shape(name: str) -> str:
+    return (f'<p:sp><p:nvSpPr><p:cNvPr id="{SHAPE_ID_PLACEHOLDER}" name="{name} {SHAPE_ID_PLACEHOLDER}"/>'
+            '<p:cNvSpPr/><p:nvPr/></p:nvSpPr><p:spPr/></p:sp>')
+
+
+def test_placeholder_ids_are_unique_and_skip_sptree_id():
+    embedder = DrawingMLEmbedder()
+    group_xml = (f'<p:grpSp><p:nvGrpSpPr><p:cNvPr id="{SHAPE_ID_PLACEHOLDER}" name="Group"/>'
+                 f'<p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr><p:grpSpPr/>{_shape("Child")}</p:grpSp>')
+
+    result = embedder.embed_scene([], [_result(_shape("Path"), "a"), _result(group_xml, "g")])
+
+    root = ET.fromstring(result.slide_xml.encode('utf-8'))
+    ids = [el.get('id') for el in root.iter(f'{{{P_NS}}}cNvPr')]
+    assert ids == ['1', '2', '3', '4']
+    assert result.shape_id_map == {'a': ['2'], 'g': ['3']}
+    assert 'name="Path 2"' in result.slide_xml
+    assert 'name="Child 4"' in result.slide_xml
+    assert SHAPE_ID_PLACEHOLDER not in result.slide_xml
+
+
+def test_legacy_xml_rewrites_first_cnvpr_only():
+    embedder = DrawingMLEmbedder()
+    legacy = '<p:pic><p:nvPicPr><p:cNvPr id="1" name="Image"/></p:nvPicPr><a:blip r:embed="rId1" id="9"/></p:pic>'
+
+    xml, assigned = embedder._assign_shape_id(legacy)
+
+    assert assigned == 2
+    assert re.findall(r'id="(\d+)"', xml) == ['2', '9']
+    assert 'name="Image"' in xml
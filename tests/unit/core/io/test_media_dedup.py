@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Unit tests for content-addressed media deduplication.
+
+Identical media bytes must become a single ppt/media part, within a slide
+and across slides, with every slide relationship pointing at it.
+"""
+
+import io
+import re
+import zipfile
+
+from core.io.embedder import DrawingMLEmbedder, EmbedderResult
+from core.io.package_writer import PackageWriter
+from core.ir import Point, Rect
+from core.ir import Image as IRImage
+from core.map.base import MapperResult, OutputFormat
+
+LOGO = b'\x89PNG\r\n\x1a\n' + bytes(range(256)) * 8
+OTHER = b'\x89PNG\r\n\x1a\n' + bytes(reversed(range(256))) * 8
+
+
+def _image_result(rel_id: str, data: bytes) -> MapperResult:
+    image = IRImage(origin=Point(0, 0), size=Rect(0, 0, 10, 10), data=data, format='png')
+    xml = (
+        '<p:pic><p:nvPicPr><p:cNvPr id="1" name="Image"/></p:nvPicPr>'
+        f'<p:blipFill><a:blip r:embed="{rel_id}"/></p:blipFill></p:pic>'
+    )
+    return MapperResult(
+        element=image,
+        output_format=OutputFormat.EMF_RASTER,
+        xml_content=xml,
+        policy_decision=None,
+        metadata={},
+        media_files=[{
+            'relationship_id': rel_id,
+            'data': data,
+            'format': 'png',
+            'content_type': 'image/png',
+        }],
+    )
+
+
+def _embed_slide(*results: MapperResult) -> EmbedderResult:
+    embedder = DrawingMLEmbedder()
+    return embedder.embed_scene([], list(results))
+
+
+class TestEmbedderMediaDedup:
+    """Test per-slide media deduplication in the embedder."""
+
+    def test_identical_media_shares_one_relationship(self):
+        result = _embed_slide(_image_result('rId7', LOGO), _image_result('rId8', LOGO))
+
+        assert len(result.media_files) == 1
+        assert len(result.relationship_data) == 1
+        assert re.findall(r'r:embed="([^"]*)"', result.slide_xml) == ['rId7', 'rId7']
+
+    def test_media_named_by_content(self):
+        result = _embed_slide(_image_result('rId7', LOGO), _image_result('rId8', OTHER))
+
+        filenames = [media['filename'] for media in result.media_files]
+        assert len(set(filenames)) == 2
+        assert all(re.fullmatch(r'image_[0-9a-f]{16}\.png', name) for name in filenames)
+        assert [rel['target'] for rel in result.relationship_data] == [f'../media/{name}' for name in filenames]
+
+    def test_colliding_relationship_ids_are_remapped(self):
+        # rId1 is the slide layout; two different images also claim the same ID
+        result = _embed_slide(_image_result('rId1', LOGO), _image_result('rId1', OTHER))
+
+        rel_ids = [rel['id'] for rel in result.relationship_data]
+        assert 'rId1' not in rel_ids
+        assert len(set(rel_ids)) == 2
+        assert re.findall(r'r:embed="([^"]*)"', result.slide_xml) == rel_ids
+
+
+class TestPackageMediaDedup:
+    """Test cross-slide media deduplication in the package writer."""
+
+    def test_repeated_media_written_once(self):
+        slides = [_embed_slide(_image_result(f'rId{i + 2}', LOGO)) for i in range(5)]
+        stream = io.BytesIO()
+
+        stats = PackageWriter().write_package_stream(slides, stream)
+
+        with zipfile.ZipFile(stream) as zf:
+            media = [name for name in zf.namelist() if name.startswith('ppt/media/') and name != 'ppt/media/']
+            assert media == [f"ppt/media/{slides[0].media_files[0]['filename']}"]
+            assert zf.read(media[0]) == LOGO
+            for i in range(5):
+                rels = zf.read(f'ppt/slides/_rels/slide{i + 1}.xml.rels').decode()
+                assert f'Id="rId{i + 2}"' in rels
+                assert media[0].replace('ppt/', '../') in rels
+        assert stats['media_files'] == 1
+
+    def test_unnamed_media_is_named_by_content(self):
+        slide = EmbedderResult(
+            slide_xml='<p:sld/>',
+            relationship_data=[],
+            media_files=[{'data': LOGO, 'content_type': 'image/gif'}, {'data': LOGO, 'content_type': 'image/gif'}],
+        )
+        stream = io.BytesIO()
+
+        PackageWriter().write_package_stream([slide], stream)
+
+        with zipfile.ZipFile(stream) as zf:
+            media = [name for name in zf.namelist() if name.endswith('.gif')]
+            assert len(media) == 1
+            assert 'Default Extension="gif" ContentType="image/gif"' in zf.read('[Content_Types].xml').decode()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for streaming PackageWriter output
+
+Covers direct streaming to files and unseekable targets, reuse of the
+pre-deflated static parts, store-mode media, and converter results for
+streamed packages.
+"""
+
+import io
+import zipfile
+import zlib
+
+import pytest
+
+from core.io.embedder import EmbedderResult
+from core.io.package_writer import PackageError, PackageWriter, _PrecompressedPart
+from core.pipeline.converter import CleanSlateConverter
+
+
+class _Pipe:
+    """Write-only target without tell/seek, like a socket"""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, data):
+        self.data += data
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+@pytest.fixture
+def embedder_result():
+    return EmbedderResult(
+        slide_xml='<p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"/>',
+        relationship_data=[],
+        media_files=[
+            {'filename': 'image1.png', 'data': b'\x89PNG' + bytes(2000)},
+            {'filename': 'emf1.emf', 'data': bytes(2000)},
+        ],
+    )
+
+
+def test_stream_package_is_valid_and_sized(embedder_result):
+    stream = io.BytesIO(b'prefix')
+    stream.seek(0, io.SEEK_END)
+
+    stats = PackageWriter().write_package_stream([embedder_result], stream)
+
+    package = stream.getvalue()[len(b'prefix'):]
+    assert stats['package_size_bytes'] == len(package)
+    with zipfile.ZipFile(io.BytesIO(package)) as zf:
+        assert zf.testzip() is None
+        assert zf.read('ppt/slides/slide1.xml') == embedder_result.slide_xml.encode('utf-8')
+
+
+def test_unseekable_stream_supported(embedder_result):
+    pipe = _Pipe()
+
+    stats = PackageWriter().write_package_stream([embedder_result], pipe)
+
+    assert stats['package_size_bytes'] == len(pipe.data)
+    with zipfile.ZipFile(io.BytesIO(bytes(pipe.data))) as zf:
+        assert zf.testzip() is None
+
+
+def test_static_parts_deflated_once_and_reused(embedder_result):
+    writer = PackageWriter()
+    first, second = io.BytesIO(), io.BytesIO()
+
+    writer.write_package_stream([embedder_result], first)
+    writer.write_package_stream([embedder_result], second)
+
+    assert writer._get_static_parts() is PackageWriter()._get_static_parts()
+    with zipfile.ZipFile(first) as a, zipfile.ZipFile(second) as b:
+        theme = a.getinfo('ppt/theme/theme1.xml')
+        assert theme.compress_type == zipfile.ZIP_DEFLATED
+        assert a.read('ppt/theme/theme1.xml') == b.read('ppt/theme/theme1.xml')
+        assert any(name.startswith('ppt/slideLayouts/') for name in a.namelist())
+
+
+def test_compressed_media_stored(embedder_result, tmp_path):
+    output_path = tmp_path / 'deck.pptx'
+
+    result = PackageWriter().write_package([embedder_result], str(output_path))
+
+    assert result['package_size_bytes'] == output_path.stat().st_size
+    with zipfile.ZipFile(output_path) as zf:
+        assert zf.getinfo('ppt/media/image1.png').compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo('ppt/media/emf1.emf').compress_type == zipfile.ZIP_DEFLATED
+
+
+@pytest.mark.parametrize('raw_write', [True, False])
+def test_static_part_crcs_verified(embedder_result, monkeypatch, raw_write):
+    if not raw_write:
+        monkeypatch.setattr(_PrecompressedPart, 'supports_raw_write', staticmethod(lambda zip_file: False))
+    stream = io.BytesIO()
+
+    PackageWriter().write_package_stream([embedder_result], stream)
+
+    with zipfile.ZipFile(stream) as zf:
+        assert zf.testzip() is None
+        for part in PackageWriter()._get_static_parts():
+            info = zf.getinfo(part.arcname)
+            data = zf.read(part.arcname)
+            assert info.CRC == part.crc == zlib.crc32(data)
+            assert info.file_size == part.file_size == len(data)
+
+
+def test_failed_write_leaves_no_file(embedder_result, tmp_path, monkeypatch):
+    output_path = tmp_path / 'deck.pptx'
+    writer = PackageWriter()
+
+    def fail(zip_file, media_files):
+        raise RuntimeError('media unavailable')
+
+    monkeypatch.setattr(writer, '_write_media_files', fail)
+
+    with pytest.raises(PackageError):
+        writer.write_package([embedder_result], str(output_path))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_convert_file_reports_streamed_output(tmp_path):
+    svg_path = tmp_path / 'drawing.svg'
+    svg_path.write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">'
+        '<rect x="10" y="10" width="50" height="40" fill="red"/></svg>',
+        encoding='utf-8',
+    )
+
+    result = CleanSlateConverter().convert_file(str(svg_path))
+
+    output_path = tmp_path / 'drawing.pptx'
+    # The package went straight to disk; size and path describe it instead
+    assert result.output_data == b''
+    assert result.output_path == str(output_path)
+    assert result.output_size == output_path.stat().st_size > 0
+
+    pipe = _Pipe()
+    streamed = CleanSlateConverter().convert_string(svg_path.read_text(encoding='utf-8'), output_stream=pipe)
+    assert streamed.output_size == len(pipe.data)
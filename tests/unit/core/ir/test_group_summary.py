@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Unit tests for cached Group subtree summaries (bbox, depth, element count).
+"""
+
+from core.ir import Group, LineSegment, Path, Point, Rect
+from core.policy import Policy
+
+
+def _path(x: float, y: float) -> Path:
+    return Path(segments=[LineSegment(Point(x, y), Point(x + 1, y + 2))])
+
+
+def _chain(depth: int) -> Group:
+    group = Group(children=[_path(0, 0)])
+    for level in range(1, depth + 1):
+        group = Group(children=[_path(level, level), group])
+    return group
+
+
+class TestGroupSummary:
+    """Test cached group summaries."""
+
+    def test_bbox_covers_nested_children(self):
+        group = Group(children=[_path(0, 0), Group(children=[_path(10, 5)])])
+
+        assert group.bbox == Rect(0, 0, 11, 7)
+        assert group.bbox is group.bbox
+
+    def test_empty_group_bbox(self):
+        assert Group(children=[]).bbox == Rect(0, 0, 0, 0)
+
+    def test_nesting_depth_and_element_count(self):
+        group = _chain(3)
+
+        assert group.nesting_depth == 3
+        assert group.total_element_count == 7
+        assert Group(children=[_path(0, 0)]).nesting_depth == 0
+
+    def test_deep_nesting_is_linear(self):
+        group = _chain(200)
+
+        assert group.nesting_depth == 200
+        assert group.bbox == Rect(0, 0, 201, 202)
+
+    def test_policy_reads_cached_depth(self):
+        policy = Policy()
+        group = _chain(4)
+
+        assert policy._calculate_nesting_depth(group) == 4
+        assert policy._calculate_nesting_depth(group, 2) == 6
+        assert policy.decide_group(group).nesting_depth == 4
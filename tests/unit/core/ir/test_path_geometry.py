@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Unit tests for columnar Path geometry (SegmentBuffer / SegmentView).
+
+Checks that buffer-backed paths behave like list-backed paths for existing
+consumers and that PathMapper emits identical DrawingML for both.
+"""
+
+import pytest
+
+from core.ir import BezierSegment, LineSegment, Path, Point, Rect, SegmentBuffer, SegmentView
+from core.map.path_mapper import PathMapper
+from core.policy import Policy
+
+
+def _segments():
+    return [
+        LineSegment(Point(0, 0), Point(10, 0)),
+        BezierSegment(Point(10, 0), Point(12, 4), Point(8, 9), Point(10, 10)),
+        LineSegment(Point(10, 10), Point(0, 0)),
+    ]
+
+
+class TestSegmentView:
+    """Test the lazy segment view used by buffer-backed paths."""
+
+    def test_view_yields_segment_objects(self):
+        view = SegmentView(SegmentBuffer.from_segments(_segments()))
+
+        assert len(view) == 3
+        assert list(view) == _segments()
+        assert view[1] == _segments()[1]
+        assert view[-1] == _segments()[-1]
+        assert view == _segments()
+
+    def test_slicing_returns_view(self):
+        view = SegmentView(SegmentBuffer.from_segments(_segments()))
+
+        sliced = view[:2]
+
+        assert isinstance(sliced, SegmentView)
+        assert list(sliced) == _segments()[:2]
+
+    def test_index_out_of_range(self):
+        view = SegmentView(SegmentBuffer.from_segments(_segments()))
+
+        with pytest.raises(IndexError):
+            view[3]
+
+
+class TestBufferBackedPath:
+    """Test Path.from_buffer against the list-backed Path."""
+
+    def test_properties_match_list_backed_path(self):
+        list_path = Path(segments=_segments())
+        buffer_path = Path.from_buffer(SegmentBuffer.from_segments(_segments()))
+
+        assert buffer_path.bbox == list_path.bbox == Rect(0, 0, 12, 10)
+        assert buffer_path.is_closed is list_path.is_closed is True
+        assert buffer_path.complexity_score == list_path.complexity_score
+
+    def test_geometry_is_shared_and_bbox_cached(self):
+        buffer = SegmentBuffer.from_segments(_segments())
+        path = Path.from_buffer(buffer)
+
+        assert path.geometry is buffer
+        assert path.bbox is path.bbox
+
+    def test_empty_buffer_rejected(self):
+        with pytest.raises(ValueError):
+            Path.from_buffer(SegmentBuffer.empty())
+
+    def test_path_mapper_output_identical(self):
+        mapper = PathMapper(Policy())
+        list_path = Path(segments=_segments())
+        buffer_path = Path.from_buffer(SegmentBuffer.from_segments(_segments()))
+
+        path_data = mapper._generate_path_data(buffer_path)
+
+        assert path_data == mapper._generate_path_data(list_path)
+        assert path_data.startswith('<a:moveTo><a:pt x="0" y="0"/></a:moveTo>')
+        assert '<a:pt x="21600" y="8640"/>' in path_data
+        assert path_data.endswith('<a:close/>')
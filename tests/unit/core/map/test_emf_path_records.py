@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Unit tests for vector path records emitted by EMFPathAdapter."""
+
+import struct
+
+import numpy as np
+
+from core.emf.emf_blob import NULL_PEN, EMFBlob, EMFRecordType
+from core.ir import BezierSegment, LineSegment, Path, Point, SolidPaint, Stroke
+from core.ir.segment_buffer import SegmentBuffer
+from core.map.emf_adapter import EMF_LOGICAL_EXTENT, EMFPathAdapter
+
+
+def _records(emf_data: bytes) -> list[tuple[int, bytes]]:
+    records = []
+    offset = 0
+    while offset < len(emf_data):
+        record_type, size = struct.unpack_from('<II', emf_data, offset)
+        records.append((record_type, emf_data[offset + 8:offset + size]))
+        offset += size
+    assert offset == len(emf_data)
+    return records
+
+
+def _record_types(emf_data: bytes) -> list[int]:
+    return [record_type for record_type, _ in _records(emf_data)]
+
+
+def _points16(payload: bytes) -> list[tuple[int, int]]:
+    count = struct.unpack_from('<I', payload, 16)[0]
+    return list(zip(*[iter(struct.unpack_from(f'<{count * 2}h', payload, 20))] * 2))
+
+
+class TestEMFBlobRecords:
+    """Test header totals and point record encoding."""
+
+    def test_header_totals_match_blob(self):
+        emf = EMFBlob(width=914400, height=914400)
+        emf.select_object(emf.add_solid_brush(0x0000FF))
+        emf.polygon(np.array([[0, 0], [10, 0], [10, 10]]))
+
+        data = emf.finalize()
+
+        signature, _, size, count, handles = struct.unpack_from('<IIIIH', data, 40)
+        assert signature == 0x464D4520
+        assert size == len(data)
+        assert count == len(_records(data))
+        assert handles == 2
+        assert emf.finalize() == data
+
+    def test_large_coordinates_use_32_bit_records(self):
+        emf = EMFBlob()
+        emf.poly_line_to(np.array([[0, 0], [40000, 5]]))
+        emf.poly_line_to(np.array([[1, 2]]))
+
+        types = _record_types(emf.finalize())
+
+        assert EMFRecordType.EMR_POLYLINETO in types
+        assert EMFRecordType.EMR_POLYLINETO16 in types
+
+
+class TestEMFPathAdapterGeometry:
+    """Test IR paths become real polygon/path-bracket records."""
+
+    def test_straight_closed_path_emits_polygon(self):
+        corners = [Point(0, 0), Point(10, 0), Point(10, 20), Point(0, 20)]
+        path = Path(
+            segments=[LineSegment(a, b) for a, b in zip(corners, corners[1:] + corners[:1])],
+            fill=SolidPaint('FF0000'),
+        )
+
+        records = _records(EMFPathAdapter().generate_emf_blob(path).emf_data)
+
+        polygons = [payload for record_type, payload in records if record_type == EMFRecordType.EMR_POLYGON16]
+        assert len(polygons) == 1
+        top = EMF_LOGICAL_EXTENT
+        assert _points16(polygons[0]) == [(0, 0), (top, 0), (top, top), (0, top)]
+        assert EMFRecordType.EMR_RECTANGLE not in [record_type for record_type, _ in records]
+        # Unstroked polygon must not pick up the default black pen
+        assert (EMFRecordType.EMR_SELECTOBJECT, struct.pack('<I', NULL_PEN)) in records
+
+    def test_curved_path_emits_path_bracket(self):
+        path = Path(
+            segments=[
+                BezierSegment(Point(0, 0), Point(0, 10), Point(10, 10), Point(10, 0)),
+                LineSegment(Point(10, 0), Point(0, 0)),
+                LineSegment(Point(20, 20), Point(30, 30)),
+            ],
+            fill=SolidPaint('00FF00'),
+            stroke=Stroke(paint=SolidPaint('000000'), width=1.0),
+        )
+
+        records = _records(EMFPathAdapter().generate_emf_blob(path).emf_data)
+        types = [record_type for record_type, _ in records]
+
+        begin = types.index(EMFRecordType.EMR_BEGINPATH)
+        bracket = [
+            EMFRecordType.EMR_BEGINPATH,
+            EMFRecordType.EMR_MOVETOEX,
+            EMFRecordType.EMR_POLYBEZIERTO16,
+            EMFRecordType.EMR_CLOSEFIGURE,
+            EMFRecordType.EMR_MOVETOEX,
+            EMFRecordType.EMR_POLYLINETO16,
+            EMFRecordType.EMR_ENDPATH,
+        ]
+        # The open trailing figure is filled and stroked in separate brackets
+        assert types[begin:] == [
+            *bracket, EMFRecordType.EMR_FILLPATH,
+            *bracket, EMFRecordType.EMR_STROKEPATH,
+            EMFRecordType.EMR_EOF,
+        ]
+        bezier = dict(records)[EMFRecordType.EMR_POLYBEZIERTO16]
+        # Trailing line becomes a degenerate cubic: 2 segments x 3 points
+        assert len(_points16(bezier)) == 6
+        assert EMFRecordType.EMR_CREATEPEN in types
+
+    def test_stroke_only_path_strokes(self):
+        path = Path(
+            segments=[LineSegment(Point(0, 0), Point(10, 5)), LineSegment(Point(10, 5), Point(20, 0))],
+            stroke=Stroke(paint=SolidPaint('000000'), width=2.0),
+        )
+
+        types = _record_types(EMFPathAdapter().generate_emf_blob(path).emf_data)
+
+        assert EMFRecordType.EMR_STROKEPATH in types
+        assert EMFRecordType.EMR_FILLPATH not in types
+
+    def test_open_filled_and_stroked_path_keeps_stroke_open(self):
+        path = Path(
+            segments=[LineSegment(Point(0, 0), Point(10, 5)), LineSegment(Point(10, 5), Point(20, 0))],
+            fill=SolidPaint('00FF00'),
+            stroke=Stroke(paint=SolidPaint('000000'), width=2.0),
+        )
+
+        types = _record_types(EMFPathAdapter().generate_emf_blob(path).emf_data)
+
+        assert EMFRecordType.EMR_POLYGON16 not in types
+        assert EMFRecordType.EMR_STROKEANDFILLPATH not in types
+        assert EMFRecordType.EMR_CLOSEFIGURE not in types
+        begin = types.index(EMFRecordType.EMR_BEGINPATH)
+        bracket = [
+            EMFRecordType.EMR_BEGINPATH,
+            EMFRecordType.EMR_MOVETOEX,
+            EMFRecordType.EMR_POLYLINETO16,
+            EMFRecordType.EMR_ENDPATH,
+        ]
+        assert types[begin:] == [
+            *bracket, EMFRecordType.EMR_FILLPATH,
+            *bracket, EMFRecordType.EMR_STROKEPATH,
+            EMFRecordType.EMR_EOF,
+        ]
+
+    def test_dense_path_packs_one_record_per_figure(self):
+        angles = np.linspace(0, 2 * np.pi, 20000, endpoint=False)
+        buffer = SegmentBuffer.from_polyline(np.column_stack((np.cos(angles), np.sin(angles))), closed=True)
+        path = Path.from_buffer(buffer, stroke=Stroke(paint=SolidPaint('000000'), width=0.1))
+
+        records = _records(EMFPathAdapter().generate_emf_blob(path).emf_data)
+
+        lines = [payload for record_type, payload in records if record_type == EMFRecordType.EMR_POLYLINETO16]
+        assert len(lines) == 1
+        assert len(_points16(lines[0])) == len(buffer)
+
+    def test_stroked_canvas_padded_and_pen_scaled_on_x(self):
+        corners = [Point(0, 0), Point(10, 0), Point(10, 100), Point(0, 100)]
+        path = Path(
+            segments=[LineSegment(a, b) for a, b in zip(corners, corners[1:] + corners[:1])],
+            stroke=Stroke(paint=SolidPaint('000000'), width=2.0),
+        )
+
+        result = EMFPathAdapter().generate_emf_blob(path)
+        records = _records(result.emf_data)
+
+        # Half the stroke on every side stays inside the canvas
+        assert (result.width_emu, result.height_emu) == (12 * 12700, 102 * 12700)
+        assert (result.x_emu, result.y_emu) == (-12700, -12700)
+        pen = dict(records)[EMFRecordType.EMR_CREATEPEN]
+        assert struct.unpack_from('<l', pen, 8)[0] == round(2.0 * EMF_LOGICAL_EXTENT / 12)
+        begin = [record_type for record_type, _ in records].index(EMFRecordType.EMR_BEGINPATH)
+        move = records[begin + 1][1]
+        assert struct.unpack('<ll', move) == (EMF_LOGICAL_EXTENT // 12, EMF_LOGICAL_EXTENT // 102)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Unit tests for PathMapper reuse of cached XML fragments."""
+
+from core.ir import LineSegment, Path, Point, SolidPaint, Stroke
+from core.map.fragment_cache import XMLFragmentCache, fragment_key
+from core.map.path_mapper import PathMapper
+from core.policy import Policy
+
+
+def _marker(x: float, y: float, size: float = 4.0, rgb: str = '3366CC') -> Path:
+    corners = [Point(x, y), Point(x + size, y), Point(x + size, y + size), Point(x, y + size)]
+    return Path(
+        segments=[LineSegment(a, b) for a, b in zip(corners, corners[1:] + corners[:1])],
+        fill=SolidPaint(rgb),
+        stroke=Stroke(paint=SolidPaint('000000'), width=0.5),
+    )
+
+
+class TestXMLFragmentCache:
+    """Test the bounded fragment LRU."""
+
+    def test_builds_once_per_key(self):
+        cache = XMLFragmentCache()
+        calls = []
+
+        def build():
+            calls.append(1)
+            return '<a:close/>'
+
+        first = cache.get_or_build('k', build)
+        second = cache.get_or_build('k', build)
+
+        assert second is first
+        assert len(calls) == 1
+        assert cache.get_statistics()['hit_rate'] == 0.5
+
+    def test_evicts_and_bypasses(self):
+        cache = XMLFragmentCache(max_size=1)
+        cache.get_or_build('a', lambda: 'a')
+        cache.get_or_build('b', lambda: 'b')
+        cache.get_or_build(None, lambda: 'unkeyed')
+
+        assert len(cache) == 1
+        assert cache.get_statistics()['misses'] == 2
+
+    def test_unhashable_values_have_no_key(self):
+        dashed = Stroke(paint=SolidPaint('000000'), width=1.0, dash_array=[2.0, 1.0])
+
+        assert fragment_key('stroke', dashed) is None
+        assert fragment_key('fill', SolidPaint('FF0000')) == ('fill', SolidPaint('FF0000'))
+
+
+class TestPathMapperFragmentReuse:
+    """Test translated copies of one shape share their XML fragments."""
+
+    def test_translated_markers_share_fragments(self):
+        mapper = PathMapper(Policy())
+
+        first = mapper.map(_marker(0, 0))
+        second = mapper.map(_marker(120, 40))
+
+        assert first.xml_content != second.xml_content
+        assert first.xml_content.replace('<a:off x="0" y="0"/>', '') == \
+            second.xml_content.replace('<a:off x="1524000" y="508000"/>', '')
+        stats = mapper.get_statistics()['fragment_cache']
+        assert stats['misses'] == 3
+        assert stats['hits'] == 3
+
+    def test_path_body_reused_by_reference(self):
+        mapper = PathMapper(Policy())
+
+        assert mapper._generate_path_data(_marker(0, 0)) is mapper._generate_path_data(_marker(9, 9))
+        assert mapper._generate_path_data(_marker(0, 0, size=2)) is mapper._generate_path_data(_marker(0, 0))
+
+    def test_cached_output_matches_uncached(self):
+        cached = PathMapper(Policy())
+        uncached = PathMapper(Policy(), fragment_cache_size=0)
+        paths = [_marker(i * 3.5, i * 1.25, size=1 + i % 3, rgb='FF0000' if i % 2 else '00FF00') for i in range(12)]
+
+        assert [cached.map(p).xml_content for p in paths] == [uncached.map(p).xml_content for p in paths]
+        assert uncached.get_statistics()['fragment_cache']['size'] == 0
+
+    def test_distinct_fill_not_shared(self):
+        mapper = PathMapper(Policy())
+
+        red = mapper.map(_marker(0, 0, rgb='FF0000')).xml_content
+        blue = mapper.map(_marker(0, 0, rgb='0000FF')).xml_content
+
+        assert 'FF0000' in red and '0000FF' in blue
+
+    def test_clear_fragment_cache(self):
+        mapper = PathMapper(Policy())
+        mapper.map(_marker(0, 0))
+
+        mapper.clear_fragment_cache()
+
+        assert mapper.get_statistics()['fragment_cache']['size'] == 0
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for multi-page packaging from in-memory embedder results.
+"""
+
+import io
+import zipfile
+
+import pytest
+
+from core.multipage.converter import CleanSlateMultiPageConverter, PageSource
+
+
+def _page(fill: str) -> PageSource:
+    return PageSource(
+        content=(
+            '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">'
+            f'<rect x="10" y="10" width="50" height="40" fill="{fill}"/></svg>'
+        ),
+    )
+
+
+def test_pages_keep_their_converted_slide_xml():
+    converter = CleanSlateMultiPageConverter()
+
+    result = converter.convert_pages([_page('#FF0000'), _page('#0000FF')])
+
+    with zipfile.ZipFile(io.BytesIO(result.output_data)) as package:
+        slide1 = package.read('ppt/slides/slide1.xml').decode('utf-8')
+        slide2 = package.read('ppt/slides/slide2.xml').decode('utf-8')
+
+    assert result.page_count == 2
+    assert 'FF0000' in slide1 and '0000FF' not in slide1
+    assert '0000FF' in slide2
+    assert all(page.embedder_result.slide_xml for page in result.page_results)
+
+
+def test_parallel_pages_match_sequential_order():
+    pages = [_page(fill) for fill in ('#FF0000', '#00FF00', '#0000FF')]
+    sequential = CleanSlateMultiPageConverter().convert_pages(pages)
+    converter = CleanSlateMultiPageConverter(max_workers=2)
+
+    try:
+        parallel = converter.convert_pages(pages)
+    finally:
+        converter.close()
+
+    assert parallel.page_count == 3
+    assert [p.embedder_result.slide_xml for p in parallel.page_results] == [
+        p.embedder_result.slide_xml for p in sequential.page_results
+    ]
+
+
+def test_broken_page_pool_rebuilt_on_next_call():
+    pages = [_page('#FF0000'), _page('#0000FF')]
+    converter = CleanSlateMultiPageConverter(max_workers=2)
+
+    try:
+        converter.convert_pages(pages)
+        broken = converter._executor
+        for process in list(broken._processes.values()):
+            process.kill()
+            process.join()
+
+        with pytest.raises(ValueError):
+            converter.convert_pages(pages)
+        assert converter._executor is None
+
+        result = converter.convert_pages(pages)
+    finally:
+        converter.close()
+
+    assert result.page_count == 2
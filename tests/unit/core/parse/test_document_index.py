@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Unit tests for the per-document element index built by SVGParser."""
+
+from lxml import etree as ET
+
+from core.animations import SMILParser
+from core.parse import SVGParser
+from core.parse.document_index import DocumentIndex
+from core.xml.safe_iter import walk
+
+SVG = """<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"
+     width="100" height="100">
+  <!-- comment nodes are not indexed -->
+  <defs>
+    <linearGradient id="lg"><stop offset="0"/></linearGradient>
+    <clipPath id="clip"><rect width="10" height="10"/></clipPath>
+    <radialGradient id="rg"><stop offset="1"/></radialGradient>
+    <filter id="blur"><feGaussianBlur stdDeviation="2"/></filter>
+  </defs>
+  <linearGradient id="outside-defs"/>
+  <g id="layer" clip-path="url(#clip)">
+    <rect id="box" fill="url('#lg')" width="5" height="5">
+      <animate attributeName="opacity" from="0" to="1" dur="1s"/>
+    </rect>
+    <use xlink:href="#box"/>
+    <image href="https://example.com/a.png" width="1" height="1"/>
+  </g>
+</svg>"""
+
+
+def _parse():
+    result = SVGParser(enable_normalization=False).parse(SVG)
+    assert result.success
+    return result
+
+
+class TestDocumentIndex:
+    """Test index contents against a reference tree walk."""
+
+    def test_elements_match_tree_walk(self):
+        result = _parse()
+        index = result.document_index
+
+        assert index.elements == list(walk(result.svg_root))
+        assert result.element_count == index.element_count
+        for position, element in enumerate(index.elements):
+            parent = element.getparent()
+            expected = index.elements.index(parent) if parent is not None else -1
+            assert index.parents[position] == expected
+            assert list(index.iter_subtree(element)) == list(walk(element))
+
+    def test_ids_tags_and_references(self):
+        index = _parse().document_index
+
+        assert index.get_element_by_id('box').get('width') == '5'
+        assert [el.get('id') for el in index.find_all('clipPath')] == ['clip']
+        assert index.depth(index.get_element_by_id('box')) == 2
+        assert index.parent(index.get_element_by_id('box')) is index.get_element_by_id('layer')
+        assert {(ref.attribute, ref.target_id) for ref in index.references} == {
+            ('clip-path', 'clip'),
+            ('fill', 'lg'),
+            ('{http://www.w3.org/1999/xlink}href', 'box'),
+        }
+        assert [ref.element.get('id') for ref in index.references_to('lg')] == ['box']
+        assert index.has_external_references
+
+    def test_no_external_references(self):
+        index = DocumentIndex.build(ET.fromstring('<svg xmlns="http://www.w3.org/2000/svg"><rect/></svg>'))
+
+        assert not index.has_external_references
+        assert index.find_all('rect', namespace=None) == []
+
+
+class TestDocumentIndexConsumers:
+    """Test downstream stages give the same answers with and without the index."""
+
+    def test_clip_definitions(self):
+        result = _parse()
+        parser = SVGParser(enable_normalization=False)
+
+        assert result.clip_paths.keys() == parser._collect_clip_definitions(result.svg_root).keys() == {'clip'}
+
+    def test_animation_elements(self):
+        result = _parse()
+
+        indexed = SMILParser()._find_animation_elements(result.svg_root, result.document_index)
+        plain = SMILParser()._find_animation_elements(result.svg_root)
+
+        assert indexed == plain
+        assert len(indexed) == 1
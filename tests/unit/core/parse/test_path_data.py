@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from core.ir import BezierSegment, LineSegment, Point
+from core.ir.segment_buffer import SEGMENT_CUBIC, SEGMENT_LINE, SegmentBuffer
+from core.parse.path_data import apply_coordinate_space, parse_path_data, tokenize_path_data
+from core.transforms.coordinate_space import CoordinateSpace
+from core.transforms.core import Matrix
+
+
+class TestTokenizePathData:
+    def test_produces_command_codes_and_offsets(self):
+        tokens = tokenize_path_data("M10,20 l5-5 h.5 Z")
+
+        assert bytes(tokens.commands) == b"MlhZ"
+        assert tokens.offsets.tolist() == [0, 2, 4, 5, 5]
+        assert tokens.values.tolist() == [10.0, 20.0, 5.0, -5.0, 0.5]
+
+    @pytest.mark.parametrize(
+        "d, expected",
+        [
+            ("M1e2-3E-1", [100.0, -0.3]),
+            ("M.5.5", [0.5, 0.5]),
+            ("M+1+2", [1.0, 2.0]),
+            ("M1 2 x", [1.0, 2.0]),
+        ],
+    )
+    def test_compact_and_malformed_numbers(self, d, expected):
+        assert tokenize_path_data(d).values.tolist() == expected
+
+    def test_arc_flags_without_separators(self):
+        tokens = tokenize_path_data("M0 0 a5 5 0 0110 0")
+
+        assert tokens.values[2:].tolist() == [5.0, 5.0, 0.0, 0.0, 1.0, 10.0, 0.0]
+
+
+class TestParsePathData:
+    def test_relative_commands_and_close(self):
+        segments = parse_path_data("m10 10 l10 0 v10 z").to_segments()
+
+        assert segments == [
+            LineSegment(Point(10, 10), Point(20, 10)),
+            LineSegment(Point(20, 10), Point(20, 20)),
+            LineSegment(Point(20, 20), Point(10, 10)),
+        ]
+
+    def test_implicit_repeats_match_repeated_commands(self):
+        points = " ".join(f"{i},{(i * 7) % 13}" for i in range(40))
+        implicit = parse_path_data(f"M0 0 L{points}")
+        repeated = parse_path_data("M0 0 " + " ".join(f"L{p}" for p in points.split()))
+        relative = parse_path_data("M0 0 l" + " ".join("1,1" for _ in range(40)))
+
+        assert len(implicit) == 40
+        np.testing.assert_array_equal(implicit.coords, repeated.coords)
+        assert relative.coords[-1, 6:8].tolist() == [40.0, 40.0]
+
+    def test_vectorized_curve_run_matches_scalar_resolution(self):
+        curves = " ".join(f"{i} 1 {i} 2 {i + 1} 0" for i in range(20))
+        vectorized = parse_path_data(f"M0 0 c{curves}")
+        scalar = parse_path_data("M0 0 " + " ".join(f"c{i} 1 {i} 2 {i + 1} 0" for i in range(3)))
+
+        assert len(vectorized) == 20
+        assert (vectorized.kinds == SEGMENT_CUBIC).all()
+        np.testing.assert_allclose(vectorized.coords[:3], scalar.coords)
+
+    def test_smooth_and_quadratic_curves_become_cubics(self):
+        segments = parse_path_data("M0 0 Q 3 3 6 0 T 12 0 C 0 1 2 3 4 5 S 8 9 10 11").to_segments()
+
+        assert all(isinstance(segment, BezierSegment) for segment in segments)
+        assert segments[0].control1 == Point(2.0, 2.0)
+        # T reflects the previous quadratic control point (3, 3) through (6, 0)
+        assert tuple(segments[1].control1) == pytest.approx((8.0, -2.0))
+        # S reflects the previous cubic control2 (2, 3) through (4, 5)
+        assert segments[3].control1 == Point(6.0, 7.0)
+
+    def test_arc_converted_to_cubic_segments(self):
+        buffer = parse_path_data("M0 0 A5 5 0 0 1 10 0")
+
+        assert len(buffer) == 2
+        assert buffer.kinds.tolist() == [SEGMENT_CUBIC, SEGMENT_CUBIC]
+        assert buffer.coords[-1, 6:8] == pytest.approx([10.0, 0.0])
+
+    def test_empty_and_moveto_only(self):
+        assert len(parse_path_data("")) == 0
+        assert len(parse_path_data("M 10 10")) == 0
+
+
+class TestApplyCoordinateSpace:
+    def test_batched_ctm_matches_per_point_transform(self):
+        matrix = Matrix(0.5, 0.25, -0.75, 2.0, 10.0, -3.0)
+        coord_space = CoordinateSpace(matrix)
+        buffer = parse_path_data("M1.1 2.2 C 3 4 5 6 7 8 L 9.5 -1")
+
+        transformed = apply_coordinate_space(buffer, coord_space)
+
+        expected = [matrix.transform_point(x, y) for x, y in buffer.points.tolist()]
+        assert transformed.points.tolist() == [list(point) for point in expected]
+
+    def test_duck_typed_coordinate_space(self):
+        class Offset:
+            def apply_ctm(self, x, y):
+                return x + 1, y - 1
+
+        buffer = apply_coordinate_space(parse_path_data("M0 0 L2 2"), Offset())
+
+        assert buffer.to_segments() == [LineSegment(Point(1, -1), Point(3, 1))]
+
+
+def test_segment_buffer_round_trip():
+    segments = [
+        LineSegment(Point(0, 0), Point(1, 0)),
+        BezierSegment(Point(1, 0), Point(2, 1), Point(3, 1), Point(4, 0)),
+    ]
+
+    buffer = SegmentBuffer.from_segments(segments)
+
+    assert buffer.kinds.tolist() == [SEGMENT_LINE, SEGMENT_CUBIC]
+    assert buffer.to_segments() == segments
+    assert buffer.bbox().width == 4.0 and buffer.bbox().height == 1.0
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Unit tests for opt-in parallel element mapping in CleanSlateConverter."""
+
+import pytest
+
+from core.ir import LineSegment, Path, Point
+from core.pipeline.config import PerformanceConfig, PipelineConfig
+from core.pipeline.converter import CleanSlateConverter
+
+
+def _scene(count: int) -> list:
+    return [
+        Path(segments=[LineSegment(Point(i, 0), Point(i + 1, i + 2))])
+        for i in range(count)
+    ]
+
+
+def _converter(executor: str = 'thread', enable_debug: bool = False) -> CleanSlateConverter:
+    performance = PerformanceConfig(
+        parallel_processing=True,
+        max_workers=2,
+        parallel_executor=executor,
+        parallel_min_elements=2,
+    )
+    return CleanSlateConverter(PipelineConfig(performance_config=performance, enable_debug=enable_debug))
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_parallel_results_keep_z_order(executor):
+    scene = _scene(12)
+    scene.insert(5, 'not an element')
+    converter = _converter(executor)
+
+    try:
+        results = converter._map_scene_elements(scene)
+    finally:
+        converter.close()
+
+    expected = CleanSlateConverter()._map_scene_elements(scene)
+    assert [result.element for result in results] == [element for element in scene if isinstance(element, Path)]
+    assert [result.xml_content for result in results] == [result.xml_content for result in expected]
+
+    errors = converter.error_reporter.error_history
+    assert len(errors) == 1
+    assert errors[0].context.input_data['element_type'] == 'str'
+
+
+def test_mapping_errors_reported_per_element(monkeypatch):
+    scene = _scene(6)
+    converter = _converter()
+    path_mapper = converter.mappers['path']
+    original_map = path_mapper.map
+
+    def flaky_map(element):
+        if element is scene[2] or element is scene[4]:
+            raise ValueError('broken geometry')
+        return original_map(element)
+
+    monkeypatch.setattr(path_mapper, 'map', flaky_map)
+
+    try:
+        results = converter._map_scene_elements(scene)
+    finally:
+        converter.close()
+
+    assert [result.element for result in results] == [scene[0], scene[1], scene[3], scene[5]]
+    errors = converter.error_reporter.error_history
+    assert len(errors) == 2
+    assert all('broken geometry' in error.message for error in errors)
+
+
+def test_small_scenes_mapped_in_process():
+    converter = _converter()
+    converter.config.performance_config.parallel_min_elements = 50
+
+    converter._map_scene_elements(_scene(3))
+
+    assert converter._mapping_executor is None
+
+
+def test_process_worker_statistics_merged():
+    scene = _scene(12)
+    converter = _converter('process')
+
+    try:
+        converter._map_scene_elements(scene)
+        stats = converter.get_statistics()['mapper_stats']
+        decisions = converter.policy.get_metrics().total_decisions
+    finally:
+        converter.close()
+
+    sequential = CleanSlateConverter()
+    sequential._map_scene_elements(scene)
+    assert stats['path']['total_mapped'] == 12
+    assert stats['path']['native_count'] == sequential.get_statistics()['mapper_stats']['path']['native_count']
+    assert decisions == sequential.policy.get_metrics().total_decisions
+
+
+def test_broken_process_pool_rebuilt():
+    scene = _scene(12)
+    converter = _converter('process')
+
+    try:
+        converter._map_scene_elements(scene)
+        broken = converter._mapping_executor
+        for process in list(broken._processes.values()):
+            process.kill()
+            process.join()
+
+        # This conversion falls back to in-process mapping
+        results = converter._map_scene_elements(scene)
+        assert len(results) == 12
+        assert converter._mapping_executor is None
+
+        converter._map_scene_elements(scene)
+        assert converter._mapping_executor is not None
+        assert converter._mapping_executor is not broken
+    finally:
+        converter.close()
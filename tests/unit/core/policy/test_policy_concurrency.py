@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Unit tests for sharing one Policy instance across threads."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from core.ir import Group, LineSegment, Path, Point
+from core.policy import Policy
+from core.policy.config import PolicyConfig
+
+
+def _path(segment_count: int) -> Path:
+    return Path(segments=[
+        LineSegment(Point(i, 0), Point(i + 1, 1)) for i in range(segment_count)
+    ])
+
+
+class TestPolicyConcurrency:
+    """Test reentrant decisions and per-thread metrics."""
+
+    def test_no_current_decision_state(self):
+        policy = Policy()
+
+        policy.decide_path(_path(3))
+
+        assert not hasattr(policy, '_current_decision')
+
+    def test_concurrent_decisions_match_sequential(self):
+        policy = Policy()
+        paths = [_path(1 + (i % 400)) for i in range(400)]
+        expected = [policy.decide_path(path).use_native for path in paths]
+        policy.reset_metrics()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            decisions = list(executor.map(policy.decide_path, paths))
+
+        assert [decision.use_native for decision in decisions] == expected
+        metrics = policy.get_metrics()
+        assert metrics.total_decisions == metrics.path_decisions == 400
+        assert metrics.native_decisions == sum(expected)
+
+    def test_metrics_merged_across_threads(self):
+        policy = Policy()
+        group = Group(children=[_path(2)])
+
+        def decide(_):
+            policy.decide_group(group)
+            policy.decide_path(_path(2))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(decide, range(20)))
+
+        metrics = policy.metrics
+        assert metrics.group_decisions == 20
+        assert metrics.path_decisions == 20
+        assert metrics.total_decisions == 40
+        assert sum(metrics.reason_counts.values()) > 0
+        assert metrics.avg_decision_time_ms <= metrics.max_decision_time_ms
+
+    def test_reset_and_disabled_metrics(self):
+        policy = Policy()
+        policy.decide_path(_path(2))
+
+        policy.reset_metrics()
+        assert policy.metrics.total_decisions == 0
+
+        policy.decide_path(_path(2))
+        assert policy.metrics.total_decisions == 1
+
+        quiet = Policy(PolicyConfig(enable_metrics=False))
+        quiet.decide_path(_path(2))
+        assert quiet.metrics.total_decisions == 0
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Unit tests for fingerprint-keyed policy decision memoization."""
+
+from core.ir import LineSegment, Path, Point, SolidPaint, Stroke
+from core.policy import Policy, PolicyConfig
+from core.policy.decision_cache import DecisionCache
+
+
+def _path(segment_count: int = 3, x: float = 0.0, dashed: bool = False) -> Path:
+    stroke = Stroke(paint=SolidPaint('000000'), width=1.0, dash_array=[2.0, 2.0] if dashed else None)
+    return Path(
+        segments=[LineSegment(Point(x + i, 0), Point(x + i + 1, 1)) for i in range(segment_count)],
+        fill=SolidPaint('FF0000'),
+        stroke=stroke,
+    )
+
+
+class TestDecisionCache:
+    """Test the bounded LRU itself."""
+
+    def test_evicts_least_recently_used(self):
+        cache = DecisionCache(max_size=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert len(cache) == 2
+
+    def test_zero_size_disables(self):
+        cache = DecisionCache(max_size=0)
+        cache.put('a', 1)
+
+        assert cache.get('a') is None
+
+
+class TestPolicyDecisionMemoization:
+    """Test decision reuse across structurally identical elements."""
+
+    def test_identical_paths_share_decision(self):
+        policy = Policy()
+
+        first = policy.decide_path(_path(x=0))
+        second = policy.decide_path(_path(x=50))
+
+        assert second is first
+        metrics = policy.get_metrics()
+        assert metrics.decision_cache_hits == 1
+        assert metrics.decision_cache_misses == 1
+        assert metrics.path_decisions == 2
+        assert metrics.to_dict()['decision_cache']['hit_rate'] == 0.5
+
+    def test_fingerprint_separates_decision_inputs(self):
+        policy = Policy()
+
+        plain = policy.decide_path(_path())
+        dashed = policy.decide_path(_path(dashed=True))
+        longer = policy.decide_path(_path(segment_count=4))
+
+        assert dashed is not plain and longer is not plain
+        assert plain.use_native and not dashed.use_native
+        assert longer.segment_count == 4
+        assert policy.get_metrics().decision_cache_hits == 0
+
+    def test_cached_decisions_match_uncached(self):
+        cached = Policy()
+        uncached = Policy(PolicyConfig(decision_cache_size=0))
+        paths = [_path(segment_count=n % 7 + 1, dashed=n % 3 == 0) for n in range(40)]
+
+        assert [cached.decide_path(p) for p in paths] == [uncached.decide_path(p) for p in paths]
+        assert uncached.get_metrics().decision_cache_hits == 0
+        assert uncached.get_metrics().decision_cache_misses == 0
+
+    def test_gradient_decisions_cached(self):
+        policy = Policy()
+
+        first = policy.decide_gradient(gradient_type='linear', stop_count=3)
+        second = policy.decide_gradient(gradient_type='linear', stop_count=3)
+        other = policy.decide_gradient(gradient_type='radial', stop_count=3)
+
+        assert second is first
+        assert other.gradient_type == 'radial'
+
+    def test_clear_decision_cache(self):
+        policy = Policy()
+        first = policy.decide_path(_path())
+
+        policy.clear_decision_cache()
+
+        assert policy.decide_path(_path()) is not first
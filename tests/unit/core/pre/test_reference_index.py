@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import time
+
+from lxml import etree as ET
+
+from core.pre.chain import PreprocessorChain
+from core.pre.expand_use import ExpandUsePreprocessor
+from core.pre.reference_index import ReferenceIndex
+from core.pre.resolve_clips import ResolveClipsPreprocessor
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+
+
+def _svg(fragment: str) -> ET.Element:
+    return ET.fromstring(
+        f'<svg xmlns="{SVG_NS}" xmlns:xlink="{XLINK_NS}">{fragment}</svg>'
+    )
+
+
+def test_index_collects_url_and_href_references():
+    svg = _svg("""
+      <defs>
+        <linearGradient id="a"/>
+        <linearGradient id="b" xlink:href="#a"/>
+        <filter id="f"/>
+      </defs>
+      <rect id="r" fill="url(#b)" style="filter: url('#f')"/>
+      <use href="#r"/>
+    """)
+
+    index = ReferenceIndex(svg)
+
+    assert index.get_element("r").get("fill") == "url(#b)"
+    assert [e.get("id") for e in index.get_referrers("a")] == ["b"]
+    assert index.is_referenced("f")
+    assert index.is_referenced("r")
+    assert not index.is_referenced("missing")
+
+
+def test_index_tracks_subtree_replacement():
+    svg = _svg('<g id="old" fill="url(#p)"/><pattern id="p"/>')
+    index = ReferenceIndex(svg)
+    old = svg[0]
+    new = ET.SubElement(svg, f"{{{SVG_NS}}}g", id="new")
+    svg.remove(old)
+
+    index.replace_subtree(old, new)
+
+    assert not index.is_referenced("p")
+    assert index.get_element("old") is None
+    assert index.get_element("new") is new
+
+
+def test_cleanup_keeps_defs_referenced_only_from_style(monkeypatch):
+    monkeypatch.setattr(time, "time", lambda: 0.5)
+    svg = _svg("""
+      <defs>
+        <symbol id="icon"><path d="M0 0"/></symbol>
+        <symbol id="unused"><path d="M1 1"/></symbol>
+        <linearGradient id="grad"/>
+      </defs>
+      <use xlink:href="#icon"/>
+      <rect style="fill:url(#grad)"/>
+    """)
+
+    ExpandUsePreprocessor().process(svg)
+
+    defs = svg.find(f"{{{SVG_NS}}}defs")
+    assert [child.get("id") for child in defs] == ["grad"]
+
+
+def test_chain_shares_one_index_and_releases_it():
+    svg = _svg('<defs><rect id="box"/></defs><use href="#box"/>')
+    chain = PreprocessorChain()
+
+    chain.process(svg, validate=False)
+
+    assert all(p.reference_index is None for p in chain.processors)
+    assert svg.find(f".//{{{SVG_NS}}}use") is None
+
+
+def test_clip_resolution_updates_index_after_insertion():
+    svg = _svg('<clipPath id="c"><rect width="5" height="5"/></clipPath>'
+               '<rect id="r" clip-path="url(#c)" width="9" height="9"/>')
+    preprocessor = ResolveClipsPreprocessor()
+    preprocessor._index = index = ReferenceIndex(svg)
+    preprocessor._build_clippath_map(svg)
+    rect = svg[1]
+
+    preprocessor._resolve_clippath_references(svg)
+
+    group = svg[1]
+    assert group[0] is rect and rect.get("clip-path") is None
+    assert index.get_referrers("c") == []
+    assert index.get_element("r") is group
+
+
+def test_failed_clip_resolution_leaves_tree_and_index_intact(monkeypatch):
+    svg = _svg('<clipPath id="c"><rect width="5" height="5"/></clipPath>'
+               '<rect id="r" clip-path="url(#c)" width="9" height="9"/>')
+    preprocessor = ResolveClipsPreprocessor()
+    preprocessor._index = index = ReferenceIndex(svg)
+    preprocessor._build_clippath_map(svg)
+    rect = svg[1]
+
+    def fail(element, clippath_def):
+        raise ValueError("boom")
+
+    monkeypatch.setattr(preprocessor, "_create_clipping_group", fail)
+    preprocessor._resolve_clippath_references(svg)
+
+    assert svg[1] is rect and rect.get("clip-path") == "url(#c)"
+    assert index.get_referrers("c") == [rect]
+    assert index.get_element("r") is rect
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Unit tests for the persistent indexed font catalog."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from fontTools.ttLib import TTCollection, TTFont
+
+from core.services import font_catalog
+from core.services.font_catalog import FontCatalog
+from core.services.font_service import FontService
+from core.services.font_system import BasicFontDetector
+
+DEJAVU_DIR = Path('/usr/share/fonts/truetype/dejavu')
+
+pytestmark = pytest.mark.skipif(
+    not (DEJAVU_DIR / 'DejaVuSans.ttf').exists(),
+    reason="DejaVu fonts not installed",
+)
+
+
+@pytest.fixture
+def font_dir(tmp_path):
+    fonts = tmp_path / 'fonts'
+    (fonts / 'sans').mkdir(parents=True)
+    (fonts / 'serif').mkdir()
+    # Filenames deliberately say nothing about family or weight
+    shutil.copy(DEJAVU_DIR / 'DejaVuSans.ttf', fonts / 'sans' / 'a.ttf')
+    shutil.copy(DEJAVU_DIR / 'DejaVuSans-Bold.ttf', fonts / 'sans' / 'b.ttf')
+    shutil.copy(DEJAVU_DIR / 'DejaVuSerif.ttf', fonts / 'serif' / 'c.ttf')
+    (fonts / 'serif' / 'brokenmono.ttf').write_bytes(b'not a font')
+    return fonts
+
+
+@pytest.fixture
+def index_path(tmp_path, monkeypatch):
+    path = tmp_path / 'catalog.json'
+    monkeypatch.setenv(font_catalog.FONT_CATALOG_PATH_ENV, str(path))
+    monkeypatch.setattr(font_catalog, '_catalogs', {})
+    return path
+
+
+@pytest.fixture
+def collection_dir(tmp_path):
+    """Directory whose only DejaVu Serif faces live in a two-face .ttc"""
+    fonts = tmp_path / 'collection'
+    fonts.mkdir()
+    collection = TTCollection()
+    collection.fonts = [TTFont(DEJAVU_DIR / 'DejaVuSerif.ttf'), TTFont(DEJAVU_DIR / 'DejaVuSerif-Bold.ttf')]
+    collection.save(fonts / 'serif.ttc')
+    return fonts
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestFontCatalog:
+    """Test name-table indexing and mtime invalidation."""
+
+    def test_lookup_uses_name_table(self, font_dir, index_path):
+        catalog = FontCatalog([str(font_dir)], index_path)
+
+        assert catalog.find('DejaVu Sans').path.endswith('a.ttf')
+        assert catalog.find('dejavu-sans', weight=700).path.endswith('b.ttf')
+        assert catalog.find('DejaVu Sans', weight=900, italic=True).path.endswith('b.ttf')
+        assert catalog.find('DejaVuSerif').path.endswith('c.ttf')
+        assert catalog.find('Missing Family') is None
+        assert catalog.families() == ['DejaVu Sans', 'DejaVu Serif']
+
+    def test_index_reused_across_instances(self, font_dir, index_path):
+        FontCatalog([str(font_dir)], index_path).families()
+
+        warm = FontCatalog([str(font_dir)], index_path)
+        warm.families()
+
+        assert index_path.exists()
+        assert warm.stats['files_parsed'] == 0
+        assert warm.stats['directories_scanned'] == 0
+        assert warm.stats['directories_reused'] == 3
+        assert warm.find('DejaVu Sans', weight=700).path.endswith('b.ttf')
+
+    def test_changed_directory_rescanned(self, font_dir, index_path):
+        FontCatalog([str(font_dir)], index_path).families()
+        shutil.copy(DEJAVU_DIR / 'DejaVuSerif-Bold.ttf', font_dir / 'serif' / 'd.ttf')
+        _bump_mtime(font_dir / 'serif')
+
+        catalog = FontCatalog([str(font_dir)], index_path)
+
+        assert catalog.find('DejaVu Serif', weight=700).path.endswith('d.ttf')
+        assert catalog.stats['directories_scanned'] == 1
+        assert catalog.stats['files_parsed'] == 1
+        assert catalog.stats['files_reused'] == 2
+
+    def test_corrupt_index_rebuilt(self, font_dir, index_path):
+        index_path.write_text('{not json')
+
+        catalog = FontCatalog([str(font_dir)], index_path)
+
+        assert catalog.find('DejaVu Sans') is not None
+        assert FontCatalog([str(font_dir)], index_path).find('DejaVu Sans') is not None
+
+
+class TestCatalogConsumers:
+    """Test FontService and BasicFontDetector resolve through the catalog."""
+
+    def test_font_service_find_font_file(self, font_dir, index_path):
+        service = FontService(font_directories=[str(font_dir)])
+
+        assert service.find_font_file('DejaVu Sans', 'bold').endswith('b.ttf')
+        assert service.find_font_file('DejaVu Sans', '400', 'normal').endswith('a.ttf')
+        # Unparseable files stay reachable by filename
+        assert service.find_font_file('Broken Mono').endswith('brokenmono.ttf')
+        assert service.find_font_file('Nope') is None
+        assert {font['filename'] for font in service.get_available_fonts()} == {
+            'a.ttf', 'b.ttf', 'c.ttf', 'brokenmono.ttf',
+        }
+
+    def test_services_share_one_catalog(self, font_dir, index_path):
+        first = FontService(font_directories=[str(font_dir)])
+        second = FontService(font_directories=[str(font_dir)])
+
+        assert first._catalog is second._catalog
+        assert FontService(font_directories=[str(font_dir)], enable_indexing=False)._catalog is None
+
+    def test_basic_font_detector(self, font_dir, index_path):
+        detector = BasicFontDetector(FontCatalog([str(font_dir)], index_path))
+
+        assert detector.find_font_file('DejaVu Sans', 700, False).endswith('b.ttf')
+        assert detector.find_font_file('Arial', 400, False) is None
+        fonts = detector.list_system_fonts()
+        assert 'DejaVu Serif' in fonts
+        assert 'Arial' in fonts
+
+    def test_collection_faces_excluded_from_path_lookups(self, collection_dir, index_path):
+        catalog = FontCatalog([str(collection_dir)], index_path)
+        service = FontService(font_directories=[str(collection_dir)])
+        detector = BasicFontDetector(catalog)
+
+        record = catalog.find('DejaVu Serif', weight=700)
+        assert record.in_collection and record.font_number == 1
+        assert catalog.find('DejaVu Serif', include_collections=False) is None
+
+        assert service.find_font_file('DejaVu Serif') is None
+        assert service.find_font_file('serif') is None
+        assert service.load_font('DejaVu Serif') is None
+        assert detector.find_font_file('DejaVu Serif', 400, False) is None
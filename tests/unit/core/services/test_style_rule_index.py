@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Unit tests for StyleService selector indexing and computed-style memo."""
+
+from lxml import etree as ET
+
+from core.services.style_service import (
+    INHERITED,
+    PRESENTATION_MAP,
+    StyleService,
+    _matches,
+    parse_inline_style,
+)
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+
+
+def _document(rule_count: int = 40) -> ET.Element:
+    css = '\n'.join(f'.cls{i} {{ fill: #{i:06x}; stroke-width: {i}; }}' for i in range(rule_count))
+    return ET.fromstring(f'''<svg xmlns="{SVG_NS}">
+        <style>{css}
+            rect {{ stroke: black; }}
+            #hero {{ fill: gold; }}
+            .cls3 {{ opacity: 0.5; }}
+        </style>
+        <g class="cls1" fill="red">
+            <rect class="cls2 cls3"/>
+            <rect class="cls2 cls3"/>
+            <rect id="hero" class="cls3 cls2 cls2" style="stroke: blue"/>
+            <circle class="cls7" stroke-width="3"/>
+            <!-- comment -->
+            <rect class="unknown"/>
+        </g>
+    </svg>''')
+
+
+def _brute_force(service: StyleService, element, parent_style):
+    """Reference cascade: test every rule against the element."""
+    style = {k: parent_style[k] for k in INHERITED if parent_style and k in parent_style}
+    applicable = sorted(
+        ((spec, order, decls) for sel, decls, spec, order in service.rules if _matches(element, sel)),
+        key=lambda rule: rule[:2],
+    )
+    for _, _, decls in applicable:
+        style.update(decls)
+    for attr, prop in PRESENTATION_MAP.items():
+        if attr in element.attrib:
+            style[prop] = element.attrib[attr]
+    style.update(parse_inline_style(element.get('style') or ''))
+    return style
+
+
+def _walk(service: StyleService, element, parent_style=None, out=None):
+    out = [] if out is None else out
+    if not isinstance(element.tag, str):
+        return out
+    style = service.compute_style(element, parent_style)
+    out.append((element, parent_style, style))
+    for child in element:
+        _walk(service, child, style, out)
+    return out
+
+
+class TestStyleRuleIndex:
+    """Test indexed matching is equivalent to testing every rule."""
+
+    def test_matches_brute_force_cascade(self):
+        svg = _document()
+        service = StyleService(svg)
+
+        for element, parent_style, style in _walk(service, svg):
+            assert style == _brute_force(service, element, parent_style)
+
+    def test_only_candidate_buckets_built(self):
+        service = StyleService(_document(rule_count=200))
+
+        stats = service.get_statistics()
+
+        assert stats['class_buckets'] == 200
+        assert stats['id_buckets'] == 1
+        assert stats['tag_buckets'] == 1
+
+    def test_rules_change_rebuilds_index(self):
+        svg = _document()
+        service = StyleService(svg)
+        rect = svg.find(f'.//{{{SVG_NS}}}rect')
+        assert 'stroke-dasharray' not in service.compute_style(rect)
+
+        service.rules.append(('rect', {'stroke-dasharray': '2 1'}, (0, 0, 1), 99))
+
+        assert service.compute_style(rect)['stroke-dasharray'] == '2 1'
+
+
+class TestComputedStyleMemo:
+    """Test identical siblings share one computed style."""
+
+    def test_identical_siblings_share_result(self):
+        svg = _document()
+        service = StyleService(svg)
+        group = svg.find(f'{{{SVG_NS}}}g')
+        parent_style = service.compute_style(group)
+        first, second, hero = group.findall(f'{{{SVG_NS}}}rect')[:3]
+
+        assert service.compute_style(first, parent_style) == service.compute_style(second, parent_style)
+        assert service.compute_style(hero, parent_style)['fill'] == 'gold'
+        assert service.get_statistics()['memo_hits'] == 1
+
+    def test_parent_style_is_part_of_key(self):
+        svg = _document()
+        service = StyleService(svg)
+        rect = svg.find(f'.//{{{SVG_NS}}}rect')
+
+        red = service.compute_style(rect, {'fill': 'red', 'font-size': '10'})
+        blue = service.compute_style(rect, {'fill': 'blue', 'font-size': '10'})
+        # Non-inherited parent properties do not split the memo
+        same = service.compute_style(rect, {'fill': 'red', 'font-size': '10', 'opacity': '0.1'})
+
+        assert red['font-size'] == blue['font-size'] == '10'
+        assert red == same
+        stats = service.get_statistics()
+        assert (stats['memo_hits'], stats['memo_misses']) == (1, 2)
+
+    def test_mutating_result_does_not_leak(self):
+        svg = _document()
+        service = StyleService(svg)
+        group = svg.find(f'{{{SVG_NS}}}g')
+        parent_style = service.compute_style(group)
+        first, second = group.findall(f'{{{SVG_NS}}}rect')[:2]
+
+        style = service.compute_style(first, parent_style)
+        expected = dict(style)
+        style['fill'] = 'purple'
+
+        assert service.compute_style(second, parent_style) == expected
+        assert service.get_statistics()['memo_hits'] == 1
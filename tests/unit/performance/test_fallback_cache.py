@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Unit tests for the shared content-addressed fallback media cache."""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from core.ir import LineSegment, Path, Point, SolidPaint, Stroke
+from core.map.emf_adapter import EMFPathAdapter
+from core.performance import fallback_cache
+from core.performance.fallback_cache import (
+    FallbackMediaCache,
+    configure_fallback_cache,
+    fallback_cache_key,
+    get_fallback_cache,
+)
+from core.pipeline.config import PerformanceConfig, PipelineConfig
+from core.pipeline.converter import CleanSlateConverter
+
+
+def _triangle(x: float = 0.0, rgb: str = 'FF0000') -> Path:
+    corners = [Point(x, 0), Point(x + 10, 0), Point(x + 5, 8)]
+    return Path(
+        segments=[LineSegment(a, b) for a, b in zip(corners, corners[1:] + corners[:1])],
+        fill=SolidPaint(rgb),
+        stroke=Stroke(paint=SolidPaint('000000'), width=1.0),
+    )
+
+
+def _render_in_worker(cache_dir: str, x: float) -> bytes:
+    configure_fallback_cache(cache_dir)
+    return EMFPathAdapter().generate_emf_blob(_triangle(x)).emf_data
+
+
+@pytest.fixture
+def shared_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(fallback_cache, '_fallback_caches', {})
+    configure_fallback_cache(tmp_path)
+    yield tmp_path
+    configure_fallback_cache(None)
+
+
+class TestFallbackMediaCache:
+    """Test the two-level store itself."""
+
+    def test_key_separates_parts(self):
+        assert fallback_cache_key('emf', 'ab', 'c') != fallback_cache_key('emf', 'a', 'bc')
+        assert fallback_cache_key('emf', b'x', 1) == fallback_cache_key('emf', b'x', 1)
+        assert fallback_cache_key('emf', 'x') != fallback_cache_key('raster', 'x')
+
+    def test_entries_shared_through_disk(self, tmp_path):
+        writer = FallbackMediaCache(tmp_path)
+        writer.put('ab' * 10, b'emf-bytes')
+
+        reader = FallbackMediaCache(tmp_path)
+
+        assert reader.get('ab' * 10) == b'emf-bytes'
+        assert reader.get('ab' * 10) == b'emf-bytes'
+        assert reader.stats['disk_hits'] == 1
+        assert reader.stats['memory_hits'] == 1
+        assert not list(tmp_path.glob('*/*.tmp'))
+
+    def test_corrupt_entry_is_discarded(self, tmp_path):
+        cache = FallbackMediaCache(tmp_path)
+        cache.put('cd' * 10, b'payload')
+        entry = next(tmp_path.glob('*/*.bin'))
+        entry.write_bytes(b'not zlib')
+
+        assert FallbackMediaCache(tmp_path).get('cd' * 10) is None
+        assert not entry.exists()
+
+    def test_disk_budget_pruned(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(fallback_cache, '_PRUNE_INTERVAL', 1)
+        cache = FallbackMediaCache(tmp_path, max_disk_size=200, max_memory_size=0)
+
+        for index in range(20):
+            cache.put(f'{index:040x}', bytes(range(256)) * index)
+
+        assert cache.stats['pruned'] > 0
+        assert sum(entry.stat().st_size for entry in tmp_path.glob('*/*.bin')) <= 200
+
+    def test_unconfigured_cache_disabled(self, monkeypatch):
+        monkeypatch.delenv(fallback_cache.FALLBACK_CACHE_DIR_ENV, raising=False)
+        configure_fallback_cache(None)
+
+        assert get_fallback_cache() is None
+
+
+class TestEMFFallbackCaching:
+    """Test EMF path fallbacks are generated once per content."""
+
+    def test_translated_copy_reuses_blob(self, shared_cache_dir):
+        adapter = EMFPathAdapter()
+
+        first = adapter.generate_emf_blob(_triangle(0))
+        second = adapter.generate_emf_blob(_triangle(40))
+        recolored = adapter.generate_emf_blob(_triangle(0, rgb='0000FF'))
+
+        assert first.metadata['fallback_cache'] == 'miss'
+        assert second.metadata['fallback_cache'] == 'hit'
+        assert second.emf_data == first.emf_data
+        assert recolored.metadata['fallback_cache'] == 'miss'
+        assert recolored.emf_data != first.emf_data
+
+    def test_blob_from_other_process_reused(self, shared_cache_dir):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            worker_blob = executor.submit(_render_in_worker, str(shared_cache_dir), 0).result()
+
+        result = EMFPathAdapter().generate_emf_blob(_triangle(25))
+
+        assert result.metadata['fallback_cache'] == 'hit'
+        assert result.emf_data == worker_blob
+
+    def test_converter_configures_shared_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(fallback_cache, '_fallback_caches', {})
+        cache_dir = tmp_path / 'shared'
+        try:
+            CleanSlateConverter(PipelineConfig(performance_config=PerformanceConfig(fallback_cache_dir=str(cache_dir))))
+            assert get_fallback_cache().cache_dir == cache_dir
+        finally:
+            configure_fallback_cache(None)